@@ -1,7 +1,7 @@
 #!/usr/bin/env python3.9
 import os
 import sys
-from typing import Union
+from typing import Callable, Union
 
 import aws_cdk as cdk
 from constructs import IConstruct
@@ -30,6 +30,9 @@ from cdk_sih.ci_cd.codepipeline import CdkCodepipelineCiCdStack
 from cdk_sih.client_vpn.endpoint import CdkClientVpnEndpointStack
 from cdk_sih.cloudtrail.trails import CdkCloudTrailTrailsStack
 from cdk_sih.constructs.factory import CdkConstructsFactory
+from cdk_sih.constructs.profiler import CdkSynthProfiler
+from cdk_sih.constructs.registry import CdkStackRegistry
+from cdk_sih.constructs.synth_cache import CdkSynthCache
 from cdk_sih.cow.base import CdkCowBaseStack
 from cdk_sih.cow.cache import CdkCowCacheStack
 from cdk_sih.cow.cloudfront.base import CdkCowCloudFrontBaseStack
@@ -108,6 +111,9 @@ from cdk_sih.proxy.server import CdkProxyServerStack
 from cdk_sih.vpc_sih import CdkVpcSihStack
 from cdk_sih.weatherapi.storage import CdkWeatherapiStorageStack
 
+# CDK synth profiler (opt-in), e.g. `CDK_SYNTH_PROFILE=1 cdk synth`
+CdkSynthProfiler.from_env()
+
 # CDK app environment
 account: str = os.getenv("CDK_DEPLOY_ACCOUNT", default=os.environ["CDK_DEFAULT_ACCOUNT"])
 region: str = os.getenv("CDK_DEPLOY_REGION", default=os.environ["CDK_DEFAULT_REGION"])
@@ -321,6 +327,41 @@ ms_teams: dict = {
 ms_teams[factory.WEBHOOK_URL_CODEPIPELINE_][sih_] = ms_teams[factory.WEBHOOK_URL_CODEPIPELINE_MISC_]
 factory.set_factory_ms_teams(ms_teams)
 
+# CPU architecture policy (i.e. 'arm64' for Graviton, otherwise 'x86_64'), by Lambda function name, project name and
+#  component (e.g. 'lion-global'), or project name (e.g. 'lion'). Selects the Lambda function and layer architectures,
+#  CodeBuild build images (for Docker images), and Docker image tags (suffixed with '-arm64').
+#  NB. Docker images are built per CDK stack, so Lambda Docker image functions follow their project (and component).
+architectures: dict[str, str] = {
+    # lion_: factory.ARM64_,
+}
+factory.set_factory_architectures(architectures)
+
+# Shared ECS clusters, joined by the ECS services of a project name and deploy env (e.g. 'lion-staging'), a project name
+#  (e.g. 'lion'), or all ECS services (i.e. '*') in the AWS account and region. Generated in the VPC CDK stack, ECS
+#  services otherwise get an ECS cluster each. Each ECS service keeps its own Cloud Map namespace (i.e. private DNS name).
+#  NB. Moving an existing ECS service to (or from) a shared ECS cluster replaces the ECS service.
+ecs_clusters_shared: list[str] = [
+    # factory.join_sep_score([lion_, factory.STAGING_]),
+]
+factory.set_factory_ecs_clusters_shared(ecs_clusters_shared)
+
+# ECS services opted in to Fargate Spot (see ``CdkConstructsFactory.ECS_CAPACITY_PROVIDER_STRATEGIES``), by project name
+#  and component and deploy env (e.g. 'lion-ms-staging'), project name and component (e.g. 'lion-ms'), or project name
+#  (e.g. 'lion'). Only for internal and preview/demo deploy envs, ECS services otherwise run on on-demand Fargate.
+#  NB. Fargate Spot tasks can be interrupted (with a 2 minute notice), so only opt in interruption tolerant ECS services.
+ecs_fargate_spot: list[str] = [
+    # factory.join_sep_score([lion_, ms_]),
+]
+factory.set_factory_ecs_fargate_spot(ecs_fargate_spot)
+
+# Deploy envs with CloudFront real-time logs (i.e. sent to a Kinesis data stream, for monitoring and analytics), for
+#  each CloudFront distribution (see ``CdkConstructsFactory.cloudfront_distribution``). Standard logs always go to the
+#  shared CloudFront log bucket, generated in the VPC CDK stack.
+cloudfront_realtime_logs: list[str] = [
+    # factory.PROD_,
+]
+factory.set_factory_cloudfront_realtime_logs(cloudfront_realtime_logs)
+
 project_name_comp_lookup: dict[str, list[str]] = {
     ms_: [lion_, bkg_],
     gw_: [bird_, cat_, cow_, dog_, fish_],
@@ -329,6 +370,12 @@ project_name_ec_redis_instance_type_custom_meta: dict[str, int] = {
     # NB. This is Gw only, does not support Ms
     # gw-project-name: factory.M5_LARGE_
 }
+project_name_ec_redis_shards_custom_meta: dict[str, int] = {
+    # NB. This is Gw only (staging and prod), does not support Ms (see ``CdkLionCacheStack.EC_REDIS_SHARDS_CUSTOM``).
+    #  24/7 deploy envs only (i.e. without the ElastiCache auto start/stop), and cannot be changed once deployed,
+    #  see: ``CdkConstructsFactory.elasticache_replication_group``
+    # gw-project-name: 2
+}
 project_name_ecs_service_max_val_custom_meta: dict[str, int] = {
     # NB. This is Gw only, does not support Ms
     # gw-project-name: 5
@@ -364,6 +411,7 @@ for p in project_name_comp_lookup[gw_]:
     deploy_envs_metas[p] = factory.get_deploy_envs_meta(
         deploy_env_preview_demo_metas[p],
         ec_redis_instance_type_custom=project_name_ec_redis_instance_type_custom_meta.get(p),
+        ec_redis_shards_custom=project_name_ec_redis_shards_custom_meta.get(p),
         ecs_service_max_val_custom=project_name_ecs_service_max_val_custom_meta.get(p),
     )
     if m := deploy_envs_metas[p]:
@@ -390,6 +438,24 @@ def get_db_server_preview_demo(project_name: str, database_server: str) -> dict[
     return get_deploy_env_preview_demo_meta(project_name) if database_server == factory.PREVIEW_DEMO_ else None
 
 
+def get_db_consumers(project_name: str, database_meta: dict, gw_stack_class: type) -> dict[str, dict[str, int]]:
+    # The peak concurrency of the DB consumers (i.e. the Gw ECS service), per deploy env of the DB server.
+    #  NB. The BKG ms uses DynamoDB (not RDS), and the RDS init Lambda functions use the admin user reserved connections.
+    if missing := [i for i in database_meta[factory.DEPLOY_ENV_LIST_] if i not in deploy_envs_metas[project_name]]:
+        sys.exit(
+            f"## Cannot find the deploy env meta for the DB server deploy envs {missing}, of project '{project_name}', "
+            f"to get the peak concurrency of its DB consumers."
+        )
+    return {
+        gw_: {
+            deploy_env: factory.get_ecs_peak_concurrency(
+                deploy_envs_metas[project_name][deploy_env], gw_stack_class.ECS_TASK_DEFINITION_CONTAINER_MEMORY_MIB
+            )
+            for deploy_env in database_meta[factory.DEPLOY_ENV_LIST_]
+        }
+    }
+
+
 # The list of project names, which depend on other projects running at the same time.
 #   e.g. If 'cat' is selected for 24/7 (or weekend) running,
 #   this option enforces that we also need 24/7 (or weekend) running: 'bkg' & 'lion'
@@ -528,62 +594,115 @@ def get_cdk_stack_args_default(
 
 app = cdk.App()
 
-cdk_vpc_sih_stack = CdkVpcSihStack(
-    scope=app,
-    id="CdkVpcSihStack",
-    description="Virtual Private Cloud (VPC) resources: VPCs, subnets, etc.",
-    env=env,
-    termination_protection=True,
-    # --- ^ super() ---
-    factory=factory,
+# CDK stack registry, for lazy (and selective) instantiation of CDK stacks.
+#   e.g. `cdk deploy -c stacks=CdkProxyServerStack CdkProxyServerStack`
+registry: CdkStackRegistry = CdkStackRegistry(app)
+
+# CDK synth cache, for unchanged CDK stacks to be emitted from the cache (instead of instantiated).
+#   e.g. `CDK_SYNTH_CACHE=1 cdk synth`
+registry.set_synth_cache(
+    CdkSynthCache.from_env(
+        registry, app_inputs={"account": account, "region": region, "cdk_app_env_vars": cdk_app_env_vars}
+    )
 )
 
+
+def add_tags_required_infra(stack: cdk.Stack) -> None:
+    factory.add_tags_required(stacks=[stack], project_name_val=factory.TAG_VAL_INFRA_)
+
+
+def add_tags_required_base(project_name: str, custom: str = None) -> Callable[[cdk.Stack], None]:
+    return lambda stack: factory.add_tags_required(
+        stacks=[stack],
+        project_name_val=word_map[project_name],
+        custom_val=word_map[custom] if custom else factory.TAG_VAL_NONE_,
+        env_type_val=factory.TAG_VAL_NONE_,
+        component_val=word_map[base_],
+        deploy_env_val=factory.TAG_VAL_NONE_,
+    )
+
+
+@registry.stack("CdkVpcSihStack", post_build=add_tags_required_infra)
+def cdk_vpc_sih_stack(stack_id: str = None) -> CdkVpcSihStack:
+    return CdkVpcSihStack(
+        scope=app,
+        id=stack_id,
+        description="Virtual Private Cloud (VPC) resources: VPCs, subnets, etc.",
+        env=env,
+        termination_protection=True,
+        # --- ^ super() ---
+        factory=factory,
+    )
+
+
 # IMPORTANT: This CDK stack can get very expensive!! Proceed with caution.
-cdk_cloudtrail_trails_stack = CdkCloudTrailTrailsStack(
-    scope=app,
-    id="CdkCloudTrailTrailsStack",
-    description="CloudTrail resources: Trails, S3, etc.",
-    env=env,
-    termination_protection=True,
-    # --- ^ super() ---
-    factory=factory,
-)
-factory.add_tags_required(stacks=[cdk_cloudtrail_trails_stack], project_name_val=factory.TAG_VAL_CT_)
-
-cdk_client_vpn_endpoint_stack = CdkClientVpnEndpointStack(
-    scope=app,
-    id="CdkClientVpnEndpointStack",
-    description="Virtual Private Cloud (VPC) resources: Client VPN endpoint, etc.",
-    env=env,
-    termination_protection=True,
-    # --- ^ super() ---
-    client_vpn_endpoint_internet=False,  # bool(factory.aws_profile is None)  # TODO: (NEXT) Add a Client VPN Endpoint (Internet) to AWS Foobar Products A/c, as needed
-    client_vpn_endpoint_server_certificate_id=os.getenv(
-        "CLIENT_VPN_ENDPOINT_SERVER_CERTIFICATE_ID", default="8ac31cc0-d5af-49e0-b8f9-8d7817cfa424"
-    ),  # The ACM certificate ID ('server'). Default: Lives in London (eu-west-2) region, A/C: 7832***
-    factory=factory,
-    vpc_stack=cdk_vpc_sih_stack,
+@registry.stack(
+    "CdkCloudTrailTrailsStack",
+    post_build=lambda s: factory.add_tags_required(stacks=[s], project_name_val=factory.TAG_VAL_CT_),
 )
+def cdk_cloudtrail_trails_stack(stack_id: str = None) -> CdkCloudTrailTrailsStack:
+    return CdkCloudTrailTrailsStack(
+        scope=app,
+        id=stack_id,
+        description="CloudTrail resources: Trails, S3, etc.",
+        env=env,
+        termination_protection=True,
+        # --- ^ super() ---
+        factory=factory,
+    )
+
+
+@registry.stack("CdkClientVpnEndpointStack", post_build=add_tags_required_infra)
+def cdk_client_vpn_endpoint_stack(stack_id: str = None) -> CdkClientVpnEndpointStack:
+    return CdkClientVpnEndpointStack(
+        scope=app,
+        id=stack_id,
+        description="Virtual Private Cloud (VPC) resources: Client VPN endpoint, etc.",
+        env=env,
+        termination_protection=True,
+        # --- ^ super() ---
+        client_vpn_endpoint_internet=False,  # bool(factory.aws_profile is None)  # TODO: (NEXT) Add a Client VPN Endpoint (Internet) to AWS Foobar Products A/c, as needed
+        client_vpn_endpoint_server_certificate_id=os.getenv(
+            "CLIENT_VPN_ENDPOINT_SERVER_CERTIFICATE_ID", default="8ac31cc0-d5af-49e0-b8f9-8d7817cfa424"
+        ),  # The ACM certificate ID ('server'). Default: Lives in London (eu-west-2) region, A/C: 7832***
+        factory=factory,
+        vpc_stack=cdk_vpc_sih_stack(),
+    )
+
 
 client_vpn_endpoint_override: bool = True
-client_vpn_endpoint_stack = (
-    None if factory.aws_profile or client_vpn_endpoint_override else cdk_client_vpn_endpoint_stack
-)
+
+
+def get_client_vpn_endpoint_stack() -> CdkClientVpnEndpointStack:
+    return None if factory.aws_profile or client_vpn_endpoint_override else cdk_client_vpn_endpoint_stack()
+
 
 cdk_bastion_host_linux_stack_name: str = "CdkBastionHostLinuxStack"
-cdk_bastion_host_linux_stack = CdkBastionHostLinuxStack(
-    scope=app,
-    id=cdk_bastion_host_linux_stack_name,
-    description="Bastion Host resources: BastionHostLinux EC2 instances, etc.",
-    env=env,
-    termination_protection=True,
-    # --- ^ super() ---
-    client_vpn_endpoint_stack=client_vpn_endpoint_stack,
-    factory=factory,
-    vpc_stack=cdk_vpc_sih_stack,
-)
 
-bastion_host_private_ips: list[str] = cdk_bastion_host_linux_stack.get_bastion_host_private_ips()
+
+def add_tags_bastion_host_linux(stack: CdkBastionHostLinuxStack) -> None:
+    add_tags_required_infra(stack)
+    factory.add_tags_auto_start_stop(stacks=[stack], include_resource_type=["AWS::EC2::Instance"])
+
+
+@registry.stack(cdk_bastion_host_linux_stack_name, post_build=add_tags_bastion_host_linux)
+def cdk_bastion_host_linux_stack(stack_id: str = None) -> CdkBastionHostLinuxStack:
+    return CdkBastionHostLinuxStack(
+        scope=app,
+        id=stack_id,
+        description="Bastion Host resources: BastionHostLinux EC2 instances, etc.",
+        env=env,
+        termination_protection=True,
+        # --- ^ super() ---
+        client_vpn_endpoint_stack=get_client_vpn_endpoint_stack(),
+        factory=factory,
+        vpc_stack=cdk_vpc_sih_stack(),
+    )
+
+
+def get_bastion_host_private_ips() -> list[str]:
+    return cdk_bastion_host_linux_stack().get_bastion_host_private_ips()
+
 
 ipsec_vpn_: str = "ipsec-vpn"
 ipsec_vpn_server_: str = factory.join_sep_score([ipsec_vpn_, server_])
@@ -594,735 +713,860 @@ openvpn_vpn_server_: str = factory.join_sep_score([openvpn_vpn_, server_])
 
 elastic_ip_str_list: list[str] = [ipsec_vpn_server_, proxy_server_, openvpn_vpn_server_]
 
-cdk_elastic_ips_stack = CdkElasticIpsStack(
-    scope=app,
-    id="CdkElasticIpsStack",
-    description=f"Elastic IP resources: Elastic IPs (static IP addresses) for use by VPN/Proxy/{word_map[pypi_]} servers, etc.",
-    env=env,
-    termination_protection=True,
-    # --- ^ super() ---
-    elastic_ip_str_list=elastic_ip_str_list,
-    factory=factory,
-    vpc_stack=cdk_vpc_sih_stack,
-)
-elastic_ip_parameter_names: dict[str, str] = {}
-
-cdk_ipsec_vpn_base_stack = CdkIpsecVpnBaseStack(
-    scope=app,
-    id="CdkIpsecVpnBaseStack",
-    description="VPN base resources: IPsec VPN server role, VPN user password secrets, etc.",
-    env=env,
-    termination_protection=True,
-    # --- ^ super() ---
-    component=server_,
-    factory=factory,
-    project_name=ipsec_vpn_,
-    vpc_stack=cdk_vpc_sih_stack,
-)
-
-cdk_ipsec_vpn_psk_stack = CdkIpsecVpnPskStack(
-    scope=app,
-    id="CdkIpsecVpnPskStack",
-    description="VPN PSK resources: VPN Pre-Shared Key (PSK) secret, etc.",
-    env=env,
-    termination_protection=True,
-    # --- ^ super() ---
-    base_stack=cdk_ipsec_vpn_base_stack,
-    component=server_,
-    factory=factory,
-    project_name=ipsec_vpn_,
-    vpc_stack=cdk_vpc_sih_stack,
-)
-
-cdk_ipsec_vpn_server_stack = CdkIpsecVpnServerStack(
-    scope=app,
-    id="CdkIpsecVpnServerStack",
-    description="VPN resources: IPsec VPN server EC2 instance launched by an ASG, etc.",
-    env=env,
-    termination_protection=True,
-    # --- ^ super() ---
-    base_stack=cdk_ipsec_vpn_base_stack,
-    client_vpn_endpoint_stack=client_vpn_endpoint_stack,
-    component=server_,
-    elastic_ip=cdk_elastic_ips_stack.elastic_ips[ipsec_vpn_server_],
-    factory=factory,
-    project_name=ipsec_vpn_,
-    psk_stack=cdk_ipsec_vpn_psk_stack,
-    vpc_stack=cdk_vpc_sih_stack,
-)
-elastic_ip_parameter_names[ipsec_vpn_server_] = cdk_ipsec_vpn_server_stack.public_ipv4_parameter_name
-
-cdk_proxy_server_stack = CdkProxyServerStack(
-    scope=app,
-    id="CdkProxyServerStack",
-    description="Proxy resources: Proxy server EC2 instance launched by an ASG, etc.",
-    env=env,
-    termination_protection=True,
-    # --- ^ super() ---
-    component=server_,
-    elastic_ip=cdk_elastic_ips_stack.elastic_ips[proxy_server_],
-    elastic_ip_parameter_names=elastic_ip_parameter_names,
-    factory=factory,
-    project_name=proxy_,
-)
-elastic_ip_parameter_names[proxy_server_] = cdk_proxy_server_stack.public_ipv4_parameter_name
-
-openvpn_vpn_vpc_default: bool = True  # Whether to use the default VPC
-cdk_openvpn_vpn_base_stack_name: str = "CdkOpenvpnVpnBaseStack"
-cdk_openvpn_vpn_base_stack = CdkOpenvpnVpnBaseStack(
-    scope=app,
-    id=cdk_openvpn_vpn_base_stack_name,
-    description="VPN base resources: OpenVPN VPN server role, etc.",
-    env=env,
-    termination_protection=True,
-    # --- ^ super() ---
-    component=server_,
-    elastic_ip_parameter_names=elastic_ip_parameter_names,
-    factory=factory,
-    project_name=openvpn_vpn_,
-)
-
-cdk_openvpn_vpn_cloudfront_stack = CdkOpenvpnVpnCloudFrontStack(
-    scope=app,
-    id="CdkOpenvpnVpnCloudFrontStack",
-    description="VPN CloudFront resources: ACM certificates, WAF Web ACLs, etc.",
-    env=env_cloudfront,
-    termination_protection=True,
-    # --- ^ super() ---
-    base_stack=cdk_openvpn_vpn_base_stack,
-    component=server_,
-    factory=factory,
-    project_name=openvpn_vpn_,
-)
-
-cdk_openvpn_vpn_user_stack = CdkOpenvpnVpnUserStack(
-    scope=app,
-    id="CdkOpenvpnVpnUserStack",
-    description="VPN User resources: VPN user password secrets, etc.",
-    env=env,
-    termination_protection=True,
-    # --- ^ super() ---
-    base_stack=cdk_openvpn_vpn_base_stack,
-    component=server_,
-    factory=factory,
-    project_name=openvpn_vpn_,
-    vpc_default=openvpn_vpn_vpc_default,
-    vpc_stack=cdk_vpc_sih_stack,
-)
-
-cdk_openvpn_vpn_server_stack = CdkOpenvpnVpnServerStack(
-    scope=app,
-    id="CdkOpenvpnVpnServerStack",
-    description="VPN resources: ALB, NLB, OpenVPN VPN server EC2 instance launched by an ASG, etc.",
-    env=env,
-    termination_protection=True,
-    # --- ^ super() ---
-    base_stack=cdk_openvpn_vpn_base_stack,
-    component=server_,
-    elastic_ip=cdk_elastic_ips_stack.elastic_ips[openvpn_vpn_server_],
-    factory=factory,
-    project_name=openvpn_vpn_,
-    user_stack=cdk_openvpn_vpn_user_stack,
-    vpc_default=openvpn_vpn_vpc_default,
-    vpc_stack=cdk_vpc_sih_stack,
-)
-elastic_ip_parameter_names[openvpn_vpn_server_] = cdk_openvpn_vpn_server_stack.public_ipv4_parameter_name
-
-cdk_lambda_ec2_instance_auto_stack = CdkLambdaEc2InstanceAutoStack(
-    scope=app,
-    id="CdkLambdaEc2InstanceAutoStack",
-    description="EC2 instance auto start/stop resources: Lambda functions, etc.",
-    env=env,
-    termination_protection=True,
-    # --- ^ super() ---
-    factory=factory,
-    vpc_stack=cdk_vpc_sih_stack,
-)
-
-cdk_lambda_rds_instance_auto_stack = CdkLambdaRdsInstanceAutoStack(
-    scope=app,
-    id="CdkLambdaRdsInstanceAutoStack",
-    description="RDS database instance auto start/stop resources: Lambda functions, etc.",
-    env=env,
-    termination_protection=True,
-    # --- ^ super() ---
-    factory=factory,
-    vpc_stack=cdk_vpc_sih_stack,
-)
-
-cdk_amplify_ci_cd_stack = CdkAmplifyCiCdStack(
-    scope=app,
-    id="CdkAmplifyCiCdStack",
-    description="Pipeline support resources for all deployment envs",
-    env=env,
-    termination_protection=True,
-    # --- ^ super() ---
-    factory=factory,
-)
-
-cdk_codepipeline_ci_cd_stack = CdkCodepipelineCiCdStack(
-    scope=app,
-    id="CdkCodepipelineCiCdStack",
-    description="Pipeline support resources for all deployment envs",
-    env=env,
-    termination_protection=True,
-    # --- ^ super() ---
-    factory=factory,
-)
+cdk_ipsec_vpn_server_stack_name: str = "CdkIpsecVpnServerStack"
+cdk_proxy_server_stack_name: str = "CdkProxyServerStack"
+cdk_openvpn_vpn_server_stack_name: str = "CdkOpenvpnVpnServerStack"
 
-cdk_pypi_base_stack_name: str = factory.get_cdk_stack_id(pypi_, base_comp=True)
-cdk_pypi_base_stack = CdkPypiBaseStack(
-    scope=app,
-    id=cdk_pypi_base_stack_name,
-    description=factory.get_cdk_stack_description(pypi_, base_comp=True, detail="Security Groups"),
-    env=env,
-    termination_protection=True,
-    # --- ^ super() ---
-    bastion_host_private_ips=bastion_host_private_ips,
-    client_vpn_endpoint_stack=client_vpn_endpoint_stack,
-    component=server_,
-    elastic_ip_parameter_names=elastic_ip_parameter_names,
-    factory=factory,
-    project_name=pypi_,
-    vpc_stack=cdk_vpc_sih_stack,
-)
-
-cdk_pypi_cloudfront_stack = CdkPypiCloudFrontStack(
-    scope=app,
-    id=factory.get_cdk_stack_id(pypi_, components=[cf_]),
-    description=factory.get_cdk_stack_description(pypi_, components=[cf_], detail="ACM certificates, WAF Web ACLs"),
-    env=env_cloudfront,
-    termination_protection=True,
-    # --- ^ super() ---
-    base_stack=cdk_pypi_base_stack,
-    component=server_,
-    elastic_ip_str_list=elastic_ip_str_list,
-    factory=factory,
-    project_name=pypi_,
-)
-
-cdk_pypi_storage_stack = CdkPypiStorageStack(
-    scope=app,
-    id=factory.get_cdk_stack_id(pypi_, components=[storage_]),
-    description=factory.get_cdk_stack_description(pypi_, components=[storage_], detail="EFS"),
-    env=env,
-    termination_protection=True,
-    # --- ^ super() ---
-    base_stack=cdk_pypi_base_stack,
-    component=server_,
-    factory=factory,
-    project_name=pypi_,
-    vpc_stack=cdk_vpc_sih_stack,
-)
-
-cdk_pypi_server_stack = CdkPypiServerStack(
-    scope=app,
-    id=factory.get_cdk_stack_id(pypi_, components=[server_]),
-    description=factory.get_cdk_stack_description(
-        pypi_,
-        components=[server_],
-        detail=f"ALB, {word_map[pypi_]} {word_map[server_]} EC2 instance launched by an ASG",
-    ),
-    env=env,
-    termination_protection=True,
-    # --- ^ super() ---
-    base_stack=cdk_pypi_base_stack,
-    component=server_,
-    factory=factory,
-    project_name=pypi_,
-    storage_stack=cdk_pypi_storage_stack,
-    vpc_stack=cdk_vpc_sih_stack,
-)
 
-sih_autoiod_: str = factory.join_sep_score([sih_, autoiod_])
-sih_bkg_: str = factory.join_sep_score([sih_, bkg_])
-sih_dosimetry_: str = factory.join_sep_score([sih_, dosimetry_])
-sih_lion_: str = factory.join_sep_score([sih_, lion_])
-sih_hds_: str = factory.join_sep_score([sih_, hds_])
-sih_spectrum_: str = factory.join_sep_score([sih_, spectrum_])
-pypi_package_mappings: dict[str] = {lion_: sih_lion_}
-pypi_package_list: list[str] = [sih_, sih_autoiod_, sih_bkg_, sih_dosimetry_, sih_lion_, sih_hds_, sih_spectrum_]
-pypi_package_list_word_map: dict[str, str] = {
-    i: factory.join_sep_empty([j.capitalize() for j in i.split(factory.SEP_SCORE_)]) for i in pypi_package_list
-}
+@registry.stack("CdkElasticIpsStack", post_build=add_tags_required_infra)
+def cdk_elastic_ips_stack(stack_id: str = None) -> CdkElasticIpsStack:
+    return CdkElasticIpsStack(
+        scope=app,
+        id=stack_id,
+        description=f"Elastic IP resources: Elastic IPs (static IP addresses) for use by VPN/Proxy/{word_map[pypi_]} servers, etc.",
+        env=env,
+        termination_protection=True,
+        # --- ^ super() ---
+        elastic_ip_str_list=elastic_ip_str_list,
+        factory=factory,
+        vpc_stack=cdk_vpc_sih_stack(),
+    )
 
-cdk_pypi_package_base_stack = CdkPypiPackageBaseStack(
-    scope=app,
-    id=factory.get_cdk_stack_id(pypi_, components=[package_], base_comp=True),
-    description=factory.get_cdk_stack_description(
-        pypi_, components=[package_], base_comp=True, detail="SSM Parameters"
-    ),
-    env=env,
-    termination_protection=True,
-    # --- ^ super() ---
-    factory=factory,
-    project_name=pypi_,
-    pypi_package_list=pypi_package_list,
-)
 
-cdk_pypi_package_pipeline_stacks: dict[str, dict[str, CdkPypiPackagePipelineStack]] = {
-    pypi_package: {
-        branch: CdkPypiPackagePipelineStack(
-            scope=app,
-            id=factory.get_cdk_stack_id(
-                pypi_, components=[package_, (pypi_package_list_word_map[pypi_package],), pipeline_], deploy_env=branch
-            ),
-            description=factory.get_cdk_stack_description(
-                pypi_,
-                components=[package_, (pypi_package_list_word_map[pypi_package],), pipeline_],
-                deploy_env=branch,
-                detail="CodeBuild, CodePipeline",
-            ),
-            env=env,
-            termination_protection=True,
-            # --- ^ super() ---
-            base_stack=cdk_pypi_package_base_stack,
-            branch=branch,
-            factory=factory,
-            project_name=pypi_package,
-            pypi_base_stack=cdk_pypi_base_stack,
-            vpc_stack=cdk_vpc_sih_stack,
-        )
-        for branch in factory.DEV_MAIN_BRANCH_LIST
-    }
-    for pypi_package in pypi_package_list
+# NB. The SSM parameter names are known ahead of instantiating the (VPN/Proxy) server CDK stacks
+elastic_ip_parameter_names: dict[str, str] = {
+    k: factory.get_ec2_instance_public_ipv4_parameter_name(v)
+    for k, v in {
+        ipsec_vpn_server_: cdk_ipsec_vpn_server_stack_name,
+        proxy_server_: cdk_proxy_server_stack_name,
+        openvpn_vpn_server_: cdk_openvpn_vpn_server_stack_name,
+    }.items()
 }
-for _, v in cdk_pypi_package_pipeline_stacks.items():
-    factory.add_tags_required(stacks=[j for _, j in v.items()], project_name_val=factory.TAG_VAL_INFRA_)
-
-cdk_metoffice_storage_stack = CdkMetofficeStorageStack(
-    scope=app,
-    id=factory.get_cdk_stack_id(metoffice_, components=[storage_]),
-    description=factory.get_cdk_stack_description(
-        metoffice_,
-        components=[storage_],
-        detail=f"S3, IAM, Lambda, {word_map[metoffice_]} {word_map[storage_]} solution, "
-        f"for remote ingestion, alternative to FTP server",
-    ),
-    env=env,
-    termination_protection=True,
-    # --- ^ super() ---
-    component=storage_,
-    factory=factory,
-    project_name=metoffice_,
-)
-
-cdk_weatherapi_storage_stack = CdkWeatherapiStorageStack(
-    scope=app,
-    id=factory.get_cdk_stack_id(weatherapi_, components=[storage_]),
-    description=factory.get_cdk_stack_description(
-        weatherapi_,
-        components=[storage_],
-        detail=f"Lambda, {word_map[weatherapi_]} {word_map[storage_]} solution, for downloading of WeatherAPI data",
-    ),
-    env=env,
-    termination_protection=True,
-    # --- ^ super() ---
-    component=storage_,
-    factory=factory,
-    project_name=weatherapi_,
-)
-
-factory.add_tags_required(
-    stacks=[
-        cdk_amplify_ci_cd_stack,
-        cdk_bastion_host_linux_stack,
-        cdk_client_vpn_endpoint_stack,
-        cdk_codepipeline_ci_cd_stack,
-        cdk_elastic_ips_stack,
-        cdk_ipsec_vpn_base_stack,
-        cdk_ipsec_vpn_psk_stack,
-        cdk_ipsec_vpn_server_stack,
-        cdk_lambda_ec2_instance_auto_stack,
-        cdk_lambda_rds_instance_auto_stack,
-        cdk_metoffice_storage_stack,
-        cdk_openvpn_vpn_base_stack,
-        cdk_openvpn_vpn_cloudfront_stack,
-        cdk_openvpn_vpn_server_stack,
-        cdk_openvpn_vpn_user_stack,
-        cdk_proxy_server_stack,
-        cdk_pypi_base_stack,
-        cdk_pypi_cloudfront_stack,
-        cdk_pypi_package_base_stack,
-        cdk_pypi_storage_stack,
-        cdk_pypi_server_stack,
-        cdk_vpc_sih_stack,
-        cdk_weatherapi_storage_stack,
-    ],
-    project_name_val=factory.TAG_VAL_INFRA_,
-)
-
-factory.add_tags_auto_start_stop(stacks=[cdk_bastion_host_linux_stack], include_resource_type=["AWS::EC2::Instance"])
 
-####################################################################################################
-# --- Base Stacks ---
-####################################################################################################
 
-bkg_ms_comp_subs_meta: dict[str, tuple[int, float]] = {
-    # name: (port, cpu_unit_weighting)
-    api_: (5000, 0.1),
-    beat_: (6380, None),
-    util_: (8001, 0.2),
-    dos_: (8002, 0.3),
-}
-bkg_ms_comp_subs: list[str] = list(bkg_ms_comp_subs_meta.keys())
+@registry.stack("CdkIpsecVpnBaseStack", post_build=add_tags_required_infra)
+def cdk_ipsec_vpn_base_stack(stack_id: str = None) -> CdkIpsecVpnBaseStack:
+    return CdkIpsecVpnBaseStack(
+        scope=app,
+        id=stack_id,
+        description="VPN base resources: IPsec VPN server role, VPN user password secrets, etc.",
+        env=env,
+        termination_protection=True,
+        # --- ^ super() ---
+        component=server_,
+        factory=factory,
+        project_name=ipsec_vpn_,
+        vpc_stack=cdk_vpc_sih_stack(),
+    )
 
-cdk_bkg_base_stack_name: str = factory.get_cdk_stack_id(bkg_, base_comp=True)
-cdk_bkg_base_stack = CdkBkgBaseStack(
-    scope=app,
-    id=cdk_bkg_base_stack_name,
-    description=factory.get_cdk_stack_description(bkg_, base_comp=True, detail="ECR, Security Groups, Secrets Manager"),
-    env=env,
-    termination_protection=True,
-    # --- ^ super() ---
-    bastion_host_private_ips=bastion_host_private_ips,
-    client_vpn_endpoint_stack=client_vpn_endpoint_stack,
-    component=ms_,
-    component_sub_ports={
-        k: (v, bool(k == api_)) for k, v in {k: v[0] for k, v in bkg_ms_comp_subs_meta.items()}.items()
-    },
-    elastic_ip_parameter_names=elastic_ip_parameter_names,
-    factory=factory,
-    project_name=bkg_,
-    project_name_comp_list=[
-        factory.join_sep_score([bkg_, ms_] + j) for j in [[k] for k in bkg_ms_comp_subs] + [[base_]]
-    ],
-    vpc_stack=cdk_vpc_sih_stack,
-)
 
-cdk_dog_base_stack_name: str = factory.get_cdk_stack_id(dog_, base_comp=True)
-cdk_dog_base_stack = CdkDogBaseStack(
-    scope=app,
-    id=cdk_dog_base_stack_name,
-    description=factory.get_cdk_stack_description(dog_, base_comp=True, detail="ECR, Security Groups, Secrets Manager"),
-    env=env,
-    termination_protection=True,
-    # --- ^ super() ---
-    bastion_host_private_ips=bastion_host_private_ips,
-    client_vpn_endpoint_stack=client_vpn_endpoint_stack,
-    component=gw_,
-    deploy_env_preview_demo_meta=get_deploy_env_preview_demo_meta(dog_),
-    elastic_ip_parameter_names=elastic_ip_parameter_names,
-    factory=factory,
-    project_name=dog_,
-    project_name_comp_list=project_name_comp_lists[dog_],
-    project_name_ecomm=factory.join_sep_score([dog_, ecomm_]),
-    vpc_stack=cdk_vpc_sih_stack,
-)
+@registry.stack("CdkIpsecVpnPskStack", post_build=add_tags_required_infra)
+def cdk_ipsec_vpn_psk_stack(stack_id: str = None) -> CdkIpsecVpnPskStack:
+    return CdkIpsecVpnPskStack(
+        scope=app,
+        id=stack_id,
+        description="VPN PSK resources: VPN Pre-Shared Key (PSK) secret, etc.",
+        env=env,
+        termination_protection=True,
+        # --- ^ super() ---
+        base_stack=cdk_ipsec_vpn_base_stack(),
+        component=server_,
+        factory=factory,
+        project_name=ipsec_vpn_,
+        vpc_stack=cdk_vpc_sih_stack(),
+    )
 
-cdk_cat_base_stack_name: str = factory.get_cdk_stack_id(cat_, base_comp=True)
-cdk_cat_base_stack = CdkCatBaseStack(
-    scope=app,
-    id=cdk_cat_base_stack_name,
-    description=factory.get_cdk_stack_description(cat_, base_comp=True, detail="ECR, Security Groups, Secrets Manager"),
-    env=env,
-    termination_protection=True,
-    # --- ^ super() ---
-    bastion_host_private_ips=bastion_host_private_ips,
-    client_vpn_endpoint_stack=client_vpn_endpoint_stack,
-    component=gw_,
-    deploy_env_preview_demo_meta=get_deploy_env_preview_demo_meta(cat_),
-    elastic_ip_parameter_names=elastic_ip_parameter_names,
-    factory=factory,
-    project_name=cat_,
-    project_name_comp_list=project_name_comp_lists[cat_],
-    vpc_stack=cdk_vpc_sih_stack,
-)
 
-cdk_bird_base_stack_name: str = factory.get_cdk_stack_id(bird_, base_comp=True)
-cdk_bird_base_stack = CdkBirdBaseStack(
-    scope=app,
-    id=cdk_bird_base_stack_name,
-    description=factory.get_cdk_stack_description(
-        bird_, base_comp=True, detail="ECR, Security Groups, Secrets Manager"
-    ),
-    env=env,
-    termination_protection=True,
-    # --- ^ super() ---
-    bastion_host_private_ips=bastion_host_private_ips,
-    client_vpn_endpoint_stack=client_vpn_endpoint_stack,
-    component=gw_,
-    deploy_env_preview_demo_meta=get_deploy_env_preview_demo_meta(bird_),
-    elastic_ip_parameter_names=elastic_ip_parameter_names,
-    factory=factory,
-    project_name=bird_,
-    project_name_comp_list=project_name_comp_lists[bird_],
-    vpc_stack=cdk_vpc_sih_stack,
-)
+@registry.stack(cdk_ipsec_vpn_server_stack_name, post_build=add_tags_required_infra)
+def cdk_ipsec_vpn_server_stack(stack_id: str = None) -> CdkIpsecVpnServerStack:
+    return CdkIpsecVpnServerStack(
+        scope=app,
+        id=stack_id,
+        description="VPN resources: IPsec VPN server EC2 instance launched by an ASG, etc.",
+        env=env,
+        termination_protection=True,
+        # --- ^ super() ---
+        base_stack=cdk_ipsec_vpn_base_stack(),
+        client_vpn_endpoint_stack=get_client_vpn_endpoint_stack(),
+        component=server_,
+        elastic_ip=cdk_elastic_ips_stack().elastic_ips[ipsec_vpn_server_],
+        factory=factory,
+        project_name=ipsec_vpn_,
+        psk_stack=cdk_ipsec_vpn_psk_stack(),
+        vpc_stack=cdk_vpc_sih_stack(),
+    )
 
-cdk_cow_base_stack_name: str = factory.get_cdk_stack_id(cow_, base_comp=True)
-cdk_cow_base_stack = CdkCowBaseStack(
-    scope=app,
-    id=cdk_cow_base_stack_name,
-    description=factory.get_cdk_stack_description(cow_, base_comp=True, detail="ECR, Security Groups, Secrets Manager"),
-    env=env,
-    termination_protection=True,
-    # --- ^ super() ---
-    bastion_host_private_ips=bastion_host_private_ips,
-    client_vpn_endpoint_stack=client_vpn_endpoint_stack,
-    component=gw_,
-    deploy_env_preview_demo_meta=get_deploy_env_preview_demo_meta(cow_),
-    elastic_ip_parameter_names=elastic_ip_parameter_names,
-    factory=factory,
-    project_name=cow_,
-    project_name_comp_list=project_name_comp_lists[cow_],
-    vpc_stack=cdk_vpc_sih_stack,
-)
 
-cdk_fish_base_stack_name: str = factory.get_cdk_stack_id(fish_, base_comp=True)
-cdk_fish_base_stack = CdkFishBaseStack(
-    scope=app,
-    id=cdk_fish_base_stack_name,
-    description=factory.get_cdk_stack_description(
-        fish_, base_comp=True, detail="ECR, Security Groups, Secrets Manager"
-    ),
-    env=env,
-    termination_protection=True,
-    # --- ^ super() ---
-    bastion_host_private_ips=bastion_host_private_ips,
-    client_vpn_endpoint_stack=client_vpn_endpoint_stack,
-    component=gw_,
-    deploy_env_preview_demo_meta=get_deploy_env_preview_demo_meta(fish_),
-    elastic_ip_parameter_names=elastic_ip_parameter_names,
-    factory=factory,
-    project_name=fish_,
-    project_name_comp_list=project_name_comp_lists[fish_],
-    vpc_stack=cdk_vpc_sih_stack,
-)
+@registry.stack(cdk_proxy_server_stack_name, post_build=add_tags_required_infra)
+def cdk_proxy_server_stack(stack_id: str = None) -> CdkProxyServerStack:
+    return CdkProxyServerStack(
+        scope=app,
+        id=stack_id,
+        description="Proxy resources: Proxy server EC2 instance launched by an ASG, etc.",
+        env=env,
+        termination_protection=True,
+        # --- ^ super() ---
+        component=server_,
+        elastic_ip=cdk_elastic_ips_stack().elastic_ips[proxy_server_],
+        elastic_ip_parameter_names={k: elastic_ip_parameter_names[k] for k in [ipsec_vpn_server_]},
+        factory=factory,
+        project_name=proxy_,
+    )
 
-####################################################################################################
-# --- Mail (SES) ---
-####################################################################################################
 
-mail_ms_: str = factory.join_sep_score([mail_, ms_])
-mail_supported_base_stacks: list[IConstruct] = [
-    cdk_bkg_base_stack,
-    cdk_dog_base_stack,
-    cdk_cat_base_stack,
-    cdk_bird_base_stack,
-    cdk_fish_base_stack,
-]
+openvpn_vpn_vpc_default: bool = True  # Whether to use the default VPC
+cdk_openvpn_vpn_base_stack_name: str = "CdkOpenvpnVpnBaseStack"
 
-cdk_mail_base_stack_name: str = factory.get_cdk_stack_id(mail_, base_comp=True)
-cdk_mail_base_stack = CdkMailBaseStack(
-    scope=app,
-    id=cdk_mail_base_stack_name,
-    description=factory.get_cdk_stack_description(mail_, base_comp=True, detail="Security Groups, SES"),
-    env=env,
-    termination_protection=True,
-    # --- ^ super() ---
-    component=ms_,
-    factory=factory,
-    mail_users_hosted_zones={
-        getattr(i, factory.MAIL_USER_): getattr(i, factory.HOSTED_ZONE_) for i in mail_supported_base_stacks
-    },
-    project_name=mail_,
-    vpc_stack=cdk_vpc_sih_stack,
-)
-factory.add_tags_required(
-    stacks=[cdk_mail_base_stack],
-    project_name_val=word_map[mail_],
-    custom_val=factory.TAG_VAL_NONE_,
-    env_type_val=factory.TAG_VAL_NONE_,
-    component_val=word_map[base_],
-    deploy_env_val=factory.TAG_VAL_NONE_,
-)
 
-cdk_mail_ms_stacks: dict[str, CdkMailMsStack] = {
-    deploy_env: CdkMailMsStack(
+@registry.stack(cdk_openvpn_vpn_base_stack_name, post_build=add_tags_required_infra)
+def cdk_openvpn_vpn_base_stack(stack_id: str = None) -> CdkOpenvpnVpnBaseStack:
+    return CdkOpenvpnVpnBaseStack(
         scope=app,
-        id=factory.get_cdk_stack_id(mail_, components=[ms_], deploy_env=deploy_env),
-        description=factory.get_cdk_stack_description(
-            mail_, components=[ms_], deploy_env=deploy_env, detail="Lambda functions"
-        ),
+        id=stack_id,
+        description="VPN base resources: OpenVPN VPN server role, etc.",
         env=env,
-        termination_protection=factory.get_termination_protection(deploy_env),
+        termination_protection=True,
         # --- ^ super() ---
-        base_stack=cdk_mail_base_stack,
-        component=ms_,
-        deploy_env=deploy_env,
-        env_meta=env_meta,
+        component=server_,
+        elastic_ip_parameter_names={k: elastic_ip_parameter_names[k] for k in [ipsec_vpn_server_, proxy_server_]},
         factory=factory,
-        project_name=mail_,
-        project_names_ses_email_templates=[factory.get_attr_project_name(i) for i in mail_supported_base_stacks],
-        vpc_stack=cdk_vpc_sih_stack,
+        project_name=openvpn_vpn_,
     )
-    for deploy_env, env_meta in factory.deploy_envs_stag_prod_meta.items()
-}
-factory.add_tags_required_wrapper(cdk_mail_ms_stacks, project_name=mail_, component=ms_)
 
-####################################################################################################
-# --- Pdf (DOCX-to-PDF) ---
-####################################################################################################
 
-pdf_ms_: str = factory.join_sep_score([pdf_, ms_])
-pdf_supported_base_stacks: list = [
-    cdk_bkg_base_stack,
-    cdk_dog_base_stack,
-    cdk_cat_base_stack,
-    cdk_bird_base_stack,
-    cdk_fish_base_stack,
-]
+@registry.stack("CdkOpenvpnVpnCloudFrontStack", post_build=add_tags_required_infra)
+def cdk_openvpn_vpn_cloudfront_stack(stack_id: str = None) -> CdkOpenvpnVpnCloudFrontStack:
+    return CdkOpenvpnVpnCloudFrontStack(
+        scope=app,
+        id=stack_id,
+        description="VPN CloudFront resources: ACM certificates, WAF Web ACLs, etc.",
+        env=env_cloudfront,
+        termination_protection=True,
+        # --- ^ super() ---
+        base_stack=cdk_openvpn_vpn_base_stack(),
+        component=server_,
+        factory=factory,
+        project_name=openvpn_vpn_,
+    )
 
-cdk_pdf_base_stack_name: str = factory.get_cdk_stack_id(pdf_, base_comp=True)
-cdk_pdf_base_stack = CdkPdfBaseStack(
-    scope=app,
-    id=cdk_pdf_base_stack_name,
-    description=factory.get_cdk_stack_description(pdf_, base_comp=True, detail="Security Groups, SES"),
-    env=env,
-    termination_protection=True,
-    # --- ^ super() ---
-    component=ms_,
-    factory=factory,
-    project_name=pdf_,
-    vpc_stack=cdk_vpc_sih_stack,
-)
-factory.add_tags_required(
-    stacks=[cdk_pdf_base_stack],
-    project_name_val=word_map[pdf_],
-    custom_val=factory.TAG_VAL_NONE_,
-    env_type_val=factory.TAG_VAL_NONE_,
-    component_val=word_map[base_],
-    deploy_env_val=factory.TAG_VAL_NONE_,
-)
-
-cdk_pdf_ms_stacks: dict[str, CdkPdfMsStack] = {
-    deploy_env: CdkPdfMsStack(
-        scope=app,
-        id=factory.get_cdk_stack_id(pdf_, components=[ms_], deploy_env=deploy_env),
-        description=factory.get_cdk_stack_description(
-            pdf_, components=[ms_], deploy_env=deploy_env, detail="Lambda functions"
-        ),
+
+@registry.stack("CdkOpenvpnVpnUserStack", post_build=add_tags_required_infra)
+def cdk_openvpn_vpn_user_stack(stack_id: str = None) -> CdkOpenvpnVpnUserStack:
+    return CdkOpenvpnVpnUserStack(
+        scope=app,
+        id=stack_id,
+        description="VPN User resources: VPN user password secrets, etc.",
         env=env,
-        termination_protection=factory.get_termination_protection(deploy_env),
+        termination_protection=True,
         # --- ^ super() ---
-        base_stack=cdk_pdf_base_stack,
-        component=ms_,
-        deploy_env=deploy_env,
-        env_meta=env_meta,
+        base_stack=cdk_openvpn_vpn_base_stack(),
+        component=server_,
         factory=factory,
-        project_name=pdf_,
-        vpc_stack=cdk_vpc_sih_stack,
+        project_name=openvpn_vpn_,
+        vpc_default=openvpn_vpn_vpc_default,
+        vpc_stack=cdk_vpc_sih_stack(),
     )
-    for deploy_env, env_meta in factory.deploy_envs_stag_prod_meta.items()
-}
-factory.add_tags_required_wrapper(cdk_pdf_ms_stacks, project_name=pdf_, component=ms_)
 
-####################################################################################################
-# --- CDN (Content Delivery Network) ---
-####################################################################################################
 
-cdn_assets_: str = factory.join_sep_score([cdn_, assets_])
+@registry.stack(cdk_openvpn_vpn_server_stack_name, post_build=add_tags_required_infra)
+def cdk_openvpn_vpn_server_stack(stack_id: str = None) -> CdkOpenvpnVpnServerStack:
+    return CdkOpenvpnVpnServerStack(
+        scope=app,
+        id=stack_id,
+        description="VPN resources: ALB, NLB, OpenVPN VPN server EC2 instance launched by an ASG, etc.",
+        env=env,
+        termination_protection=True,
+        # --- ^ super() ---
+        base_stack=cdk_openvpn_vpn_base_stack(),
+        component=server_,
+        elastic_ip=cdk_elastic_ips_stack().elastic_ips[openvpn_vpn_server_],
+        factory=factory,
+        project_name=openvpn_vpn_,
+        user_stack=cdk_openvpn_vpn_user_stack(),
+        vpc_default=openvpn_vpn_vpc_default,
+        vpc_stack=cdk_vpc_sih_stack(),
+    )
 
-cdk_cdn_base_stack_name: str = factory.get_cdk_stack_id(cdn_, base_comp=True)
-cdk_cdn_base_stack = CdkCdnBaseStack(
-    scope=app,
-    id=cdk_cdn_base_stack_name,
-    description=factory.get_cdk_stack_description(cdn_, base_comp=True, detail="ECR, Security Groups, Secrets Manager"),
-    env=env,
-    termination_protection=True,
-    # --- ^ super() ---
-    component=assets_,
-    factory=factory,
-    project_name=cdn_,
-)
-cdk_cdn_cloudfront_base_stack = CdkCdnCloudFrontBaseStack(
-    scope=app,
-    id=factory.get_cdk_stack_id(cdn_, components=[cf_], base_comp=True),
-    description=factory.get_cdk_stack_description(
-        cdn_, components=[cf_], base_comp=True, detail="WAF Regex Pattern Set"
-    ),
-    env=env_cloudfront,
-    termination_protection=True,
-    # --- ^ super() ---
-    base_stack=cdk_cdn_base_stack,
-    component=assets_,
-    elastic_ip_str_list=elastic_ip_str_list,
-    factory=factory,
-    project_name=cdn_,
-)
-factory.add_tags_required(
-    stacks=[cdk_cdn_base_stack, cdk_cdn_cloudfront_base_stack],
-    project_name_val=word_map[cdn_],
-    custom_val=factory.TAG_VAL_NONE_,
-    env_type_val=factory.TAG_VAL_NONE_,
-    component_val=word_map[base_],
-    deploy_env_val=factory.TAG_VAL_NONE_,
-)
 
-cdk_cdn_assets_cloudfront_stacks: dict[str, CdkCdnCloudFrontStack] = {
-    deploy_env: CdkCdnCloudFrontStack(
+@registry.stack("CdkLambdaEc2InstanceAutoStack", post_build=add_tags_required_infra)
+def cdk_lambda_ec2_instance_auto_stack(stack_id: str = None) -> CdkLambdaEc2InstanceAutoStack:
+    return CdkLambdaEc2InstanceAutoStack(
         scope=app,
-        id=factory.get_cdk_stack_id(cdn_, components=[assets_, cf_], deploy_env=deploy_env),
-        description=factory.get_cdk_stack_description(
-            cdn_, components=[assets_, cf_], deploy_env=deploy_env, detail="ACM certificates, WAF Web ACLs"
-        ),
-        env=env_cloudfront,
+        id=stack_id,
+        description="EC2 instance auto start/stop resources: Lambda functions, etc.",
+        env=env,
         termination_protection=True,
         # --- ^ super() ---
-        base_stack=cdk_cdn_base_stack,
-        cloudfront_base_stack=cdk_cdn_cloudfront_base_stack,
-        component=assets_,
-        deploy_env=deploy_env,
-        env_meta=env_meta,
         factory=factory,
-        project_name=cdn_,
+        vpc_stack=cdk_vpc_sih_stack(),
     )
-    for deploy_env, env_meta in factory.deploy_envs_stag_prod_meta.items()
-}
-factory.add_tags_required_wrapper(cdk_cdn_assets_cloudfront_stacks, project_name=cdn_, component=cf_)
 
-cdk_cdn_storage_stacks: dict[str, CdkCdnStorageStack] = {
-    deploy_env: CdkCdnStorageStack(
+
+@registry.stack("CdkLambdaRdsInstanceAutoStack", post_build=add_tags_required_infra)
+def cdk_lambda_rds_instance_auto_stack(stack_id: str = None) -> CdkLambdaRdsInstanceAutoStack:
+    return CdkLambdaRdsInstanceAutoStack(
         scope=app,
-        id=factory.get_cdk_stack_id(cdn_, components=[storage_], deploy_env=deploy_env),
-        description=factory.get_cdk_stack_description(cdn_, components=[storage_], deploy_env=deploy_env, detail="S3"),
+        id=stack_id,
+        description="RDS database instance auto start/stop resources: Lambda functions, etc.",
         env=env,
-        termination_protection=factory.get_termination_protection(deploy_env),
+        termination_protection=True,
         # --- ^ super() ---
-        base_stack=cdk_cdn_base_stack,
-        component=assets_,
-        deploy_env=deploy_env,
-        env_meta=env_meta,
         factory=factory,
-        project_name=cdn_,
+        vpc_stack=cdk_vpc_sih_stack(),
     )
-    for deploy_env, env_meta in factory.deploy_envs_stag_prod_meta.items()
-}
-factory.add_tags_required_wrapper(cdk_cdn_storage_stacks, project_name=cdn_, component=assets_)
 
-cdk_cdn_assets_stacks: dict[str, CdkCdnAssetsStack] = {
-    deploy_env: CdkCdnAssetsStack(
+
+@registry.stack("CdkAmplifyCiCdStack", post_build=add_tags_required_infra)
+def cdk_amplify_ci_cd_stack(stack_id: str = None) -> CdkAmplifyCiCdStack:
+    return CdkAmplifyCiCdStack(
         scope=app,
-        id=factory.get_cdk_stack_id(cdn_, components=[assets_], deploy_env=deploy_env),
-        description=factory.get_cdk_stack_description(
-            cdn_, components=[assets_], deploy_env=deploy_env, detail="CloudFront Distribution, ALB, ECS"
-        ),
+        id=stack_id,
+        description="Pipeline support resources for all deployment envs",
         env=env,
-        termination_protection=factory.get_termination_protection(deploy_env),
+        termination_protection=True,
         # --- ^ super() ---
-        base_stack=cdk_cdn_base_stack,
-        component=assets_,
-        deploy_env=deploy_env,
-        env_meta=env_meta,
         factory=factory,
-        project_name=cdn_,
-        storage_stack=cdk_cdn_storage_stacks[deploy_env],
     )
-    for deploy_env, env_meta in factory.deploy_envs_stag_prod_meta.items()
-}
-factory.add_tags_required_wrapper(cdk_cdn_assets_stacks, project_name=cdn_, component=assets_)
 
-####################################################################################################
-# --- LION ---
-####################################################################################################
 
-# Global resources chosen to be centrally located in London (eu-west-2) region
-lion_global_region: str = factory.EU_WEST_2_
+@registry.stack("CdkCodepipelineCiCdStack", post_build=add_tags_required_infra)
+def cdk_codepipeline_ci_cd_stack(stack_id: str = None) -> CdkCodepipelineCiCdStack:
+    return CdkCodepipelineCiCdStack(
+        scope=app,
+        id=stack_id,
+        description="Pipeline support resources for all deployment envs",
+        env=env,
+        termination_protection=True,
+        # --- ^ super() ---
+        factory=factory,
+    )
 
-lion_cache_region_af: str = "AF"
-lion_cache_region_ant: str = "ANT"
-lion_cache_region_arc: str = "ARC"
+
+cdk_pypi_base_stack_name: str = factory.get_cdk_stack_id(pypi_, base_comp=True)
+
+
+@registry.stack(cdk_pypi_base_stack_name, post_build=add_tags_required_infra)
+def cdk_pypi_base_stack(stack_id: str = None) -> CdkPypiBaseStack:
+    return CdkPypiBaseStack(
+        scope=app,
+        id=stack_id,
+        description=factory.get_cdk_stack_description(pypi_, base_comp=True, detail="Security Groups"),
+        env=env,
+        termination_protection=True,
+        # --- ^ super() ---
+        bastion_host_private_ips=get_bastion_host_private_ips(),
+        client_vpn_endpoint_stack=get_client_vpn_endpoint_stack(),
+        component=server_,
+        elastic_ip_parameter_names=elastic_ip_parameter_names,
+        factory=factory,
+        project_name=pypi_,
+        vpc_stack=cdk_vpc_sih_stack(),
+    )
+
+
+@registry.stack(
+    factory.get_cdk_stack_id(pypi_, components=[cf_]),
+    dependencies=[cdk_vpc_sih_stack],
+    post_build=add_tags_required_infra,
+)
+def cdk_pypi_cloudfront_stack(stack_id: str = None) -> CdkPypiCloudFrontStack:
+    return CdkPypiCloudFrontStack(
+        scope=app,
+        id=stack_id,
+        description=factory.get_cdk_stack_description(pypi_, components=[cf_], detail="ACM certificates, WAF Web ACLs"),
+        env=env_cloudfront,
+        termination_protection=True,
+        # --- ^ super() ---
+        base_stack=cdk_pypi_base_stack(),
+        component=server_,
+        elastic_ip_str_list=elastic_ip_str_list,
+        factory=factory,
+        project_name=pypi_,
+    )
+
+
+@registry.stack(factory.get_cdk_stack_id(pypi_, components=[storage_]), post_build=add_tags_required_infra)
+def cdk_pypi_storage_stack(stack_id: str = None) -> CdkPypiStorageStack:
+    return CdkPypiStorageStack(
+        scope=app,
+        id=stack_id,
+        description=factory.get_cdk_stack_description(pypi_, components=[storage_], detail="EFS"),
+        env=env,
+        termination_protection=True,
+        # --- ^ super() ---
+        base_stack=cdk_pypi_base_stack(),
+        component=server_,
+        factory=factory,
+        project_name=pypi_,
+        vpc_stack=cdk_vpc_sih_stack(),
+    )
+
+
+@registry.stack(factory.get_cdk_stack_id(pypi_, components=[server_]), post_build=add_tags_required_infra)
+def cdk_pypi_server_stack(stack_id: str = None) -> CdkPypiServerStack:
+    return CdkPypiServerStack(
+        scope=app,
+        id=stack_id,
+        description=factory.get_cdk_stack_description(
+            pypi_,
+            components=[server_],
+            detail=f"ALB, {word_map[pypi_]} {word_map[server_]} EC2 instance launched by an ASG",
+        ),
+        env=env,
+        termination_protection=True,
+        # --- ^ super() ---
+        base_stack=cdk_pypi_base_stack(),
+        component=server_,
+        factory=factory,
+        project_name=pypi_,
+        storage_stack=cdk_pypi_storage_stack(),
+        vpc_stack=cdk_vpc_sih_stack(),
+    )
+
+
+sih_autoiod_: str = factory.join_sep_score([sih_, autoiod_])
+sih_bkg_: str = factory.join_sep_score([sih_, bkg_])
+sih_dosimetry_: str = factory.join_sep_score([sih_, dosimetry_])
+sih_lion_: str = factory.join_sep_score([sih_, lion_])
+sih_hds_: str = factory.join_sep_score([sih_, hds_])
+sih_spectrum_: str = factory.join_sep_score([sih_, spectrum_])
+pypi_package_mappings: dict[str] = {lion_: sih_lion_}
+pypi_package_list: list[str] = [sih_, sih_autoiod_, sih_bkg_, sih_dosimetry_, sih_lion_, sih_hds_, sih_spectrum_]
+pypi_package_list_word_map: dict[str, str] = {
+    i: factory.join_sep_empty([j.capitalize() for j in i.split(factory.SEP_SCORE_)]) for i in pypi_package_list
+}
+
+
+@registry.stack(
+    factory.get_cdk_stack_id(pypi_, components=[package_], base_comp=True), post_build=add_tags_required_infra
+)
+def cdk_pypi_package_base_stack(stack_id: str = None) -> CdkPypiPackageBaseStack:
+    return CdkPypiPackageBaseStack(
+        scope=app,
+        id=stack_id,
+        description=factory.get_cdk_stack_description(
+            pypi_, components=[package_], base_comp=True, detail="SSM Parameters"
+        ),
+        env=env,
+        termination_protection=True,
+        # --- ^ super() ---
+        factory=factory,
+        project_name=pypi_,
+        pypi_package_list=pypi_package_list,
+    )
+
+
+cdk_pypi_package_pipeline_stacks: dict[str, dict[str, CdkPypiPackagePipelineStack]] = {}
+for pypi_package in pypi_package_list:
+
+    @registry.stack_map(
+        {branch: pypi_package for branch in factory.DEV_MAIN_BRANCH_LIST},
+        lambda branch, pypi_package=pypi_package: factory.get_cdk_stack_id(
+            pypi_, components=[package_, (pypi_package_list_word_map[pypi_package],), pipeline_], deploy_env=branch
+        ),
+        dependencies=[cdk_codepipeline_ci_cd_stack],
+        post_build=lambda s: factory.add_tags_required(
+            stacks=list(s.values()), project_name_val=factory.TAG_VAL_INFRA_
+        ),
+    )
+    def cdk_pypi_package_pipeline_stacks_(
+        stack_id: str, branch: str, pypi_package_: str
+    ) -> CdkPypiPackagePipelineStack:
+        return CdkPypiPackagePipelineStack(
+            scope=app,
+            id=stack_id,
+            description=factory.get_cdk_stack_description(
+                pypi_,
+                components=[package_, (pypi_package_list_word_map[pypi_package_],), pipeline_],
+                deploy_env=branch,
+                detail="CodeBuild, CodePipeline",
+            ),
+            env=env,
+            termination_protection=True,
+            # --- ^ super() ---
+            base_stack=cdk_pypi_package_base_stack(),
+            branch=branch,
+            factory=factory,
+            project_name=pypi_package_,
+            pypi_base_stack=cdk_pypi_base_stack(),
+            vpc_stack=cdk_vpc_sih_stack(),
+        )
+
+    cdk_pypi_package_pipeline_stacks[pypi_package] = cdk_pypi_package_pipeline_stacks_
+
+
+@registry.stack(factory.get_cdk_stack_id(metoffice_, components=[storage_]), post_build=add_tags_required_infra)
+def cdk_metoffice_storage_stack(stack_id: str = None) -> CdkMetofficeStorageStack:
+    return CdkMetofficeStorageStack(
+        scope=app,
+        id=stack_id,
+        description=factory.get_cdk_stack_description(
+            metoffice_,
+            components=[storage_],
+            detail=f"S3, IAM, Lambda, {word_map[metoffice_]} {word_map[storage_]} solution, "
+            f"for remote ingestion, alternative to FTP server",
+        ),
+        env=env,
+        termination_protection=True,
+        # --- ^ super() ---
+        component=storage_,
+        factory=factory,
+        project_name=metoffice_,
+    )
+
+
+@registry.stack(factory.get_cdk_stack_id(weatherapi_, components=[storage_]), post_build=add_tags_required_infra)
+def cdk_weatherapi_storage_stack(stack_id: str = None) -> CdkWeatherapiStorageStack:
+    return CdkWeatherapiStorageStack(
+        scope=app,
+        id=stack_id,
+        description=factory.get_cdk_stack_description(
+            weatherapi_,
+            components=[storage_],
+            detail=f"Lambda, {word_map[weatherapi_]} {word_map[storage_]} solution, for downloading of WeatherAPI data",
+        ),
+        env=env,
+        termination_protection=True,
+        # --- ^ super() ---
+        component=storage_,
+        factory=factory,
+        project_name=weatherapi_,
+    )
+
+
+####################################################################################################
+# --- Base Stacks ---
+####################################################################################################
+
+bkg_ms_comp_subs_meta: dict[str, tuple[int, float]] = {
+    # name: (port, cpu_unit_weighting)
+    api_: (5000, 0.1),
+    beat_: (6380, None),
+    util_: (8001, 0.2),
+    dos_: (8002, 0.3),
+}
+bkg_ms_comp_subs: list[str] = list(bkg_ms_comp_subs_meta.keys())
+
+cdk_bkg_base_stack_name: str = factory.get_cdk_stack_id(bkg_, base_comp=True)
+
+
+@registry.stack(cdk_bkg_base_stack_name, post_build=add_tags_required_base(bkg_))
+def cdk_bkg_base_stack(stack_id: str = None) -> CdkBkgBaseStack:
+    return CdkBkgBaseStack(
+        scope=app,
+        id=stack_id,
+        description=factory.get_cdk_stack_description(
+            bkg_, base_comp=True, detail="ECR, Security Groups, Secrets Manager"
+        ),
+        env=env,
+        termination_protection=True,
+        # --- ^ super() ---
+        bastion_host_private_ips=get_bastion_host_private_ips(),
+        client_vpn_endpoint_stack=get_client_vpn_endpoint_stack(),
+        component=ms_,
+        component_sub_ports={
+            k: (v, bool(k == api_)) for k, v in {k: v[0] for k, v in bkg_ms_comp_subs_meta.items()}.items()
+        },
+        elastic_ip_parameter_names=elastic_ip_parameter_names,
+        factory=factory,
+        project_name=bkg_,
+        project_name_comp_list=[
+            factory.join_sep_score([bkg_, ms_] + j) for j in [[k] for k in bkg_ms_comp_subs] + [[base_]]
+        ],
+        vpc_stack=cdk_vpc_sih_stack(),
+    )
+
+
+cdk_dog_base_stack_name: str = factory.get_cdk_stack_id(dog_, base_comp=True)
+
+
+@registry.stack(cdk_dog_base_stack_name, post_build=add_tags_required_base(dog_))
+def cdk_dog_base_stack(stack_id: str = None) -> CdkDogBaseStack:
+    return CdkDogBaseStack(
+        scope=app,
+        id=stack_id,
+        description=factory.get_cdk_stack_description(
+            dog_, base_comp=True, detail="ECR, Security Groups, Secrets Manager"
+        ),
+        env=env,
+        termination_protection=True,
+        # --- ^ super() ---
+        bastion_host_private_ips=get_bastion_host_private_ips(),
+        client_vpn_endpoint_stack=get_client_vpn_endpoint_stack(),
+        component=gw_,
+        deploy_env_preview_demo_meta=get_deploy_env_preview_demo_meta(dog_),
+        elastic_ip_parameter_names=elastic_ip_parameter_names,
+        factory=factory,
+        project_name=dog_,
+        project_name_comp_list=project_name_comp_lists[dog_],
+        project_name_ecomm=factory.join_sep_score([dog_, ecomm_]),
+        vpc_stack=cdk_vpc_sih_stack(),
+    )
+
+
+cdk_cat_base_stack_name: str = factory.get_cdk_stack_id(cat_, base_comp=True)
+
+
+@registry.stack(cdk_cat_base_stack_name, post_build=add_tags_required_base(cat_))
+def cdk_cat_base_stack(stack_id: str = None) -> CdkCatBaseStack:
+    return CdkCatBaseStack(
+        scope=app,
+        id=stack_id,
+        description=factory.get_cdk_stack_description(
+            cat_, base_comp=True, detail="ECR, Security Groups, Secrets Manager"
+        ),
+        env=env,
+        termination_protection=True,
+        # --- ^ super() ---
+        bastion_host_private_ips=get_bastion_host_private_ips(),
+        client_vpn_endpoint_stack=get_client_vpn_endpoint_stack(),
+        component=gw_,
+        deploy_env_preview_demo_meta=get_deploy_env_preview_demo_meta(cat_),
+        elastic_ip_parameter_names=elastic_ip_parameter_names,
+        factory=factory,
+        project_name=cat_,
+        project_name_comp_list=project_name_comp_lists[cat_],
+        vpc_stack=cdk_vpc_sih_stack(),
+    )
+
+
+cdk_bird_base_stack_name: str = factory.get_cdk_stack_id(bird_, base_comp=True)
+
+
+@registry.stack(cdk_bird_base_stack_name, post_build=add_tags_required_base(bird_))
+def cdk_bird_base_stack(stack_id: str = None) -> CdkBirdBaseStack:
+    return CdkBirdBaseStack(
+        scope=app,
+        id=stack_id,
+        description=factory.get_cdk_stack_description(
+            bird_, base_comp=True, detail="ECR, Security Groups, Secrets Manager"
+        ),
+        env=env,
+        termination_protection=True,
+        # --- ^ super() ---
+        bastion_host_private_ips=get_bastion_host_private_ips(),
+        client_vpn_endpoint_stack=get_client_vpn_endpoint_stack(),
+        component=gw_,
+        deploy_env_preview_demo_meta=get_deploy_env_preview_demo_meta(bird_),
+        elastic_ip_parameter_names=elastic_ip_parameter_names,
+        factory=factory,
+        project_name=bird_,
+        project_name_comp_list=project_name_comp_lists[bird_],
+        vpc_stack=cdk_vpc_sih_stack(),
+    )
+
+
+cdk_cow_base_stack_name: str = factory.get_cdk_stack_id(cow_, base_comp=True)
+
+
+@registry.stack(cdk_cow_base_stack_name, post_build=add_tags_required_base(cow_))
+def cdk_cow_base_stack(stack_id: str = None) -> CdkCowBaseStack:
+    return CdkCowBaseStack(
+        scope=app,
+        id=stack_id,
+        description=factory.get_cdk_stack_description(
+            cow_, base_comp=True, detail="ECR, Security Groups, Secrets Manager"
+        ),
+        env=env,
+        termination_protection=True,
+        # --- ^ super() ---
+        bastion_host_private_ips=get_bastion_host_private_ips(),
+        client_vpn_endpoint_stack=get_client_vpn_endpoint_stack(),
+        component=gw_,
+        deploy_env_preview_demo_meta=get_deploy_env_preview_demo_meta(cow_),
+        elastic_ip_parameter_names=elastic_ip_parameter_names,
+        factory=factory,
+        project_name=cow_,
+        project_name_comp_list=project_name_comp_lists[cow_],
+        vpc_stack=cdk_vpc_sih_stack(),
+    )
+
+
+cdk_fish_base_stack_name: str = factory.get_cdk_stack_id(fish_, base_comp=True)
+
+
+@registry.stack(cdk_fish_base_stack_name, post_build=add_tags_required_base(fish_))
+def cdk_fish_base_stack(stack_id: str = None) -> CdkFishBaseStack:
+    return CdkFishBaseStack(
+        scope=app,
+        id=stack_id,
+        description=factory.get_cdk_stack_description(
+            fish_, base_comp=True, detail="ECR, Security Groups, Secrets Manager"
+        ),
+        env=env,
+        termination_protection=True,
+        # --- ^ super() ---
+        bastion_host_private_ips=get_bastion_host_private_ips(),
+        client_vpn_endpoint_stack=get_client_vpn_endpoint_stack(),
+        component=gw_,
+        deploy_env_preview_demo_meta=get_deploy_env_preview_demo_meta(fish_),
+        elastic_ip_parameter_names=elastic_ip_parameter_names,
+        factory=factory,
+        project_name=fish_,
+        project_name_comp_list=project_name_comp_lists[fish_],
+        vpc_stack=cdk_vpc_sih_stack(),
+    )
+
+
+####################################################################################################
+# --- Mail (SES) ---
+####################################################################################################
+
+mail_ms_: str = factory.join_sep_score([mail_, ms_])
+
+
+def get_mail_supported_base_stacks() -> list[IConstruct]:
+    return [
+        cdk_bkg_base_stack(),
+        cdk_dog_base_stack(),
+        cdk_cat_base_stack(),
+        cdk_bird_base_stack(),
+        cdk_fish_base_stack(),
+    ]
+
+
+cdk_mail_base_stack_name: str = factory.get_cdk_stack_id(mail_, base_comp=True)
+
+
+@registry.stack(cdk_mail_base_stack_name, post_build=add_tags_required_base(mail_))
+def cdk_mail_base_stack(stack_id: str = None) -> CdkMailBaseStack:
+    return CdkMailBaseStack(
+        scope=app,
+        id=stack_id,
+        description=factory.get_cdk_stack_description(mail_, base_comp=True, detail="Security Groups, SES"),
+        env=env,
+        termination_protection=True,
+        # --- ^ super() ---
+        component=ms_,
+        factory=factory,
+        mail_users_hosted_zones={
+            getattr(i, factory.MAIL_USER_): getattr(i, factory.HOSTED_ZONE_) for i in get_mail_supported_base_stacks()
+        },
+        project_name=mail_,
+        vpc_stack=cdk_vpc_sih_stack(),
+    )
+
+
+@registry.stack_map(
+    factory.deploy_envs_stag_prod_meta,
+    lambda deploy_env: factory.get_cdk_stack_id(mail_, components=[ms_], deploy_env=deploy_env),
+    post_build=lambda s: factory.add_tags_required_wrapper(s, project_name=mail_, component=ms_),
+)
+def cdk_mail_ms_stacks(stack_id: str, deploy_env: str, env_meta: dict) -> CdkMailMsStack:
+    return CdkMailMsStack(
+        scope=app,
+        id=stack_id,
+        description=factory.get_cdk_stack_description(
+            mail_, components=[ms_], deploy_env=deploy_env, detail="Lambda functions"
+        ),
+        env=env,
+        termination_protection=factory.get_termination_protection(deploy_env),
+        # --- ^ super() ---
+        base_stack=cdk_mail_base_stack(),
+        component=ms_,
+        deploy_env=deploy_env,
+        env_meta=env_meta,
+        factory=factory,
+        project_name=mail_,
+        project_names_ses_email_templates=[factory.get_attr_project_name(i) for i in get_mail_supported_base_stacks()],
+        vpc_stack=cdk_vpc_sih_stack(),
+    )
+
+
+####################################################################################################
+# --- Pdf (DOCX-to-PDF) ---
+####################################################################################################
+
+pdf_ms_: str = factory.join_sep_score([pdf_, ms_])
+
+
+def get_pdf_supported_base_stacks() -> list:
+    return [
+        cdk_bkg_base_stack(),
+        cdk_dog_base_stack(),
+        cdk_cat_base_stack(),
+        cdk_bird_base_stack(),
+        cdk_fish_base_stack(),
+    ]
+
+
+cdk_pdf_base_stack_name: str = factory.get_cdk_stack_id(pdf_, base_comp=True)
+
+
+@registry.stack(cdk_pdf_base_stack_name, post_build=add_tags_required_base(pdf_))
+def cdk_pdf_base_stack(stack_id: str = None) -> CdkPdfBaseStack:
+    return CdkPdfBaseStack(
+        scope=app,
+        id=stack_id,
+        description=factory.get_cdk_stack_description(pdf_, base_comp=True, detail="Security Groups, SES"),
+        env=env,
+        termination_protection=True,
+        # --- ^ super() ---
+        component=ms_,
+        factory=factory,
+        project_name=pdf_,
+        vpc_stack=cdk_vpc_sih_stack(),
+    )
+
+
+@registry.stack_map(
+    factory.deploy_envs_stag_prod_meta,
+    lambda deploy_env: factory.get_cdk_stack_id(pdf_, components=[ms_], deploy_env=deploy_env),
+    dependencies=[cdk_codepipeline_ci_cd_stack],
+    post_build=lambda s: factory.add_tags_required_wrapper(s, project_name=pdf_, component=ms_),
+)
+def cdk_pdf_ms_stacks(stack_id: str, deploy_env: str, env_meta: dict) -> CdkPdfMsStack:
+    return CdkPdfMsStack(
+        scope=app,
+        id=stack_id,
+        description=factory.get_cdk_stack_description(
+            pdf_, components=[ms_], deploy_env=deploy_env, detail="Lambda functions"
+        ),
+        env=env,
+        termination_protection=factory.get_termination_protection(deploy_env),
+        # --- ^ super() ---
+        base_stack=cdk_pdf_base_stack(),
+        component=ms_,
+        deploy_env=deploy_env,
+        env_meta=env_meta,
+        factory=factory,
+        project_name=pdf_,
+        vpc_stack=cdk_vpc_sih_stack(),
+    )
+
+
+####################################################################################################
+# --- CDN (Content Delivery Network) ---
+####################################################################################################
+
+cdn_assets_: str = factory.join_sep_score([cdn_, assets_])
+
+cdk_cdn_base_stack_name: str = factory.get_cdk_stack_id(cdn_, base_comp=True)
+
+
+@registry.stack(cdk_cdn_base_stack_name, post_build=add_tags_required_base(cdn_))
+def cdk_cdn_base_stack(stack_id: str = None) -> CdkCdnBaseStack:
+    return CdkCdnBaseStack(
+        scope=app,
+        id=stack_id,
+        description=factory.get_cdk_stack_description(
+            cdn_, base_comp=True, detail="ECR, Security Groups, Secrets Manager"
+        ),
+        env=env,
+        termination_protection=True,
+        # --- ^ super() ---
+        component=assets_,
+        factory=factory,
+        project_name=cdn_,
+    )
+
+
+@registry.stack(
+    factory.get_cdk_stack_id(cdn_, components=[cf_], base_comp=True),
+    dependencies=[cdk_vpc_sih_stack],
+    post_build=add_tags_required_base(cdn_),
+)
+def cdk_cdn_cloudfront_base_stack(stack_id: str = None) -> CdkCdnCloudFrontBaseStack:
+    return CdkCdnCloudFrontBaseStack(
+        scope=app,
+        id=stack_id,
+        description=factory.get_cdk_stack_description(
+            cdn_, components=[cf_], base_comp=True, detail="WAF Regex Pattern Set"
+        ),
+        env=env_cloudfront,
+        termination_protection=True,
+        # --- ^ super() ---
+        base_stack=cdk_cdn_base_stack(),
+        component=assets_,
+        elastic_ip_str_list=elastic_ip_str_list,
+        factory=factory,
+        project_name=cdn_,
+    )
+
+
+@registry.stack_map(
+    factory.deploy_envs_stag_prod_meta,
+    lambda deploy_env: factory.get_cdk_stack_id(cdn_, components=[assets_, cf_], deploy_env=deploy_env),
+    post_build=lambda s: factory.add_tags_required_wrapper(s, project_name=cdn_, component=cf_),
+)
+def cdk_cdn_assets_cloudfront_stacks(stack_id: str, deploy_env: str, env_meta: dict) -> CdkCdnCloudFrontStack:
+    return CdkCdnCloudFrontStack(
+        scope=app,
+        id=stack_id,
+        description=factory.get_cdk_stack_description(
+            cdn_, components=[assets_, cf_], deploy_env=deploy_env, detail="ACM certificates, WAF Web ACLs"
+        ),
+        env=env_cloudfront,
+        termination_protection=True,
+        # --- ^ super() ---
+        base_stack=cdk_cdn_base_stack(),
+        cloudfront_base_stack=cdk_cdn_cloudfront_base_stack(),
+        component=assets_,
+        deploy_env=deploy_env,
+        env_meta=env_meta,
+        factory=factory,
+        project_name=cdn_,
+    )
+
+
+@registry.stack_map(
+    factory.deploy_envs_stag_prod_meta,
+    lambda deploy_env: factory.get_cdk_stack_id(cdn_, components=[assets_], deploy_env=deploy_env),
+    post_build=lambda s: factory.add_tags_required_wrapper(s, project_name=cdn_, component=assets_),
+)
+def cdk_cdn_assets_stacks(stack_id: str, deploy_env: str, env_meta: dict) -> CdkCdnAssetsStack:
+    return CdkCdnAssetsStack(
+        scope=app,
+        id=stack_id,
+        description=factory.get_cdk_stack_description(
+            cdn_, components=[assets_], deploy_env=deploy_env, detail="CloudFront Distribution, ALB, ECS"
+        ),
+        env=env,
+        termination_protection=factory.get_termination_protection(deploy_env),
+        # --- ^ super() ---
+        base_stack=cdk_cdn_base_stack(),
+        component=assets_,
+        deploy_env=deploy_env,
+        env_meta=env_meta,
+        factory=factory,
+        project_name=cdn_,
+        vpc_stack=cdk_vpc_sih_stack(),
+    )
+
+
+@registry.stack_map(
+    factory.deploy_envs_stag_prod_meta,
+    lambda deploy_env: factory.get_cdk_stack_id(cdn_, components=[storage_], deploy_env=deploy_env),
+    post_build=lambda s: factory.add_tags_required_wrapper(s, project_name=cdn_, component=assets_),
+)
+def cdk_cdn_storage_stacks(stack_id: str, deploy_env: str, env_meta: dict) -> CdkCdnStorageStack:
+    return CdkCdnStorageStack(
+        scope=app,
+        id=stack_id,
+        description=factory.get_cdk_stack_description(cdn_, components=[storage_], deploy_env=deploy_env, detail="S3"),
+        env=env,
+        termination_protection=factory.get_termination_protection(deploy_env),
+        # --- ^ super() ---
+        assets_stack=cdk_cdn_assets_stacks[deploy_env],
+        base_stack=cdk_cdn_base_stack(),
+        component=assets_,
+        deploy_env=deploy_env,
+        env_meta=env_meta,
+        factory=factory,
+        project_name=cdn_,
+    )
+
+
+####################################################################################################
+# --- LION ---
+####################################################################################################
+
+# Global resources chosen to be centrally located in London (eu-west-2) region
+lion_global_region: str = factory.EU_WEST_2_
+
+lion_cache_region_af: str = "AF"
+lion_cache_region_ant: str = "ANT"
+lion_cache_region_arc: str = "ARC"
 lion_cache_region_asi: str = "ASI"
 lion_cache_region_au: str = "AU"
 lion_cache_region_eu: str = "EU"
@@ -1346,179 +1590,265 @@ lion_ms_regions_set: set[str] = {
     v[0] for _, v in lion_cache_region_meta.items()
 }  # AWS regions to serve LION Micro-service CDK stack(s)
 
+# LION data source(s) S3 Param Data bucket obj key prefixes filter mode, to filter the S3 object created events sent to
+#  each AWS region, and to each Extractor Lambda function, by the obj key prefixes of their data source(s). If False, all
+#  S3 object created events (in the S3 Param Data bucket).
+lion_data_source_obj_prefixes_filter: bool = False
+
+# LION data source(s) S3 Param Data bucket obj key prefixes, as put by the LION component Lambda functions (i.e. their
+#  'S3_PARAM_DATA_BUCKET_OBJ_PREFIX' env var, see ``CdkLionCollectorStack`` and ``CdkLionProcessorStack``).
+lion_data_source_obj_prefixes: dict[str, str] = (
+    {
+        **{
+            i: factory.get_path([collector_, i])
+            for i in [CdkLionCollectorStack.CAMS_, CdkLionCollectorStack.METOFFICE_]
+        },
+        **{
+            i: factory.get_path([processor_, i])
+            for i in [
+                CdkLionProcessorStack.GOES16_,
+                CdkLionProcessorStack.GOES18_,
+                CdkLionProcessorStack.HIMAWARI9_,
+                CdkLionProcessorStack.MSG0DEG_,
+                CdkLionProcessorStack.MSGIODC_,
+            ]
+        },
+    }
+    if lion_data_source_obj_prefixes_filter
+    else None
+)
+
+lion_ms_regions_obj_prefixes: dict[str, list[str]] = (
+    {
+        i: sorted(
+            {lion_data_source_obj_prefixes[k] for _, v in lion_cache_region_meta.items() if v[0] == i for k in v[1]}
+        )
+        for i in lion_ms_regions_set
+    }
+    if lion_data_source_obj_prefixes
+    else None
+)
+
+# LION processor Step Functions Map state max. concurrency (0 for no limit), to process all sat data sources in a
+#  single state machine. If None, a state machine per sat data source.
+lion_processor_step_func_map_max_concurrency: int = None
+
+# LION processor Step Functions EXPRESS check mode, to run the (every minute) latest and available steps in an EXPRESS
+#  state machine, starting the (STANDARD) process state machine only when all files are available.
+lion_processor_step_func_express_check: bool = False
+
+# LION processor Step Functions log level, and whether to include execution data, per step (i.e. 'latest', 'available'
+#  and 'process'). If None, all logs (including execution data) for all steps.
+lion_processor_step_func_logs: dict[str, tuple[cdk.aws_stepfunctions.LogLevel, bool]] = None
+
+# LION extractor SQS buffer mode, to invoke each extractor Lambda function with batches of S3 events (from an SQS queue),
+#  at a capped concurrency, instead of once per S3 event.
+lion_extractor_sqs_buffer: bool = False
+
 cdk_lion_base_stack_name: str = factory.get_cdk_stack_id(lion_, base_comp=True)
-cdk_lion_base_stack = CdkLionBaseStack(
-    scope=app,
-    id=cdk_lion_base_stack_name,
-    description=factory.get_cdk_stack_description(
-        lion_, base_comp=True, detail="ECR, Security Groups, Secrets Manager"
-    ),
-    env=env,
-    termination_protection=True,
-    # --- ^ super() ---
-    bastion_host_private_ips=bastion_host_private_ips,
-    client_vpn_endpoint_stack=client_vpn_endpoint_stack,
-    component=ms_,
-    elastic_ip_parameter_names=elastic_ip_parameter_names,
-    factory=factory,
-    project_name=lion_,
-    project_name_comp_list=project_name_comp_lists[lion_],
-    pypi_package_name=pypi_package_mappings[lion_],
-    vpc_stack=cdk_vpc_sih_stack,
-)
-cdk_lion_cloudfront_base_stack = CdkLionCloudFrontBaseStack(
-    scope=app,
-    id=factory.get_cdk_stack_id(lion_, components=[cf_], base_comp=True),
-    description=factory.get_cdk_stack_description(
-        lion_, components=[cf_], base_comp=True, detail="WAF Regex Pattern Set"
-    ),
-    env=env_cloudfront,
-    termination_protection=True,
-    # --- ^ super() ---
-    base_stack=cdk_lion_base_stack,
-    component=ms_,
-    elastic_ip_str_list=elastic_ip_str_list,
-    factory=factory,
-    project_name=lion_,
+
+
+@registry.stack(
+    cdk_lion_base_stack_name, dependencies=[cdk_codepipeline_ci_cd_stack], post_build=add_tags_required_base(lion_)
 )
-factory.add_tags_required(
-    stacks=[cdk_lion_base_stack, cdk_lion_cloudfront_base_stack],
-    project_name_val=word_map[lion_],
-    custom_val=factory.TAG_VAL_NONE_,
-    env_type_val=factory.TAG_VAL_NONE_,
-    component_val=word_map[base_],
-    deploy_env_val=factory.TAG_VAL_NONE_,
+def cdk_lion_base_stack(stack_id: str = None) -> CdkLionBaseStack:
+    return CdkLionBaseStack(
+        scope=app,
+        id=stack_id,
+        description=factory.get_cdk_stack_description(
+            lion_, base_comp=True, detail="ECR, Security Groups, Secrets Manager"
+        ),
+        env=env,
+        termination_protection=True,
+        # --- ^ super() ---
+        bastion_host_private_ips=get_bastion_host_private_ips(),
+        client_vpn_endpoint_stack=get_client_vpn_endpoint_stack(),
+        component=ms_,
+        elastic_ip_parameter_names=elastic_ip_parameter_names,
+        factory=factory,
+        project_name=lion_,
+        project_name_comp_list=project_name_comp_lists[lion_],
+        pypi_package_name=pypi_package_mappings[lion_],
+        vpc_stack=cdk_vpc_sih_stack(),
+    )
+
+
+@registry.stack(
+    factory.get_cdk_stack_id(lion_, components=[cf_], base_comp=True),
+    dependencies=[cdk_vpc_sih_stack],
+    post_build=add_tags_required_base(lion_),
 )
+def cdk_lion_cloudfront_base_stack(stack_id: str = None) -> CdkLionCloudFrontBaseStack:
+    return CdkLionCloudFrontBaseStack(
+        scope=app,
+        id=stack_id,
+        description=factory.get_cdk_stack_description(
+            lion_, components=[cf_], base_comp=True, detail="WAF Regex Pattern Set"
+        ),
+        env=env_cloudfront,
+        termination_protection=True,
+        # --- ^ super() ---
+        base_stack=cdk_lion_base_stack(),
+        component=ms_,
+        elastic_ip_str_list=elastic_ip_str_list,
+        factory=factory,
+        project_name=lion_,
+    )
 
-cdk_lion_ms_cloudfront_stacks: dict[str, CdkLionCloudFrontStack] = {
-    deploy_env: CdkLionCloudFrontStack(
+
+@registry.stack_map(
+    factory.deploy_envs_stag_prod_meta,
+    lambda deploy_env: factory.get_cdk_stack_id(lion_, components=[ms_, cf_], deploy_env=deploy_env),
+    post_build=lambda s: factory.add_tags_required_wrapper(s, project_name=lion_, component=cf_),
+)
+def cdk_lion_ms_cloudfront_stacks(stack_id: str, deploy_env: str, env_meta: dict) -> CdkLionCloudFrontStack:
+    return CdkLionCloudFrontStack(
         scope=app,
-        id=factory.get_cdk_stack_id(lion_, components=[ms_, cf_], deploy_env=deploy_env),
+        id=stack_id,
         description=factory.get_cdk_stack_description(
             lion_, components=[ms_, cf_], deploy_env=deploy_env, detail="ACM certificates, WAF Web ACLs"
         ),
         env=env_cloudfront,
         termination_protection=True,
         # --- ^ super() ---
-        base_stack=cdk_lion_base_stack,
-        cloudfront_base_stack=cdk_lion_cloudfront_base_stack,
+        base_stack=cdk_lion_base_stack(),
+        cloudfront_base_stack=cdk_lion_cloudfront_base_stack(),
         component=ms_,
         deploy_env=deploy_env,
         env_meta=env_meta,
         factory=factory,
         project_name=lion_,
     )
-    for deploy_env, env_meta in factory.deploy_envs_stag_prod_meta.items()
-}
-factory.add_tags_required_wrapper(cdk_lion_ms_cloudfront_stacks, project_name=lion_, component=cf_)
+
 
 cdk_lion_ms_stacks: dict[str, CdkLionMsStack] = {}
 if env.region in lion_ms_regions_set:
-    cdk_lion_events_stacks: dict[str, CdkLionEventsStack] = {
-        deploy_env: CdkLionEventsStack(
+
+    @registry.stack_map(
+        factory.deploy_envs_stag_prod_meta,
+        lambda deploy_env: factory.get_cdk_stack_id(lion_, components=[events_], deploy_env=deploy_env),
+        post_build=lambda s: factory.add_tags_required_wrapper(s, project_name=lion_, component=global_),
+    )
+    def cdk_lion_events_stacks(stack_id: str, deploy_env: str, env_meta: dict) -> CdkLionEventsStack:
+        return CdkLionEventsStack(
             scope=app,
-            id=factory.get_cdk_stack_id(lion_, components=[events_], deploy_env=deploy_env),
+            id=stack_id,
             description=factory.get_cdk_stack_description(
                 lion_, components=[events_], deploy_env=deploy_env, detail="Events Buses"
             ),
             env=env,
             termination_protection=True,
             # --- ^ super() ---
-            base_stack=cdk_lion_base_stack,
+            base_stack=cdk_lion_base_stack(),
             component=global_,
             deploy_env=deploy_env,
             env_meta=env_meta,
             factory=factory,
             project_name=lion_,
         )
-        for deploy_env, env_meta in factory.deploy_envs_stag_prod_meta.items()
-    }
-    factory.add_tags_required_wrapper(cdk_lion_events_stacks, project_name=lion_, component=global_)
 
     cdk_lion_storage_stacks: dict[str, CdkLionStorageStack] = {}
     if env.region == lion_global_region:
-        cdk_lion_storage_stacks = {
-            deploy_env: CdkLionStorageStack(
+
+        @registry.stack_map(
+            factory.deploy_envs_stag_prod_meta,
+            lambda deploy_env: factory.get_cdk_stack_id(lion_, components=[storage_], deploy_env=deploy_env),
+            post_build=lambda s: factory.add_tags_required_wrapper(s, project_name=lion_, component=global_),
+        )
+        def cdk_lion_storage_stacks(stack_id: str, deploy_env: str, env_meta: dict) -> CdkLionStorageStack:
+            return CdkLionStorageStack(
                 scope=app,
-                id=factory.get_cdk_stack_id(lion_, components=[storage_], deploy_env=deploy_env),
+                id=stack_id,
                 description=factory.get_cdk_stack_description(
                     lion_, components=[storage_], deploy_env=deploy_env, detail="S3"
                 ),
                 env=env,
                 termination_protection=True,
                 # --- ^ super() ---
-                base_stack=cdk_lion_base_stack,
+                base_stack=cdk_lion_base_stack(),
                 component=global_,
                 deploy_env=deploy_env,
                 env_meta=env_meta,
                 event_bus_regions=lion_ms_regions_set,
+                event_bus_regions_obj_prefixes=lion_ms_regions_obj_prefixes,
                 events_stack=cdk_lion_events_stacks[deploy_env],
                 factory=factory,
                 project_name=lion_,
             )
-            for deploy_env, env_meta in factory.deploy_envs_stag_prod_meta.items()
-        }
-        factory.add_tags_required_wrapper(cdk_lion_storage_stacks, project_name=lion_, component=global_)
 
-        cdk_lion_collector_stacks: dict[str, CdkLionCollectorStack] = {
-            deploy_env: CdkLionCollectorStack(
+        @registry.stack_map(
+            factory.deploy_envs_stag_prod_meta,
+            lambda deploy_env: factory.get_cdk_stack_id(lion_, components=[collector_], deploy_env=deploy_env),
+            dependencies=[cdk_codepipeline_ci_cd_stack],
+            post_build=lambda s: factory.add_tags_required_wrapper(s, project_name=lion_, component=global_),
+        )
+        def cdk_lion_collector_stacks(stack_id: str, deploy_env: str, env_meta: dict) -> CdkLionCollectorStack:
+            return CdkLionCollectorStack(
                 scope=app,
-                id=factory.get_cdk_stack_id(lion_, components=[collector_], deploy_env=deploy_env),
+                id=stack_id,
                 description=factory.get_cdk_stack_description(
                     lion_, components=[collector_], deploy_env=deploy_env, detail="Step Functions, Lambda functions"
                 ),
                 env=env,
                 termination_protection=True,
                 # --- ^ super() ---
-                base_stack=cdk_lion_base_stack,
+                base_stack=cdk_lion_base_stack(),
                 component=global_,
                 deploy_env=deploy_env,
                 env_meta=env_meta,
                 factory=factory,
                 project_name=lion_,
-                pypi_package_base_stack=cdk_pypi_package_base_stack,
+                pypi_package_base_stack=cdk_pypi_package_base_stack(),
                 storage_stack=cdk_lion_storage_stacks[deploy_env],
-                vpc_stack=cdk_vpc_sih_stack,
+                vpc_stack=cdk_vpc_sih_stack(),
             )
-            for deploy_env, env_meta in factory.deploy_envs_stag_prod_meta.items()
-        }
-        factory.add_tags_required_wrapper(cdk_lion_collector_stacks, project_name=lion_, component=global_)
 
-        cdk_lion_processor_stacks: dict[str, CdkLionProcessorStack] = {
-            deploy_env: CdkLionProcessorStack(
+        @registry.stack_map(
+            factory.deploy_envs_stag_prod_meta,
+            lambda deploy_env: factory.get_cdk_stack_id(lion_, components=[processor_], deploy_env=deploy_env),
+            dependencies=[cdk_codepipeline_ci_cd_stack],
+            post_build=lambda s: factory.add_tags_required_wrapper(s, project_name=lion_, component=global_),
+        )
+        def cdk_lion_processor_stacks(stack_id: str, deploy_env: str, env_meta: dict) -> CdkLionProcessorStack:
+            return CdkLionProcessorStack(
                 scope=app,
-                id=factory.get_cdk_stack_id(lion_, components=[processor_], deploy_env=deploy_env),
+                id=stack_id,
                 description=factory.get_cdk_stack_description(
                     lion_, components=[processor_], deploy_env=deploy_env, detail="Step Functions, Lambda functions"
                 ),
                 env=env,
                 termination_protection=True,
                 # --- ^ super() ---
-                base_stack=cdk_lion_base_stack,
+                base_stack=cdk_lion_base_stack(),
                 component=global_,
                 deploy_env=deploy_env,
                 env_meta=env_meta,
                 factory=factory,
                 project_name=lion_,
-                pypi_package_base_stack=cdk_pypi_package_base_stack,
+                pypi_package_base_stack=cdk_pypi_package_base_stack(),
                 storage_stack=cdk_lion_storage_stacks[deploy_env],
-                vpc_stack=cdk_vpc_sih_stack,
+                vpc_stack=cdk_vpc_sih_stack(),
+                step_func_map_max_concurrency=lion_processor_step_func_map_max_concurrency,
+                step_func_express_check=lion_processor_step_func_express_check,
+                step_func_logs=lion_processor_step_func_logs,
             )
-            for deploy_env, env_meta in factory.deploy_envs_stag_prod_meta.items()
-        }
-        factory.add_tags_required_wrapper(cdk_lion_processor_stacks, project_name=lion_, component=global_)
 
-    cdk_lion_cache_stacks: dict[str, CdkLionCacheStack] = {
-        deploy_env: CdkLionCacheStack(
+    @registry.stack_map(
+        factory.deploy_envs_stag_prod_meta,
+        lambda deploy_env: factory.get_cdk_stack_id(lion_, components=[cache_], deploy_env=deploy_env),
+        post_build=lambda s: factory.add_tags_required_wrapper(s, project_name=lion_, component=cache_, is_cache=True),
+    )
+    def cdk_lion_cache_stacks(stack_id: str, deploy_env: str, env_meta: dict) -> CdkLionCacheStack:
+        return CdkLionCacheStack(
             scope=app,
-            id=factory.get_cdk_stack_id(lion_, components=[cache_], deploy_env=deploy_env),
+            id=stack_id,
             description=factory.get_cdk_stack_description(
                 lion_, components=[cache_], deploy_env=deploy_env, detail="ElastiCache Redis"
             ),
             env=env,
             termination_protection=factory.get_termination_protection(deploy_env),
             # --- ^ super() ---
-            base_stack=cdk_lion_base_stack,
+            base_stack=cdk_lion_base_stack(),
             component=ms_,
             deploy_env=deploy_env,
             deploy_env_24_7_set=deploy_env_24_7_sets[lion_],
@@ -1526,23 +1856,25 @@ if env.region in lion_ms_regions_set:
             env_meta=env_meta,
             factory=factory,
             project_name=lion_,
-            vpc_stack=cdk_vpc_sih_stack,
+            vpc_stack=cdk_vpc_sih_stack(),
         )
-        for deploy_env, env_meta in factory.deploy_envs_stag_prod_meta.items()
-    }
-    factory.add_tags_required_wrapper(cdk_lion_cache_stacks, project_name=lion_, component=cache_, is_cache=True)
 
-    cdk_lion_ms_stacks = {
-        deploy_env: CdkLionMsStack(
+    @registry.stack_map(
+        factory.deploy_envs_stag_prod_meta,
+        lambda deploy_env: factory.get_cdk_stack_id(lion_, components=[ms_], deploy_env=deploy_env),
+        post_build=lambda s: factory.add_tags_required_wrapper(s, project_name=lion_, component=ms_),
+    )
+    def cdk_lion_ms_stacks(stack_id: str, deploy_env: str, env_meta: dict) -> CdkLionMsStack:
+        return CdkLionMsStack(
             scope=app,
-            id=factory.get_cdk_stack_id(lion_, components=[ms_], deploy_env=deploy_env),
+            id=stack_id,
             description=factory.get_cdk_stack_description(
                 lion_, components=[ms_], deploy_env=deploy_env, detail="CloudFront Distribution, ALB, ECS"
             ),
             env=env,
             termination_protection=factory.get_termination_protection(deploy_env),
             # --- ^ super() ---
-            base_stack=cdk_lion_base_stack,
+            base_stack=cdk_lion_base_stack(),
             cache_regions=[k for k, v in lion_cache_region_meta.items() if env.region == v[0]],
             cache_stack=cdk_lion_cache_stacks[deploy_env],
             component=ms_,
@@ -1552,24 +1884,28 @@ if env.region in lion_ms_regions_set:
             env_meta=env_meta,
             factory=factory,
             project_name=lion_,
-            vpc_stack=cdk_vpc_sih_stack,
+            vpc_stack=cdk_vpc_sih_stack(),
         )
-        for deploy_env, env_meta in factory.deploy_envs_stag_prod_meta.items()
-    }
+
     project_dependant_map[lion_] = cdk_lion_ms_stacks
-    factory.add_tags_required_wrapper(cdk_lion_ms_stacks, project_name=lion_, component=ms_)
 
-    cdk_lion_ms_pipeline_stacks: dict[str, CdkLionPipelineStack] = {
-        deploy_env: CdkLionPipelineStack(
+    @registry.stack_map(
+        factory.deploy_envs_stag_prod_meta,
+        lambda deploy_env: factory.get_cdk_stack_id(lion_, components=[ms_, pipeline_], deploy_env=deploy_env),
+        dependencies=[cdk_codepipeline_ci_cd_stack],
+        post_build=lambda s: factory.add_tags_required_wrapper(s, project_name=lion_, component=pipeline_),
+    )
+    def cdk_lion_ms_pipeline_stacks(stack_id: str, deploy_env: str, env_meta: dict) -> CdkLionPipelineStack:
+        return CdkLionPipelineStack(
             scope=app,
-            id=factory.get_cdk_stack_id(lion_, components=[ms_, pipeline_], deploy_env=deploy_env),
+            id=stack_id,
             description=factory.get_cdk_stack_description(
                 lion_, components=[ms_, pipeline_], deploy_env=deploy_env, detail="CodeBuild, CodePipeline"
             ),
             env=env,
             termination_protection=factory.get_termination_protection(deploy_env),
             # --- ^ super() ---
-            base_stack=cdk_lion_base_stack,
+            base_stack=cdk_lion_base_stack(),
             component=ms_,
             deploy_env=deploy_env,
             env_meta=env_meta,
@@ -1577,25 +1913,27 @@ if env.region in lion_ms_regions_set:
             ms_stack=cdk_lion_ms_stacks[deploy_env],
             project_name=lion_,
             project_name_comp_list=project_name_comp_lists[lion_],
-            pypi_base_stack=cdk_pypi_base_stack,
-            vpc_stack=cdk_vpc_sih_stack,
+            pypi_base_stack=cdk_pypi_base_stack(),
+            vpc_stack=cdk_vpc_sih_stack(),
         )
-        for deploy_env, env_meta in factory.deploy_envs_stag_prod_meta.items()
-    }
-    factory.add_tags_required_wrapper(cdk_lion_ms_pipeline_stacks, project_name=lion_, component=pipeline_)
 
     # TODO: (NEXT) Handle when LION 'storage_stack' is in a different AWS region to the LION Extractor
-    cdk_lion_extractor_stacks: dict[str, CdkLionExtractorStack] = {
-        deploy_env: CdkLionExtractorStack(
+    @registry.stack_map(
+        factory.deploy_envs_stag_prod_meta,
+        lambda deploy_env: factory.get_cdk_stack_id(lion_, components=[extractor_], deploy_env=deploy_env),
+        post_build=lambda s: factory.add_tags_required_wrapper(s, project_name=lion_, component=extractor_),
+    )
+    def cdk_lion_extractor_stacks(stack_id: str, deploy_env: str, env_meta: dict) -> CdkLionExtractorStack:
+        return CdkLionExtractorStack(
             scope=app,
-            id=factory.get_cdk_stack_id(lion_, components=[extractor_], deploy_env=deploy_env),
+            id=stack_id,
             description=factory.get_cdk_stack_description(
                 lion_, components=[extractor_], deploy_env=deploy_env, detail="Lambda functions"
             ),
             env=env,
             termination_protection=factory.get_termination_protection(deploy_env),
             # --- ^ super() ---
-            base_stack=cdk_lion_base_stack,
+            base_stack=cdk_lion_base_stack(),
             cache_regions={k: v[1] for k, v in lion_cache_region_meta.items() if env.region == v[0]},
             cache_stack=cdk_lion_cache_stacks[deploy_env],
             component=ms_,
@@ -1605,75 +1943,83 @@ if env.region in lion_ms_regions_set:
             events_stack=cdk_lion_events_stacks[deploy_env],
             factory=factory,
             project_name=lion_,
-            pypi_package_base_stack=cdk_pypi_package_base_stack,
+            pypi_package_base_stack=cdk_pypi_package_base_stack(),
             storage_stack=cdk_lion_storage_stacks.get(deploy_env),
-            vpc_stack=cdk_vpc_sih_stack,
+            vpc_stack=cdk_vpc_sih_stack(),
+            data_source_obj_prefixes=lion_data_source_obj_prefixes,
+            sqs_buffer=lion_extractor_sqs_buffer,
         )
-        for deploy_env, env_meta in factory.deploy_envs_stag_prod_meta.items()
-    }
-    factory.add_tags_required_wrapper(cdk_lion_extractor_stacks, project_name=lion_, component=extractor_)
+
 
 ####################################################################################################
 # --- Bkg ---
 ####################################################################################################
 
-cdk_bkg_cloudfront_base_stack = CdkBkgCloudFrontBaseStack(
-    scope=app,
-    id=factory.get_cdk_stack_id(bkg_, components=[cf_], base_comp=True),
-    description=factory.get_cdk_stack_description(
-        bkg_, components=[cf_], base_comp=True, detail="WAF Regex Pattern Set"
-    ),
-    env=env_cloudfront,
-    termination_protection=True,
-    # --- ^ super() ---
-    base_stack=cdk_bkg_base_stack,
-    component=ms_,
-    elastic_ip_str_list=elastic_ip_str_list,
-    factory=factory,
-    project_name=bkg_,
-)
-factory.add_tags_required(
-    stacks=[cdk_bkg_base_stack, cdk_bkg_cloudfront_base_stack],
-    project_name_val=word_map[bkg_],
-    custom_val=factory.TAG_VAL_NONE_,
-    env_type_val=factory.TAG_VAL_NONE_,
-    component_val=word_map[base_],
-    deploy_env_val=factory.TAG_VAL_NONE_,
+
+@registry.stack(
+    factory.get_cdk_stack_id(bkg_, components=[cf_], base_comp=True),
+    dependencies=[cdk_vpc_sih_stack],
+    post_build=add_tags_required_base(bkg_),
 )
+def cdk_bkg_cloudfront_base_stack(stack_id: str = None) -> CdkBkgCloudFrontBaseStack:
+    return CdkBkgCloudFrontBaseStack(
+        scope=app,
+        id=stack_id,
+        description=factory.get_cdk_stack_description(
+            bkg_, components=[cf_], base_comp=True, detail="WAF Regex Pattern Set"
+        ),
+        env=env_cloudfront,
+        termination_protection=True,
+        # --- ^ super() ---
+        base_stack=cdk_bkg_base_stack(),
+        component=ms_,
+        elastic_ip_str_list=elastic_ip_str_list,
+        factory=factory,
+        project_name=bkg_,
+    )
 
-cdk_bkg_ms_cloudfront_stacks: dict[str, CdkBkgCloudFrontStack] = {
-    deploy_env: CdkBkgCloudFrontStack(
+
+@registry.stack_map(
+    factory.deploy_envs_stag_prod_meta,
+    lambda deploy_env: factory.get_cdk_stack_id(bkg_, components=[ms_, cf_], deploy_env=deploy_env),
+    post_build=lambda s: factory.add_tags_required_wrapper(s, project_name=bkg_, component=cf_),
+)
+def cdk_bkg_ms_cloudfront_stacks(stack_id: str, deploy_env: str, env_meta: dict) -> CdkBkgCloudFrontStack:
+    return CdkBkgCloudFrontStack(
         scope=app,
-        id=factory.get_cdk_stack_id(bkg_, components=[ms_, cf_], deploy_env=deploy_env),
+        id=stack_id,
         description=factory.get_cdk_stack_description(
             bkg_, components=[ms_, cf_], deploy_env=deploy_env, detail="ACM certificates, WAF Web ACLs"
         ),
         env=env_cloudfront,
         termination_protection=True,
         # --- ^ super() ---
-        base_stack=cdk_bkg_base_stack,
-        cloudfront_base_stack=cdk_bkg_cloudfront_base_stack,
+        base_stack=cdk_bkg_base_stack(),
+        cloudfront_base_stack=cdk_bkg_cloudfront_base_stack(),
         component=ms_,
         deploy_env=deploy_env,
         env_meta=env_meta,
         factory=factory,
         project_name=bkg_,
     )
-    for deploy_env, env_meta in factory.deploy_envs_stag_prod_meta.items()
-}
-factory.add_tags_required_wrapper(cdk_bkg_ms_cloudfront_stacks, project_name=bkg_, component=cf_)
 
-cdk_bkg_cache_stacks: dict[str, CdkBkgCacheStack] = {
-    deploy_env: CdkBkgCacheStack(
+
+@registry.stack_map(
+    factory.deploy_envs_stag_prod_meta,
+    lambda deploy_env: factory.get_cdk_stack_id(bkg_, components=[cache_], deploy_env=deploy_env),
+    post_build=lambda s: factory.add_tags_required_wrapper(s, project_name=bkg_, component=cache_, is_cache=True),
+)
+def cdk_bkg_cache_stacks(stack_id: str, deploy_env: str, env_meta: dict) -> CdkBkgCacheStack:
+    return CdkBkgCacheStack(
         scope=app,
-        id=factory.get_cdk_stack_id(bkg_, components=[cache_], deploy_env=deploy_env),
+        id=stack_id,
         description=factory.get_cdk_stack_description(
             bkg_, components=[cache_], deploy_env=deploy_env, detail="ElastiCache Redis"
         ),
         env=env,
         termination_protection=factory.get_termination_protection(deploy_env),
         # --- ^ super() ---
-        base_stack=cdk_bkg_base_stack,
+        base_stack=cdk_bkg_base_stack(),
         component=ms_,
         deploy_env=deploy_env,
         deploy_env_24_7_set=deploy_env_24_7_sets[bkg_],
@@ -1681,47 +2027,53 @@ cdk_bkg_cache_stacks: dict[str, CdkBkgCacheStack] = {
         env_meta=env_meta,
         factory=factory,
         project_name=bkg_,
-        vpc_stack=cdk_vpc_sih_stack,
+        vpc_stack=cdk_vpc_sih_stack(),
     )
-    for deploy_env, env_meta in factory.deploy_envs_stag_prod_meta.items()
-}
-factory.add_tags_required_wrapper(cdk_bkg_cache_stacks, project_name=bkg_, component=cache_, is_cache=True)
 
-cdk_bkg_broker_stacks: dict[str, CdkBkgBrokerStack] = {
-    deploy_env: CdkBkgBrokerStack(
+
+@registry.stack_map(
+    factory.deploy_envs_stag_prod_meta,
+    lambda deploy_env: factory.get_cdk_stack_id(bkg_, components=[broker_], deploy_env=deploy_env),
+    post_build=lambda s: factory.add_tags_required_wrapper(s, project_name=bkg_, component=broker_),
+)
+def cdk_bkg_broker_stacks(stack_id: str, deploy_env: str, env_meta: dict) -> CdkBkgBrokerStack:
+    return CdkBkgBrokerStack(
         scope=app,
-        id=factory.get_cdk_stack_id(bkg_, components=[broker_], deploy_env=deploy_env),
+        id=stack_id,
         description=factory.get_cdk_stack_description(
             bkg_, components=[broker_], deploy_env=deploy_env, detail="Amazon MQ RabbitMQ"
         ),
         env=env,
         termination_protection=factory.get_termination_protection(deploy_env),
         # --- ^ super() ---
-        base_stack=cdk_bkg_base_stack,
+        base_stack=cdk_bkg_base_stack(),
         component=ms_,
         deploy_env=deploy_env,
         env_meta=env_meta,
         factory=factory,
         mq_rabbitmq_user_prefix=sih_,
         project_name=bkg_,
-        vpc_stack=cdk_vpc_sih_stack,
+        vpc_stack=cdk_vpc_sih_stack(),
     )
-    for deploy_env, env_meta in factory.deploy_envs_stag_prod_meta.items()
-}
-factory.add_tags_required_wrapper(cdk_bkg_broker_stacks, project_name=bkg_, component=broker_)
 
-cdk_bkg_mq_cloudfront_stacks: dict[str, CdkBkgCloudFrontStack] = {
-    deploy_env: CdkBkgCloudFrontStack(
+
+@registry.stack_map(
+    factory.deploy_envs_stag_prod_meta,
+    lambda deploy_env: factory.get_cdk_stack_id(bkg_, components=[broker_web_, cf_], deploy_env=deploy_env),
+    post_build=lambda s: factory.add_tags_required_wrapper(s, project_name=bkg_, component=cf_),
+)
+def cdk_bkg_mq_cloudfront_stacks(stack_id: str, deploy_env: str, env_meta: dict) -> CdkBkgCloudFrontStack:
+    return CdkBkgCloudFrontStack(
         scope=app,
-        id=factory.get_cdk_stack_id(bkg_, components=[broker_web_, cf_], deploy_env=deploy_env),
+        id=stack_id,
         description=factory.get_cdk_stack_description(
             bkg_, components=[broker_web_, cf_], deploy_env=deploy_env, detail="ACM certificates, WAF Web ACLs"
         ),
         env=env_cloudfront,
         termination_protection=True,
         # --- ^ super() ---
-        base_stack=cdk_bkg_base_stack,
-        cloudfront_base_stack=cdk_bkg_cloudfront_base_stack,
+        base_stack=cdk_bkg_base_stack(),
+        cloudfront_base_stack=cdk_bkg_cloudfront_base_stack(),
         component=broker_web_,
         component_alt=broker_web_,
         deploy_env=deploy_env,
@@ -1729,21 +2081,24 @@ cdk_bkg_mq_cloudfront_stacks: dict[str, CdkBkgCloudFrontStack] = {
         factory=factory,
         project_name=bkg_,
     )
-    for deploy_env, env_meta in factory.deploy_envs_stag_prod_meta.items()
-}
-factory.add_tags_required_wrapper(cdk_bkg_mq_cloudfront_stacks, project_name=bkg_, component=cf_)
 
-cdk_bkg_mq_stacks: dict[str, CdkBkgMqStack] = {
-    deploy_env: CdkBkgMqStack(
+
+@registry.stack_map(
+    factory.deploy_envs_stag_prod_meta,
+    lambda deploy_env: factory.get_cdk_stack_id(bkg_, components=[broker_web_], deploy_env=deploy_env),
+    post_build=lambda s: factory.add_tags_required_wrapper(s, project_name=bkg_, component=broker_),
+)
+def cdk_bkg_mq_stacks(stack_id: str, deploy_env: str, env_meta: dict) -> CdkBkgMqStack:
+    return CdkBkgMqStack(
         scope=app,
-        id=factory.get_cdk_stack_id(bkg_, components=[broker_web_], deploy_env=deploy_env),
+        id=stack_id,
         description=factory.get_cdk_stack_description(
             bkg_, components=[broker_web_], deploy_env=deploy_env, detail="Amazon MQ RabbitMQ Web Console"
         ),
         env=env,
         termination_protection=factory.get_termination_protection(deploy_env),
         # --- ^ super() ---
-        base_stack=cdk_bkg_base_stack,
+        base_stack=cdk_bkg_base_stack(),
         broker_stack=cdk_bkg_broker_stacks[deploy_env],
         component=broker_web_,
         component_alt=broker_web_,
@@ -1751,63 +2106,74 @@ cdk_bkg_mq_stacks: dict[str, CdkBkgMqStack] = {
         env_meta=env_meta,
         factory=factory,
         project_name=bkg_,
-        vpc_stack=cdk_vpc_sih_stack,
+        vpc_stack=cdk_vpc_sih_stack(),
     )
-    for deploy_env, env_meta in factory.deploy_envs_stag_prod_meta.items()
-}
-factory.add_tags_required_wrapper(cdk_bkg_mq_stacks, project_name=bkg_, component=broker_)
 
-cdk_bkg_database_stacks: dict[str, CdkBkgDatabaseStack] = {
-    deploy_env: CdkBkgDatabaseStack(
+
+@registry.stack_map(
+    factory.deploy_envs_stag_prod_meta,
+    lambda deploy_env: factory.get_cdk_stack_id(bkg_, components=[database_], deploy_env=deploy_env),
+    post_build=lambda s: factory.add_tags_required_wrapper(
+        s, project_name=bkg_, component=database_, is_db_server=True
+    ),
+)
+def cdk_bkg_database_stacks(stack_id: str, deploy_env: str, env_meta: dict) -> CdkBkgDatabaseStack:
+    return CdkBkgDatabaseStack(
         scope=app,
-        id=factory.get_cdk_stack_id(bkg_, components=[database_], deploy_env=deploy_env),
+        id=stack_id,
         description=factory.get_cdk_stack_description(
             bkg_, components=[database_], deploy_env=deploy_env, detail="DynamoDB"
         ),
         env=env,
         termination_protection=factory.get_termination_protection(deploy_env),
         # --- ^ super() ---
-        base_stack=cdk_bkg_base_stack,
+        base_stack=cdk_bkg_base_stack(),
         component=ms_,
         deploy_env=deploy_env,
         env_meta=env_meta,
         factory=factory,
         project_name=bkg_,
     )
-    for deploy_env, env_meta in factory.deploy_envs_stag_prod_meta.items()
-}
-factory.add_tags_required_wrapper(cdk_bkg_database_stacks, project_name=bkg_, component=database_, is_db_server=True)
 
-cdk_bkg_storage_stacks: dict[str, CdkBkgStorageStack] = {
-    deploy_env: CdkBkgStorageStack(
+
+@registry.stack_map(
+    factory.deploy_envs_stag_prod_meta,
+    lambda deploy_env: factory.get_cdk_stack_id(bkg_, components=[storage_], deploy_env=deploy_env),
+    post_build=lambda s: factory.add_tags_required_wrapper(s, project_name=bkg_, component=ms_),
+)
+def cdk_bkg_storage_stacks(stack_id: str, deploy_env: str, env_meta: dict) -> CdkBkgStorageStack:
+    return CdkBkgStorageStack(
         scope=app,
-        id=factory.get_cdk_stack_id(bkg_, components=[storage_], deploy_env=deploy_env),
+        id=stack_id,
         description=factory.get_cdk_stack_description(bkg_, components=[storage_], deploy_env=deploy_env, detail="S3"),
         env=env,
         termination_protection=factory.get_termination_protection(deploy_env),
         # --- ^ super() ---
-        base_stack=cdk_bkg_base_stack,
+        base_stack=cdk_bkg_base_stack(),
         component=ms_,
         deploy_env=deploy_env,
         env_meta=env_meta,
         factory=factory,
         project_name=bkg_,
     )
-    for deploy_env, env_meta in factory.deploy_envs_stag_prod_meta.items()
-}
-factory.add_tags_required_wrapper(cdk_bkg_storage_stacks, project_name=bkg_, component=ms_)
 
-cdk_bkg_ms_stacks: dict[str, CdkBkgMsStack] = {
-    deploy_env: CdkBkgMsStack(
+
+@registry.stack_map(
+    factory.deploy_envs_stag_prod_meta,
+    lambda deploy_env: factory.get_cdk_stack_id(bkg_, components=[ms_], deploy_env=deploy_env),
+    post_build=lambda s: factory.add_tags_required_wrapper(s, project_name=bkg_, component=ms_),
+)
+def cdk_bkg_ms_stacks(stack_id: str, deploy_env: str, env_meta: dict) -> CdkBkgMsStack:
+    return CdkBkgMsStack(
         scope=app,
-        id=factory.get_cdk_stack_id(bkg_, components=[ms_], deploy_env=deploy_env),
+        id=stack_id,
         description=factory.get_cdk_stack_description(
             bkg_, components=[ms_], deploy_env=deploy_env, detail="CloudFront Distribution, ALB, ECS"
         ),
         env=env,
         termination_protection=factory.get_termination_protection(deploy_env),
         # --- ^ super() ---
-        base_stack=cdk_bkg_base_stack,
+        base_stack=cdk_bkg_base_stack(),
         broker_stack=cdk_bkg_broker_stacks[deploy_env],
         cache_stack=cdk_bkg_cache_stacks[deploy_env],
         component=ms_,
@@ -1818,15 +2184,15 @@ cdk_bkg_ms_stacks: dict[str, CdkBkgMsStack] = {
         ecs_container_service_access={
             getattr(s, factory.HOSTED_ZONE_NAME_): getattr(s, factory.MAIL_USER_, None)
             for s in [
-                cdk_dog_base_stack,
-                cdk_cat_base_stack,
-                cdk_bird_base_stack,
-                cdk_fish_base_stack,
+                cdk_dog_base_stack(),
+                cdk_cat_base_stack(),
+                cdk_bird_base_stack(),
+                cdk_fish_base_stack(),
             ]
         },
         ecs_container_service_access_task_subscriptions={
             getattr(s, factory.HOSTED_ZONE_NAME_): s.task_subscriptions
-            for s in [cdk_dog_base_stack, cdk_cat_base_stack, cdk_bird_base_stack]
+            for s in [cdk_dog_base_stack(), cdk_cat_base_stack(), cdk_bird_base_stack()]
         },
         lion_ms_stack=get_lion_ms_stack(bkg_, deploy_env),
         env_meta=env_meta,
@@ -1834,29 +2200,35 @@ cdk_bkg_ms_stacks: dict[str, CdkBkgMsStack] = {
         project_name=bkg_,
         project_name_comp_subs={
             k: (word_map[k], v, bool(k == api_), cpu_unit_weightings[k])
-            for k, v in cdk_bkg_base_stack.comp_sub_ports.items()
+            for k, v in cdk_bkg_base_stack().comp_sub_ports.items()
             if (cpu_unit_weightings := {k: v[1] for k, v in bkg_ms_comp_subs_meta.items()})
         },
         ses_lambda_func=cdk_mail_ms_stacks[factory.PROD_].ses_lambda_func,
         storage_stack=cdk_bkg_storage_stacks[deploy_env],
-        vpc_stack=cdk_vpc_sih_stack,
+        vpc_stack=cdk_vpc_sih_stack(),
     )
-    for deploy_env, env_meta in factory.deploy_envs_stag_prod_meta.items()
-}
+
+
 project_dependant_map[bkg_] = cdk_bkg_ms_stacks
-factory.add_tags_required_wrapper(cdk_bkg_ms_stacks, project_name=bkg_, component=ms_)
 
-cdk_bkg_ms_pipeline_stacks: dict[str, CdkBkgPipelineStack] = {
-    deploy_env: CdkBkgPipelineStack(
+
+@registry.stack_map(
+    factory.deploy_envs_stag_prod_meta,
+    lambda deploy_env: factory.get_cdk_stack_id(bkg_, components=[ms_, pipeline_], deploy_env=deploy_env),
+    dependencies=[cdk_codepipeline_ci_cd_stack],
+    post_build=lambda s: factory.add_tags_required_wrapper(s, project_name=bkg_, component=pipeline_),
+)
+def cdk_bkg_ms_pipeline_stacks(stack_id: str, deploy_env: str, env_meta: dict) -> CdkBkgPipelineStack:
+    return CdkBkgPipelineStack(
         scope=app,
-        id=factory.get_cdk_stack_id(bkg_, components=[ms_, pipeline_], deploy_env=deploy_env),
+        id=stack_id,
         description=factory.get_cdk_stack_description(
             bkg_, components=[ms_, pipeline_], deploy_env=deploy_env, detail="CodeBuild, CodePipeline"
         ),
         env=env,
         termination_protection=factory.get_termination_protection(deploy_env),
         # --- ^ super() ---
-        base_stack=cdk_bkg_base_stack,
+        base_stack=cdk_bkg_base_stack(),
         component=ms_,
         deploy_env=deploy_env,
         env_meta=env_meta,
@@ -1864,69 +2236,77 @@ cdk_bkg_ms_pipeline_stacks: dict[str, CdkBkgPipelineStack] = {
         ms_stack=cdk_bkg_ms_stacks[deploy_env],
         project_name=bkg_,
         project_name_comp_list=project_name_comp_lists[bkg_],
-        pypi_base_stack=cdk_pypi_base_stack,
-        vpc_stack=cdk_vpc_sih_stack,
+        pypi_base_stack=cdk_pypi_base_stack(),
+        vpc_stack=cdk_vpc_sih_stack(),
+    )
+
+
+####################################################################################################
+# --- Dog ---
+####################################################################################################
+
+
+@registry.stack(
+    factory.get_cdk_stack_id(dog_, components=[cf_], base_comp=True),
+    dependencies=[cdk_vpc_sih_stack],
+    post_build=add_tags_required_base(dog_),
+)
+def cdk_dog_cloudfront_base_stack(stack_id: str = None) -> CdkDogCloudFrontBaseStack:
+    return CdkDogCloudFrontBaseStack(
+        scope=app,
+        id=stack_id,
+        description=factory.get_cdk_stack_description(
+            dog_, components=[cf_], base_comp=True, detail="WAF Regex Pattern Set"
+        ),
+        env=env_cloudfront,
+        termination_protection=True,
+        # --- ^ super() ---
+        base_stack=cdk_dog_base_stack(),
+        component=gw_,
+        elastic_ip_str_list=elastic_ip_str_list,
+        factory=factory,
+        project_name=dog_,
     )
-    for deploy_env, env_meta in factory.deploy_envs_stag_prod_meta.items()
-}
-factory.add_tags_required_wrapper(cdk_bkg_ms_pipeline_stacks, project_name=bkg_, component=pipeline_)
 
-####################################################################################################
-# --- Dog ---
-####################################################################################################
 
-cdk_dog_cloudfront_base_stack = CdkDogCloudFrontBaseStack(
-    scope=app,
-    id=factory.get_cdk_stack_id(dog_, components=[cf_], base_comp=True),
-    description=factory.get_cdk_stack_description(
-        dog_, components=[cf_], base_comp=True, detail="WAF Regex Pattern Set"
-    ),
-    env=env_cloudfront,
-    termination_protection=True,
-    # --- ^ super() ---
-    base_stack=cdk_dog_base_stack,
-    component=gw_,
-    elastic_ip_str_list=elastic_ip_str_list,
-    factory=factory,
-    project_name=dog_,
-)
-factory.add_tags_required(
-    stacks=[cdk_dog_base_stack, cdk_dog_cloudfront_base_stack],
-    project_name_val=word_map[dog_],
-    custom_val=factory.TAG_VAL_NONE_,
-    env_type_val=factory.TAG_VAL_NONE_,
-    component_val=word_map[base_],
-    deploy_env_val=factory.TAG_VAL_NONE_,
+@registry.stack_map(
+    deploy_envs_metas[dog_],
+    lambda deploy_env: factory.get_cdk_stack_id(dog_, components=[gw_, cf_], deploy_env=deploy_env),
+    post_build=lambda s: factory.add_tags_required_wrapper(s, project_name=dog_, component=cf_),
 )
-
-cdk_dog_gw_cloudfront_stacks: dict[str, CdkDogCloudFrontStack] = {
-    deploy_env: CdkDogCloudFrontStack(
+def cdk_dog_gw_cloudfront_stacks(stack_id: str, deploy_env: str, env_meta: dict) -> CdkDogCloudFrontStack:
+    return CdkDogCloudFrontStack(
         scope=app,
-        id=factory.get_cdk_stack_id(dog_, components=[gw_, cf_], deploy_env=deploy_env),
+        id=stack_id,
         description=factory.get_cdk_stack_description(
             dog_, components=[gw_, cf_], deploy_env=deploy_env, detail="ACM certificates, WAF Web ACLs"
         ),
         env=env_cloudfront,
         termination_protection=True,
         # --- ^ super() ---
-        base_stack=cdk_dog_base_stack,
-        cloudfront_base_stack=cdk_dog_cloudfront_base_stack,
+        base_stack=cdk_dog_base_stack(),
+        cloudfront_base_stack=cdk_dog_cloudfront_base_stack(),
         component=gw_,
         deploy_env=deploy_env,
         env_meta=env_meta,
         factory=factory,
         project_name=dog_,
     )
-    for deploy_env, env_meta in deploy_envs_metas[dog_].items()
-}
-factory.add_tags_required_wrapper(cdk_dog_gw_cloudfront_stacks, project_name=dog_, component=cf_)
 
-cdk_dog_database_stacks: dict[str, CdkDogDatabaseStack] = {
-    database_server: CdkDogDatabaseStack(
+
+@registry.stack_map(
+    database_server_deploy_env_maps[dog_],
+    lambda database_server: factory.get_cdk_stack_id(
+        dog_, components=[database_], deploy_env=factory.format_database_server(database_server)
+    ),
+    post_build=lambda s: factory.add_tags_required_wrapper(
+        s, project_name=dog_, component=database_, is_db_server=True
+    ),
+)
+def cdk_dog_database_stacks(stack_id: str, database_server: str, database_meta: dict) -> CdkDogDatabaseStack:
+    return CdkDogDatabaseStack(
         scope=app,
-        id=factory.get_cdk_stack_id(
-            dog_, components=[database_], deploy_env=factory.format_database_server(database_server)
-        ),
+        id=stack_id,
         description=factory.get_cdk_stack_description(
             dog_,
             components=[database_],
@@ -1936,37 +2316,36 @@ cdk_dog_database_stacks: dict[str, CdkDogDatabaseStack] = {
         env=env,
         termination_protection=factory.get_termination_protection(database_server),
         # --- ^ super() ---
-        base_stack=cdk_dog_base_stack,
+        base_stack=cdk_dog_base_stack(),
         component=gw_,
         database_meta=database_meta,
+        db_consumers=get_db_consumers(dog_, database_meta, CdkDogGwStack),
         db_server_name=database_server,
         db_server_preview_demo=get_db_server_preview_demo(dog_, database_server),
         deploy_env_24_7_set=deploy_env_24_7_sets[dog_],
         deploy_env_weekend_set=deploy_env_weekend_sets[dog_],
         factory=factory,
         project_name=dog_,
-        vpc_stack=cdk_vpc_sih_stack,
+        vpc_stack=cdk_vpc_sih_stack(),
     )
-    for database_server, database_meta in database_server_deploy_env_maps[dog_].items()
-}
-factory.add_tags_required_wrapper(
-    cdk_dog_database_stacks,
-    project_name=dog_,
-    component=database_,
-    is_db_server=True,
-)
 
-cdk_dog_cache_stacks: dict[str, CdkDogCacheStack] = {
-    deploy_env: CdkDogCacheStack(
+
+@registry.stack_map(
+    deploy_envs_metas[dog_],
+    lambda deploy_env: factory.get_cdk_stack_id(dog_, components=[cache_], deploy_env=deploy_env),
+    post_build=lambda s: factory.add_tags_required_wrapper(s, project_name=dog_, component=cache_, is_cache=True),
+)
+def cdk_dog_cache_stacks(stack_id: str, deploy_env: str, env_meta: dict) -> CdkDogCacheStack:
+    return CdkDogCacheStack(
         scope=app,
-        id=factory.get_cdk_stack_id(dog_, components=[cache_], deploy_env=deploy_env),
+        id=stack_id,
         description=factory.get_cdk_stack_description(
             dog_, components=[cache_], deploy_env=deploy_env, detail="ElastiCache Redis"
         ),
         env=env,
         termination_protection=factory.get_termination_protection(deploy_env),
         # --- ^ super() ---
-        base_stack=cdk_dog_base_stack,
+        base_stack=cdk_dog_base_stack(),
         component=gw_,
         deploy_env=deploy_env,
         deploy_env_24_7_set=deploy_env_24_7_sets[dog_],
@@ -1974,70 +2353,70 @@ cdk_dog_cache_stacks: dict[str, CdkDogCacheStack] = {
         env_meta=env_meta,
         factory=factory,
         project_name=dog_,
-        vpc_stack=cdk_vpc_sih_stack,
+        vpc_stack=cdk_vpc_sih_stack(),
     )
-    for deploy_env, env_meta in deploy_envs_metas[dog_].items()
-}
-factory.add_tags_required_wrapper(
-    cdk_dog_cache_stacks,
-    project_name=dog_,
-    component=cache_,
-    is_cache=True,
-)
 
-cdk_dog_storage_stacks: dict[str, CdkDogStorageStack] = {
-    deploy_env: CdkDogStorageStack(
+
+@registry.stack_map(
+    deploy_envs_metas[dog_],
+    lambda deploy_env: factory.get_cdk_stack_id(dog_, components=[storage_], deploy_env=deploy_env),
+    post_build=lambda s: factory.add_tags_required_wrapper(s, project_name=dog_, component=gw_),
+)
+def cdk_dog_storage_stacks(stack_id: str, deploy_env: str, env_meta: dict) -> CdkDogStorageStack:
+    return CdkDogStorageStack(
         scope=app,
-        id=factory.get_cdk_stack_id(dog_, components=[storage_], deploy_env=deploy_env),
+        id=stack_id,
         description=factory.get_cdk_stack_description(dog_, components=[storage_], deploy_env=deploy_env, detail="S3"),
         env=env,
         termination_protection=factory.get_termination_protection(deploy_env),
         # --- ^ super() ---
-        base_stack=cdk_dog_base_stack,
+        base_stack=cdk_dog_base_stack(),
         component=gw_,
         deploy_env=deploy_env,
         env_meta=env_meta,
         factory=factory,
         project_name=dog_,
     )
-    for deploy_env, env_meta in deploy_envs_metas[dog_].items()
-}
-factory.add_tags_required_wrapper(cdk_dog_storage_stacks, project_name=dog_, component=gw_)
 
-cdk_dog_notif_stacks: dict[str, CdkDogNotifStack] = {
-    deploy_env: CdkDogNotifStack(
+
+@registry.stack_map(
+    deploy_envs_metas[dog_],
+    lambda deploy_env: factory.get_cdk_stack_id(dog_, components=[notif_], deploy_env=deploy_env),
+    post_build=lambda s: factory.add_tags_required_wrapper(s, project_name=dog_, component=gw_),
+)
+def cdk_dog_notif_stacks(stack_id: str, deploy_env: str, env_meta: dict) -> CdkDogNotifStack:
+    return CdkDogNotifStack(
         scope=app,
-        id=factory.get_cdk_stack_id(dog_, components=[notif_], deploy_env=deploy_env),
+        id=stack_id,
         description=factory.get_cdk_stack_description(dog_, components=[notif_], deploy_env=deploy_env, detail="SNS"),
         env=env,
         termination_protection=factory.get_termination_protection(deploy_env),
         # --- ^ super() ---
-        base_stack=cdk_dog_base_stack,
+        base_stack=cdk_dog_base_stack(),
         component=gw_,
         deploy_env=deploy_env,
         env_meta=env_meta,
         factory=factory,
         project_name=dog_,
     )
-    for deploy_env, env_meta in deploy_envs_metas[dog_].items()
-}
-factory.add_tags_required_wrapper(
-    cdk_dog_notif_stacks,
-    project_name=dog_,
-    component=gw_,
-)
 
-cdk_dog_gw_stacks: dict[str, CdkDogGwStack] = {
-    deploy_env: CdkDogGwStack(
+
+@registry.stack_map(
+    deploy_envs_metas[dog_],
+    lambda deploy_env: factory.get_cdk_stack_id(dog_, components=[gw_], deploy_env=deploy_env),
+    post_build=lambda s: factory.add_tags_required_wrapper(s, project_name=dog_, component=gw_),
+)
+def cdk_dog_gw_stacks(stack_id: str, deploy_env: str, env_meta: dict) -> CdkDogGwStack:
+    return CdkDogGwStack(
         scope=app,
-        id=factory.get_cdk_stack_id(dog_, components=[gw_], deploy_env=deploy_env),
+        id=stack_id,
         description=factory.get_cdk_stack_description(
             dog_, components=[gw_], deploy_env=deploy_env, detail="CloudFront Distribution, ALB, ECS"
         ),
         env=env,
         termination_protection=factory.get_termination_protection(deploy_env),
         # --- ^ super() ---
-        base_stack=cdk_dog_base_stack,
+        base_stack=cdk_dog_base_stack(),
         bkg_ms_stack=get_bkg_ms_stack(dog_, deploy_env),
         cache_stack=cdk_dog_cache_stacks[deploy_env],
         component=gw_,
@@ -2053,23 +2432,27 @@ cdk_dog_gw_stacks: dict[str, CdkDogGwStack] = {
         pdf_ms_stack=cdk_pdf_ms_stacks[factory.PROD_],
         project_name=dog_,
         storage_stack=cdk_dog_storage_stacks[deploy_env],
-        vpc_stack=cdk_vpc_sih_stack,
+        vpc_stack=cdk_vpc_sih_stack(),
     )
-    for deploy_env, env_meta in deploy_envs_metas[dog_].items()
-}
-factory.add_tags_required_wrapper(cdk_dog_gw_stacks, project_name=dog_, component=gw_)
 
-cdk_dog_gw_pipeline_stacks: dict[str, CdkDogPipelineStack] = {
-    deploy_env: CdkDogPipelineStack(
+
+@registry.stack_map(
+    deploy_envs_metas[dog_],
+    lambda deploy_env: factory.get_cdk_stack_id(dog_, components=[gw_, pipeline_], deploy_env=deploy_env),
+    dependencies=[cdk_codepipeline_ci_cd_stack],
+    post_build=lambda s: factory.add_tags_required_wrapper(s, project_name=dog_, component=pipeline_),
+)
+def cdk_dog_gw_pipeline_stacks(stack_id: str, deploy_env: str, env_meta: dict) -> CdkDogPipelineStack:
+    return CdkDogPipelineStack(
         scope=app,
-        id=factory.get_cdk_stack_id(dog_, components=[gw_, pipeline_], deploy_env=deploy_env),
+        id=stack_id,
         description=factory.get_cdk_stack_description(
             dog_, components=[gw_, pipeline_], deploy_env=deploy_env, detail="CodeBuild, CodePipeline"
         ),
         env=env,
         termination_protection=factory.get_termination_protection(deploy_env),
         # --- ^ super() ---
-        base_stack=cdk_dog_base_stack,
+        base_stack=cdk_dog_base_stack(),
         component=gw_,
         deploy_env=deploy_env,
         env_meta=env_meta,
@@ -2077,25 +2460,28 @@ cdk_dog_gw_pipeline_stacks: dict[str, CdkDogPipelineStack] = {
         gw_stack=cdk_dog_gw_stacks[deploy_env],
         project_name=dog_,
         project_name_comp_list=project_name_comp_lists[dog_],
-        pypi_base_stack=cdk_pypi_base_stack,
-        vpc_stack=cdk_vpc_sih_stack,
+        pypi_base_stack=cdk_pypi_base_stack(),
+        vpc_stack=cdk_vpc_sih_stack(),
     )
-    for deploy_env, env_meta in deploy_envs_metas[dog_].items()
-}
-factory.add_tags_required_wrapper(cdk_dog_gw_pipeline_stacks, project_name=dog_, component=pipeline_)
 
-cdk_dog_em_cloudfront_stacks: dict[str, CdkDogCloudFrontStack] = {
-    deploy_env: CdkDogCloudFrontStack(
+
+@registry.stack_map(
+    factory.deploy_envs_stag_prod_meta,
+    lambda deploy_env: factory.get_cdk_stack_id(dog_, components=[em_, cf_], deploy_env=deploy_env),
+    post_build=lambda s: factory.add_tags_required_wrapper(s, project_name=dog_, component=cf_),
+)
+def cdk_dog_em_cloudfront_stacks(stack_id: str, deploy_env: str, env_meta: dict) -> CdkDogCloudFrontStack:
+    return CdkDogCloudFrontStack(
         scope=app,
-        id=factory.get_cdk_stack_id(dog_, components=[em_, cf_], deploy_env=deploy_env),
+        id=stack_id,
         description=factory.get_cdk_stack_description(
             dog_, components=[em_, cf_], deploy_env=deploy_env, detail="ACM certificates, WAF Web ACLs"
         ),
         env=env_cloudfront,
         termination_protection=True,
         # --- ^ super() ---
-        base_stack=cdk_dog_base_stack,
-        cloudfront_base_stack=cdk_dog_cloudfront_base_stack,
+        base_stack=cdk_dog_base_stack(),
+        cloudfront_base_stack=cdk_dog_cloudfront_base_stack(),
         component=em_,
         deploy_env=deploy_env,
         env_meta=env_meta,
@@ -2103,16 +2489,21 @@ cdk_dog_em_cloudfront_stacks: dict[str, CdkDogCloudFrontStack] = {
         project_name=dog_,
         wordpress=True,
     )
-    for deploy_env, env_meta in factory.deploy_envs_stag_prod_meta.items()
-}
-factory.add_tags_required_wrapper(cdk_dog_em_cloudfront_stacks, project_name=dog_, component=cf_)
 
-cdk_dog_em_database_stacks: dict[str, CdkDogDatabaseStack] = {
-    database_server: CdkDogDatabaseStack(
+
+@registry.stack_map(
+    factory.database_server_deploy_env_stag_prod_map,
+    lambda database_server: factory.get_cdk_stack_id(
+        dog_, components=[em_, database_], deploy_env=factory.format_database_server(database_server)
+    ),
+    post_build=lambda s: factory.add_tags_required_wrapper(
+        s, project_name=dog_, component=database_, is_db_server=True
+    ),
+)
+def cdk_dog_em_database_stacks(stack_id: str, database_server: str, database_meta: dict) -> CdkDogDatabaseStack:
+    return CdkDogDatabaseStack(
         scope=app,
-        id=factory.get_cdk_stack_id(
-            dog_, components=[em_, database_], deploy_env=factory.format_database_server(database_server)
-        ),
+        id=stack_id,
         description=factory.get_cdk_stack_description(
             dog_,
             components=[em_, database_],
@@ -2122,7 +2513,7 @@ cdk_dog_em_database_stacks: dict[str, CdkDogDatabaseStack] = {
         env=env,
         termination_protection=factory.get_termination_protection(database_server),
         # --- ^ super() ---
-        base_stack=cdk_dog_base_stack,
+        base_stack=cdk_dog_base_stack(),
         component=em_,
         database_meta=database_meta,
         db_server_name=database_server,
@@ -2131,48 +2522,49 @@ cdk_dog_em_database_stacks: dict[str, CdkDogDatabaseStack] = {
         deploy_env_weekend_set=deploy_env_weekend_sets[dog_],
         factory=factory,
         project_name=dog_,
-        vpc_stack=cdk_vpc_sih_stack,
+        vpc_stack=cdk_vpc_sih_stack(),
     )
-    for database_server, database_meta in factory.database_server_deploy_env_stag_prod_map.items()
-}
-factory.add_tags_required_wrapper(
-    cdk_dog_em_database_stacks,
-    project_name=dog_,
-    component=database_,
-    is_db_server=True,
-)
 
-cdk_dog_em_fs_stacks: dict[str, CdkDogFsStack] = {
-    deploy_env: CdkDogFsStack(
+
+@registry.stack_map(
+    factory.deploy_envs_stag_prod_meta,
+    lambda deploy_env: factory.get_cdk_stack_id(dog_, components=[em_, fs_], deploy_env=deploy_env),
+    post_build=lambda s: factory.add_tags_required_wrapper(s, project_name=dog_, component=em_),
+)
+def cdk_dog_em_fs_stacks(stack_id: str, deploy_env: str, env_meta: dict) -> CdkDogFsStack:
+    return CdkDogFsStack(
         scope=app,
-        id=factory.get_cdk_stack_id(dog_, components=[em_, fs_], deploy_env=deploy_env),
+        id=stack_id,
         description=factory.get_cdk_stack_description(dog_, components=[em_, fs_], deploy_env=deploy_env, detail="EFS"),
         env=env,
         termination_protection=factory.get_termination_protection(deploy_env),
         # --- ^ super() ---
-        base_stack=cdk_dog_base_stack,
+        base_stack=cdk_dog_base_stack(),
         component=em_,
         deploy_env=deploy_env,
         env_meta=env_meta,
         factory=factory,
         project_name=dog_,
-        vpc_stack=cdk_vpc_sih_stack,
+        vpc_stack=cdk_vpc_sih_stack(),
     )
-    for deploy_env, env_meta in factory.deploy_envs_stag_prod_meta.items()
-}
-factory.add_tags_required_wrapper(cdk_dog_em_fs_stacks, project_name=dog_, component=em_)
 
-cdk_dog_em_stacks: dict[str, CdkDogEmStack] = {
-    deploy_env: CdkDogEmStack(
+
+@registry.stack_map(
+    factory.deploy_envs_stag_prod_meta,
+    lambda deploy_env: factory.get_cdk_stack_id(dog_, components=[em_], deploy_env=deploy_env),
+    post_build=lambda s: factory.add_tags_required_wrapper(s, project_name=dog_, component=em_),
+)
+def cdk_dog_em_stacks(stack_id: str, deploy_env: str, env_meta: dict) -> CdkDogEmStack:
+    return CdkDogEmStack(
         scope=app,
-        id=factory.get_cdk_stack_id(dog_, components=[em_], deploy_env=deploy_env),
+        id=stack_id,
         description=factory.get_cdk_stack_description(
             dog_, components=[em_], deploy_env=deploy_env, detail="CloudFront Distribution, ALB, ECS"
         ),
         env=env,
         termination_protection=factory.get_termination_protection(deploy_env),
         # --- ^ super() ---
-        base_stack=cdk_dog_base_stack,
+        base_stack=cdk_dog_base_stack(),
         component=em_,
         custom_subdomain="store",
         database_stack=cdk_dog_em_database_stacks[factory.deploy_env_database_server_map[deploy_env]],
@@ -2184,23 +2576,27 @@ cdk_dog_em_stacks: dict[str, CdkDogEmStack] = {
         fs_stack=cdk_dog_em_fs_stacks[deploy_env],
         project_name=dog_,
         url_gw=getattr(cdk_dog_gw_stacks[factory.PROD_], factory.URL_PRIVATE_),
-        vpc_stack=cdk_vpc_sih_stack,
+        vpc_stack=cdk_vpc_sih_stack(),
     )
-    for deploy_env, env_meta in factory.deploy_envs_stag_prod_meta.items()
-}
-factory.add_tags_required_wrapper(cdk_dog_em_stacks, project_name=dog_, component=em_)
 
-cdk_dog_em_pipeline_stacks: dict[str, CdkDogPipelineStack] = {
-    deploy_env: CdkDogPipelineStack(
+
+@registry.stack_map(
+    factory.deploy_envs_stag_prod_meta,
+    lambda deploy_env: factory.get_cdk_stack_id(dog_, components=[em_, pipeline_], deploy_env=deploy_env),
+    dependencies=[cdk_codepipeline_ci_cd_stack],
+    post_build=lambda s: factory.add_tags_required_wrapper(s, project_name=dog_, component=pipeline_),
+)
+def cdk_dog_em_pipeline_stacks(stack_id: str, deploy_env: str, env_meta: dict) -> CdkDogPipelineStack:
+    return CdkDogPipelineStack(
         scope=app,
-        id=factory.get_cdk_stack_id(dog_, components=[em_, pipeline_], deploy_env=deploy_env),
+        id=stack_id,
         description=factory.get_cdk_stack_description(
             dog_, components=[em_, pipeline_], deploy_env=deploy_env, detail="CodeBuild, CodePipeline"
         ),
         env=env,
         termination_protection=factory.get_termination_protection(deploy_env),
         # --- ^ super() ---
-        base_stack=cdk_dog_base_stack,
+        base_stack=cdk_dog_base_stack(),
         component=em_,
         deploy_env=deploy_env,
         env_meta=env_meta,
@@ -2208,12 +2604,10 @@ cdk_dog_em_pipeline_stacks: dict[str, CdkDogPipelineStack] = {
         gw_stack=cdk_dog_em_stacks[deploy_env],
         project_name=dog_,
         project_name_comp_list=[factory.join_sep_score([dog_, ecomm_])],
-        pypi_base_stack=cdk_pypi_base_stack,
-        vpc_stack=cdk_vpc_sih_stack,
+        pypi_base_stack=cdk_pypi_base_stack(),
+        vpc_stack=cdk_vpc_sih_stack(),
     )
-    for deploy_env, env_meta in factory.deploy_envs_stag_prod_meta.items()
-}
-factory.add_tags_required_wrapper(cdk_dog_em_pipeline_stacks, project_name=dog_, component=pipeline_)
+
 
 ####################################################################################################
 # --- Dog Custom ---
@@ -2222,15 +2616,23 @@ factory.add_tags_required_wrapper(cdk_dog_em_pipeline_stacks, project_name=dog_,
 deploy_env_24_7_set_dog_spain: set[str] = set()
 deploy_env_weekend_set_dog_spain: set[str] = set()
 
-cdk_dog_custom_database_stacks: dict[str, CdkDogDatabaseStack] = {
-    database_server: CdkDogDatabaseStack(
+
+@registry.stack_map(
+    factory.database_server_deploy_env_stag_prod_map,
+    lambda database_server: factory.get_cdk_stack_id(
+        dog_,
+        custom_val=factory.CUSTOM_,
+        components=[database_],
+        deploy_env=factory.format_database_server(database_server),
+    ),
+    post_build=lambda s: factory.add_tags_required_wrapper(
+        s, project_name=dog_, custom_val=factory.CUSTOM_, component=database_, is_db_server=True
+    ),
+)
+def cdk_dog_custom_database_stacks(stack_id: str, database_server: str, database_meta: dict) -> CdkDogDatabaseStack:
+    return CdkDogDatabaseStack(
         scope=app,
-        id=factory.get_cdk_stack_id(
-            dog_,
-            custom_val=factory.CUSTOM_,
-            components=[database_],
-            deploy_env=factory.format_database_server(database_server),
-        ),
+        id=stack_id,
         description=factory.get_cdk_stack_description(
             dog_,
             custom_val=factory.CUSTOM_,
@@ -2241,7 +2643,7 @@ cdk_dog_custom_database_stacks: dict[str, CdkDogDatabaseStack] = {
         env=env,
         termination_protection=factory.get_termination_protection(database_server),
         # --- ^ super() ---
-        base_stack=cdk_dog_base_stack,
+        base_stack=cdk_dog_base_stack(),
         component=gw_,
         customisations=[spain_],
         database_meta=database_meta,
@@ -2251,17 +2653,9 @@ cdk_dog_custom_database_stacks: dict[str, CdkDogDatabaseStack] = {
         deploy_env_weekend_set=deploy_env_weekend_set_dog_spain,
         factory=factory,
         project_name=dog_,
-        vpc_stack=cdk_vpc_sih_stack,
+        vpc_stack=cdk_vpc_sih_stack(),
     )
-    for database_server, database_meta in factory.database_server_deploy_env_stag_prod_map.items()
-}
-factory.add_tags_required_wrapper(
-    cdk_dog_custom_database_stacks,
-    project_name=dog_,
-    custom_val=factory.CUSTOM_,
-    component=database_,
-    is_db_server=True,
-)
+
 
 ####################################################################################################
 # --- Dog Spain ---
@@ -2269,35 +2663,39 @@ factory.add_tags_required_wrapper(
 
 project_name_comp_list_dog_spain: list[str] = [factory.join_sep_score([dog_, spain_, gw_] + j) for j in [[], [base_]]]
 
-cdk_dog_spain_base_stack = CdkDogSpainBaseStack(
-    scope=app,
-    id=factory.get_cdk_stack_id(dog_, custom_val=spain_, base_comp=True),
-    description=factory.get_cdk_stack_description(
-        dog_, custom_val=spain_, base_comp=True, detail="ECR, Secrets Manager"
-    ),
-    env=env,
-    termination_protection=True,
-    # --- ^ super() ---
-    component=gw_,
-    custom_val=spain_,
-    elastic_ip_parameter_names=elastic_ip_parameter_names,
-    factory=factory,
-    project_name=dog_,
-    project_name_comp_list=project_name_comp_list_dog_spain,
-)
-factory.add_tags_required(
-    stacks=[cdk_dog_spain_base_stack],
-    project_name_val=word_map[dog_],
-    custom_val=word_map[spain_],
-    env_type_val=factory.TAG_VAL_NONE_,
-    component_val=word_map[base_],
-    deploy_env_val=factory.TAG_VAL_NONE_,
-)
-
-cdk_dog_spain_gw_cloudfront_stacks: dict[str, CdkDogCloudFrontStack] = {
-    deploy_env: CdkDogCloudFrontStack(
-        scope=app,
-        id=factory.get_cdk_stack_id(dog_, custom_val=spain_, components=[gw_, cf_], deploy_env=deploy_env),
+
+@registry.stack(
+    factory.get_cdk_stack_id(dog_, custom_val=spain_, base_comp=True),
+    post_build=add_tags_required_base(dog_, custom=spain_),
+)
+def cdk_dog_spain_base_stack(stack_id: str = None) -> CdkDogSpainBaseStack:
+    return CdkDogSpainBaseStack(
+        scope=app,
+        id=stack_id,
+        description=factory.get_cdk_stack_description(
+            dog_, custom_val=spain_, base_comp=True, detail="ECR, Secrets Manager"
+        ),
+        env=env,
+        termination_protection=True,
+        # --- ^ super() ---
+        component=gw_,
+        custom_val=spain_,
+        elastic_ip_parameter_names=elastic_ip_parameter_names,
+        factory=factory,
+        project_name=dog_,
+        project_name_comp_list=project_name_comp_list_dog_spain,
+    )
+
+
+@registry.stack_map(
+    factory.deploy_envs_stag_prod_meta,
+    lambda deploy_env: factory.get_cdk_stack_id(dog_, custom_val=spain_, components=[gw_, cf_], deploy_env=deploy_env),
+    post_build=lambda s: factory.add_tags_required_wrapper(s, project_name=dog_, custom_val=spain_, component=cf_),
+)
+def cdk_dog_spain_gw_cloudfront_stacks(stack_id: str, deploy_env: str, env_meta: dict) -> CdkDogCloudFrontStack:
+    return CdkDogCloudFrontStack(
+        scope=app,
+        id=stack_id,
         description=factory.get_cdk_stack_description(
             dog_,
             custom_val=spain_,
@@ -2308,8 +2706,8 @@ cdk_dog_spain_gw_cloudfront_stacks: dict[str, CdkDogCloudFrontStack] = {
         env=env_cloudfront,
         termination_protection=True,
         # --- ^ super() ---
-        base_stack=cdk_dog_base_stack,
-        cloudfront_base_stack=cdk_dog_cloudfront_base_stack,
+        base_stack=cdk_dog_base_stack(),
+        cloudfront_base_stack=cdk_dog_cloudfront_base_stack(),
         component=gw_,
         custom_val=spain_,
         deploy_env=deploy_env,
@@ -2317,23 +2715,24 @@ cdk_dog_spain_gw_cloudfront_stacks: dict[str, CdkDogCloudFrontStack] = {
         factory=factory,
         project_name=dog_,
     )
-    for deploy_env, env_meta in factory.deploy_envs_stag_prod_meta.items()
-}
-factory.add_tags_required_wrapper(
-    cdk_dog_spain_gw_cloudfront_stacks, project_name=dog_, custom_val=spain_, component=cf_
-)
 
-cdk_dog_spain_cache_stacks: dict[str, CdkDogCacheStack] = {
-    deploy_env: CdkDogCacheStack(
+
+@registry.stack_map(
+    factory.deploy_envs_stag_prod_meta,
+    lambda deploy_env: factory.get_cdk_stack_id(dog_, custom_val=spain_, components=[cache_], deploy_env=deploy_env),
+    post_build=lambda s: factory.add_tags_required_wrapper(s, project_name=dog_, component=cache_, is_cache=True),
+)
+def cdk_dog_spain_cache_stacks(stack_id: str, deploy_env: str, env_meta: dict) -> CdkDogCacheStack:
+    return CdkDogCacheStack(
         scope=app,
-        id=factory.get_cdk_stack_id(dog_, custom_val=spain_, components=[cache_], deploy_env=deploy_env),
+        id=stack_id,
         description=factory.get_cdk_stack_description(
             dog_, custom_val=spain_, components=[cache_], deploy_env=deploy_env, detail="ElastiCache Redis"
         ),
         env=env,
         termination_protection=factory.get_termination_protection(deploy_env),
         # --- ^ super() ---
-        base_stack=cdk_dog_base_stack,
+        base_stack=cdk_dog_base_stack(),
         component=gw_,
         custom_val=spain_,
         deploy_env=deploy_env,
@@ -2342,28 +2741,26 @@ cdk_dog_spain_cache_stacks: dict[str, CdkDogCacheStack] = {
         env_meta=env_meta,
         factory=factory,
         project_name=dog_,
-        vpc_stack=cdk_vpc_sih_stack,
+        vpc_stack=cdk_vpc_sih_stack(),
     )
-    for deploy_env, env_meta in factory.deploy_envs_stag_prod_meta.items()
-}
-factory.add_tags_required_wrapper(
-    cdk_dog_spain_cache_stacks,
-    project_name=dog_,
-    component=cache_,
-    is_cache=True,
-)
 
-cdk_dog_spain_storage_stacks: dict[str, CdkDogStorageStack] = {
-    deploy_env: CdkDogStorageStack(
+
+@registry.stack_map(
+    factory.deploy_envs_stag_prod_meta,
+    lambda deploy_env: factory.get_cdk_stack_id(dog_, custom_val=spain_, components=[storage_], deploy_env=deploy_env),
+    post_build=lambda s: factory.add_tags_required_wrapper(s, project_name=dog_, component=gw_),
+)
+def cdk_dog_spain_storage_stacks(stack_id: str, deploy_env: str, env_meta: dict) -> CdkDogStorageStack:
+    return CdkDogStorageStack(
         scope=app,
-        id=factory.get_cdk_stack_id(dog_, custom_val=spain_, components=[storage_], deploy_env=deploy_env),
+        id=stack_id,
         description=factory.get_cdk_stack_description(
             dog_, custom_val=spain_, components=[storage_], deploy_env=deploy_env, detail="S3"
         ),
         env=env,
         termination_protection=factory.get_termination_protection(deploy_env),
         # --- ^ super() ---
-        base_stack=cdk_dog_base_stack,
+        base_stack=cdk_dog_base_stack(),
         component=gw_,
         custom_val=spain_,
         deploy_env=deploy_env,
@@ -2371,14 +2768,17 @@ cdk_dog_spain_storage_stacks: dict[str, CdkDogStorageStack] = {
         factory=factory,
         project_name=dog_,
     )
-    for deploy_env, env_meta in factory.deploy_envs_stag_prod_meta.items()
-}
-factory.add_tags_required_wrapper(cdk_dog_spain_storage_stacks, project_name=dog_, component=gw_)
 
-cdk_dog_spain_gw_stacks: dict[str, CdkDogGwStack] = {
-    deploy_env: CdkDogGwStack(
+
+@registry.stack_map(
+    factory.deploy_envs_stag_prod_meta,
+    lambda deploy_env: factory.get_cdk_stack_id(dog_, custom_val=spain_, components=[gw_], deploy_env=deploy_env),
+    post_build=lambda s: factory.add_tags_required_wrapper(s, project_name=dog_, custom_val=spain_, component=gw_),
+)
+def cdk_dog_spain_gw_stacks(stack_id: str, deploy_env: str, env_meta: dict) -> CdkDogGwStack:
+    return CdkDogGwStack(
         scope=app,
-        id=factory.get_cdk_stack_id(dog_, custom_val=spain_, components=[gw_], deploy_env=deploy_env),
+        id=stack_id,
         description=factory.get_cdk_stack_description(
             dog_,
             custom_val=spain_,
@@ -2389,8 +2789,8 @@ cdk_dog_spain_gw_stacks: dict[str, CdkDogGwStack] = {
         env=env,
         termination_protection=factory.get_termination_protection(deploy_env),
         # --- ^ super() ---
-        base_stack=cdk_dog_base_stack,
-        base_stack_alt=cdk_dog_spain_base_stack,
+        base_stack=cdk_dog_base_stack(),
+        base_stack_alt=cdk_dog_spain_base_stack(),
         bkg_ms_stack=get_bkg_ms_stack(dog_, deploy_env),
         cache_stack=cdk_dog_spain_cache_stacks[deploy_env],
         component=gw_,
@@ -2407,21 +2807,24 @@ cdk_dog_spain_gw_stacks: dict[str, CdkDogGwStack] = {
         pdf_ms_stack=cdk_pdf_ms_stacks[factory.PROD_],
         project_name=dog_,
         storage_stack=cdk_dog_spain_storage_stacks[deploy_env],
-        vpc_stack=cdk_vpc_sih_stack,
+        vpc_stack=cdk_vpc_sih_stack(),
     )
-    for deploy_env, env_meta in factory.deploy_envs_stag_prod_meta.items()
-}
-factory.add_tags_required_wrapper(
-    cdk_dog_spain_gw_stacks,
-    project_name=dog_,
-    custom_val=spain_,
-    component=gw_,
-)
 
-cdk_dog_spain_gw_pipeline_stacks: dict[str, CdkDogPipelineStack] = {
-    deploy_env: CdkDogPipelineStack(
+
+@registry.stack_map(
+    factory.deploy_envs_stag_prod_meta,
+    lambda deploy_env: factory.get_cdk_stack_id(
+        dog_, custom_val=spain_, components=[gw_, pipeline_], deploy_env=deploy_env
+    ),
+    dependencies=[cdk_codepipeline_ci_cd_stack],
+    post_build=lambda s: factory.add_tags_required_wrapper(
+        s, project_name=dog_, custom_val=spain_, component=pipeline_
+    ),
+)
+def cdk_dog_spain_gw_pipeline_stacks(stack_id: str, deploy_env: str, env_meta: dict) -> CdkDogPipelineStack:
+    return CdkDogPipelineStack(
         scope=app,
-        id=factory.get_cdk_stack_id(dog_, custom_val=spain_, components=[gw_, pipeline_], deploy_env=deploy_env),
+        id=stack_id,
         description=factory.get_cdk_stack_description(
             dog_,
             custom_val=spain_,
@@ -2432,7 +2835,7 @@ cdk_dog_spain_gw_pipeline_stacks: dict[str, CdkDogPipelineStack] = {
         env=env,
         termination_protection=factory.get_termination_protection(deploy_env),
         # --- ^ super() ---
-        base_stack=cdk_dog_spain_base_stack,
+        base_stack=cdk_dog_spain_base_stack(),
         component=gw_,
         custom_val=spain_,
         deploy_env=deploy_env,
@@ -2441,71 +2844,77 @@ cdk_dog_spain_gw_pipeline_stacks: dict[str, CdkDogPipelineStack] = {
         gw_stack=cdk_dog_spain_gw_stacks[deploy_env],
         project_name=dog_,
         project_name_comp_list=project_name_comp_list_dog_spain,
-        pypi_base_stack=cdk_pypi_base_stack,
-        vpc_stack=cdk_vpc_sih_stack,
+        pypi_base_stack=cdk_pypi_base_stack(),
+        vpc_stack=cdk_vpc_sih_stack(),
     )
-    for deploy_env, env_meta in factory.deploy_envs_stag_prod_meta.items()
-}
-factory.add_tags_required_wrapper(
-    cdk_dog_spain_gw_pipeline_stacks, project_name=dog_, custom_val=spain_, component=pipeline_
-)
+
 
 ####################################################################################################
 # --- Cat ---
 ####################################################################################################
 
-cdk_cat_cloudfront_base_stack = CdkCatCloudFrontBaseStack(
-    scope=app,
-    id=factory.get_cdk_stack_id(cat_, components=[cf_], base_comp=True),
-    description=factory.get_cdk_stack_description(
-        cat_, components=[cf_], base_comp=True, detail="WAF Regex Pattern Set"
-    ),
-    env=env_cloudfront,
-    termination_protection=True,
-    # --- ^ super() ---
-    base_stack=cdk_cat_base_stack,
-    component=gw_,
-    elastic_ip_str_list=elastic_ip_str_list,
-    factory=factory,
-    project_name=cat_,
-)
-factory.add_tags_required(
-    stacks=[cdk_cat_base_stack, cdk_cat_cloudfront_base_stack],
-    project_name_val=word_map[cat_],
-    custom_val=factory.TAG_VAL_NONE_,
-    env_type_val=factory.TAG_VAL_NONE_,
-    component_val=word_map[base_],
-    deploy_env_val=factory.TAG_VAL_NONE_,
+
+@registry.stack(
+    factory.get_cdk_stack_id(cat_, components=[cf_], base_comp=True),
+    dependencies=[cdk_vpc_sih_stack],
+    post_build=add_tags_required_base(cat_),
 )
+def cdk_cat_cloudfront_base_stack(stack_id: str = None) -> CdkCatCloudFrontBaseStack:
+    return CdkCatCloudFrontBaseStack(
+        scope=app,
+        id=stack_id,
+        description=factory.get_cdk_stack_description(
+            cat_, components=[cf_], base_comp=True, detail="WAF Regex Pattern Set"
+        ),
+        env=env_cloudfront,
+        termination_protection=True,
+        # --- ^ super() ---
+        base_stack=cdk_cat_base_stack(),
+        component=gw_,
+        elastic_ip_str_list=elastic_ip_str_list,
+        factory=factory,
+        project_name=cat_,
+    )
+
 
-cdk_cat_gw_cloudfront_stacks: dict[str, CdkCatCloudFrontStack] = {
-    deploy_env: CdkCatCloudFrontStack(
+@registry.stack_map(
+    deploy_envs_metas[cat_],
+    lambda deploy_env: factory.get_cdk_stack_id(cat_, components=[gw_, cf_], deploy_env=deploy_env),
+    post_build=lambda s: factory.add_tags_required_wrapper(s, project_name=cat_, component=cf_),
+)
+def cdk_cat_gw_cloudfront_stacks(stack_id: str, deploy_env: str, env_meta: dict) -> CdkCatCloudFrontStack:
+    return CdkCatCloudFrontStack(
         scope=app,
-        id=factory.get_cdk_stack_id(cat_, components=[gw_, cf_], deploy_env=deploy_env),
+        id=stack_id,
         description=factory.get_cdk_stack_description(
             cat_, components=[gw_, cf_], deploy_env=deploy_env, detail="ACM certificates, WAF Web ACLs"
         ),
         env=env_cloudfront,
         termination_protection=True,
         # --- ^ super() ---
-        base_stack=cdk_cat_base_stack,
-        cloudfront_base_stack=cdk_cat_cloudfront_base_stack,
+        base_stack=cdk_cat_base_stack(),
+        cloudfront_base_stack=cdk_cat_cloudfront_base_stack(),
         component=gw_,
         deploy_env=deploy_env,
         env_meta=env_meta,
         factory=factory,
         project_name=cat_,
     )
-    for deploy_env, env_meta in deploy_envs_metas[cat_].items()
-}
-factory.add_tags_required_wrapper(cdk_cat_gw_cloudfront_stacks, project_name=cat_, component=cf_)
 
-cdk_cat_database_stacks: dict[str, CdkCatDatabaseStack] = {
-    database_server: CdkCatDatabaseStack(
+
+@registry.stack_map(
+    database_server_deploy_env_maps[cat_],
+    lambda database_server: factory.get_cdk_stack_id(
+        cat_, components=[database_], deploy_env=factory.format_database_server(database_server)
+    ),
+    post_build=lambda s: factory.add_tags_required_wrapper(
+        s, project_name=cat_, component=database_, is_db_server=True
+    ),
+)
+def cdk_cat_database_stacks(stack_id: str, database_server: str, database_meta: dict) -> CdkCatDatabaseStack:
+    return CdkCatDatabaseStack(
         scope=app,
-        id=factory.get_cdk_stack_id(
-            cat_, components=[database_], deploy_env=factory.format_database_server(database_server)
-        ),
+        id=stack_id,
         description=factory.get_cdk_stack_description(
             cat_,
             components=[database_],
@@ -2515,37 +2924,36 @@ cdk_cat_database_stacks: dict[str, CdkCatDatabaseStack] = {
         env=env,
         termination_protection=factory.get_termination_protection(database_server),
         # --- ^ super() ---
-        base_stack=cdk_cat_base_stack,
+        base_stack=cdk_cat_base_stack(),
         component=gw_,
         database_meta=database_meta,
+        db_consumers=get_db_consumers(cat_, database_meta, CdkCatGwStack),
         db_server_name=database_server,
         db_server_preview_demo=get_db_server_preview_demo(cat_, database_server),
         deploy_env_24_7_set=deploy_env_24_7_sets[cat_],
         deploy_env_weekend_set=deploy_env_weekend_sets[cat_],
         factory=factory,
         project_name=cat_,
-        vpc_stack=cdk_vpc_sih_stack,
+        vpc_stack=cdk_vpc_sih_stack(),
     )
-    for database_server, database_meta in database_server_deploy_env_maps[cat_].items()
-}
-factory.add_tags_required_wrapper(
-    cdk_cat_database_stacks,
-    project_name=cat_,
-    component=database_,
-    is_db_server=True,
-)
 
-cdk_cat_cache_stacks: dict[str, CdkCatCacheStack] = {
-    deploy_env: CdkCatCacheStack(
+
+@registry.stack_map(
+    deploy_envs_metas[cat_],
+    lambda deploy_env: factory.get_cdk_stack_id(cat_, components=[cache_], deploy_env=deploy_env),
+    post_build=lambda s: factory.add_tags_required_wrapper(s, project_name=cat_, component=cache_, is_cache=True),
+)
+def cdk_cat_cache_stacks(stack_id: str, deploy_env: str, env_meta: dict) -> CdkCatCacheStack:
+    return CdkCatCacheStack(
         scope=app,
-        id=factory.get_cdk_stack_id(cat_, components=[cache_], deploy_env=deploy_env),
+        id=stack_id,
         description=factory.get_cdk_stack_description(
             cat_, components=[cache_], deploy_env=deploy_env, detail="ElastiCache Redis"
         ),
         env=env,
         termination_protection=factory.get_termination_protection(deploy_env),
         # --- ^ super() ---
-        base_stack=cdk_cat_base_stack,
+        base_stack=cdk_cat_base_stack(),
         component=gw_,
         deploy_env=deploy_env,
         deploy_env_24_7_set=deploy_env_24_7_sets[cat_],
@@ -2553,70 +2961,70 @@ cdk_cat_cache_stacks: dict[str, CdkCatCacheStack] = {
         env_meta=env_meta,
         factory=factory,
         project_name=cat_,
-        vpc_stack=cdk_vpc_sih_stack,
+        vpc_stack=cdk_vpc_sih_stack(),
     )
-    for deploy_env, env_meta in deploy_envs_metas[cat_].items()
-}
-factory.add_tags_required_wrapper(
-    cdk_cat_cache_stacks,
-    project_name=cat_,
-    component=cache_,
-    is_cache=True,
-)
 
-cdk_cat_storage_stacks: dict[str, CdkCatStorageStack] = {
-    deploy_env: CdkCatStorageStack(
+
+@registry.stack_map(
+    deploy_envs_metas[cat_],
+    lambda deploy_env: factory.get_cdk_stack_id(cat_, components=[storage_], deploy_env=deploy_env),
+    post_build=lambda s: factory.add_tags_required_wrapper(s, project_name=cat_, component=gw_),
+)
+def cdk_cat_storage_stacks(stack_id: str, deploy_env: str, env_meta: dict) -> CdkCatStorageStack:
+    return CdkCatStorageStack(
         scope=app,
-        id=factory.get_cdk_stack_id(cat_, components=[storage_], deploy_env=deploy_env),
+        id=stack_id,
         description=factory.get_cdk_stack_description(cat_, components=[storage_], deploy_env=deploy_env, detail="S3"),
         env=env,
         termination_protection=factory.get_termination_protection(deploy_env),
         # --- ^ super() ---
-        base_stack=cdk_cat_base_stack,
+        base_stack=cdk_cat_base_stack(),
         component=gw_,
         deploy_env=deploy_env,
         env_meta=env_meta,
         factory=factory,
         project_name=cat_,
     )
-    for deploy_env, env_meta in deploy_envs_metas[cat_].items()
-}
-factory.add_tags_required_wrapper(cdk_cat_storage_stacks, project_name=cat_, component=gw_)
 
-cdk_cat_notif_stacks: dict[str, CdkCatNotifStack] = {
-    deploy_env: CdkCatNotifStack(
+
+@registry.stack_map(
+    deploy_envs_metas[cat_],
+    lambda deploy_env: factory.get_cdk_stack_id(cat_, components=[notif_], deploy_env=deploy_env),
+    post_build=lambda s: factory.add_tags_required_wrapper(s, project_name=cat_, component=gw_),
+)
+def cdk_cat_notif_stacks(stack_id: str, deploy_env: str, env_meta: dict) -> CdkCatNotifStack:
+    return CdkCatNotifStack(
         scope=app,
-        id=factory.get_cdk_stack_id(cat_, components=[notif_], deploy_env=deploy_env),
+        id=stack_id,
         description=factory.get_cdk_stack_description(cat_, components=[notif_], deploy_env=deploy_env, detail="SNS"),
         env=env,
         termination_protection=factory.get_termination_protection(deploy_env),
         # --- ^ super() ---
-        base_stack=cdk_cat_base_stack,
+        base_stack=cdk_cat_base_stack(),
         component=gw_,
         deploy_env=deploy_env,
         env_meta=env_meta,
         factory=factory,
         project_name=cat_,
     )
-    for deploy_env, env_meta in deploy_envs_metas[cat_].items()
-}
-factory.add_tags_required_wrapper(
-    cdk_cat_notif_stacks,
-    project_name=cat_,
-    component=gw_,
-)
 
-cdk_cat_gw_stacks: dict[str, CdkCatGwStack] = {
-    deploy_env: CdkCatGwStack(
+
+@registry.stack_map(
+    deploy_envs_metas[cat_],
+    lambda deploy_env: factory.get_cdk_stack_id(cat_, components=[gw_], deploy_env=deploy_env),
+    post_build=lambda s: factory.add_tags_required_wrapper(s, project_name=cat_, component=gw_),
+)
+def cdk_cat_gw_stacks(stack_id: str, deploy_env: str, env_meta: dict) -> CdkCatGwStack:
+    return CdkCatGwStack(
         scope=app,
-        id=factory.get_cdk_stack_id(cat_, components=[gw_], deploy_env=deploy_env),
+        id=stack_id,
         description=factory.get_cdk_stack_description(
             cat_, components=[gw_], deploy_env=deploy_env, detail="CloudFront Distribution, ALB, ECS"
         ),
         env=env,
         termination_protection=factory.get_termination_protection(deploy_env),
         # --- ^ super() ---
-        base_stack=cdk_cat_base_stack,
+        base_stack=cdk_cat_base_stack(),
         bkg_ms_stack=get_bkg_ms_stack(cat_, deploy_env),
         cache_stack=cdk_cat_cache_stacks[deploy_env],
         component=gw_,
@@ -2632,23 +3040,27 @@ cdk_cat_gw_stacks: dict[str, CdkCatGwStack] = {
         pdf_ms_stack=cdk_pdf_ms_stacks[factory.PROD_],
         project_name=cat_,
         storage_stack=cdk_cat_storage_stacks[deploy_env],
-        vpc_stack=cdk_vpc_sih_stack,
+        vpc_stack=cdk_vpc_sih_stack(),
     )
-    for deploy_env, env_meta in deploy_envs_metas[cat_].items()
-}
-factory.add_tags_required_wrapper(cdk_cat_gw_stacks, project_name=cat_, component=gw_)
 
-cdk_cat_gw_pipeline_stacks: dict[str, CdkCatPipelineStack] = {
-    deploy_env: CdkCatPipelineStack(
+
+@registry.stack_map(
+    deploy_envs_metas[cat_],
+    lambda deploy_env: factory.get_cdk_stack_id(cat_, components=[gw_, pipeline_], deploy_env=deploy_env),
+    dependencies=[cdk_codepipeline_ci_cd_stack],
+    post_build=lambda s: factory.add_tags_required_wrapper(s, project_name=cat_, component=pipeline_),
+)
+def cdk_cat_gw_pipeline_stacks(stack_id: str, deploy_env: str, env_meta: dict) -> CdkCatPipelineStack:
+    return CdkCatPipelineStack(
         scope=app,
-        id=factory.get_cdk_stack_id(cat_, components=[gw_, pipeline_], deploy_env=deploy_env),
+        id=stack_id,
         description=factory.get_cdk_stack_description(
             cat_, components=[gw_, pipeline_], deploy_env=deploy_env, detail="CodeBuild, CodePipeline"
         ),
         env=env,
         termination_protection=factory.get_termination_protection(deploy_env),
         # --- ^ super() ---
-        base_stack=cdk_cat_base_stack,
+        base_stack=cdk_cat_base_stack(),
         component=gw_,
         deploy_env=deploy_env,
         env_meta=env_meta,
@@ -2656,69 +3068,77 @@ cdk_cat_gw_pipeline_stacks: dict[str, CdkCatPipelineStack] = {
         gw_stack=cdk_cat_gw_stacks[deploy_env],
         project_name=cat_,
         project_name_comp_list=project_name_comp_lists[cat_],
-        pypi_base_stack=cdk_pypi_base_stack,
-        vpc_stack=cdk_vpc_sih_stack,
+        pypi_base_stack=cdk_pypi_base_stack(),
+        vpc_stack=cdk_vpc_sih_stack(),
     )
-    for deploy_env, env_meta in deploy_envs_metas[cat_].items()
-}
-factory.add_tags_required_wrapper(cdk_cat_gw_pipeline_stacks, project_name=cat_, component=pipeline_)
+
 
 ####################################################################################################
 # --- Bird ---
 ####################################################################################################
 
-cdk_bird_cloudfront_base_stack = CdkBirdCloudFrontBaseStack(
-    scope=app,
-    id=factory.get_cdk_stack_id(bird_, components=[cf_], base_comp=True),
-    description=factory.get_cdk_stack_description(
-        bird_, components=[cf_], base_comp=True, detail="WAF Regex Pattern Set"
-    ),
-    env=env_cloudfront,
-    termination_protection=True,
-    # --- ^ super() ---
-    base_stack=cdk_bird_base_stack,
-    component=gw_,
-    elastic_ip_str_list=elastic_ip_str_list,
-    factory=factory,
-    project_name=bird_,
-)
-factory.add_tags_required(
-    stacks=[cdk_bird_base_stack, cdk_bird_cloudfront_base_stack],
-    project_name_val=word_map[bird_],
-    custom_val=factory.TAG_VAL_NONE_,
-    env_type_val=factory.TAG_VAL_NONE_,
-    component_val=word_map[base_],
-    deploy_env_val=factory.TAG_VAL_NONE_,
+
+@registry.stack(
+    factory.get_cdk_stack_id(bird_, components=[cf_], base_comp=True),
+    dependencies=[cdk_vpc_sih_stack],
+    post_build=add_tags_required_base(bird_),
 )
+def cdk_bird_cloudfront_base_stack(stack_id: str = None) -> CdkBirdCloudFrontBaseStack:
+    return CdkBirdCloudFrontBaseStack(
+        scope=app,
+        id=stack_id,
+        description=factory.get_cdk_stack_description(
+            bird_, components=[cf_], base_comp=True, detail="WAF Regex Pattern Set"
+        ),
+        env=env_cloudfront,
+        termination_protection=True,
+        # --- ^ super() ---
+        base_stack=cdk_bird_base_stack(),
+        component=gw_,
+        elastic_ip_str_list=elastic_ip_str_list,
+        factory=factory,
+        project_name=bird_,
+    )
 
-cdk_bird_gw_cloudfront_stacks: dict[str, CdkBirdCloudFrontStack] = {
-    deploy_env: CdkBirdCloudFrontStack(
+
+@registry.stack_map(
+    deploy_envs_metas[bird_],
+    lambda deploy_env: factory.get_cdk_stack_id(bird_, components=[gw_, cf_], deploy_env=deploy_env),
+    post_build=lambda s: factory.add_tags_required_wrapper(s, project_name=bird_, component=cf_),
+)
+def cdk_bird_gw_cloudfront_stacks(stack_id: str, deploy_env: str, env_meta: dict) -> CdkBirdCloudFrontStack:
+    return CdkBirdCloudFrontStack(
         scope=app,
-        id=factory.get_cdk_stack_id(bird_, components=[gw_, cf_], deploy_env=deploy_env),
+        id=stack_id,
         description=factory.get_cdk_stack_description(
             bird_, components=[gw_, cf_], deploy_env=deploy_env, detail="ACM certificates, WAF Web ACLs"
         ),
         env=env_cloudfront,
         termination_protection=True,
         # --- ^ super() ---
-        base_stack=cdk_bird_base_stack,
-        cloudfront_base_stack=cdk_bird_cloudfront_base_stack,
+        base_stack=cdk_bird_base_stack(),
+        cloudfront_base_stack=cdk_bird_cloudfront_base_stack(),
         component=gw_,
         deploy_env=deploy_env,
         env_meta=env_meta,
         factory=factory,
         project_name=bird_,
     )
-    for deploy_env, env_meta in deploy_envs_metas[bird_].items()
-}
-factory.add_tags_required_wrapper(cdk_bird_gw_cloudfront_stacks, project_name=bird_, component=cf_)
 
-cdk_bird_database_stacks: dict[str, CdkBirdDatabaseStack] = {
-    database_server: CdkBirdDatabaseStack(
+
+@registry.stack_map(
+    database_server_deploy_env_maps[bird_],
+    lambda database_server: factory.get_cdk_stack_id(
+        bird_, components=[database_], deploy_env=factory.format_database_server(database_server)
+    ),
+    post_build=lambda s: factory.add_tags_required_wrapper(
+        s, project_name=bird_, component=database_, is_db_server=True
+    ),
+)
+def cdk_bird_database_stacks(stack_id: str, database_server: str, database_meta: dict) -> CdkBirdDatabaseStack:
+    return CdkBirdDatabaseStack(
         scope=app,
-        id=factory.get_cdk_stack_id(
-            bird_, components=[database_], deploy_env=factory.format_database_server(database_server)
-        ),
+        id=stack_id,
         description=factory.get_cdk_stack_description(
             bird_,
             components=[database_],
@@ -2728,37 +3148,36 @@ cdk_bird_database_stacks: dict[str, CdkBirdDatabaseStack] = {
         env=env,
         termination_protection=factory.get_termination_protection(database_server),
         # --- ^ super() ---
-        base_stack=cdk_bird_base_stack,
+        base_stack=cdk_bird_base_stack(),
         component=gw_,
         database_meta=database_meta,
+        db_consumers=get_db_consumers(bird_, database_meta, CdkBirdGwStack),
         db_server_name=database_server,
         db_server_preview_demo=get_db_server_preview_demo(bird_, database_server),
         deploy_env_24_7_set=deploy_env_24_7_sets[bird_],
         deploy_env_weekend_set=deploy_env_weekend_sets[bird_],
         factory=factory,
         project_name=bird_,
-        vpc_stack=cdk_vpc_sih_stack,
+        vpc_stack=cdk_vpc_sih_stack(),
     )
-    for database_server, database_meta in database_server_deploy_env_maps[bird_].items()
-}
-factory.add_tags_required_wrapper(
-    cdk_bird_database_stacks,
-    project_name=bird_,
-    component=database_,
-    is_db_server=True,
-)
 
-cdk_bird_cache_stacks: dict[str, CdkBirdCacheStack] = {
-    deploy_env: CdkBirdCacheStack(
+
+@registry.stack_map(
+    deploy_envs_metas[bird_],
+    lambda deploy_env: factory.get_cdk_stack_id(bird_, components=[cache_], deploy_env=deploy_env),
+    post_build=lambda s: factory.add_tags_required_wrapper(s, project_name=bird_, component=cache_, is_cache=True),
+)
+def cdk_bird_cache_stacks(stack_id: str, deploy_env: str, env_meta: dict) -> CdkBirdCacheStack:
+    return CdkBirdCacheStack(
         scope=app,
-        id=factory.get_cdk_stack_id(bird_, components=[cache_], deploy_env=deploy_env),
+        id=stack_id,
         description=factory.get_cdk_stack_description(
             bird_, components=[cache_], deploy_env=deploy_env, detail="ElastiCache Redis"
         ),
         env=env,
         termination_protection=factory.get_termination_protection(deploy_env),
         # --- ^ super() ---
-        base_stack=cdk_bird_base_stack,
+        base_stack=cdk_bird_base_stack(),
         component=gw_,
         deploy_env=deploy_env,
         deploy_env_24_7_set=deploy_env_24_7_sets[bird_],
@@ -2766,70 +3185,70 @@ cdk_bird_cache_stacks: dict[str, CdkBirdCacheStack] = {
         env_meta=env_meta,
         factory=factory,
         project_name=bird_,
-        vpc_stack=cdk_vpc_sih_stack,
+        vpc_stack=cdk_vpc_sih_stack(),
     )
-    for deploy_env, env_meta in deploy_envs_metas[bird_].items()
-}
-factory.add_tags_required_wrapper(
-    cdk_bird_cache_stacks,
-    project_name=bird_,
-    component=cache_,
-    is_cache=True,
-)
 
-cdk_bird_storage_stacks: dict[str, CdkBirdStorageStack] = {
-    deploy_env: CdkBirdStorageStack(
+
+@registry.stack_map(
+    deploy_envs_metas[bird_],
+    lambda deploy_env: factory.get_cdk_stack_id(bird_, components=[storage_], deploy_env=deploy_env),
+    post_build=lambda s: factory.add_tags_required_wrapper(s, project_name=bird_, component=gw_),
+)
+def cdk_bird_storage_stacks(stack_id: str, deploy_env: str, env_meta: dict) -> CdkBirdStorageStack:
+    return CdkBirdStorageStack(
         scope=app,
-        id=factory.get_cdk_stack_id(bird_, components=[storage_], deploy_env=deploy_env),
+        id=stack_id,
         description=factory.get_cdk_stack_description(bird_, components=[storage_], deploy_env=deploy_env, detail="S3"),
         env=env,
         termination_protection=factory.get_termination_protection(deploy_env),
         # --- ^ super() ---
-        base_stack=cdk_bird_base_stack,
+        base_stack=cdk_bird_base_stack(),
         component=gw_,
         deploy_env=deploy_env,
         env_meta=env_meta,
         factory=factory,
         project_name=bird_,
     )
-    for deploy_env, env_meta in deploy_envs_metas[bird_].items()
-}
-factory.add_tags_required_wrapper(cdk_bird_storage_stacks, project_name=bird_, component=gw_)
 
-cdk_bird_notif_stacks: dict[str, CdkBirdNotifStack] = {
-    deploy_env: CdkBirdNotifStack(
+
+@registry.stack_map(
+    deploy_envs_metas[bird_],
+    lambda deploy_env: factory.get_cdk_stack_id(bird_, components=[notif_], deploy_env=deploy_env),
+    post_build=lambda s: factory.add_tags_required_wrapper(s, project_name=bird_, component=gw_),
+)
+def cdk_bird_notif_stacks(stack_id: str, deploy_env: str, env_meta: dict) -> CdkBirdNotifStack:
+    return CdkBirdNotifStack(
         scope=app,
-        id=factory.get_cdk_stack_id(bird_, components=[notif_], deploy_env=deploy_env),
+        id=stack_id,
         description=factory.get_cdk_stack_description(bird_, components=[notif_], deploy_env=deploy_env, detail="SNS"),
         env=env,
         termination_protection=factory.get_termination_protection(deploy_env),
         # --- ^ super() ---
-        base_stack=cdk_bird_base_stack,
+        base_stack=cdk_bird_base_stack(),
         component=gw_,
         deploy_env=deploy_env,
         env_meta=env_meta,
         factory=factory,
         project_name=bird_,
     )
-    for deploy_env, env_meta in deploy_envs_metas[bird_].items()
-}
-factory.add_tags_required_wrapper(
-    cdk_bird_notif_stacks,
-    project_name=bird_,
-    component=gw_,
-)
 
-cdk_bird_gw_stacks: dict[str, CdkBirdGwStack] = {
-    deploy_env: CdkBirdGwStack(
+
+@registry.stack_map(
+    deploy_envs_metas[bird_],
+    lambda deploy_env: factory.get_cdk_stack_id(bird_, components=[gw_], deploy_env=deploy_env),
+    post_build=lambda s: factory.add_tags_required_wrapper(s, project_name=bird_, component=gw_),
+)
+def cdk_bird_gw_stacks(stack_id: str, deploy_env: str, env_meta: dict) -> CdkBirdGwStack:
+    return CdkBirdGwStack(
         scope=app,
-        id=factory.get_cdk_stack_id(bird_, components=[gw_], deploy_env=deploy_env),
+        id=stack_id,
         description=factory.get_cdk_stack_description(
             bird_, components=[gw_], deploy_env=deploy_env, detail="CloudFront Distribution, ALB, ECS"
         ),
         env=env,
         termination_protection=factory.get_termination_protection(deploy_env),
         # --- ^ super() ---
-        base_stack=cdk_bird_base_stack,
+        base_stack=cdk_bird_base_stack(),
         bkg_ms_stack=get_bkg_ms_stack(bird_, deploy_env),
         cache_stack=cdk_bird_cache_stacks[deploy_env],
         component=gw_,
@@ -2845,23 +3264,27 @@ cdk_bird_gw_stacks: dict[str, CdkBirdGwStack] = {
         pdf_ms_stack=cdk_pdf_ms_stacks[factory.PROD_],
         project_name=bird_,
         storage_stack=cdk_bird_storage_stacks[deploy_env],
-        vpc_stack=cdk_vpc_sih_stack,
+        vpc_stack=cdk_vpc_sih_stack(),
     )
-    for deploy_env, env_meta in deploy_envs_metas[bird_].items()
-}
-factory.add_tags_required_wrapper(cdk_bird_gw_stacks, project_name=bird_, component=gw_)
 
-cdk_bird_gw_pipeline_stacks: dict[str, CdkBirdPipelineStack] = {
-    deploy_env: CdkBirdPipelineStack(
+
+@registry.stack_map(
+    deploy_envs_metas[bird_],
+    lambda deploy_env: factory.get_cdk_stack_id(bird_, components=[gw_, pipeline_], deploy_env=deploy_env),
+    dependencies=[cdk_codepipeline_ci_cd_stack],
+    post_build=lambda s: factory.add_tags_required_wrapper(s, project_name=bird_, component=pipeline_),
+)
+def cdk_bird_gw_pipeline_stacks(stack_id: str, deploy_env: str, env_meta: dict) -> CdkBirdPipelineStack:
+    return CdkBirdPipelineStack(
         scope=app,
-        id=factory.get_cdk_stack_id(bird_, components=[gw_, pipeline_], deploy_env=deploy_env),
+        id=stack_id,
         description=factory.get_cdk_stack_description(
             bird_, components=[gw_, pipeline_], deploy_env=deploy_env, detail="CodeBuild, CodePipeline"
         ),
         env=env,
         termination_protection=factory.get_termination_protection(deploy_env),
         # --- ^ super() ---
-        base_stack=cdk_bird_base_stack,
+        base_stack=cdk_bird_base_stack(),
         component=gw_,
         deploy_env=deploy_env,
         env_meta=env_meta,
@@ -2869,69 +3292,77 @@ cdk_bird_gw_pipeline_stacks: dict[str, CdkBirdPipelineStack] = {
         gw_stack=cdk_bird_gw_stacks[deploy_env],
         project_name=bird_,
         project_name_comp_list=project_name_comp_lists[bird_],
-        pypi_base_stack=cdk_pypi_base_stack,
-        vpc_stack=cdk_vpc_sih_stack,
+        pypi_base_stack=cdk_pypi_base_stack(),
+        vpc_stack=cdk_vpc_sih_stack(),
     )
-    for deploy_env, env_meta in deploy_envs_metas[bird_].items()
-}
-factory.add_tags_required_wrapper(cdk_bird_gw_pipeline_stacks, project_name=bird_, component=pipeline_)
+
 
 ####################################################################################################
 # --- Cow ---
 ####################################################################################################
 
-cdk_cow_cloudfront_base_stack = CdkCowCloudFrontBaseStack(
-    scope=app,
-    id=factory.get_cdk_stack_id(cow_, components=[cf_], base_comp=True),
-    description=factory.get_cdk_stack_description(
-        cow_, components=[cf_], base_comp=True, detail="WAF Regex Pattern Set"
-    ),
-    env=env_cloudfront,
-    termination_protection=True,
-    # --- ^ super() ---
-    base_stack=cdk_cow_base_stack,
-    component=gw_,
-    elastic_ip_str_list=elastic_ip_str_list,
-    factory=factory,
-    project_name=cow_,
-)
-factory.add_tags_required(
-    stacks=[cdk_cow_base_stack, cdk_cow_cloudfront_base_stack],
-    project_name_val=word_map[cow_],
-    custom_val=factory.TAG_VAL_NONE_,
-    env_type_val=factory.TAG_VAL_NONE_,
-    component_val=word_map[base_],
-    deploy_env_val=factory.TAG_VAL_NONE_,
+
+@registry.stack(
+    factory.get_cdk_stack_id(cow_, components=[cf_], base_comp=True),
+    dependencies=[cdk_vpc_sih_stack],
+    post_build=add_tags_required_base(cow_),
 )
+def cdk_cow_cloudfront_base_stack(stack_id: str = None) -> CdkCowCloudFrontBaseStack:
+    return CdkCowCloudFrontBaseStack(
+        scope=app,
+        id=stack_id,
+        description=factory.get_cdk_stack_description(
+            cow_, components=[cf_], base_comp=True, detail="WAF Regex Pattern Set"
+        ),
+        env=env_cloudfront,
+        termination_protection=True,
+        # --- ^ super() ---
+        base_stack=cdk_cow_base_stack(),
+        component=gw_,
+        elastic_ip_str_list=elastic_ip_str_list,
+        factory=factory,
+        project_name=cow_,
+    )
+
 
-cdk_cow_gw_cloudfront_stacks: dict[str, CdkCowCloudFrontStack] = {
-    deploy_env: CdkCowCloudFrontStack(
+@registry.stack_map(
+    deploy_envs_metas[cow_],
+    lambda deploy_env: factory.get_cdk_stack_id(cow_, components=[gw_, cf_], deploy_env=deploy_env),
+    post_build=lambda s: factory.add_tags_required_wrapper(s, project_name=cow_, component=cf_),
+)
+def cdk_cow_gw_cloudfront_stacks(stack_id: str, deploy_env: str, env_meta: dict) -> CdkCowCloudFrontStack:
+    return CdkCowCloudFrontStack(
         scope=app,
-        id=factory.get_cdk_stack_id(cow_, components=[gw_, cf_], deploy_env=deploy_env),
+        id=stack_id,
         description=factory.get_cdk_stack_description(
             cow_, components=[gw_, cf_], deploy_env=deploy_env, detail="ACM certificates, WAF Web ACLs"
         ),
         env=env_cloudfront,
         termination_protection=True,
         # --- ^ super() ---
-        base_stack=cdk_cow_base_stack,
-        cloudfront_base_stack=cdk_cow_cloudfront_base_stack,
+        base_stack=cdk_cow_base_stack(),
+        cloudfront_base_stack=cdk_cow_cloudfront_base_stack(),
         component=gw_,
         deploy_env=deploy_env,
         env_meta=env_meta,
         factory=factory,
         project_name=cow_,
     )
-    for deploy_env, env_meta in deploy_envs_metas[cow_].items()
-}
-factory.add_tags_required_wrapper(cdk_cow_gw_cloudfront_stacks, project_name=cow_, component=cf_)
 
-cdk_cow_database_stacks: dict[str, CdkCowDatabaseStack] = {
-    database_server: CdkCowDatabaseStack(
+
+@registry.stack_map(
+    database_server_deploy_env_maps[cow_],
+    lambda database_server: factory.get_cdk_stack_id(
+        cow_, components=[database_], deploy_env=factory.format_database_server(database_server)
+    ),
+    post_build=lambda s: factory.add_tags_required_wrapper(
+        s, project_name=cow_, component=database_, is_db_server=True
+    ),
+)
+def cdk_cow_database_stacks(stack_id: str, database_server: str, database_meta: dict) -> CdkCowDatabaseStack:
+    return CdkCowDatabaseStack(
         scope=app,
-        id=factory.get_cdk_stack_id(
-            cow_, components=[database_], deploy_env=factory.format_database_server(database_server)
-        ),
+        id=stack_id,
         description=factory.get_cdk_stack_description(
             cow_,
             components=[database_],
@@ -2941,37 +3372,36 @@ cdk_cow_database_stacks: dict[str, CdkCowDatabaseStack] = {
         env=env,
         termination_protection=factory.get_termination_protection(database_server),
         # --- ^ super() ---
-        base_stack=cdk_cow_base_stack,
+        base_stack=cdk_cow_base_stack(),
         component=gw_,
         database_meta=database_meta,
+        db_consumers=get_db_consumers(cow_, database_meta, CdkCowGwStack),
         db_server_name=database_server,
         db_server_preview_demo=get_db_server_preview_demo(cow_, database_server),
         deploy_env_24_7_set=deploy_env_24_7_sets[cow_],
         deploy_env_weekend_set=deploy_env_weekend_sets[cow_],
         factory=factory,
         project_name=cow_,
-        vpc_stack=cdk_vpc_sih_stack,
+        vpc_stack=cdk_vpc_sih_stack(),
     )
-    for database_server, database_meta in database_server_deploy_env_maps[cow_].items()
-}
-factory.add_tags_required_wrapper(
-    cdk_cow_database_stacks,
-    project_name=cow_,
-    component=database_,
-    is_db_server=True,
-)
 
-cdk_cow_cache_stacks: dict[str, CdkCowCacheStack] = {
-    deploy_env: CdkCowCacheStack(
+
+@registry.stack_map(
+    deploy_envs_metas[cow_],
+    lambda deploy_env: factory.get_cdk_stack_id(cow_, components=[cache_], deploy_env=deploy_env),
+    post_build=lambda s: factory.add_tags_required_wrapper(s, project_name=cow_, component=cache_, is_cache=True),
+)
+def cdk_cow_cache_stacks(stack_id: str, deploy_env: str, env_meta: dict) -> CdkCowCacheStack:
+    return CdkCowCacheStack(
         scope=app,
-        id=factory.get_cdk_stack_id(cow_, components=[cache_], deploy_env=deploy_env),
+        id=stack_id,
         description=factory.get_cdk_stack_description(
             cow_, components=[cache_], deploy_env=deploy_env, detail="ElastiCache Redis"
         ),
         env=env,
         termination_protection=factory.get_termination_protection(deploy_env),
         # --- ^ super() ---
-        base_stack=cdk_cow_base_stack,
+        base_stack=cdk_cow_base_stack(),
         component=gw_,
         deploy_env=deploy_env,
         deploy_env_24_7_set=deploy_env_24_7_sets[cow_],
@@ -2979,28 +3409,26 @@ cdk_cow_cache_stacks: dict[str, CdkCowCacheStack] = {
         env_meta=env_meta,
         factory=factory,
         project_name=cow_,
-        vpc_stack=cdk_vpc_sih_stack,
+        vpc_stack=cdk_vpc_sih_stack(),
     )
-    for deploy_env, env_meta in deploy_envs_metas[cow_].items()
-}
-factory.add_tags_required_wrapper(
-    cdk_cow_cache_stacks,
-    project_name=cow_,
-    component=cache_,
-    is_cache=True,
-)
 
-cdk_cow_gw_stacks: dict[str, CdkCowGwStack] = {
-    deploy_env: CdkCowGwStack(
+
+@registry.stack_map(
+    deploy_envs_metas[cow_],
+    lambda deploy_env: factory.get_cdk_stack_id(cow_, components=[gw_], deploy_env=deploy_env),
+    post_build=lambda s: factory.add_tags_required_wrapper(s, project_name=cow_, component=gw_),
+)
+def cdk_cow_gw_stacks(stack_id: str, deploy_env: str, env_meta: dict) -> CdkCowGwStack:
+    return CdkCowGwStack(
         scope=app,
-        id=factory.get_cdk_stack_id(cow_, components=[gw_], deploy_env=deploy_env),
+        id=stack_id,
         description=factory.get_cdk_stack_description(
             cow_, components=[gw_], deploy_env=deploy_env, detail="CloudFront Distribution, ALB, ECS"
         ),
         env=env,
         termination_protection=factory.get_termination_protection(deploy_env),
         # --- ^ super() ---
-        base_stack=cdk_cow_base_stack,
+        base_stack=cdk_cow_base_stack(),
         cache_stack=cdk_cow_cache_stacks[deploy_env],
         component=gw_,
         database_stack=cdk_cow_database_stacks[deploy_env_database_server_maps[cow_][deploy_env]],
@@ -3010,23 +3438,27 @@ cdk_cow_gw_stacks: dict[str, CdkCowGwStack] = {
         env_meta=env_meta,
         factory=factory,
         project_name=cow_,
-        vpc_stack=cdk_vpc_sih_stack,
+        vpc_stack=cdk_vpc_sih_stack(),
     )
-    for deploy_env, env_meta in deploy_envs_metas[cow_].items()
-}
-factory.add_tags_required_wrapper(cdk_cow_gw_stacks, project_name=cow_, component=gw_)
 
-cdk_cow_gw_pipeline_stacks: dict[str, CdkCowPipelineStack] = {
-    deploy_env: CdkCowPipelineStack(
+
+@registry.stack_map(
+    deploy_envs_metas[cow_],
+    lambda deploy_env: factory.get_cdk_stack_id(cow_, components=[gw_, pipeline_], deploy_env=deploy_env),
+    dependencies=[cdk_codepipeline_ci_cd_stack],
+    post_build=lambda s: factory.add_tags_required_wrapper(s, project_name=cow_, component=pipeline_),
+)
+def cdk_cow_gw_pipeline_stacks(stack_id: str, deploy_env: str, env_meta: dict) -> CdkCowPipelineStack:
+    return CdkCowPipelineStack(
         scope=app,
-        id=factory.get_cdk_stack_id(cow_, components=[gw_, pipeline_], deploy_env=deploy_env),
+        id=stack_id,
         description=factory.get_cdk_stack_description(
             cow_, components=[gw_, pipeline_], deploy_env=deploy_env, detail="CodeBuild, CodePipeline"
         ),
         env=env,
         termination_protection=factory.get_termination_protection(deploy_env),
         # --- ^ super() ---
-        base_stack=cdk_cow_base_stack,
+        base_stack=cdk_cow_base_stack(),
         component=gw_,
         deploy_env=deploy_env,
         env_meta=env_meta,
@@ -3034,69 +3466,77 @@ cdk_cow_gw_pipeline_stacks: dict[str, CdkCowPipelineStack] = {
         gw_stack=cdk_cow_gw_stacks[deploy_env],
         project_name=cow_,
         project_name_comp_list=project_name_comp_lists[cow_],
-        pypi_base_stack=cdk_pypi_base_stack,
-        vpc_stack=cdk_vpc_sih_stack,
+        pypi_base_stack=cdk_pypi_base_stack(),
+        vpc_stack=cdk_vpc_sih_stack(),
     )
-    for deploy_env, env_meta in deploy_envs_metas[cow_].items()
-}
-factory.add_tags_required_wrapper(cdk_cow_gw_pipeline_stacks, project_name=cow_, component=pipeline_)
+
 
 ####################################################################################################
 # --- Fish ---
 ####################################################################################################
 
-cdk_fish_cloudfront_base_stack = CdkFishCloudFrontBaseStack(
-    scope=app,
-    id=factory.get_cdk_stack_id(fish_, components=[cf_], base_comp=True),
-    description=factory.get_cdk_stack_description(
-        fish_, components=[cf_], base_comp=True, detail="WAF Regex Pattern Set"
-    ),
-    env=env_cloudfront,
-    termination_protection=True,
-    # --- ^ super() ---
-    base_stack=cdk_fish_base_stack,
-    component=gw_,
-    elastic_ip_str_list=elastic_ip_str_list,
-    factory=factory,
-    project_name=fish_,
-)
-factory.add_tags_required(
-    stacks=[cdk_fish_base_stack, cdk_fish_cloudfront_base_stack],
-    project_name_val=word_map[fish_],
-    custom_val=factory.TAG_VAL_NONE_,
-    env_type_val=factory.TAG_VAL_NONE_,
-    component_val=word_map[base_],
-    deploy_env_val=factory.TAG_VAL_NONE_,
+
+@registry.stack(
+    factory.get_cdk_stack_id(fish_, components=[cf_], base_comp=True),
+    dependencies=[cdk_vpc_sih_stack],
+    post_build=add_tags_required_base(fish_),
 )
+def cdk_fish_cloudfront_base_stack(stack_id: str = None) -> CdkFishCloudFrontBaseStack:
+    return CdkFishCloudFrontBaseStack(
+        scope=app,
+        id=stack_id,
+        description=factory.get_cdk_stack_description(
+            fish_, components=[cf_], base_comp=True, detail="WAF Regex Pattern Set"
+        ),
+        env=env_cloudfront,
+        termination_protection=True,
+        # --- ^ super() ---
+        base_stack=cdk_fish_base_stack(),
+        component=gw_,
+        elastic_ip_str_list=elastic_ip_str_list,
+        factory=factory,
+        project_name=fish_,
+    )
+
 
-cdk_fish_gw_cloudfront_stacks: dict[str, CdkFishCloudFrontStack] = {
-    deploy_env: CdkFishCloudFrontStack(
+@registry.stack_map(
+    deploy_envs_metas[fish_],
+    lambda deploy_env: factory.get_cdk_stack_id(fish_, components=[gw_, cf_], deploy_env=deploy_env),
+    post_build=lambda s: factory.add_tags_required_wrapper(s, project_name=fish_, component=cf_),
+)
+def cdk_fish_gw_cloudfront_stacks(stack_id: str, deploy_env: str, env_meta: dict) -> CdkFishCloudFrontStack:
+    return CdkFishCloudFrontStack(
         scope=app,
-        id=factory.get_cdk_stack_id(fish_, components=[gw_, cf_], deploy_env=deploy_env),
+        id=stack_id,
         description=factory.get_cdk_stack_description(
             fish_, components=[gw_, cf_], deploy_env=deploy_env, detail="ACM certificates, WAF Web ACLs"
         ),
         env=env_cloudfront,
         termination_protection=True,
         # --- ^ super() ---
-        base_stack=cdk_fish_base_stack,
-        cloudfront_base_stack=cdk_fish_cloudfront_base_stack,
+        base_stack=cdk_fish_base_stack(),
+        cloudfront_base_stack=cdk_fish_cloudfront_base_stack(),
         component=gw_,
         deploy_env=deploy_env,
         env_meta=env_meta,
         factory=factory,
         project_name=fish_,
     )
-    for deploy_env, env_meta in deploy_envs_metas[fish_].items()
-}
-factory.add_tags_required_wrapper(cdk_fish_gw_cloudfront_stacks, project_name=fish_, component=cf_)
 
-cdk_fish_database_stacks: dict[str, CdkFishDatabaseStack] = {
-    database_server: CdkFishDatabaseStack(
+
+@registry.stack_map(
+    database_server_deploy_env_maps[fish_],
+    lambda database_server: factory.get_cdk_stack_id(
+        fish_, components=[database_], deploy_env=factory.format_database_server(database_server)
+    ),
+    post_build=lambda s: factory.add_tags_required_wrapper(
+        s, project_name=fish_, component=database_, is_db_server=True
+    ),
+)
+def cdk_fish_database_stacks(stack_id: str, database_server: str, database_meta: dict) -> CdkFishDatabaseStack:
+    return CdkFishDatabaseStack(
         scope=app,
-        id=factory.get_cdk_stack_id(
-            fish_, components=[database_], deploy_env=factory.format_database_server(database_server)
-        ),
+        id=stack_id,
         description=factory.get_cdk_stack_description(
             fish_,
             components=[database_],
@@ -3106,37 +3546,36 @@ cdk_fish_database_stacks: dict[str, CdkFishDatabaseStack] = {
         env=env,
         termination_protection=factory.get_termination_protection(database_server),
         # --- ^ super() ---
-        base_stack=cdk_fish_base_stack,
+        base_stack=cdk_fish_base_stack(),
         component=gw_,
         database_meta=database_meta,
+        db_consumers=get_db_consumers(fish_, database_meta, CdkFishGwStack),
         db_server_name=database_server,
         db_server_preview_demo=get_db_server_preview_demo(fish_, database_server),
         deploy_env_24_7_set=deploy_env_24_7_sets[fish_],
         deploy_env_weekend_set=deploy_env_weekend_sets[fish_],
         factory=factory,
         project_name=fish_,
-        vpc_stack=cdk_vpc_sih_stack,
+        vpc_stack=cdk_vpc_sih_stack(),
     )
-    for database_server, database_meta in database_server_deploy_env_maps[fish_].items()
-}
-factory.add_tags_required_wrapper(
-    cdk_fish_database_stacks,
-    project_name=fish_,
-    component=database_,
-    is_db_server=True,
-)
 
-cdk_fish_cache_stacks: dict[str, CdkFishCacheStack] = {
-    deploy_env: CdkFishCacheStack(
+
+@registry.stack_map(
+    deploy_envs_metas[fish_],
+    lambda deploy_env: factory.get_cdk_stack_id(fish_, components=[cache_], deploy_env=deploy_env),
+    post_build=lambda s: factory.add_tags_required_wrapper(s, project_name=fish_, component=cache_, is_cache=True),
+)
+def cdk_fish_cache_stacks(stack_id: str, deploy_env: str, env_meta: dict) -> CdkFishCacheStack:
+    return CdkFishCacheStack(
         scope=app,
-        id=factory.get_cdk_stack_id(fish_, components=[cache_], deploy_env=deploy_env),
+        id=stack_id,
         description=factory.get_cdk_stack_description(
             fish_, components=[cache_], deploy_env=deploy_env, detail="ElastiCache Redis"
         ),
         env=env,
         termination_protection=factory.get_termination_protection(deploy_env),
         # --- ^ super() ---
-        base_stack=cdk_fish_base_stack,
+        base_stack=cdk_fish_base_stack(),
         component=gw_,
         deploy_env=deploy_env,
         deploy_env_24_7_set=deploy_env_24_7_sets[fish_],
@@ -3144,47 +3583,48 @@ cdk_fish_cache_stacks: dict[str, CdkFishCacheStack] = {
         env_meta=env_meta,
         factory=factory,
         project_name=fish_,
-        vpc_stack=cdk_vpc_sih_stack,
+        vpc_stack=cdk_vpc_sih_stack(),
     )
-    for deploy_env, env_meta in deploy_envs_metas[fish_].items()
-}
-factory.add_tags_required_wrapper(
-    cdk_fish_cache_stacks,
-    project_name=fish_,
-    component=cache_,
-    is_cache=True,
-)
 
-cdk_fish_storage_stacks: dict[str, CdkFishStorageStack] = {
-    deploy_env: CdkFishStorageStack(
+
+@registry.stack_map(
+    deploy_envs_metas[fish_],
+    lambda deploy_env: factory.get_cdk_stack_id(fish_, components=[storage_], deploy_env=deploy_env),
+    post_build=lambda s: factory.add_tags_required_wrapper(s, project_name=fish_, component=gw_),
+)
+def cdk_fish_storage_stacks(stack_id: str, deploy_env: str, env_meta: dict) -> CdkFishStorageStack:
+    return CdkFishStorageStack(
         scope=app,
-        id=factory.get_cdk_stack_id(fish_, components=[storage_], deploy_env=deploy_env),
+        id=stack_id,
         description=factory.get_cdk_stack_description(fish_, components=[storage_], deploy_env=deploy_env, detail="S3"),
         env=env,
         termination_protection=factory.get_termination_protection(deploy_env),
         # --- ^ super() ---
-        base_stack=cdk_fish_base_stack,
+        base_stack=cdk_fish_base_stack(),
         component=gw_,
         deploy_env=deploy_env,
         env_meta=env_meta,
         factory=factory,
         project_name=fish_,
     )
-    for deploy_env, env_meta in deploy_envs_metas[fish_].items()
-}
-factory.add_tags_required_wrapper(cdk_fish_storage_stacks, project_name=fish_, component=gw_)
 
-cdk_fish_gw_stacks: dict[str, CdkFishGwStack] = {
-    deploy_env: CdkFishGwStack(
+
+@registry.stack_map(
+    deploy_envs_metas[fish_],
+    lambda deploy_env: factory.get_cdk_stack_id(fish_, components=[gw_], deploy_env=deploy_env),
+    post_build=lambda s: factory.add_tags_required_wrapper(s, project_name=fish_, component=gw_),
+)
+def cdk_fish_gw_stacks(stack_id: str, deploy_env: str, env_meta: dict) -> CdkFishGwStack:
+    return CdkFishGwStack(
         scope=app,
-        id=factory.get_cdk_stack_id(fish_, components=[gw_], deploy_env=deploy_env),
+        id=stack_id,
         description=factory.get_cdk_stack_description(
             fish_, components=[gw_], deploy_env=deploy_env, detail="CloudFront Distribution, ALB, ECS"
         ),
         env=env,
         termination_protection=factory.get_termination_protection(deploy_env),
         # --- ^ super() ---
-        base_stack=cdk_fish_base_stack,
+        base_stack=cdk_fish_base_stack(),
         cache_stack=cdk_fish_cache_stacks[deploy_env],
         component=gw_,
         database_stack=cdk_fish_database_stacks[deploy_env_database_server_maps[fish_][deploy_env]],
@@ -3196,23 +3636,27 @@ cdk_fish_gw_stacks: dict[str, CdkFishGwStack] = {
         mail_ms_stack=cdk_mail_ms_stacks[factory.PROD_],
         project_name=fish_,
         storage_stack=cdk_fish_storage_stacks[deploy_env],
-        vpc_stack=cdk_vpc_sih_stack,
+        vpc_stack=cdk_vpc_sih_stack(),
     )
-    for deploy_env, env_meta in deploy_envs_metas[fish_].items()
-}
-factory.add_tags_required_wrapper(cdk_fish_gw_stacks, project_name=fish_, component=gw_)
 
-cdk_fish_gw_pipeline_stacks: dict[str, CdkFishPipelineStack] = {
-    deploy_env: CdkFishPipelineStack(
+
+@registry.stack_map(
+    deploy_envs_metas[fish_],
+    lambda deploy_env: factory.get_cdk_stack_id(fish_, components=[gw_, pipeline_], deploy_env=deploy_env),
+    dependencies=[cdk_codepipeline_ci_cd_stack],
+    post_build=lambda s: factory.add_tags_required_wrapper(s, project_name=fish_, component=pipeline_),
+)
+def cdk_fish_gw_pipeline_stacks(stack_id: str, deploy_env: str, env_meta: dict) -> CdkFishPipelineStack:
+    return CdkFishPipelineStack(
         scope=app,
-        id=factory.get_cdk_stack_id(fish_, components=[gw_, pipeline_], deploy_env=deploy_env),
+        id=stack_id,
         description=factory.get_cdk_stack_description(
             fish_, components=[gw_, pipeline_], deploy_env=deploy_env, detail="CodeBuild, CodePipeline"
         ),
         env=env,
         termination_protection=factory.get_termination_protection(deploy_env),
         # --- ^ super() ---
-        base_stack=cdk_fish_base_stack,
+        base_stack=cdk_fish_base_stack(),
         component=gw_,
         deploy_env=deploy_env,
         env_meta=env_meta,
@@ -3220,15 +3664,15 @@ cdk_fish_gw_pipeline_stacks: dict[str, CdkFishPipelineStack] = {
         gw_stack=cdk_fish_gw_stacks[deploy_env],
         project_name=fish_,
         project_name_comp_list=project_name_comp_lists[fish_],
-        pypi_base_stack=cdk_pypi_base_stack,
-        vpc_stack=cdk_vpc_sih_stack,
+        pypi_base_stack=cdk_pypi_base_stack(),
+        vpc_stack=cdk_vpc_sih_stack(),
     )
-    for deploy_env, env_meta in deploy_envs_metas[fish_].items()
-}
-factory.add_tags_required_wrapper(cdk_fish_gw_pipeline_stacks, project_name=fish_, component=pipeline_)
+
 
 ####################################################################################################
 # --- End of Infrastructure ---
 ####################################################################################################
 
-app.synth()
+registry.build()
+
+registry.synth()
@@ -0,0 +1,214 @@
+#!/usr/bin/env python3.9
+import argparse
+import json
+import os
+import sys
+from typing import Optional
+
+encoding: str = "utf-8"
+cdk_out_path: str = "cdk.out"
+cdk_deploy_plan_path: str = "cdk-deploy-plan.json"
+
+# The CDK deploy shell script per AWS account, mirroring the `cdk-synth-sih.py` accounts
+#   (e.g. `cdk-deploy-to-sih-innov.sh` deploys with the 'innovation' AWS account profile, in the AWS CLI config).
+cdk_deploy_scripts: dict[str, str] = {
+    "123456789123": "./cdk-deploy-to-sih.sh",
+    "123456789124": "./cdk-deploy-to-sih-innov.sh",
+}
+
+stack_artifact_type: str = "aws:cloudformation:stack"
+assets_artifact_suffix: str = ".assets"
+
+
+def get_stacks(outdir: str) -> dict[str, dict]:
+    manifest_path: str = os.path.join(outdir, "manifest.json")
+    if not os.path.exists(manifest_path):
+        sys.exit(f"## Cannot find '{manifest_path}', run `cdk synth` (or `cdk-synth-sih.py`) first.")
+    with open(manifest_path, "r", encoding=encoding) as f:
+        manifest: dict = json.load(f)
+    artifacts: dict[str, dict] = {
+        k: v for k, v in manifest.get("artifacts", {}).items() if v.get("type") == stack_artifact_type
+    }
+    # e.g. 'aws://123456789123/eu-west-2'
+    return {
+        k: {
+            "account": v.get("environment", "").split("/")[-2],
+            "region": v.get("environment", "").split("/")[-1],
+            "termination_protection": v.get("properties", {}).get("terminationProtection", False),
+            "dependencies": sorted(
+                i for i in v.get("dependencies", []) if not i.endswith(assets_artifact_suffix) and i in artifacts
+            ),
+        }
+        for k, v in artifacts.items()
+    }
+
+
+def get_dependents(stacks: dict[str, dict]) -> dict[str, list[str]]:
+    dependents: dict[str, list[str]] = {i: [] for i in stacks}
+    for k, v in stacks.items():
+        for dependency in v["dependencies"]:
+            dependents[dependency].append(k)
+    return dependents
+
+
+def get_transitive(graph: dict[str, list[str]], stack: str) -> list[str]:
+    seen: set[str] = set()
+    pending: list[str] = list(graph[stack])
+    while pending:
+        if (i := pending.pop()) not in seen:
+            seen.add(i)
+            pending += graph[i]
+    return sorted(seen)
+
+
+def get_waves(stacks: dict[str, dict]) -> list[list[str]]:
+    # Topological waves (Kahn's algorithm), each stack is in the wave after its last dependency
+    dependents: dict[str, list[str]] = get_dependents(stacks)
+    in_degree: dict[str, int] = {k: len(v["dependencies"]) for k, v in stacks.items()}
+    waves: list[list[str]] = []
+    wave: list[str] = sorted(k for k, v in in_degree.items() if v == 0)
+    while wave:
+        waves.append(wave)
+        next_wave: list[str] = []
+        for stack in wave:
+            for dependent in dependents[stack]:
+                in_degree[dependent] -= 1
+                if in_degree[dependent] == 0:
+                    next_wave.append(dependent)
+        wave = sorted(next_wave)
+    if cycle := sorted(k for k, v in in_degree.items() if v > 0):
+        sys.exit(f"## Circular CDK stack dependencies, between: {cycle}")
+    return waves
+
+
+def get_critical_path(stacks: dict[str, dict], waves: list[list[str]]) -> list[str]:
+    # The longest chain of dependent stacks, i.e. the minimum number of sequential deploys
+    longest: dict[str, list[str]] = {}
+    for wave in waves:
+        for stack in wave:
+            longest[stack] = max((longest[i] for i in stacks[stack]["dependencies"]), key=len, default=[]) + [stack]
+    return max(longest.values(), key=len, default=[])
+
+
+def get_cdk_deploy_script(account: str) -> str:
+    if account not in cdk_deploy_scripts:
+        sys.exit(
+            f"## Cannot find the CDK deploy shell script, for AWS account '{account}' (see: `cdk_deploy_scripts`)."
+        )
+    return cdk_deploy_scripts[account]
+
+
+def get_group(stack: dict) -> tuple[str, str, bool]:
+    # Stacks are deployed per AWS account and region (e.g. the CloudFront stacks in 'us-east-1'),
+    # and termination protected stacks are deployed separately
+    return stack["account"], stack["region"], stack["termination_protection"]
+
+
+def get_deploy_plan(stacks: dict[str, dict], waves: list[list[str]], concurrency: int, outdir: str) -> list[dict]:
+    # Sequential deploy steps, each a `cdk deploy --concurrency` of stacks in the same group.
+    #   A stack goes into the first step (of its group) after the steps of its dependencies in other groups,
+    #   as `cdk deploy` itself orders the stacks within a step by their dependencies.
+    steps: list[dict] = []
+    step_index: dict[str, int] = {}
+    for wave in waves:
+        for stack in wave:
+            group: tuple[str, str, bool] = get_group(stacks[stack])
+            min_index: int = max(
+                (
+                    step_index[i] if steps[step_index[i]]["group"] == group else step_index[i] + 1
+                    for i in stacks[stack]["dependencies"]
+                ),
+                default=0,
+            )
+            index: Optional[int] = next((i for i in range(min_index, len(steps)) if steps[i]["group"] == group), None)
+            if index is None:
+                index = len(steps)
+                steps.append({"group": group, "stacks": []})
+            steps[index]["stacks"].append(stack)
+            step_index[stack] = index
+
+    plan: list[dict] = []
+    for i, step in enumerate(steps, start=1):
+        account, region, termination_protection = step["group"]
+        plan.append(
+            {
+                "step": i,
+                "account": account,
+                "region": region,
+                "termination_protection": termination_protection,
+                "stacks": step["stacks"],
+                "command": " ".join(
+                    [get_cdk_deploy_script(account), account, region, "--app", outdir, "--exclusively"]
+                    + ["--concurrency", str(concurrency)]
+                    + step["stacks"]
+                ),
+            }
+        )
+    return plan
+
+
+def print_stack(stacks: dict[str, dict], stack: str) -> None:
+    if stack not in stacks:
+        sys.exit(f"## Cannot find CDK stack '{stack}', in the cloud assembly.")
+    dependents: dict[str, list[str]] = get_dependents(stacks)
+    dependencies: dict[str, list[str]] = {k: v["dependencies"] for k, v in stacks.items()}
+    print(f"\nFor CDK stack: {stack}\n...")
+    print(f"CDK stack dependencies:\n{json.dumps(stacks[stack]['dependencies'], indent=2)}")
+    print(f"CDK stack dependencies (transitive):\n{json.dumps(get_transitive(dependencies, stack), indent=2)}")
+    print(f"CDK stack dependents (transitive):\n{json.dumps(get_transitive(dependents, stack), indent=2)}\n")
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(
+        description="Build the CDK stack dependency graph (DAG), from the synthesized cloud assembly "
+        "(i.e. run `cdk synth` first). For the given stacks, print their dependencies (and dependents). "
+        "Otherwise, print the critical path and topological waves of all stacks, and write a parallel deploy plan "
+        f"to '{cdk_deploy_plan_path}'."
+    )
+    parser.add_argument("stacks", nargs="*", help="Optional stacks, to print the dependencies of.")
+    parser.add_argument("-a", "--app", default=cdk_out_path, help=f"The cloud assembly dir. Default: {cdk_out_path}")
+    parser.add_argument(
+        "-c", "--concurrency", type=int, default=4, help="Max. stacks to deploy in parallel, per step. Default: 4"
+    )
+    args = parser.parse_args()
+
+    stacks: dict[str, dict] = get_stacks(args.app)
+    if args.stacks:
+        for stack in args.stacks:
+            print_stack(stacks, stack)
+        return 0
+
+    waves: list[list[str]] = get_waves(stacks)
+    critical_path: list[str] = get_critical_path(stacks, waves)
+    plan: list[dict] = get_deploy_plan(stacks, waves, args.concurrency, args.app)
+
+    print(f"\nCDK stacks: {len(stacks)}, topological waves: {len(waves)}, deploy steps: {len(plan)}")
+    print(f"\nCritical path (length: {len(critical_path)}):\n  {' -> '.join(critical_path)}")
+    print("\nTopological waves:")
+    for i, wave in enumerate(waves, start=1):
+        print(f"  {i}: ({len(wave)}) {', '.join(wave)}")
+    print("\nDeploy plan:")
+    for step in plan:
+        print(
+            f"  {step['step']}: {step['account']}/{step['region']}"
+            f"{' (termination protected)' if step['termination_protection'] else ''} - {len(step['stacks'])} stacks"
+        )
+
+    with open(cdk_deploy_plan_path, "w+", encoding=encoding) as f:
+        json.dump(
+            {
+                "app": args.app,
+                "concurrency": args.concurrency,
+                "critical_path": critical_path,
+                "waves": waves,
+                "steps": plan,
+            },
+            f,
+            indent=2,
+        )
+    print(f"\nWritten deploy plan to: '{cdk_deploy_plan_path}'")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
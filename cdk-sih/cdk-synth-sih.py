@@ -0,0 +1,174 @@
+#!/usr/bin/env python3.9
+import argparse
+import json
+import os
+import subprocess
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+encoding: str = "utf-8"
+cdk_json_path: str = "cdk.json"
+cdk_context_json_path: str = "cdk.context.json"
+cdk_out_manifest_path: str = "cdk.out.manifest.json"
+
+# The AWS accounts and regions to synth, mirroring the `cdk-deploy-to-sih-*.sh` shell scripts.
+#   NB. Each target synths in its own Python process, as the CDK constructs factory (and its schedules)
+#   are region-dependent, and the CDK app holds module-level state.
+sih_: str = "sih"
+sih_innov_: str = "sih-innov"
+accounts: dict[str, dict] = {
+    sih_: {
+        "account": "123456789123",
+        "regions": ["eu-west-2", "eu-central-1", "us-east-1"],
+        "env": {},
+    },
+    sih_innov_: {
+        "account": "123456789124",
+        "regions": ["eu-west-2", "us-east-1"],
+        "env": {
+            "EMAIL_NOTIFICATION_RECIPIENT": "cloud.innovation@foobar.co.uk",
+            "INFRASTRUCTURE_DOMAIN_NAME": "sihdyefqna.com",
+            "PROFILE": "Innovation",
+            "SSH_KEY": "aws_foobar_innovation_default_key",
+        },
+    },
+}
+region_env: dict[tuple[str, str], dict[str, str]] = {
+    (sih_innov_, "eu-west-2"): {"CLIENT_VPN_ENDPOINT_SERVER_CERTIFICATE_ID": "db0b722b-7228-440c-be94-11aedbc2b383"},
+}
+
+
+def get_targets(names: list[str] = None) -> list[dict]:
+    targets: list[dict] = []
+    for name, meta in accounts.items():
+        for region in meta["regions"]:
+            target_env: dict[str, str] = {**meta["env"], **region_env.get((name, region), {})}
+            profile: str = target_env.get("PROFILE")
+            target: dict = {
+                "name": f"{name}-{region}",
+                "account": meta["account"],
+                "region": region,
+                "profile": profile,
+                # e.g. 'cdk.out.eu-west-2', or 'cdk.out.eu-west-2-innovation' (like the CDK custom outputs file)
+                "outdir": f"cdk.out.{region}{f'-{profile.lower()}' if profile else ''}",
+                "env": target_env,
+            }
+            if not names or target["name"] in names or name in names or region in names:
+                targets.append(target)
+    return targets
+
+
+def get_cdk_context() -> dict:
+    # The CDK context, as passed by the CDK CLI to the CDK app
+    context: dict = {}
+    for path in [cdk_json_path, cdk_context_json_path]:
+        if os.path.exists(path):
+            with open(path, "r", encoding=encoding) as f:
+                c: dict = json.load(f)
+                context.update(c.get("context", {}) if path == cdk_json_path else c)
+    return context
+
+
+def synth(target: dict, context: dict, stacks: str = None) -> dict:
+    env: dict[str, str] = {
+        **os.environ,
+        **target["env"],
+        "CDK_DEFAULT_ACCOUNT": target["account"],
+        "CDK_DEFAULT_REGION": target["region"],
+        "CDK_DEPLOY_ACCOUNT": target["account"],
+        "CDK_DEPLOY_REGION": target["region"],
+        "CDK_OUTDIR": target["outdir"],
+        "CDK_CONTEXT_JSON": json.dumps(context),
+    }
+    if stacks:
+        env["CDK_STACKS"] = stacks
+    start: float = time.perf_counter()
+    with open(f"{target['outdir']}.log", "w+", encoding=encoding) as f:
+        returncode: int = subprocess.run(
+            [sys.executable, "app.py"], env=env, stdout=f, stderr=subprocess.STDOUT, check=False
+        ).returncode
+    manifest: dict = get_manifest(target["outdir"]) if returncode == 0 else {}
+    return {
+        **{k: v for k, v in target.items() if k != "env"},
+        "returncode": returncode,
+        "duration_s": round(time.perf_counter() - start, 3),
+        "log": f"{target['outdir']}.log",
+        "missing": get_missing(manifest),
+        "stacks": get_stacks(manifest, target["outdir"]),
+    }
+
+
+def get_manifest(outdir: str) -> dict:
+    with open(os.path.join(outdir, "manifest.json"), "r", encoding=encoding) as f:
+        return json.load(f)
+
+
+def get_missing(manifest: dict) -> list[str]:
+    # The context lookups (e.g. VPCs, hosted zones) missing from the CDK context, synthed with dummy values.
+    #   NB. The CDK CLI would look them up (caching them in 'cdk.context.json') and synth again, this script cannot.
+    return sorted({i["key"] for i in manifest.get("missing", [])})
+
+
+def get_stacks(manifest: dict, outdir: str) -> list[dict]:
+    return [
+        {
+            "id": k,
+            "environment": v.get("environment"),
+            "template_file": os.path.join(outdir, v["properties"]["templateFile"]),
+            "termination_protection": v["properties"].get("terminationProtection", False),
+            "dependencies": [i for i in v.get("dependencies", []) if not i.endswith(".assets")],
+        }
+        for k, v in manifest.get("artifacts", {}).items()
+        if v.get("type") == "aws:cloudformation:stack"
+    ]
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(
+        description="Synth the CDK app for all AWS accounts and regions concurrently, each into its own "
+        "'cdk.out.<region>' cloud assembly dir (deploy with e.g. `cdk deploy --app cdk.out.eu-west-2 ...`), "
+        f"and write an aggregated manifest to '{cdk_out_manifest_path}'."
+    )
+    parser.add_argument(
+        "targets", nargs="*", help="Optional targets to synth, by account name, region or both (e.g. sih-eu-west-2)."
+    )
+    parser.add_argument("-j", "--max-workers", type=int, default=os.cpu_count(), help="Default: the number of CPUs.")
+    parser.add_argument("-s", "--stacks", help="Optional CDK stacks selection (see `CDK_STACKS`), for all targets.")
+    args = parser.parse_args()
+
+    if not (targets := get_targets(args.targets)):
+        sys.exit(f"## No targets match: {args.targets}")
+
+    context: dict = get_cdk_context()
+    results: list[dict] = []
+    start: float = time.perf_counter()
+    with ProcessPoolExecutor(max_workers=min(args.max_workers, len(targets))) as executor:
+        futures = {executor.submit(synth, target, context, args.stacks): target for target in targets}
+        for future in as_completed(futures):
+            result: dict = future.result()
+            results.append(result)
+            status: str = "FAILED" if result["returncode"] else ("MISSING CONTEXT" if result["missing"] else "OK")
+            print(
+                f"## {status}: {result['name']} "
+                f"({len(result['stacks'])} stacks, {result['duration_s']}s) -> {result['outdir']} (log: {result['log']})"
+            )
+            for i in result["missing"]:
+                print(f"##   Missing context lookup (synthed with a dummy value): {i}")
+
+    results.sort(key=lambda i: i["name"])
+    with open(cdk_out_manifest_path, "w+", encoding=encoding) as f:
+        json.dump(
+            {"duration_s": round(time.perf_counter() - start, 3), "targets": results}, f, indent=2, sort_keys=True
+        )
+    print(f"\nWritten aggregated manifest to: '{cdk_out_manifest_path}'")
+    if any(i["missing"] for i in results):
+        print(
+            f"\n## Context lookups missing from '{cdk_context_json_path}', so NOT deployable: run `cdk synth` for the "
+            "targets (i.e. the CDK CLI looks them up, and caches them), then synth again."
+        )
+    return 1 if any(i["returncode"] or i["missing"] for i in results) else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,187 @@
+#!/usr/bin/env python3.9
+import argparse
+import json
+import os
+import sys
+from collections import Counter
+
+encoding: str = "utf-8"
+cdk_out_path: str = "cdk.out"
+cdk_template_budget_baseline_path: str = "cdk-template-budget.json"
+
+stack_artifact_type: str = "aws:cloudformation:stack"
+logical_id_metadata_type: str = "aws:cdk:logicalId"
+
+# CloudFormation quotas, see: https://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/cloudformation-limits.html
+resources_: str = "resources"
+template_bytes_: str = "template_bytes"
+parameters_: str = "parameters"
+outputs_: str = "outputs"
+limits: dict[str, int] = {
+    resources_: 500,
+    template_bytes_: 1_048_576,  # 1 MB, for a template uploaded to S3 (as is done by CDK)
+    parameters_: 200,
+    outputs_: 200,
+}
+
+
+def get_logical_id_paths(artifact: dict) -> dict[str, str]:
+    # The CDK construct path of each resource (by logical ID), e.g. 'Cdk-dog-gw-kms-Key/Resource'
+    return {
+        i["data"]: k.split("/", 2)[-1]
+        for k, v in artifact.get("metadata", {}).items()
+        for i in v
+        if i.get("type") == logical_id_metadata_type
+    }
+
+
+def get_stacks(outdir: str) -> dict[str, dict]:
+    manifest_path: str = os.path.join(outdir, "manifest.json")
+    if not os.path.exists(manifest_path):
+        sys.exit(f"## Cannot find '{manifest_path}', run `cdk synth` (or `cdk-synth-sih.py`) first.")
+    with open(manifest_path, "r", encoding=encoding) as f:
+        manifest: dict = json.load(f)
+    stacks: dict[str, dict] = {}
+    for k, v in manifest.get("artifacts", {}).items():
+        if v.get("type") != stack_artifact_type:
+            continue
+        template_path: str = os.path.join(outdir, v["properties"]["templateFile"])
+        with open(template_path, "r", encoding=encoding) as f:
+            template: dict = json.load(f)
+        logical_id_paths: dict[str, str] = get_logical_id_paths(v)
+        resources: dict[str, dict] = template.get("Resources", {})
+        stacks[k] = {
+            resources_: len(resources),
+            template_bytes_: os.path.getsize(template_path),
+            parameters_: len(template.get("Parameters", {})),
+            outputs_: len(template.get("Outputs", {})),
+            "resource_types": dict(Counter(i["Type"] for i in resources.values()).most_common()),
+            "resource_paths": [
+                logical_id_paths.get(i, r.get("Metadata", {}).get("aws:cdk:path", i).split("/", 1)[-1])
+                for i, r in resources.items()
+            ],
+        }
+    return stacks
+
+
+def get_split_points(resource_paths: list[str], max_resources: int) -> list[dict]:
+    # Candidate split points: the prefixes (hyphen-separated) of each resource's top-level CDK construct ID,
+    #   e.g. 'Cdk-lion-processor-himawari9' (of 'Cdk-lion-processor-himawari9-rad-Function/Resource').
+    #   Greedily pick the largest (non-overlapping) prefixes, until the rest of the stack is within budget.
+    total: int = len(resource_paths)
+    prefixes: Counter = Counter()
+    for path in resource_paths:
+        tokens: list[str] = path.split("/", 1)[0].split("-")
+        prefixes.update({"-".join(tokens[:i]) for i in range(1, len(tokens) + 1)})
+    # Exclude prefixes common to (almost) the whole stack, e.g. 'Cdk-lion-processor'
+    candidates: list[tuple[str, int]] = sorted(
+        ((k, v) for k, v in prefixes.items() if 1 < v <= total * 0.9), key=lambda i: (-i[1], i[0])
+    )
+    split_points: list[dict] = []
+    remaining: int = total
+    for prefix, count in candidates:
+        if remaining <= max_resources:
+            break
+        if any(prefix.startswith(i["prefix"]) or i["prefix"].startswith(prefix) for i in split_points):
+            continue
+        split_points.append({"prefix": prefix, resources_: count})
+        remaining -= count
+    return split_points
+
+
+def get_report(stacks: dict[str, dict], baseline: dict[str, dict], threshold: float, max_growth: float) -> dict:
+    budgets: dict[str, int] = {k: int(v * threshold) for k, v in limits.items()}
+    report: dict[str, dict] = {}
+    for k, v in sorted(stacks.items(), key=lambda i: -i[1][resources_]):
+        failures: list[str] = [
+            f"{i}: {v[i]} > {budgets[i]} ({int(threshold * 100)}% of {j})"
+            for i, j in limits.items()
+            if v[i] > budgets[i]
+        ]
+        growth: dict[str, int] = {}
+        if base := baseline.get(k):
+            growth = {i: v[i] - base[i] for i in limits if v[i] != base.get(i, v[i])}
+            if (
+                max_growth is not None
+                and base[resources_]
+                and ((pct := (v[resources_] - base[resources_]) * 100 / base[resources_]) > max_growth)
+            ):
+                failures.append(f"{resources_} growth: {pct:.1f}% > {max_growth}% (baseline: {base[resources_]})")
+        report[k] = {
+            **{i: v[i] for i in limits},
+            "growth": growth,
+            "resource_types": v["resource_types"],
+            "failures": failures,
+            "split_points": (
+                get_split_points(v["resource_paths"], budgets[resources_])
+                if v[resources_] > budgets[resources_]
+                else []
+            ),
+        }
+    return report
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(
+        description="Analyze the CloudFormation templates in the cloud assembly (i.e. run `cdk synth` first): "
+        "per stack, the resource count (by type), template bytes, parameter and output counts, and growth against a stored "
+        "baseline. Fails (i.e. for CI) when a budget (a percentage of the CloudFormation quotas) is exceeded, "
+        "suggesting split points (by CDK construct ID prefix)."
+    )
+    parser.add_argument("-a", "--app", default=cdk_out_path, help=f"The cloud assembly dir. Default: {cdk_out_path}")
+    parser.add_argument(
+        "-b",
+        "--baseline",
+        default=cdk_template_budget_baseline_path,
+        help=f"The baseline JSON file. Default: {cdk_template_budget_baseline_path}",
+    )
+    parser.add_argument(
+        "-t",
+        "--threshold",
+        type=float,
+        default=0.8,
+        help="The budget, as a fraction of the CloudFormation quotas. Default: 0.8",
+    )
+    parser.add_argument(
+        "-g",
+        "--max-growth",
+        type=float,
+        help="Optional max. resource count growth (%%) per stack, against the baseline.",
+    )
+    parser.add_argument("-u", "--update-baseline", action="store_true", help="Write the baseline, from the templates.")
+    parser.add_argument("-v", "--verbose", action="store_true", help="Show the resource counts by type.")
+    args = parser.parse_args()
+
+    stacks: dict[str, dict] = get_stacks(args.app)
+    baseline: dict[str, dict] = {}
+    if os.path.exists(args.baseline):
+        with open(args.baseline, "r", encoding=encoding) as f:
+            baseline = json.load(f)
+
+    report: dict[str, dict] = get_report(stacks, baseline, args.threshold, args.max_growth)
+    print(f"\n{'CDK stack':<60} {'Resources':>10} {'Bytes':>10} {'Params':>7} {'Outputs':>8}  Growth")
+    for k, v in report.items():
+        growth: str = ", ".join(f"{i}: {j:+}" for i, j in v["growth"].items())
+        print(f"{k:<60} {v[resources_]:>10} {v[template_bytes_]:>10} {v[parameters_]:>7} {v[outputs_]:>8}  {growth}")
+        if args.verbose:
+            for i, j in v["resource_types"].items():
+                print(f"    {i}: {j}")
+
+    failed: dict[str, dict] = {k: v for k, v in report.items() if v["failures"]}
+    for k, v in failed.items():
+        print(f"\n## Budget exceeded, for CDK stack: {k}")
+        for i in v["failures"]:
+            print(f"  - {i}")
+        for i in v["split_points"]:
+            print(f"  Consider splitting out: '{i['prefix']}*' ({i[resources_]} resources)")
+
+    if args.update_baseline:
+        with open(args.baseline, "w+", encoding=encoding) as f:
+            json.dump({k: {i: v[i] for i in limits} for k, v in sorted(stacks.items())}, f, indent=2)
+        print(f"\nWritten baseline to: '{args.baseline}'")
+    print(f"\nCDK stacks: {len(report)}, over budget: {len(failed)}")
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
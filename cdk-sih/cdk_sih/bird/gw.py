@@ -16,6 +16,8 @@ from cdk_sih.pdf.ms import CdkPdfMsStack
 
 
 class CdkBirdGwStack(CdkGwStack):
+    ECS_TASK_DEFINITION_CONTAINER_MEMORY_MIB: int = 8192
+
     def __init__(
         self,
         base_stack: CdkBirdBaseStack,
@@ -33,7 +35,6 @@ class CdkBirdGwStack(CdkGwStack):
             base_stack=base_stack,
             deploy_env=deploy_env,
             factory=factory,
-            ecs_task_definition_container_memory_mib=8192,
             storage_bkg_stack=bkg_ms_stack.storage_stack,
             **kwargs,
         )
@@ -53,9 +54,7 @@ class CdkBirdGwStack(CdkGwStack):
             "BACKGROUND_URL": self.get_url_background(self, bkg_ms_stack),
             "BASE_URL": getattr(self, factory.URL_PRIVATE_),
             "CPU_CORES": self.ecs_task_definition_container_cpu_cores,
-            "DB_ENGINE_OPTIONS": json.dumps(
-                self.get_sqlalchemy_database_engine_options(pool_size=80, max_overflow=100)
-            ),
+            "DB_ENGINE_OPTIONS": json.dumps(self.get_sqlalchemy_database_engine_options(database_stack)),
             "DB_URL": self.get_sqlalchemy_database_uri(database_stack, deploy_env),
             "DEBUG": self.debug,
             "LIONAPI_BASE_URL": factory.get_url_for_ms_from_cdk_stack(self, lion_ms_stack),
@@ -70,9 +69,10 @@ class CdkBirdGwStack(CdkGwStack):
             "PDF_CDK_STACK_REGION": factory.get_attr_env_region(self),
             "PDF_LAMBDA_FUNCTION_NAME": pdf_ms_stack.pdf_lambda_func.function_name,
             "PORTAL_BASE_URL": self.url_portal,
-            "REDIS_HOST": cache_stack.ec_redis_cluster_rep_group.attr_primary_end_point_address,
-            "REDIS_HOST_READER": cache_stack.ec_redis_cluster_rep_group.attr_reader_end_point_address,
-            "REDIS_PORT": cache_stack.ec_redis_cluster_rep_group.attr_primary_end_point_port,
+            "REDIS_CLUSTER": cache_stack.ec_redis_cluster,
+            "REDIS_HOST": cache_stack.ec_redis_host,
+            "REDIS_HOST_READER": cache_stack.ec_redis_host_reader,
+            "REDIS_PORT": cache_stack.ec_redis_port,
             "REDIS_SSL": self.redis_ssl,
             "S3_BUCKET_NAME": getattr(self, factory.STORAGE_S3_BUCKET_NAME_),
             "S3_CDK_STACK_ACCOUNT_ID": factory.get_attr_env_account(self),
@@ -104,6 +104,7 @@ class CdkBirdGwStack(CdkGwStack):
             "UVICORN_LOG_LEVEL": self.log_level,
             "UVICORN_PORT": str(getattr(self, factory.ALB_PORT_)),
             "UVICORN_WORKERS": self.workers,
+            "WORKER_THREADS": self.get_worker_threads(database_stack),
         }
         if getattr(self, factory.DEPLOY_ENV_NOT_24_7_):
             ecs_container_environment["DAILY_TASK_SLOT_LOCAL_START"] = str(14)
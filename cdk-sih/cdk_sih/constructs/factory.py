@@ -1,3 +1,4 @@
+import hashlib
 import json
 import os
 import sys
@@ -10,6 +11,7 @@ from aws_cdk import (
     Annotations,
     ArnFormat,
     CfnOutput,
+    CfnUpdatePolicy,
     Duration,
     Environment,
     RemovalPolicy,
@@ -38,6 +40,7 @@ from aws_cdk import (
     aws_events as events,
     aws_events_targets as targets,
     aws_iam as iam,
+    aws_kinesis as kinesis,
     aws_kms as kms,
     aws_lambda as lambda_,
     aws_lambda_destinations as lambda_destinations,
@@ -108,7 +111,9 @@ class CdkConstructsFactory:
     AND_: str = "and"
     API_: str = "api"
     APP_: str = "app"
+    ARCHITECTURES_: str = "architectures"
     ARCHIVE_: str = "archive"
+    ARM64_: str = "arm64"
     ARN_: str = "arn"
     ASG_: str = "asg"
     ATMOS_: str = "atmos"
@@ -130,6 +135,7 @@ class CdkConstructsFactory:
     BLOCK_: str = "block"
     BROKER_: str = "broker"
     BUCKET_: str = "bucket"
+    BUDGET_: str = "budget"
     BUILDSPEC_: str = "buildspec"
     BUILD_: str = "build"
     BUS_: str = "bus"
@@ -140,6 +146,7 @@ class CdkConstructsFactory:
     CERT_: str = "cert"
     CF_: str = "cloudfront"
     CHECKSUM_: str = "checksum"
+    CHECK_: str = "check"
     CIDRS_: str = "cidrs"
     CIDR_: str = "cidr"
     CLASS_: str = "class"
@@ -147,6 +154,7 @@ class CdkConstructsFactory:
     CLOUDFORMATION_: str = "cloudformation"
     CLOUDWATCH_: str = "cloudwatch"
     CLOUD_: str = "cloud"
+    CLUSTERS_: str = "clusters"
     CLUSTER_: str = "cluster"
     CODEBUILD_: str = "codebuild"
     CODEDEPLOY_: str = "codedeploy"
@@ -165,6 +173,7 @@ class CdkConstructsFactory:
     CONNECTIONS_: str = "connections"
     CONTAINER_: str = "container"
     CONTEXT_: str = "context"
+    COOLDOWN_: str = "cooldown"
     COUNT_: str = "count"
     CO_: str = "co"
     CT_: str = "cloudtrail"
@@ -193,6 +202,7 @@ class CdkConstructsFactory:
     DISABLE_: str = "disable"
     DIST_: str = "dist"
     DKR_: str = "dkr"
+    DLQ_: str = "dlq"
     DNS_: str = "dns"
     DOMAIN_: str = "domain"
     DOWNLOAD_: str = "download"
@@ -224,6 +234,7 @@ class CdkConstructsFactory:
     EXTRACT_: str = "extract"
     EXT_: str = "ext"
     E_: str = "e"
+    FARGATE_: str = "fargate"
     FEDERATION_: str = "federation"
     FILENAMES_: str = "filenames"
     FILE_: str = "file"
@@ -238,13 +249,18 @@ class CdkConstructsFactory:
     GLOBAL_: str = "global"
     GROUP_: str = "group"
     HANDLER_: str = "handler"
+    HEADERS_: str = "headers"
     HEADER_: str = "header"
+    HITS_: str = "hits"
     HOSTED_: str = "hosted"
     HOST_: str = "host"
     IAM_: str = "iam"
     IDENTITY_: str = "identity"
+    IDLE_: str = "idle"
+    IDS_: str = "ids"
     ID_: str = "id"
     IGW_: str = "igw"
+    IMMUTABLE_: str = "immutable"
     INDEX_: str = "index"
     INFO_: str = "info"
     INIT_: str = "init"
@@ -253,6 +269,7 @@ class CdkConstructsFactory:
     INSTANCE_: str = "instance"
     INTERNAL_: str = "internal"
     INTERNET_: str = "internet"
+    IN_: str = "in"
     IPSEC_: str = "ipsec"
     IPS_: str = "ips"
     IPV4_: str = "ipv4"
@@ -262,6 +279,7 @@ class CdkConstructsFactory:
     IT_: str = "it"
     KEYS_: str = "keys"
     KEY_: str = "key"
+    KINESIS_: str = "kinesis"
     KMS_: str = "kms"
     LAMBDA_: str = "lambda"
     LATEST_: str = "latest"
@@ -286,13 +304,16 @@ class CdkConstructsFactory:
     MILLIS_: str = "millis"
     MIN_: str = "min"
     MISC_: str = "misc"
+    MISSES_: str = "misses"
     MOB_: str = "mob"
     MONITOR_: str = "monitor"
     MOZILLA_: str = "mozilla"
     MQ_: str = "mq"
     MS_: str = "ms"
+    MTIME_: str = "mtime"
     MULTI_: str = "multi"
     MYSQL_: str = "mysql"
+    NAMES_: str = "names"
     NAME_: str = "name"
     NAT_: str = "nat"
     NGW_: str = "ngw"
@@ -302,31 +323,40 @@ class CdkConstructsFactory:
     NOTIFICATIONS_: str = "notifications"
     NOTIFICATION_: str = "notification"
     NO_: str = "no"
+    NUMERIC_: str = "numeric"
     OBJECTS_: str = "objects"
+    OBJECT_: str = "object"
     OBJS_: str = "objs"
     OFF_: str = "off"
     ON_: str = "on"
     ORIGIN_: str = "origin"
+    OUTPUTS_: str = "outputs"
+    OUT_: str = "out"
     OVERNIGHT_: str = "overnight"
     PARAMETER_: str = "parameter"
     PARAMS_: str = "params"
     PARAM_: str = "param"
     PASSWORD_: str = "password"
+    PEAK_: str = "peak"
+    PERCENT_: str = "percent"
     PERFORMANCE_: str = "performance"
     PERFORM_: str = "perform"
     PERMITTED_: str = "permitted"
     PIPELINE_: str = "pipeline"
+    POLICIES_: str = "policies"
     POLICY_: str = "policy"
     POLL_: str = "poll"
     PORTAL_: str = "portal"
     PORT_: str = "port"
     POSTMAN_: str = "postman"
+    PREFIX_: str = "prefix"
     PREVIEW_: str = "preview"
     PRICE_: str = "price"
     PRIVATE_: str = "private"
     PRODUCT_: str = "product"
     PROD_: str = "prod"
     PROJECT_: str = "project"
+    PROPS_: str = "props"
     PROXIES_: str = "proxies"
     PROXY_: str = "proxy"
     PSK_: str = "psk"
@@ -339,6 +369,8 @@ class CdkConstructsFactory:
     RANGES_: str = "ranges"
     RATE_: str = "rate"
     RDS_: str = "rds"
+    READER_: str = "reader"
+    REALTIME_: str = "realtime"
     REASON_: str = "reason"
     RECORD_: str = "record"
     REDIS_: str = "redis"
@@ -353,6 +385,7 @@ class CdkConstructsFactory:
     REP_: str = "rep"
     REQUESTS_: str = "requests"
     RESERVED_: str = "reserved"
+    RESPONSE_: str = "response"
     ROLE_: str = "role"
     ROT_: str = "rot"
     ROUTE_53_: str = "route53"
@@ -361,6 +394,7 @@ class CdkConstructsFactory:
     S3_: str = "s3"
     SAML_: str = "saml"
     SAT_: str = "sat"
+    SCALE_: str = "scale"
     SCALING_: str = "scaling"
     SCHEDULE_: str = "schedule"
     SCHEMAS_: str = "schemas"
@@ -373,14 +407,20 @@ class CdkConstructsFactory:
     SES_: str = "ses"
     SET_: str = "set"
     SG_: str = "sg"
+    SHARDS_: str = "shards"
+    SHARED_: str = "shared"
+    SHIELD_: str = "shield"
     SH_: str = "sh"
     SIMPLE_: str = "simple"
+    SIZE_: str = "size"
     SLOWQUERY_: str = "slowquery"
     SLOW_: str = "slow"
     SNAPSHOT_: str = "snapshot"
     SNS_: str = "sns"
     SOURCE_: str = "source"
     SPACE_: str = "space"
+    SPOT_: str = "spot"
+    SQS_: str = "sqs"
     SSH_: str = "ssh"
     SSMMESSAGES_: str = "ssmmessages"
     SSM_: str = "ssm"
@@ -392,6 +432,7 @@ class CdkConstructsFactory:
     STATUS_: str = "status"
     STOP_: str = "stop"
     STORAGE_: str = "storage"
+    STREAM_: str = "stream"
     STS_: str = "sts"
     SUBDOMAIN_: str = "subdomain"
     SUBJECT_: str = "subject"
@@ -399,6 +440,7 @@ class CdkConstructsFactory:
     SUBNET_: str = "subnet"
     SUBSCRIPTIONS_: str = "subscriptions"
     SUBS_: str = "subs"
+    SUFFIX_: str = "suffix"
     SUPPORT_: str = "support"
     SYSTEM_: str = "system"
     TABLE_: str = "table"
@@ -438,9 +480,11 @@ class CdkConstructsFactory:
     WEEKEND_: str = "weekend"
     WEEKLY_: str = "weekly"
     WEEK_: str = "week"
+    WILDCARD_: str = "wildcard"
     WINDOW_: str = "window"
     WORD_: str = "word"
     WORKSPACE_: str = "workspace"
+    X86_64_: str = "x86_64"
     XML_: str = "xml"
     YML_: str = "yml"
     ZIP_: str = "zip"
@@ -461,6 +505,7 @@ class CdkConstructsFactory:
     _ECS_CONTAINER_: str = SEP_UNDER_.join([ECS_, CONTAINER_])
     _END_WEEK_DAYS_: str = SEP_UNDER_.join([END_, WEEK_, DAYS_])
     _E_COMMERCE_API_KEY_: str = SEP_UNDER_.join([E_, COMMERCE_, API_, KEY_])
+    _LAMBDA_LAYER_VERSION_BASE_: str = SEP_UNDER_.join([LAMBDA_, LAYER_, VERSION_, BASE_])
     _SCHEDULE_WINDOW_: str = SEP_UNDER_.join([SCHEDULE_, WINDOW_])
     _SECRET_KEY_: str = SEP_UNDER_.join([SECRET_, KEY_])
     _START_WEEK_DAYS_: str = SEP_UNDER_.join([START_, WEEK_, DAYS_])
@@ -470,11 +515,15 @@ class CdkConstructsFactory:
     ALB_PORT_: str = SEP_UNDER_.join([ALB_, PORT_])
     ALB_SG_: str = SEP_UNDER_.join([ALB_, SG_])
     CLIENT_VPN_ENDPOINT_PRIVATE_SG_: str = SEP_UNDER_.join([CLIENT_, VPN_, ENDPOINT_, PRIVATE_, SG_])
+    CLOUDFRONT_CACHE_POLICIES_: str = SEP_UNDER_.join([CF_, CACHE_, POLICIES_])
+    CLOUDFRONT_LOG_BUCKET_: str = SEP_UNDER_.join([CF_, LOG_, BUCKET_])
+    CLOUDFRONT_REALTIME_LOGS_: str = SEP_UNDER_.join([CF_, REALTIME_, LOGS_])
     CODESTAR_CONNECTIONS_ARN_: str = SEP_UNDER_.join([CODESTAR_, CONNECTIONS_, ARN_])
     CODESTAR_CONNECTIONS_BITBUCKET_WORKSPACE_: str = SEP_UNDER_.join([CODESTAR_, CONNECTIONS_, BITBUCKET_, WORKSPACE_])
     COMP_SUBDOMAIN_: str = SEP_UNDER_.join([COMP_, SUBDOMAIN_])
     DB_API_USER_PW_: str = SEP_UNDER_.join([_DB_API_USER_, PW_])
     DB_API_USER_USERNAME_: str = SEP_UNDER_.join([_DB_API_USER_, USERNAME_])
+    DB_CONNECTIONS_BUDGET_: str = SEP_UNDER_.join([DB_, CONNECTIONS_, BUDGET_])
     DB_PORT_: str = SEP_UNDER_.join([DB_, PORT_])
     DB_PROXIES_: str = SEP_UNDER_.join([DB_, PROXIES_])
     DB_SCHEMAS_: str = SEP_UNDER_.join([DB_, SCHEMAS_])
@@ -497,9 +546,12 @@ class CdkConstructsFactory:
     DEPLOY_ENV_WEEKEND_: str = SEP_UNDER_.join([DEPLOY_ENV_, WEEKEND_])
     DEV_STAGING_: str = SEP_UNDER_.join([DEV_, STAGING_])
     DISABLE_24_7_: str = SEP_UNDER_.join([DISABLE_, str(24), str(7)])
+    ECS_CLUSTERS_: str = SEP_UNDER_.join([ECS_, CLUSTERS_])
+    ECS_CLUSTERS_SHARED_: str = SEP_UNDER_.join([ECS_, CLUSTERS_, SHARED_])
     ECS_CONTAINER_API_KEYS_SECRET_: str = SEP_UNDER_.join([_ECS_CONTAINER_, API_, KEYS_, SECRET_])
     ECS_CONTAINER_SECRET_: str = SEP_UNDER_.join([_ECS_CONTAINER_, SECRET_])
     ECS_CONTAINER_SERVICE_ACCESS_SECRET_: str = SEP_UNDER_.join([_ECS_CONTAINER_, SERVICE_, ACCESS_, SECRET_])
+    ECS_FARGATE_SPOT_: str = SEP_UNDER_.join([ECS_, FARGATE_, SPOT_])
     ECS_SERVICE_CLOUD_MAP_SERVICE_NAME_: str = SEP_UNDER_.join([ECS_, SERVICE_, CLOUD_, MAP_, SERVICE_, NAME_])
     ECS_SG_: str = SEP_UNDER_.join([ECS_, SG_])
     EC_REDIS_SG_: str = SEP_UNDER_.join([EC_, REDIS_, SG_])
@@ -512,6 +564,8 @@ class CdkConstructsFactory:
     KMS_KEY_STACK_: str = SEP_UNDER_.join([KMS_, KEY_, STACK_])
     LAMBDA_SG_: str = SEP_UNDER_.join([LAMBDA_, SG_])
     MAIL_USER_: str = SEP_UNDER_.join([MAIL_, USER_])
+    MAX_CONNECTIONS_PERCENT_: str = SEP_UNDER_.join([MAX_, CONNECTIONS_, PERCENT_])
+    MAX_IDLE_CONNECTIONS_PERCENT_: str = SEP_UNDER_.join([MAX_, IDLE_, CONNECTIONS_, PERCENT_])
     MAIL_USER_SUPPORT_: str = SEP_UNDER_.join([MAIL_USER_, SUPPORT_])
     MQ_RABBITMQ_SG_: str = SEP_UNDER_.join([MQ_, RABBITMQ_, SG_])
     MS_TEAMS_: str = SEP_UNDER_.join([MS_, TEAMS_])
@@ -585,6 +639,7 @@ class CdkConstructsFactory:
     SA_EAST_1_: str = "sa-east-1"
 
     # AWS region metadata
+    _CF_ORIGIN_SHIELD_REGION_: str = SEP_UNDER_.join([CF_, ORIGIN_, SHIELD_, REGION_])
     _CF_PRICE_CLASS_: str = SEP_UNDER_.join([CF_, PRICE_, CLASS_])
     _CF_PRICE_CLASS_DEFAULT: cloudfront.PriceClass = cloudfront.PriceClass.PRICE_CLASS_100
     _MULTI_REGION_: str = SEP_UNDER_.join([MULTI_, REGION_])
@@ -595,37 +650,44 @@ class CdkConstructsFactory:
             US_EAST_1_: {
                 _TIMEZONE_: SEP_FW_.join(["US", "Eastern"]),
                 _CF_PRICE_CLASS_: cloudfront.PriceClass.PRICE_CLASS_100,
+                _CF_ORIGIN_SHIELD_REGION_: US_EAST_1_,
                 _MULTI_REGION_: "zxxd85bkqcajcy",
             },  # N. Virginia
             AF_SOUTH_1_: {
                 _TIMEZONE_: SEP_FW_.join(["Africa", "Maputo"]),
                 _CF_PRICE_CLASS_: cloudfront.PriceClass.PRICE_CLASS_200,
+                _CF_ORIGIN_SHIELD_REGION_: None,  # Origin Shield is not available in Cape Town
                 _MULTI_REGION_: "rk9r4oeyrkry7b",
             },  # Cape Town
             AP_NORTHEAST_2_: {
                 _TIMEZONE_: SEP_FW_.join(["Asia", "Seoul"]),
                 _CF_PRICE_CLASS_: cloudfront.PriceClass.PRICE_CLASS_200,
+                _CF_ORIGIN_SHIELD_REGION_: AP_NORTHEAST_2_,
                 _MULTI_REGION_: "ykg3pn4y7e4eg5",
             },  # Seoul
             AP_SOUTHEAST_2_: {
                 _TIMEZONE_: SEP_FW_.join(["Australia", "Sydney"]),
                 _CF_PRICE_CLASS_: cloudfront.PriceClass.PRICE_CLASS_ALL,
+                _CF_ORIGIN_SHIELD_REGION_: AP_SOUTHEAST_2_,
                 _MULTI_REGION_: "376mnqpdodhxyy",
             },  # Sydney
             EU_CENTRAL_1_: {
                 _TIMEZONE_: SEP_FW_.join(["Europe", "Berlin"]),
                 _CF_PRICE_CLASS_: cloudfront.PriceClass.PRICE_CLASS_100,
+                _CF_ORIGIN_SHIELD_REGION_: EU_CENTRAL_1_,
                 _MULTI_REGION_: "tzy5agpq6gfste",
             },  # Frankfurt
             EU_WEST_2_: {
                 _TIMEZONE_: SEP_FW_.join(["Europe", "London"]),
                 _CF_PRICE_CLASS_: cloudfront.PriceClass.PRICE_CLASS_ALL,
+                _CF_ORIGIN_SHIELD_REGION_: EU_WEST_2_,
                 # TODO: (NEXT) When multi-region is enabled, reset to use _CF_PRICE_CLASS_DEFAULT
                 _MULTI_REGION_: "m3c4s4y4jphaqh",
             },  # London
             SA_EAST_1_: {
                 _TIMEZONE_: SEP_FW_.join(["America", "Sao_Paulo"]),
                 _CF_PRICE_CLASS_: cloudfront.PriceClass.PRICE_CLASS_ALL,
+                _CF_ORIGIN_SHIELD_REGION_: SA_EAST_1_,
                 _MULTI_REGION_: "5axscsqj4pz4ec",
             },  # São Paulo
         }
@@ -682,23 +744,132 @@ class CdkConstructsFactory:
         PERFORM_: {DEPLOY_ENV_LIST_: [PERFORM_], RDS_INSTANCE_TYPE_: RDS_INSTANCE_TYPE_DEFAULT_VALUE},
         PROD_: {DEPLOY_ENV_LIST_: [PROD_], RDS_INSTANCE_TYPE_: RDS_INSTANCE_TYPE_DEFAULT_VALUE},
     }
+    # AWS RDS MySQL default 'max_connections' (i.e. {DBInstanceClassMemory/12582880}), per RDS instance type
+    RDS_MYSQL_MAX_CONNECTIONS: dict[str, int] = {M5_XLARGE_: 1320, M6G_LARGE_: 648, T3_MEDIUM_: 312, T3_SMALL_: 150}
+    # AWS RDS max. connections (%) reserved for the admin user (e.g. RDS init Lambda functions, and secret rotation),
+    #  and the RDS proxy max. idle connections (%) kept, of the max. connections of each deploy env type
+    RDS_MAX_CONNECTIONS_RESERVED_PERCENT: int = 10
+    RDS_PROXY_MAX_IDLE_CONNECTIONS_RATIO: dict[bool, float] = {True: 0.25, False: 0.5}  # Key: is deploy env internal
 
     # AWS ElastiCache Redis metadata
     EC_REDIS_INSTANCE_TYPE_: str = SEP_UNDER_.join([EC_, REDIS_, INSTANCE_, TYPE_])
     EC_REDIS_REPLICAS_: str = SEP_UNDER_.join([EC_, REDIS_, REPLICAS_])
+    EC_REDIS_SHARDS_: str = SEP_UNDER_.join([EC_, REDIS_, SHARDS_])
+    # Shards (i.e. node groups), and replicas per shard. More than 1 shard enables cluster mode, after which changing
+    #  the shards (i.e. 2 or more) is applied by online resharding (i.e. without downtime). NB. Changing a deployed
+    #  replication group from 1 shard to more (or back) is NOT applied in place, see: ``elasticache_replication_group``
     EC_REDIS_META: dict[str, str] = {
-        LIGHT_: {EC_REDIS_INSTANCE_TYPE_: T3_SMALL_, EC_REDIS_REPLICAS_: 1},
-        HEAVY_: {EC_REDIS_INSTANCE_TYPE_: T3_MEDIUM_, EC_REDIS_REPLICAS_: 1},
+        LIGHT_: {EC_REDIS_INSTANCE_TYPE_: T3_SMALL_, EC_REDIS_REPLICAS_: 1, EC_REDIS_SHARDS_: 1},
+        HEAVY_: {EC_REDIS_INSTANCE_TYPE_: T3_MEDIUM_, EC_REDIS_REPLICAS_: 1, EC_REDIS_SHARDS_: 1},
     }
 
     # AWS (ECS) Elastic Container Service metadata
     ECS_SERVICE_MAX_: str = SEP_UNDER_.join([ECS_, SERVICE_, MAX_])
     ECS_SERVICE_MIN_: str = SEP_UNDER_.join([ECS_, SERVICE_, MIN_])
+    ECS_SERVICE_SCALE_IN_COOLDOWN_: str = SEP_UNDER_.join([ECS_, SERVICE_, SCALE_, IN_, COOLDOWN_])
+    ECS_SERVICE_SCALE_IN_DISABLE_: str = SEP_UNDER_.join([ECS_, SERVICE_, SCALE_, IN_, DISABLE_])
+    ECS_SERVICE_SCALE_OUT_COOLDOWN_: str = SEP_UNDER_.join([ECS_, SERVICE_, SCALE_, OUT_, COOLDOWN_])
+    # Auto-scaling cooldowns (in secs), and scale-in protection (i.e. target tracking policies only scale out, if True)
     ECS_META: dict[str, dict[str, int]] = {
-        LIGHT_: {ECS_SERVICE_MIN_: 1, ECS_SERVICE_MAX_: 1},
-        HEAVY_: {ECS_SERVICE_MIN_: 1, ECS_SERVICE_MAX_: 3},
+        LIGHT_: {
+            ECS_SERVICE_MIN_: 1,
+            ECS_SERVICE_MAX_: 1,
+            ECS_SERVICE_SCALE_IN_COOLDOWN_: 300,
+            ECS_SERVICE_SCALE_IN_DISABLE_: False,
+            ECS_SERVICE_SCALE_OUT_COOLDOWN_: 60,
+        },
+        HEAVY_: {
+            ECS_SERVICE_MIN_: 1,
+            ECS_SERVICE_MAX_: 3,
+            ECS_SERVICE_SCALE_IN_COOLDOWN_: 300,
+            ECS_SERVICE_SCALE_IN_DISABLE_: False,
+            ECS_SERVICE_SCALE_OUT_COOLDOWN_: 60,
+        },
     }
 
+    # AWS ECS web server (e.g. Gw) sizing, workers per vCPU (as I/O-bound), min. memory (in MiB) per worker, and the
+    #  max. threads per worker (i.e. max. concurrent DB sessions of each, capped by its DB connections, see:
+    #  ``CdkGwStack.get_worker_threads``)
+    ECS_WORKERS_PER_VCPU: int = 2
+    ECS_WORKER_MEMORY_MIB: int = 512
+    ECS_WORKER_THREADS: int = 8
+
+    # AWS ECS Fargate task CPU units, and the (min., max.) memory (in MiB) supported with each
+    ECS_FARGATE_CPU_MEMORY_MIB: dict[int, tuple[int, int]] = {
+        256: (512, 2048),
+        512: (1024, 4096),
+        1024: (2048, 8192),
+        2048: (4096, 16384),
+        4096: (8192, 30720),
+        8192: (16384, 61440),
+        16384: (32768, 122880),
+    }
+
+    # AWS ECS Fargate capacity provider strategies (capacity provider, base, weight), per deploy env type, for ECS
+    #  services opted in to Fargate Spot (see ``set_factory_ecs_fargate_spot``). If none (e.g. for prod, or not opted
+    #  in), on-demand Fargate (i.e. the FARGATE launch type).
+    ECS_CAPACITY_PROVIDER_FARGATE_: str = FARGATE_.upper()
+    ECS_CAPACITY_PROVIDER_FARGATE_SPOT_: str = SEP_UNDER_.join([FARGATE_, SPOT_]).upper()
+    ECS_CAPACITY_PROVIDER_STRATEGIES: dict[str, list[tuple[str, int, int]]] = {
+        INTERNAL_: [(ECS_CAPACITY_PROVIDER_FARGATE_SPOT_, 0, 3), (ECS_CAPACITY_PROVIDER_FARGATE_, 0, 1)],
+        PREVIEW_DEMO_: [(ECS_CAPACITY_PROVIDER_FARGATE_SPOT_, 0, 3), (ECS_CAPACITY_PROVIDER_FARGATE_, 0, 1)],
+    }
+
+    # AWS CloudFront cache behaviors (by path pattern), for the OpenAPI docs (e.g. FastAPI), see:
+    #  ``cloudfront_distribution``. Their cache policies are shared by all CloudFront distributions (in the AWS account
+    #  and region), see ``cloudfront_cache_policies``.
+    CLOUDFRONT_CACHE_BEHAVIOR_OPENAPI: dict = {"default_ttl_secs": 300, "max_ttl_secs": 3600}
+    CLOUDFRONT_CACHE_BEHAVIORS_OPENAPI: dict[str, dict] = {
+        "/docs": CLOUDFRONT_CACHE_BEHAVIOR_OPENAPI,
+        "/openapi.json": CLOUDFRONT_CACHE_BEHAVIOR_OPENAPI,
+        "/redoc": CLOUDFRONT_CACHE_BEHAVIOR_OPENAPI,
+    }
+
+    # AWS CloudFront cache behavior, for immutable static assets (i.e. a new version is a new file name, e.g. by a
+    #  content hash), with a Cache-Control response header (unless set on the S3 object), see:
+    #  ``cloudfront_distribution_s3``
+    CLOUDFRONT_CACHE_BEHAVIOR_IMMUTABLE: dict = {
+        "default_ttl_secs": 31536000,
+        "max_ttl_secs": 31536000,
+        "min_ttl_secs": 86400,
+    }
+    CLOUDFRONT_CACHE_CONTROL_IMMUTABLE: str = "public, max-age=31536000, immutable"
+
+    # AWS CloudFront cache behaviors (by path pattern), for a PyPi server (i.e. pypiserver), where package files are
+    #  immutable (i.e. a new version is a new file name), and index pages are short-lived. Both vary on the
+    #  Authorization header (i.e. HTTP basic auth), to never serve a cached response to an unauthorised request.
+    CLOUDFRONT_CACHE_BEHAVIORS_PYPI: dict[str, dict] = {
+        "/packages/*": {
+            "default_ttl_secs": 31536000,
+            "max_ttl_secs": 31536000,
+            "min_ttl_secs": 86400,
+            "headers": ["Authorization"],
+            "compress": False,  # Already compressed (e.g. wheels, sdists)
+        },
+        "/simple/*": {"default_ttl_secs": 60, "max_ttl_secs": 300, "headers": ["Authorization"]},
+    }
+
+    # AWS CloudFront (standard) logs, retention in the shared log bucket, see: ``s3_bucket_cloudfront_logs``
+    CLOUDFRONT_LOGS_RETENTION_DAYS: int = 90
+
+    # AWS CloudFront real-time logs fields, see:
+    #  https://docs.aws.amazon.com/AmazonCloudFront/latest/DeveloperGuide/real-time-logs.html#understand-real-time-log-config-fields
+    CLOUDFRONT_REALTIME_LOG_FIELDS: list[str] = [
+        "timestamp",
+        "c-ip",
+        "cs-host",
+        "cs-method",
+        "cs-uri-stem",
+        "sc-status",
+        "sc-bytes",
+        "time-taken",
+        "time-to-first-byte",
+        "x-edge-location",
+        "x-edge-request-id",
+        "x-edge-result-type",
+        "x-edge-response-result-type",
+    ]
+
     # AWS CloudFront WAF (IPv4 address) block list
     CLOUDFRONT_WAF_BLOCK_IPS_V4: list[str] = []
 
@@ -717,6 +888,15 @@ class CdkConstructsFactory:
     STATUS_FAILED_: str = "FAILED"
     STATUS_SUCCEEDED_: str = "SUCCEEDED"
 
+    # CDK custom outputs - process-wide cache of parsed JSON files (keyed by file path), invalidated on file mtime change
+    _CDK_CUSTOM_OUTPUTS_CACHE: dict[str, dict] = {}
+    _CDK_CUSTOM_OUTPUTS_CACHE_STATS: dict[str, int] = {HITS_: 0, MISSES_: 0}
+
+    # CDK construct naming - per CDK stack class object naming context (resolved prefixes, and memoized IDs and names),
+    #  and whether each CDK stack class overrides the 'get_construct_id' method (keyed by class)
+    _NAMING_CONTEXT_: str = "_naming_context"
+    _CONSTRUCT_ID_METHODS: dict[type, bool] = {}
+
     # Ports
     _DB_PORT: int = 3306
     _REDIS_PORT: int = 6379
@@ -1038,9 +1218,7 @@ class CdkConstructsFactory:
         auto_scaling_group.scale_on_schedule(
             id=self.get_construct_id(self_obj, name_props + [self.START_], "ScheduledAction"),
             schedule=autoscaling.Schedule.cron(
-                minute=str(0),
-                hour=str(props[self.START_]),
-                week_day=props[self._START_WEEK_DAYS_],
+                **self.get_cron_options([props[self.START_]], props[self._START_WEEK_DAYS_])
             ),
             desired_capacity=start_capacity,
             max_capacity=start_capacity,
@@ -1049,9 +1227,7 @@ class CdkConstructsFactory:
         auto_scaling_group.scale_on_schedule(
             id=self.get_construct_id(self_obj, name_props + [self.STOP_], "ScheduledAction"),
             schedule=autoscaling.Schedule.cron(
-                minute=str(0),
-                hour=str(props[self.END_]),
-                week_day=props[self._END_WEEK_DAYS_],
+                **self.get_cron_options([props[self.END_]], props[self._END_WEEK_DAYS_])
             ),
             desired_capacity=0,
             max_capacity=0,
@@ -1075,6 +1251,151 @@ class CdkConstructsFactory:
             value=self.get_attr_project_name_comp(self_obj),
         )
 
+    def _cloudfront_cache_policy(
+        self,
+        self_obj,
+        name_props: list[str],
+        desc_insert: str,
+        default_ttl_secs: int,
+        max_ttl_secs: int = None,
+        min_ttl_secs: int = 0,
+        headers: list[str] = None,
+        cookies: Union[list[str], str] = None,
+        query_strings: Union[list[str], str] = None,
+        compress: bool = True,
+        project_name_comp: str = None,
+        global_: bool = False,
+    ) -> cloudfront.CachePolicy:
+        """
+        Generate a CloudFront cache policy, for a CloudFront distribution cache behavior.
+
+        :param self_obj: The CDK stack class object.
+        :param name_props: Specific property details to include in the CDK construct ID.
+        :param desc_insert: A description insert, for the comment.
+        :param default_ttl_secs: The default time (in secs) objects stay in the CloudFront cache.
+        :param max_ttl_secs: The max. time (in secs) objects stay in the CloudFront cache. Default: the default TTL.
+        :param min_ttl_secs: The min. time (in secs) objects stay in the CloudFront cache. Default: 0.
+        :param headers: An optional list of HTTP headers, to include in the cache key.
+        :param cookies: An optional list of cookies (or '*' for all), to include in the cache key.
+        :param query_strings: An optional list of query strings (or '*' for all), to include in the cache key.
+        :param compress: True if Gzip and Brotli compressed objects are cached (i.e. the Accept-Encoding header).
+        :param project_name_comp: An optional project name and component to use instead of the CDK stack class default.
+        :param global_: True if the cache policy name needs to be unique across AWS regions (i.e. in the AWS account).
+        :return: The CloudFront cache policy.
+        """
+        return cloudfront.CachePolicy(
+            scope=self_obj,
+            id=self.get_construct_id(self_obj, name_props, "CachePolicy"),
+            cache_policy_name=self.get_construct_name_short(
+                self_obj,
+                name_props + [self.CACHE_, self.POLICY_],
+                project_name_comp=project_name_comp,
+                global_=global_,
+                length=128,
+            ),
+            comment=f"CloudFront distribution cache policy for {desc_insert}.",
+            cookie_behavior=(
+                cloudfront.CacheCookieBehavior.all()
+                if cookies == self.SEP_ASTERISK_
+                else (
+                    cloudfront.CacheCookieBehavior.allow_list(*cookies)
+                    if cookies
+                    else cloudfront.CacheCookieBehavior.none()
+                )
+            ),
+            default_ttl=Duration.seconds(default_ttl_secs),
+            enable_accept_encoding_brotli=compress,
+            enable_accept_encoding_gzip=compress,
+            header_behavior=(
+                cloudfront.CacheHeaderBehavior.allow_list(*headers)
+                if headers
+                else cloudfront.CacheHeaderBehavior.none()
+            ),
+            max_ttl=Duration.seconds(max_ttl_secs if max_ttl_secs is not None else default_ttl_secs),
+            min_ttl=Duration.seconds(min_ttl_secs),
+            query_string_behavior=(
+                cloudfront.CacheQueryStringBehavior.all()
+                if query_strings == self.SEP_ASTERISK_
+                else (
+                    cloudfront.CacheQueryStringBehavior.allow_list(*query_strings)
+                    if query_strings
+                    else cloudfront.CacheQueryStringBehavior.none()
+                )
+            ),
+        )
+
+    def _cloudfront_realtime_log_config(
+        self, self_obj, name_props: list[str], project_name_comp: str = None
+    ) -> Optional[cloudfront.RealtimeLogConfig]:
+        """
+        Generate a CloudFront real-time log config, sending to a Kinesis data stream, if the deploy env has real-time
+        logs enabled (see ``set_factory_cloudfront_realtime_logs``).
+
+        :param self_obj: The CDK stack class object.
+        :param name_props: Specific property details to include in the CDK construct ID.
+        :param project_name_comp: An optional project name and component to use instead of the CDK stack class default.
+        :return: The CloudFront real-time log config, or None if real-time logs are not enabled.
+        """
+        if getattr(self_obj, self.DEPLOY_ENV_, None) not in getattr(self, self.CLOUDFRONT_REALTIME_LOGS_, []):
+            return None
+        stream: kinesis.Stream = kinesis.Stream(
+            scope=self_obj,
+            id=self.get_construct_id(self_obj, name_props + [self.KINESIS_], "Stream"),
+            encryption=kinesis.StreamEncryption.KMS,
+            encryption_key=self.get_attr_kms_key_stack(self_obj),
+            removal_policy=RemovalPolicy.DESTROY,
+            retention_period=Duration.hours(24),
+            shard_count=1,
+            stream_mode=kinesis.StreamMode.PROVISIONED,
+            stream_name=self.get_construct_name_short(
+                self_obj, name_props + [self.REALTIME_, self.LOGS_], project_name_comp=project_name_comp, length=128
+            ),
+        )
+        return cloudfront.RealtimeLogConfig(
+            scope=self_obj,
+            id=self.get_construct_id(self_obj, name_props, "RealtimeLogConfig"),
+            end_points=[cloudfront.Endpoint.from_kinesis_stream(stream)],  # A role is generated, to write to the stream
+            fields=self.CLOUDFRONT_REALTIME_LOG_FIELDS,
+            sampling_rate=100,
+            realtime_log_config_name=self.get_construct_name_short(
+                self_obj,
+                name_props + [self.REALTIME_, self.LOG_, self.CONFIG_],
+                project_name_comp=project_name_comp,
+                length=128,
+            ),
+        )
+
+    def _cloudfront_response_headers_policy_cache_control(
+        self, self_obj, name_props: list[str], desc_insert: str, cache_control: str, project_name_comp: str = None
+    ) -> cloudfront.ResponseHeadersPolicy:
+        """
+        Generate a CloudFront response headers policy, adding a Cache-Control header (for browsers and proxies), if not
+        already in the origin response (e.g. S3 object metadata).
+
+        :param self_obj: The CDK stack class object.
+        :param name_props: Specific property details to include in the CDK construct ID.
+        :param desc_insert: A description insert, for the comment.
+        :param cache_control: The Cache-Control header value, e.g. 'public, max-age=31536000, immutable'.
+        :param project_name_comp: An optional project name and component to use instead of the CDK stack class default.
+        :return: The CloudFront response headers policy.
+        """
+        return cloudfront.ResponseHeadersPolicy(
+            scope=self_obj,
+            id=self.get_construct_id(self_obj, name_props, "ResponseHeadersPolicy"),
+            comment=f"CloudFront distribution response headers policy for {desc_insert}.",
+            custom_headers_behavior=cloudfront.ResponseCustomHeadersBehavior(
+                custom_headers=[
+                    cloudfront.ResponseCustomHeader(header="Cache-Control", override=False, value=cache_control)
+                ]
+            ),
+            response_headers_policy_name=self.get_construct_name_short(
+                self_obj,
+                name_props + [self.RESPONSE_, self.HEADERS_, self.POLICY_],
+                project_name_comp=project_name_comp,
+                length=128,
+            ),
+        )
+
     def _cloudfront_waf_web_acl_logging_configuration(
         self, self_obj, web_acl: waf.CfnWebACL, log_group: logs.LogGroup
     ) -> waf.CfnLoggingConfiguration:
@@ -1429,7 +1750,13 @@ class CdkConstructsFactory:
                     "ORGANISATION": self.organisation if not pypi_package else None,
                     "PROJECT_NAME": project_name_comp,
                     "IMAGE_TAG": (
-                        self._get_cdk_stack_image_tag(self_obj, project_name_comp) if not pypi_package else None
+                        self.get_image_tag(
+                            self_obj,
+                            self._get_cdk_stack_image_tag(self_obj, project_name_comp),
+                            project_name_comp=project_name_comp,
+                        )
+                        if not pypi_package
+                        else None
                     ),
                     "ENV_TYPE": (
                         None
@@ -1497,7 +1824,9 @@ class CdkConstructsFactory:
             cache=codebuild.Cache.local(codebuild.LocalCacheMode.DOCKER_LAYER),
             check_secrets_in_plain_text_env_variables=True,
             description=description,
-            environment=self.codebuild_build_environment(project_name_comp),
+            environment=self.codebuild_build_environment(
+                project_name_comp, architecture=self.get_architecture(self_obj, project_name_comp=project_name_comp)
+            ),
             environment_variables=environment_variables,
             grant_report_group_permissions=False,
             logging=codebuild.LoggingOptions(
@@ -1786,6 +2115,43 @@ class CdkConstructsFactory:
             virtualization=ec2.AmazonLinuxVirt.HVM,
         )
 
+    def _ecs_cluster_execute_command_configuration(
+        self, self_obj, name_props: list[str], log_group_name_prefix: str, kms_key: kms.Key
+    ) -> ecs.ExecuteCommandConfiguration:
+        """
+        Generate an ECS cluster execute command configuration (for ECS Exec debugging), with session logs going to a
+        KMS encrypted Logs log group.
+
+        :param self_obj: The CDK stack class object.
+        :param name_props: Specific property details to include in the CDK construct ID.
+        :param log_group_name_prefix: The name prefix of the Logs log group, after the ECS log groups path.
+        :param kms_key: The KMS key, to encrypt the ECS Exec session data, and the Logs log group.
+        :return: The ECS cluster execute command configuration.
+        """
+        name_execute_command_props: list[str] = name_props + [self.EXECUTE_, self.COMMAND_]
+        return ecs.ExecuteCommandConfiguration(
+            kms_key=kms_key,
+            log_configuration=ecs.ExecuteCommandLogConfiguration(
+                cloud_watch_encryption_enabled=True,
+                cloud_watch_log_group=self.logs_log_group(
+                    self_obj,
+                    name_execute_command_props,
+                    self.get_path(
+                        [
+                            self.log_groups[self.ECS_],
+                            log_group_name_prefix,
+                            self.join_sep_score(name_execute_command_props),
+                        ]
+                    ),
+                    encryption_key=kms_key,
+                ),
+                # s3_bucket=,  # Default: - none
+                # s3_encryption_enabled=,  # Default: - encryption will be disabled.
+                # s3_key_prefix=,  # Default: - none
+            ),
+            logging=ecs.ExecuteCommandLogging.OVERRIDE,
+        )
+
     def _ecs_fargate_service_auto_scaling(
         self,
         self_obj,
@@ -1793,6 +2159,9 @@ class CdkConstructsFactory:
         ecs_service: ecs.FargateService,
         admin: bool,
         target_utilization_percent: int = 75,
+        target_group: elasticloadbalancing.ApplicationTargetGroup = None,
+        requests_per_target: int = None,
+        response_time_p90_secs: float = None,
     ) -> None:
         """
         Generate an ECS fargate service auto-scaling config.
@@ -1802,27 +2171,72 @@ class CdkConstructsFactory:
         :param ecs_service: The ECS fargate service.
         :param admin: Whether the ECS service is for admin only.
         :param target_utilization_percent: The target value for memory/CPU utilization across all tasks in the service.
+        :param target_group: The ALB target group the ECS fargate service is attached to, if any.
+        :param requests_per_target: An optional target value for ALB requests (per minute) per ECS task.
+        :param response_time_p90_secs: An optional ALB target response time (p90, in secs) to step scale out above.
         """
         ecs_fargate_scalable_target: ecs.ScalableTaskCount = ecs_service.auto_scale_task_count(
             max_capacity=self_obj.env_meta[self.ECS_SERVICE_MAX_], min_capacity=0
         )
         if not admin and self_obj.env_meta[self.ECS_SERVICE_MAX_] > 1:
+            scale_in_cooldown: Duration = Duration.seconds(self_obj.env_meta[self.ECS_SERVICE_SCALE_IN_COOLDOWN_])
+            scale_out_cooldown: Duration = Duration.seconds(self_obj.env_meta[self.ECS_SERVICE_SCALE_OUT_COOLDOWN_])
+            disable_scale_in: bool = self_obj.env_meta[self.ECS_SERVICE_SCALE_IN_DISABLE_]
             ecs_fargate_scalable_target.scale_on_memory_utilization(
                 id=self.get_construct_id(self_obj, name_props, "ScaleMemory"),
                 target_utilization_percent=target_utilization_percent,
+                disable_scale_in=disable_scale_in,
+                scale_in_cooldown=scale_in_cooldown,
+                scale_out_cooldown=scale_out_cooldown,
             )
             ecs_fargate_scalable_target.scale_on_cpu_utilization(
                 id=self.get_construct_id(self_obj, name_props, "ScaleCpu"),
                 target_utilization_percent=target_utilization_percent,
+                disable_scale_in=disable_scale_in,
+                scale_in_cooldown=scale_in_cooldown,
+                scale_out_cooldown=scale_out_cooldown,
             )
+            if target_group and requests_per_target:
+                # For I/O-bound ECS tasks, which saturate on request concurrency long before CPU/memory
+                ecs_fargate_scalable_target.scale_on_request_count(
+                    id=self.get_construct_id(self_obj, name_props, "ScaleRequestCount"),
+                    requests_per_target=requests_per_target,
+                    target_group=target_group,
+                    disable_scale_in=disable_scale_in,
+                    scale_in_cooldown=scale_in_cooldown,
+                    scale_out_cooldown=scale_out_cooldown,
+                )
+            if target_group and response_time_p90_secs:
+                # Step scale out on slow responses, no ALB requests (i.e. no datapoints) is treated as 0 secs
+                ecs_fargate_scalable_target.scale_on_metric(
+                    id=self.get_construct_id(self_obj, name_props, "ScaleResponseTime"),
+                    metric=cloudwatch.MathExpression(
+                        expression="FILL(m1, 0)",
+                        using_metrics={
+                            "m1": target_group.metrics.target_response_time(period=Duration.minutes(1), statistic="p90")
+                        },
+                        label="TargetResponseTime p90",
+                        period=Duration.minutes(1),
+                    ),
+                    scaling_steps=[
+                        applicationautoscaling.ScalingInterval(change=0, upper=response_time_p90_secs),
+                        applicationautoscaling.ScalingInterval(change=1, lower=response_time_p90_secs),
+                        applicationautoscaling.ScalingInterval(change=2, lower=response_time_p90_secs * 2),
+                    ],
+                    adjustment_type=applicationautoscaling.AdjustmentType.CHANGE_IN_CAPACITY,
+                    cooldown=scale_out_cooldown,
+                    datapoints_to_alarm=2,
+                    evaluation_periods=3,
+                    metric_aggregation_type=applicationautoscaling.MetricAggregationType.MAXIMUM,
+                )
         if getattr(self_obj, self.DEPLOY_ENV_NOT_24_7_):
             schedule_window_ecs: dict = getattr(self_obj, self.SCHEDULE_WINDOW_ECS_)
             ecs_fargate_scalable_target.scale_on_schedule(
                 id=self.get_construct_id(self_obj, name_props + [self.ON_], "ScaleSchedule"),
                 schedule=applicationautoscaling.Schedule.cron(
-                    minute=str(0),
-                    hour=str(schedule_window_ecs[self.START_]),
-                    week_day=schedule_window_ecs[self._START_WEEK_DAYS_],
+                    **self.get_cron_options(
+                        [schedule_window_ecs[self.START_]], schedule_window_ecs[self._START_WEEK_DAYS_]
+                    )
                 ),
                 max_capacity=(
                     self_obj.env_meta[self.ECS_SERVICE_MIN_] if admin else self_obj.env_meta[self.ECS_SERVICE_MAX_]
@@ -1832,9 +2246,7 @@ class CdkConstructsFactory:
             ecs_fargate_scalable_target.scale_on_schedule(
                 id=self.get_construct_id(self_obj, name_props + [self.OFF_], "ScaleSchedule"),
                 schedule=applicationautoscaling.Schedule.cron(
-                    minute=str(0),
-                    hour=str(schedule_window_ecs[self.END_]),
-                    week_day=schedule_window_ecs[self._END_WEEK_DAYS_],
+                    **self.get_cron_options([schedule_window_ecs[self.END_]], schedule_window_ecs[self._END_WEEK_DAYS_])
                 ),
                 max_capacity=0,
                 min_capacity=0,
@@ -1929,9 +2341,9 @@ class CdkConstructsFactory:
             ec_scalable_target.scale_on_schedule(
                 id=self.get_construct_id(self_obj, name_rep_group_props + [self.ON_], "ScaleSchedule"),
                 schedule=applicationautoscaling.Schedule.cron(
-                    minute=str(0),
-                    hour=str(schedule_window_ec_redis[self.START_]),
-                    week_day=schedule_window_ec_redis[self._START_WEEK_DAYS_],
+                    **self.get_cron_options(
+                        [schedule_window_ec_redis[self.START_]], schedule_window_ec_redis[self._START_WEEK_DAYS_]
+                    )
                 ),
                 max_capacity=num_node_groups,
                 min_capacity=1,
@@ -1939,9 +2351,9 @@ class CdkConstructsFactory:
             ec_scalable_target.scale_on_schedule(
                 id=self.get_construct_id(self_obj, name_rep_group_props + [self.OFF_], "ScaleSchedule"),
                 schedule=applicationautoscaling.Schedule.cron(
-                    minute=str(0),
-                    hour=str(schedule_window_ec_redis[self.END_]),
-                    week_day=schedule_window_ec_redis[self._END_WEEK_DAYS_],
+                    **self.get_cron_options(
+                        [schedule_window_ec_redis[self.END_]], schedule_window_ec_redis[self._END_WEEK_DAYS_]
+                    )
                 ),
                 max_capacity=1,
                 min_capacity=1,
@@ -2166,6 +2578,56 @@ class CdkConstructsFactory:
                 lambda_function_cloudwatch_custom=lambda_func_cloudwatch_custom,
             )
 
+    def _elasticache_replication_group_endpoints(
+        self,
+        self_obj,
+        name_props: list[str],
+        replication_group: elasticache.CfnReplicationGroup,
+        desc_insert: str,
+    ) -> None:
+        """
+        Generate an SSM parameter and CfnOutput values, for the endpoints of an ElastiCache replication group.
+
+        :param self_obj: The CDK stack class object.
+        :param name_props: Specific property details to include in the CDK construct ID.
+        :param replication_group: The ElastiCache replication group.
+        :param desc_insert: A description insert, for all descriptions.
+        """
+        host_reader_: str = self.join_sep_under([self.HOST_, self.READER_])
+        host, port = self.get_elasticache_replication_group_endpoint(replication_group)
+        host_reader, _ = self.get_elasticache_replication_group_endpoint(replication_group, is_reader=True)
+        is_cluster_mode: bool = bool(replication_group.cluster_mode == self.ENABLED_)
+        endpoints_props: list[str] = name_props + [self.ENDPOINT_]
+        self.ssm_string_parameter(
+            self_obj,
+            endpoints_props,
+            f"The endpoints of the {desc_insert} for {self.get_attr_word_map_project_name_comp(self_obj)}.",
+            self.get_path([self_obj.stack_name, self.join_sep_score(endpoints_props)], lead=True),
+            json.dumps(
+                {
+                    self.CLUSTER_: is_cluster_mode,
+                    self.HOST_: host,
+                    host_reader_: host_reader,
+                    self.PORT_: port,
+                }
+            ),
+            data_type=ssm.ParameterDataType.TEXT,
+            tier=ssm.ParameterTier.STANDARD,
+        )
+        for i, (v, desc, example_prefix) in {
+            self.HOST_: (host, "configuration", "clustercfg") if is_cluster_mode else (host, "primary", "master"),
+            host_reader_: (
+                (host_reader, "configuration", "clustercfg") if is_cluster_mode else (host_reader, "reader", "replica")
+            ),
+        }.items():
+            CfnOutput(
+                scope=self_obj,
+                id=self.get_construct_id(self_obj, name_props + i.split(self.SEP_UNDER_), self.CFN_OUTPUT_TYPE),
+                description=f"The {desc} endpoint address of the {desc_insert}. "
+                f"For example, {example_prefix}.foobar-ec-redis-rep-group.abcdef.euw2.cache.amazonaws.com.",
+                value=v,
+            )
+
     def _elasticache_replication_group_sanitise_kwargs(
         self,
         replication_group_kwargs: dict[str, str],
@@ -2224,6 +2686,27 @@ class CdkConstructsFactory:
         with open(path, "r", encoding=self.ENCODING) as f:
             return json.load(f)
 
+    def _file_json_load_cdk_custom_outputs_cached(self) -> dict:
+        """
+        Get the (process-wide) cached snapshot of the CDK custom outputs JSON file,
+        re-loading the file only if it's not yet cached, or its mtime has changed since it was cached.
+
+        :return: The cached snapshot, containing the file mtime, the parsed outputs, and the outputs lookup index.
+        """
+        path: str = os.path.abspath(self.cdk_custom_outputs_path)
+        mtime: int = os.stat(path).st_mtime_ns
+        if (cache := self._CDK_CUSTOM_OUTPUTS_CACHE.get(path)) and cache[self.MTIME_] == mtime:
+            self._CDK_CUSTOM_OUTPUTS_CACHE_STATS[self.HITS_] += 1
+            return cache
+        self._CDK_CUSTOM_OUTPUTS_CACHE_STATS[self.MISSES_] += 1
+        outputs: dict = self._file_json_load(path)
+        self._CDK_CUSTOM_OUTPUTS_CACHE[path] = {
+            self.MTIME_: mtime,
+            self.OUTPUTS_: outputs,
+            self.INDEX_: self._get_cdk_custom_outputs_index(outputs),
+        }
+        return self._CDK_CUSTOM_OUTPUTS_CACHE[path]
+
     def _file_read(self, path: str) -> str:
         with open(path, "r", encoding=self.ENCODING) as f:
             return f.read()
@@ -2271,6 +2754,23 @@ class CdkConstructsFactory:
             else (self.MAIN_ if self.get_attr_deploy_env(self_obj) != self.DEV_ else self.DEV_)
         )
 
+    def _get_cdk_custom_outputs_index(self, outputs: dict, keys: tuple[str, ...] = ()) -> dict[tuple[str, ...], str]:
+        """
+        Generate a flat lookup index of the CDK custom outputs, e.g. (stack name, output key) -> output value.
+        Regional outputs are nested one level deeper, e.g. (region, stack name, output key) -> output value.
+
+        :param outputs: The (nested) CDK custom outputs.
+        :param keys: The keys of the parent outputs, if nested.
+        :return: The lookup index.
+        """
+        index: dict[tuple[str, ...], str] = {}
+        for k, v in outputs.items():
+            if isinstance(v, dict):
+                index.update(self._get_cdk_custom_outputs_index(v, keys + (k,)))
+            else:
+                index[keys + (k,)] = v
+        return index
+
     def _get_cdk_stack_image_tag(self, self_obj, project_name_comp: str) -> str:
         """
         Generate a CDK stack image tag.
@@ -2289,6 +2789,47 @@ class CdkConstructsFactory:
             )
         )
 
+    @staticmethod
+    def _get_cloudfront_cache_policy_key(cache_policy_kwargs: dict) -> str:
+        """
+        Get a CloudFront cache policy key, a short hash of the ``_cloudfront_cache_policy`` method kwargs (i.e. the
+        cache key, TTLs and compression), to share (and name) cache policies by their options.
+
+        :param cache_policy_kwargs: The ``_cloudfront_cache_policy`` method kwargs.
+        :return: The CloudFront cache policy key.
+        """
+        return hashlib.sha256(json.dumps(cache_policy_kwargs, sort_keys=True).encode()).hexdigest()[:8]
+
+    def _get_ecs_capacity_provider_strategies(self, self_obj) -> list[ecs.CapacityProviderStrategy]:
+        """
+        Get the ECS Fargate capacity provider strategies, per deploy env type (i.e. preview/demo, internal, otherwise
+        none), see ``ECS_CAPACITY_PROVIDER_STRATEGIES``, if the ECS service is opted in to Fargate Spot (looked up by
+        project name and component and deploy env, then project name and component, then project name, see
+        ``set_factory_ecs_fargate_spot``).
+
+        :param self_obj: The CDK stack class object.
+        :return: The ECS Fargate capacity provider strategies.
+        """
+        project_name_comp: str = self.get_attr_project_name_comp(self_obj, no_custom=True)
+        if getattr(self_obj, self.DEPLOY_ENV_PROD_) or not any(
+            i in getattr(self, self.ECS_FARGATE_SPOT_, [])
+            for i in [
+                self.join_sep_score([project_name_comp, self.get_attr_deploy_env(self_obj)]),
+                project_name_comp,
+                self.get_attr_project_name(self_obj, no_custom=True),
+            ]
+        ):
+            return []
+        deploy_env_type: str = (
+            self.PREVIEW_DEMO_
+            if getattr(self_obj, self.DEPLOY_ENV_PREVIEW_DEMO_, False)
+            else (self.INTERNAL_ if getattr(self_obj, self.DEPLOY_ENV_INTERNAL_, False) else None)
+        )
+        return [
+            ecs.CapacityProviderStrategy(capacity_provider=i, base=j or None, weight=k)
+            for i, j, k in self.ECS_CAPACITY_PROVIDER_STRATEGIES.get(deploy_env_type, [])
+        ]
+
     def _get_factory_pipeline_event_lambda_function_arn(self) -> str:
         return getattr(self, self.PIPELINE_EVENT_LAMBDA_FUNCTION_ARN_)
 
@@ -2302,6 +2843,22 @@ class CdkConstructsFactory:
             return urls[project_name]
         return self.lookup_ms_teams(self.WEBHOOK_URL_CODEPIPELINE_MISC_)
 
+    def _get_naming_context(self, self_obj) -> dict:
+        """
+        Get the naming context of a CDK stack class object, (re-)setting it if not yet set,
+        or if the project name and component, or the deployment env name, have changed since it was set.
+
+        :param self_obj: The CDK stack class object.
+        :return: The naming context.
+        """
+        key: tuple[str, Optional[str]] = (
+            self.get_attr_project_name_comp(self_obj),
+            getattr(self_obj, self.DEPLOY_ENV_, None),
+        )
+        if (context := getattr(self_obj, self._NAMING_CONTEXT_, None)) is None or context[self.KEY_] != key:
+            context = self._set_attr_naming_context(self_obj)
+        return context
+
     def _get_subdomain(
         self, self_obj, comp_subdomain: str, custom_val: str = None, project_subdomain: bool = False
     ) -> str:
@@ -2423,7 +2980,7 @@ class CdkConstructsFactory:
                 #  "RuntimeError: Configure 'allowAllOutbound' directly on the supplied SecurityGroups."
                 # "allow_all_outbound": True if vpc_props else None,  # Cannot configure without configuring a VPC.
                 "allow_public_subnet": bool(vpc_props and vpc_props[2] == ec2.SubnetType.PUBLIC),
-                "architecture": self.lambda_architecture_x86_64(),
+                "architecture": self.lambda_architecture(self_obj, None if docker_image else function_name),
                 # TODO: (OPTIONAL) Look into Code Signing for Lambda functions: https://docs.aws.amazon.com/lambda/latest/dg/configuration-codesigning.html
                 # "code_signing_config": ,  # Default: - Not Sign the Code
                 # "current_version_options": ,  # Default: - default options as described in lambda_.VersionOptions
@@ -3028,6 +3585,35 @@ class CdkConstructsFactory:
                 },
             )
 
+    def _set_attr_naming_context(self, self_obj) -> dict:
+        """
+        Set the naming context of a CDK stack class object: the resolved project name and component props, and
+        CDK construct ID prefix, with the memoized CDK construct IDs and names (reset on each set),
+        and the CDK construct IDs generated so far (kept on each set, to detect duplicate IDs).
+
+        :param self_obj: The CDK stack class object.
+        :return: The naming context.
+        """
+        project_name_comp: str = self.get_attr_project_name_comp(self_obj)
+        deploy_env: Optional[str] = getattr(self_obj, self.DEPLOY_ENV_, None)
+        project_name_comp_props: list[str] = self.get_attr_project_name_comp_props(
+            self_obj, project_name_comp=project_name_comp
+        )
+        context: Optional[dict] = getattr(self_obj, self._NAMING_CONTEXT_, None)
+        setattr(
+            self_obj,
+            self._NAMING_CONTEXT_,
+            {
+                self.KEY_: (project_name_comp, deploy_env),
+                self.PROPS_: project_name_comp_props,
+                self.PREFIX_: [i for i in project_name_comp_props + [deploy_env] if i],
+                self.IDS_: {},
+                self.NAMES_: {},
+                self.ID_: context[self.ID_] if context else set(),
+            },
+        )
+        return getattr(self_obj, self._NAMING_CONTEXT_)
+
     def _set_attrs_ecs_service_cloud_map_service_name(self, self_obj) -> None:
         if not hasattr(self_obj, self.ECS_SERVICE_CLOUD_MAP_SERVICE_NAME_):
             setattr(self_obj, self.ECS_SERVICE_CLOUD_MAP_SERVICE_NAME_, self.ECS_)
@@ -3459,6 +4045,27 @@ class CdkConstructsFactory:
             return env
         sys.exit(f"## {kwargs.get(self.ID_)}: {self.ENV_} arg not set.")
 
+    def cloudfront_cache_policies(self, self_obj) -> dict[str, cloudfront.CachePolicy]:
+        """
+        Generate the CloudFront cache policies shared by all CloudFront distributions (in the AWS account and region),
+        for the OpenAPI docs cache behaviors (see ``CLOUDFRONT_CACHE_BEHAVIORS_OPENAPI``), as cache policies are
+        limited per AWS account.
+
+        :param self_obj: The CDK stack class object.
+        :return: The CloudFront cache policies, by cache policy key (see ``_get_cloudfront_cache_policy_key``).
+        """
+        cache_policies: dict[str, cloudfront.CachePolicy] = {}
+        for cache_policy_kwargs in self.CLOUDFRONT_CACHE_BEHAVIORS_OPENAPI.values():
+            if (key := self._get_cloudfront_cache_policy_key(cache_policy_kwargs)) not in cache_policies:
+                cache_policies[key] = self._cloudfront_cache_policy(
+                    self_obj,
+                    [self.CF_, key],
+                    "all CloudFront distributions (in the AWS account and region)",
+                    global_=True,
+                    **cache_policy_kwargs,
+                )
+        return cache_policies
+
     def cloudfront_distribution(
         self,
         self_obj,
@@ -3471,10 +4078,15 @@ class CdkConstructsFactory:
         desc_insert: str = None,
         domain_names: list[str] = None,
         project_name_comp: str = None,
+        cache_behaviors: dict[str, dict] = None,
     ) -> cloudfront.Distribution:
         """
         Generate a CloudFront distribution, and a Route53 A-record to match.
 
+        By default, nothing is cached (i.e. all requests go to the origin). For cacheable routes, additional cache
+        behaviors (by path pattern, e.g. '/static/*') can be given, each a dict of: 'allowed_methods' (Default: GET and
+        HEAD), and the ``_cloudfront_cache_policy`` method kwargs (i.e. the cache key, TTLs and compression).
+
         :param self_obj: The CDK stack class object.
         :param origin_load_balancer: A load balancer (ALB/NLB) to act as origin for the distribution.
         :param route53_hosted_zone_: The hosted zone where DNS records must be created.
@@ -3485,20 +4097,9 @@ class CdkConstructsFactory:
         :param desc_insert: An optional description insert, for all comments. Defaults to `CdkConstructsFactory.get_attr_word_map_project_name_comp()` method.
         :param domain_names: Alternative domain names for this distribution.
         :param project_name_comp: An optional project name and component to use instead of the CDK stack class default.
+        :param cache_behaviors: Optional additional cache behaviors, by path pattern.
         :return: The CloudFront distribution.
         """
-        # Allow CloudFront to use the KMS key to deliver logs
-        self.get_attr_kms_key_stack(self_obj).add_to_resource_policy(
-            statement=iam.PolicyStatement(
-                actions=[
-                    self.join_sep_colon([self.KMS_, i])
-                    for i in ["Decrypt", self.join_sep_empty(["GenerateDataKey", self.SEP_ASTERISK_])]
-                ],
-                resources=self.ALL_RESOURCES,
-                principals=[self.iam_service_principal(self.join_sep_dot([self.DELIVERY_, self.LOGS_]))],
-            )
-        )
-
         cf_stack_outputs: dict[str, str] = self.get_cloudfront_stack_outputs(
             self_obj.stack_name,
             getattr(self_obj, self.COMPONENT_).capitalize(),
@@ -3508,16 +4109,74 @@ class CdkConstructsFactory:
         name_props: list[str] = [self.CF_]
         name_dist_props: list[str] = name_props + [self.DIST_]
         cdk_stack_name_short: str = self.get_cdk_stack_name_short(self_obj.stack_name).lower()
-        log_bucket_name_prefix_props: list[str] = [cdk_stack_name_short]
-        if self.aws_profile is not None:
-            log_bucket_name_prefix_props.append(self.aws_profile)
 
         if desc_insert is None:
             desc_insert = self.get_attr_word_map_project_name_comp(self_obj)
 
+        realtime_log_config: Optional[cloudfront.RealtimeLogConfig] = self._cloudfront_realtime_log_config(
+            self_obj, name_dist_props, project_name_comp=project_name_comp
+        )
+
+        origin: origins.LoadBalancerV2Origin = origins.LoadBalancerV2Origin(
+            load_balancer=origin_load_balancer,
+            origin_path=origin_path,
+            custom_headers=(
+                {h: s.secret_value_from_json(h).to_string() for h, s in origin_custom_headers}
+                if origin_custom_headers
+                else None
+            ),
+        )
+        origin_request_policy: cloudfront.OriginRequestPolicy = cloudfront.OriginRequestPolicy(
+            scope=self_obj,
+            id=self.get_construct_id(self_obj, name_dist_props, "OriginRequestPolicy"),
+            comment=f"CloudFront distribution origin request policy for {desc_insert}.",
+            cookie_behavior=cloudfront.OriginRequestCookieBehavior.all(),
+            header_behavior=cloudfront.OriginRequestHeaderBehavior.all(),
+            origin_request_policy_name=self.get_construct_name_short(
+                self_obj,
+                name_dist_props + [self.ORIGIN_, "request", self.POLICY_],
+                project_name_comp=project_name_comp,
+            ),
+            query_string_behavior=cloudfront.OriginRequestQueryStringBehavior.all(),
+        )
+
+        # Cache behaviors with the same options share a cache policy (as a limited number per AWS account), either one
+        #  shared by all CloudFront distributions (see ``cloudfront_cache_policies``), or one for this distribution
+        additional_behaviors: dict[str, cloudfront.BehaviorOptions] = {}
+        cache_policies: dict[str, cloudfront.ICachePolicy] = {}
+        cache_policies_shared: dict[str, cloudfront.ICachePolicy] = (
+            self.get_attr_cloudfront_cache_policies(self_obj) if cache_behaviors else {}
+        )
+        for path_pattern, behavior in (cache_behaviors or {}).items():
+            cache_policy_kwargs: dict = {k: v for k, v in behavior.items() if k != "allowed_methods"}
+            cache_policy_key: str = self._get_cloudfront_cache_policy_key(cache_policy_kwargs)
+            if cache_policy_key not in cache_policies:
+                cache_policies[cache_policy_key] = (
+                    cache_policies_shared[cache_policy_key]
+                    if cache_policy_key in cache_policies_shared
+                    else self._cloudfront_cache_policy(
+                        self_obj,
+                        name_dist_props + [cache_policy_key],
+                        desc_insert,
+                        project_name_comp=project_name_comp,
+                        **cache_policy_kwargs,
+                    )
+                )
+            additional_behaviors[path_pattern] = cloudfront.BehaviorOptions(
+                allowed_methods=behavior.get("allowed_methods", cloudfront.AllowedMethods.ALLOW_GET_HEAD),
+                cached_methods=cloudfront.CachedMethods.CACHE_GET_HEAD,
+                cache_policy=cache_policies[cache_policy_key],
+                compress=cache_policy_kwargs.get("compress", True),
+                origin_request_policy=origin_request_policy,
+                realtime_log_config=realtime_log_config,
+                viewer_protocol_policy=cloudfront.ViewerProtocolPolicy.REDIRECT_TO_HTTPS,
+                origin=origin,
+            )
+
         cf_dist: cloudfront.Distribution = cloudfront.Distribution(
             scope=self_obj,
             id=self.get_construct_id(self_obj, name_props, "Distribution"),
+            additional_behaviors=additional_behaviors if additional_behaviors else None,
             default_behavior=cloudfront.BehaviorOptions(
                 allowed_methods=cloudfront.AllowedMethods.ALLOW_ALL,
                 cached_methods=cloudfront.CachedMethods.CACHE_GET_HEAD,
@@ -3542,33 +4201,13 @@ class CdkConstructsFactory:
                 compress=True,
                 # edge_lambdas=,  # Default: - no Lambda functions will be invoked
                 # function_associations=,  # Default: - no functions will be invoked
-                origin_request_policy=cloudfront.OriginRequestPolicy(
-                    scope=self_obj,
-                    id=self.get_construct_id(self_obj, name_dist_props, "OriginRequestPolicy"),
-                    comment=f"CloudFront distribution origin request policy for {desc_insert}.",
-                    cookie_behavior=cloudfront.OriginRequestCookieBehavior.all(),
-                    header_behavior=cloudfront.OriginRequestHeaderBehavior.all(),
-                    origin_request_policy_name=self.get_construct_name_short(
-                        self_obj,
-                        name_dist_props + [self.ORIGIN_, "request", self.POLICY_],
-                        project_name_comp=project_name_comp,
-                    ),
-                    query_string_behavior=cloudfront.OriginRequestQueryStringBehavior.all(),
-                ),
-                # realtime_log_config=,  # TODO: (NEXT) Add real-time logs to monitor, analyze, and take action based on content delivery performance. Default: - none.
+                origin_request_policy=origin_request_policy,
+                realtime_log_config=realtime_log_config,  # Default: - none.
                 # response_headers_policy=,  # Default: - none
                 smooth_streaming=False,  # For distributing media files in the Microsoft Smooth Streaming format
                 # trusted_key_groups=[],  # For validating signed URLs or signed cookies. Default: - no KeyGroups are associated with cache behavior
                 viewer_protocol_policy=cloudfront.ViewerProtocolPolicy.REDIRECT_TO_HTTPS,
-                origin=origins.LoadBalancerV2Origin(
-                    load_balancer=origin_load_balancer,
-                    origin_path=origin_path,
-                    custom_headers=(
-                        {h: s.secret_value_from_json(h).to_string() for h, s in origin_custom_headers}
-                        if origin_custom_headers
-                        else None
-                    ),
-                ),
+                origin=origin,
             ),
             certificate=acm.Certificate.from_certificate_arn(
                 scope=self_obj,
@@ -3593,13 +4232,8 @@ class CdkConstructsFactory:
             # geo_restriction=cloudfront.GeoRestriction.allowlist("UK", "GB"),
             # TODO: (OPTIONAL) Dynamically update geo_restriction list per AWS region deployed to, see: https://docs.aws.amazon.com/cdk/api/v2/python/aws_cdk.aws_cloudfront/GeoRestriction.html#aws_cdk.aws_cloudfront.GeoRestriction
             http_version=cloudfront.HttpVersion.HTTP2,
-            log_bucket=self.s3_bucket(
-                self_obj,
-                self.join_sep_score(log_bucket_name_prefix_props + name_dist_props),
-                bucket_key_enabled=True,
-                lifecycle_rules=True,
-            ),
-            log_file_prefix=self.get_path([cdk_stack_name_short, self.SEP_EMPTY_]),
+            log_bucket=self.get_attr_cloudfront_log_bucket(self_obj),
+            log_file_prefix=self.get_cloudfront_log_file_prefix(cdk_stack_name_short),
             log_includes_cookies=False,
             minimum_protocol_version=cloudfront.SecurityPolicyProtocol.TLS_V1_2_2021,
             price_class=self_obj.price_class,
@@ -3617,6 +4251,130 @@ class CdkConstructsFactory:
         )
         return cf_dist
 
+    def cloudfront_distribution_s3(
+        self,
+        self_obj,
+        s3_bucket: s3.IBucket,
+        origin_path: str = None,
+        origin_shield: bool = False,
+        cf_stack_outputs_inc_comp: bool = True,
+        desc_insert: str = None,
+        domain_names: list[str] = None,
+        enable_ipv6: bool = True,
+        project_name_comp: str = None,
+    ) -> cloudfront.Distribution:
+        """
+        Generate a CloudFront distribution, for static assets in an S3 bucket (i.e. the S3 bucket origin), using an
+        Origin Access Control (OAC), an immutable asset cache policy (with Gzip and Brotli compression), a Cache-Control
+        response headers policy, and HTTP/2 and HTTP/3.
+
+        :param self_obj: The CDK stack class object.
+        :param s3_bucket: The S3 bucket origin.
+        :param origin_path: An optional path CloudFront requests content from in the S3 bucket, e.g. '/assets'.
+        :param origin_shield: True if using Origin Shield (i.e. a caching layer in front of the S3 bucket), in the AWS
+            region nearest the S3 bucket, see: ``get_cloudfront_origin_shield_region``. Default: False
+        :param cf_stack_outputs_inc_comp: True if the CloudFront stack name includes the CDK stack component.
+        :param desc_insert: An optional description insert, for the comments.
+        :param domain_names: Alternative domain names for this distribution.
+        :param enable_ipv6: True if the distribution is enabled for IPv6 requests. Default: True
+        :param project_name_comp: An optional project name and component to use instead of the CDK stack class default.
+        :return: The CloudFront distribution.
+        """
+        cf_stack_outputs: dict[str, str] = self.get_cloudfront_stack_outputs(
+            self_obj.stack_name,
+            getattr(self_obj, self.COMPONENT_).capitalize(),
+            cf_stack_outputs_inc_comp,
+        )
+
+        name_props: list[str] = [self.CF_]
+        name_dist_props: list[str] = name_props + [self.DIST_]
+        cdk_stack_name_short: str = self.get_cdk_stack_name_short(self_obj.stack_name).lower()
+
+        if desc_insert is None:
+            desc_insert = self.get_attr_word_map_project_name_comp(self_obj)
+
+        cf_dist: cloudfront.Distribution = cloudfront.Distribution(
+            scope=self_obj,
+            id=self.get_construct_id(self_obj, name_props, "Distribution"),
+            default_behavior=cloudfront.BehaviorOptions(
+                allowed_methods=cloudfront.AllowedMethods.ALLOW_GET_HEAD,
+                cached_methods=cloudfront.CachedMethods.CACHE_GET_HEAD,
+                cache_policy=self._cloudfront_cache_policy(
+                    self_obj,
+                    name_dist_props + [self.IMMUTABLE_],
+                    desc_insert,
+                    project_name_comp=project_name_comp,
+                    **self.CLOUDFRONT_CACHE_BEHAVIOR_IMMUTABLE,
+                ),
+                compress=True,
+                realtime_log_config=self._cloudfront_realtime_log_config(
+                    self_obj, name_dist_props, project_name_comp=project_name_comp
+                ),
+                response_headers_policy=self._cloudfront_response_headers_policy_cache_control(
+                    self_obj,
+                    name_dist_props + [self.IMMUTABLE_],
+                    desc_insert,
+                    self.CLOUDFRONT_CACHE_CONTROL_IMMUTABLE,
+                    project_name_comp=project_name_comp,
+                ),
+                viewer_protocol_policy=cloudfront.ViewerProtocolPolicy.REDIRECT_TO_HTTPS,
+                origin=self.cloudfront_origin_s3(
+                    self_obj, s3_bucket, origin_path=origin_path, origin_shield=origin_shield
+                ),
+            ),
+            certificate=acm.Certificate.from_certificate_arn(
+                scope=self_obj,
+                id=self.get_construct_id(self_obj, name_dist_props, "ICertificate"),
+                certificate_arn=cf_stack_outputs[self.cfn_output_acm_cert_construct_id(self_obj, is_key=True)],
+            ),
+            comment=f"CloudFront distribution for {desc_insert}, origin pointing to an S3 bucket.",
+            domain_names=domain_names if domain_names else [self_obj.fqdn],
+            enabled=True,
+            enable_ipv6=enable_ipv6,
+            enable_logging=True,
+            http_version=cloudfront.HttpVersion.HTTP2_AND_3,
+            log_bucket=self.get_attr_cloudfront_log_bucket(self_obj),
+            log_file_prefix=self.get_cloudfront_log_file_prefix(cdk_stack_name_short),
+            log_includes_cookies=False,
+            minimum_protocol_version=cloudfront.SecurityPolicyProtocol.TLS_V1_2_2021,
+            price_class=self_obj.price_class,
+            web_acl_id=cf_stack_outputs[self.cfn_output_cf_waf_web_acl_construct_id(self_obj, is_key=True)],
+        )
+        return cf_dist
+
+    def cloudfront_origin_s3(
+        self,
+        self_obj,
+        s3_bucket: s3.IBucket,
+        origin_path: str = None,
+        origin_shield: bool = False,
+    ) -> cloudfront.IOrigin:
+        """
+        Generate a CloudFront origin, for an S3 bucket, using an Origin Access Control (OAC).
+
+        The S3 bucket policy (for the OAC) of an imported S3 bucket (e.g. by name, from another CDK stack) is in its CDK
+        stack, see: ``iam_policy_statement_s3_cloudfront_origin_access_control``.
+
+        :param self_obj: The CDK stack class object.
+        :param s3_bucket: The S3 bucket origin.
+        :param origin_path: An optional path CloudFront requests content from in the S3 bucket, e.g. '/assets'.
+        :param origin_shield: True if using Origin Shield (i.e. a caching layer in front of the S3 bucket), in the AWS
+            region nearest the S3 bucket, see: ``get_cloudfront_origin_shield_region``. Default: False
+        :return: The CloudFront origin.
+        """
+        if not isinstance(s3_bucket, s3.Bucket):
+            Annotations.of(self_obj).acknowledge_warning(
+                "@aws-cdk/aws-cloudfront-origins:updateImportedBucketPolicyOac"
+            )
+        origin_shield_region: Optional[str] = self.get_cloudfront_origin_shield_region() if origin_shield else None
+        return origins.S3BucketOrigin.with_origin_access_control(
+            bucket=s3_bucket,
+            origin_access_levels=[cloudfront.AccessLevel.READ],
+            origin_path=origin_path,
+            origin_shield_enabled=bool(origin_shield_region),
+            origin_shield_region=origin_shield_region,
+        )
+
     def cloudfront_waf_ip_set_ipv4(
         self, self_obj, name_props: list[str], addresses: list[str], description: str
     ) -> waf.CfnIPSet:
@@ -3971,16 +4729,23 @@ class CdkConstructsFactory:
         self,
         project_name_comp: str,
         base_ignore: bool = False,
+        architecture: str = None,
     ) -> codebuild.BuildEnvironment:
         """
         Generate a CodeBuild build environment.
 
         :param project_name_comp: The project name and component to use instead of the CDK stack class default.
         :param base_ignore: True if we are to ignore the fact that a project_name includes the substring 'base'.
+        :param architecture: The CPU architecture of the build (e.g. of the Docker images built), 'arm64' for an ARM
+            (Graviton) build image. Default: 'x86_64'.
         :return: The CodeBuild build environment.
         """
         return codebuild.BuildEnvironment(
-            build_image=codebuild.LinuxBuildImage.STANDARD_7_0,
+            build_image=(
+                codebuild.LinuxArmBuildImage.AMAZON_LINUX_2_STANDARD_3_0
+                if architecture == self.ARM64_
+                else codebuild.LinuxBuildImage.STANDARD_7_0
+            ),
             # certificate=,  # Default: - No PEM-encoded certificate is added to the project
             compute_type=(
                 codebuild.ComputeType.MEDIUM
@@ -4561,6 +5326,71 @@ class CdkConstructsFactory:
             repository_name=self.get_path([self.organisation, project_name_comp]),
         )
 
+    def ecs_cluster(self, self_obj, name_props: list[str], fqdn: str) -> ecs.Cluster:
+        """
+        Generate an ECS cluster, for a single ECS service, with a default Cloud Map namespace.
+
+        :param self_obj: The CDK stack class object.
+        :param name_props: Specific property details to include in the CDK construct ID.
+        :param fqdn: The Fully Qualified Domain Name (FQDN) to be the name for the ECS CloudMap name space.
+        :return: The ECS cluster.
+        """
+        return ecs.Cluster(
+            scope=self_obj,
+            id=self.get_construct_id(self_obj, name_props, "Cluster"),
+            cluster_name=self.get_construct_name_short(self_obj, name_props),
+            container_insights=True,
+            default_cloud_map_namespace=ecs.CloudMapNamespaceOptions(
+                name=fqdn, type=servicediscovery.NamespaceType.DNS_PRIVATE, vpc=self.get_attr_vpc(self_obj)
+            ),
+            enable_fargate_capacity_providers=True,
+            execute_command_configuration=self._ecs_cluster_execute_command_configuration(
+                self_obj,
+                name_props,
+                self.join_sep_score(
+                    self.get_attr_project_name_comp_props(self_obj) + [self.get_attr_deploy_env(self_obj)]
+                ),
+                self.get_attr_kms_key_stack(self_obj),
+            ),  # Config for ECS Exec debugging
+            vpc=self.get_attr_vpc(self_obj),
+        )
+
+    def ecs_clusters(self, self_obj, vpc: ec2.IVpc) -> dict[str, ecs.Cluster]:
+        """
+        Generate the shared ECS clusters (see ``set_factory_ecs_clusters_shared``), each joined by the ECS services of a
+        project and deploy env, of a project, or all ECS services (in the AWS account and region).
+
+        NB. Without a default Cloud Map namespace, as each ECS service keeps its own. ECS Exec session logs go to a KMS
+        encrypted log group per shared ECS cluster, as per an ECS cluster for a single ECS service.
+
+        :param self_obj: The CDK stack class object.
+        :param vpc: The VPC, where the ECS services of the shared ECS clusters are.
+        :return: The shared ECS clusters, by shared ECS cluster key.
+        """
+        clusters: dict[str, ecs.Cluster] = {}
+        for k in getattr(self, self.ECS_CLUSTERS_SHARED_, []):
+            cluster_name: str = self.get_ecs_cluster_shared_name(self_obj, key=k)
+            clusters[k] = ecs.Cluster(
+                scope=self_obj,
+                id=self.get_construct_id(self_obj, [k, self.ECS_], "Cluster"),
+                cluster_name=cluster_name,
+                container_insights=True,
+                enable_fargate_capacity_providers=True,
+                execute_command_configuration=self._ecs_cluster_execute_command_configuration(
+                    self_obj,
+                    [cluster_name],
+                    cluster_name,
+                    self._kms_key(
+                        self_obj,
+                        [cluster_name, self.EXECUTE_, self.COMMAND_],
+                        f"Shared ECS cluster '{cluster_name}' ECS Exec",
+                        enable_key_rotation=True,
+                    ),
+                ),  # Config for ECS Exec debugging
+                vpc=vpc,
+            )
+        return clusters
+
     def ecs_fargate_service(
         self,
         self_obj,
@@ -4572,6 +5402,8 @@ class CdkConstructsFactory:
         dependant_constructs: list[Resource] = None,
         target_group: elasticloadbalancing.ApplicationTargetGroup = None,
         admin: bool = False,
+        requests_per_target: int = None,
+        response_time_p90_secs: float = None,
     ) -> ecs.FargateService:
         """
         Generate an ECS fargate service.
@@ -4585,13 +5417,30 @@ class CdkConstructsFactory:
         :param dependant_constructs: A list of CDK constructs which are dependencies of the CDK construct being generated.
         :param target_group: An ALB target group to attach the ECS fargate service to.
         :param admin: True if the ECS service is for admin only.
+        :param requests_per_target: An optional target value for ALB requests (per minute) per ECS task, to auto-scale on.
+        :param response_time_p90_secs: An optional ALB target response time (p90, in secs), to step scale out above.
         :return: The ECS fargate service.
         """
         self._set_attrs_ecs_service_cloud_map_service_name(self_obj)
         name_props: list[str] = [getattr(self_obj, self.ECS_SERVICE_CLOUD_MAP_SERVICE_NAME_)]
         security_groups: list[ec2.SecurityGroup] = [getattr(self_obj, self.ECS_SG_)]
-        name_execute_command_props: list[str] = name_props + [self.EXECUTE_, self.COMMAND_]
-        execute_command_key: kms.Key = self.get_attr_kms_key_stack(self_obj)
+        cloud_map_namespace: servicediscovery.PrivateDnsNamespace = None
+        if cluster_shared_key := self.get_ecs_cluster_shared_key(self_obj):
+            # Join the shared ECS cluster (see ``ecs_clusters``), keeping a Cloud Map namespace per ECS service,
+            #  so the ECS service (private DNS) names are unchanged. The ECS cluster (from the VPC CDK stack) gives
+            #  the ECS service a CDK stack dependency, and the ECS Exec config (i.e. the task role KMS and logs grants)
+            cluster: ecs.ICluster = self.get_attr_ecs_clusters(self_obj)[cluster_shared_key]
+            cloud_map_namespace = servicediscovery.PrivateDnsNamespace(
+                scope=self_obj,
+                id=self.get_construct_id(self_obj, name_props, "PrivateDnsNamespace"),
+                name=fqdn,
+                vpc=self.get_attr_vpc(self_obj),
+            )
+        else:
+            cluster: ecs.ICluster = self.ecs_cluster(self_obj, name_props, fqdn)
+        capacity_provider_strategies: list[ecs.CapacityProviderStrategy] = self._get_ecs_capacity_provider_strategies(
+            self_obj
+        )
         ecs_service: ecs.FargateService = ecs.FargateService(
             scope=self_obj,
             id=self.get_construct_id(self_obj, name_props, "FargateService"),
@@ -4600,46 +5449,13 @@ class CdkConstructsFactory:
             platform_version=ecs.FargatePlatformVersion.VERSION1_4,
             security_groups=security_groups,
             vpc_subnets=ec2.SubnetSelection(subnet_type=ec2.SubnetType.PRIVATE_WITH_EGRESS),
-            cluster=ecs.Cluster(
-                scope=self_obj,
-                id=self.get_construct_id(self_obj, name_props, "Cluster"),
-                cluster_name=self.get_construct_name_short(self_obj, name_props),
-                container_insights=True,
-                default_cloud_map_namespace=ecs.CloudMapNamespaceOptions(
-                    name=fqdn, type=servicediscovery.NamespaceType.DNS_PRIVATE, vpc=self.get_attr_vpc(self_obj)
-                ),
-                enable_fargate_capacity_providers=False,
-                execute_command_configuration=ecs.ExecuteCommandConfiguration(
-                    kms_key=execute_command_key,
-                    log_configuration=ecs.ExecuteCommandLogConfiguration(
-                        cloud_watch_encryption_enabled=True,
-                        cloud_watch_log_group=self.logs_log_group(
-                            self_obj,
-                            name_execute_command_props,
-                            self.get_path(
-                                [
-                                    self.log_groups[self.ECS_],
-                                    self.join_sep_score(
-                                        self.get_attr_project_name_comp_props(self_obj)
-                                        + [self.get_attr_deploy_env(self_obj)]
-                                    ),
-                                    self.join_sep_score(name_execute_command_props),
-                                ]
-                            ),
-                            encryption_key=execute_command_key,
-                        ),
-                        # s3_bucket=,  # Default: - none
-                        # s3_encryption_enabled=,  # Default: - encryption will be disabled.
-                        # s3_key_prefix=,  # Default: - none
-                    ),
-                    logging=ecs.ExecuteCommandLogging.OVERRIDE,
-                ),  # Config for ECS Exec debugging
-                vpc=self.get_attr_vpc(self_obj),
-            ),
-            # capacity_provider_strategies=,  # Capacity Provider strategies used to place a service.
+            cluster=cluster,
+            capacity_provider_strategies=(
+                capacity_provider_strategies if capacity_provider_strategies else None
+            ),  # Default: - the FARGATE launch type (i.e. on-demand)
             # circuit_breaker=,  # Enable the deployment circuit breaker.
             cloud_map_options=ecs.CloudMapOptions(
-                # cloud_map_namespace=,  # Default: - the default_cloud_map_namespace associated to the cluster
+                cloud_map_namespace=cloud_map_namespace,  # Default: - the default_cloud_map_namespace of the cluster
                 # container=,  # Default: - the task definition’s default container
                 # container_port=,  # Default: - the default port of the ECS task definition’s default container
                 dns_record_type=servicediscovery.DnsRecordType.A,
@@ -4770,7 +5586,21 @@ class CdkConstructsFactory:
             # TODO: (NEXT) Look to replace with ``listener.addTargets()``, for more detail,
             #  see ``ecs_service.attach_to_application_target_group()`` method description
             ecs_service.attach_to_application_target_group(target_group)
-        self._ecs_fargate_service_auto_scaling(self_obj, name_props, ecs_service, admin)
+            if any(
+                i.capacity_provider == self.ECS_CAPACITY_PROVIDER_FARGATE_SPOT_ for i in capacity_provider_strategies
+            ):
+                # Fargate Spot tasks get a 2 minute interruption notice, drain (i.e. deregister) from the ALB target
+                #  group within it
+                target_group.set_attribute(key="deregistration_delay.timeout_seconds", value=str(90))
+        self._ecs_fargate_service_auto_scaling(
+            self_obj,
+            name_props,
+            ecs_service,
+            admin,
+            target_group=target_group,
+            requests_per_target=requests_per_target,
+            response_time_p90_secs=response_time_p90_secs,
+        )
         return ecs_service
 
     def ecs_fargate_service_task_definition(
@@ -4800,7 +5630,11 @@ class CdkConstructsFactory:
             # pid_mode=,  # Not supported in Fargate.
             # placement_constraints=,  # Not supported in Fargate.
             runtime_platform=ecs.RuntimePlatform(
-                cpu_architecture=ecs.CpuArchitecture.X86_64,
+                cpu_architecture=(
+                    ecs.CpuArchitecture.ARM64
+                    if self.get_architecture(self_obj) == self.ARM64_
+                    else ecs.CpuArchitecture.X86_64
+                ),
                 operating_system_family=ecs.OperatingSystemFamily.LINUX,
             ),
             execution_role=execution_role,
@@ -5002,22 +5836,42 @@ class CdkConstructsFactory:
         auth_token_secret: secretsmanager.Secret,
         ec_redis_auto_scaling_custom: bool = None,
         ec_redis_instance_type_custom: str = None,
+        ec_redis_shards_custom: int = None,
         engine_version: str = "6.x",
         num_node_groups_max: int = 1,
     ) -> elasticache.CfnReplicationGroup:
         """
         Generate an ElastiCache replication group.
 
+        With more than 1 shard (i.e. node group), the replication group is cluster mode enabled,
+          and changes to the number of shards (i.e. 2 or more) are applied with online resharding.
+
+        IMPORTANT: Cluster mode (i.e. 1 shard to more, or back) cannot be changed on a deployed replication group.
+          CloudFormation cannot replace it (as the replication group ID is fixed), and an in place migration (i.e. the
+          cluster mode 'compatible', then 'enabled') needs Redis 7+ (i.e. not the "6.x" engine version).
+          To change it: destroy the consumer CDK stacks (as they import the cache endpoints), then the cache CDK stack,
+          and deploy them again with the new number of shards. NB. The cached data is not kept (i.e. a cold cache).
+          Cluster mode enabled replication groups cannot use the custom auto start/stop (i.e. must be 24/7, or use
+          ``ec_redis_auto_scaling_custom=False``).
+
         :param self_obj: The CDK stack class object.
         :param auth_token_secret: The secret storing the password used to access a password protected server.
         :param ec_redis_auto_scaling_custom: If not None, use a custom auto-scaling option.
         :param ec_redis_instance_type_custom: If not None, use a custom instance cache node type option.
+        :param ec_redis_shards_custom: If not None, use a custom number of shards (node groups) option, for the staging
+            and prod deploy envs only (as for Gw projects, see: ``get_deploy_envs_meta``).
         :param engine_version: The version number of the cache engine to be used for the clusters in this replication group. Default: "6.x".
         :param num_node_groups_max: An optional maximum number of node groups (shards) for
             this ElastiCache (cluster mode enabled) replication group.
         :return: The ElastiCache replication group.
         """
         replicas: int = self_obj.env_meta[self.EC_REDIS_REPLICAS_]
+        shards: int = (
+            ec_redis_shards_custom
+            if ec_redis_shards_custom and self.get_attr_deploy_env(self_obj) in self.STAG_PROD_LIST
+            else self_obj.env_meta[self.EC_REDIS_SHARDS_]
+        )
+        is_cluster_mode: bool = bool(max(shards, num_node_groups_max) > 1)
         security_groups: list[ec2.SecurityGroup] = [getattr(self_obj, self.EC_REDIS_SG_)]
         cache_parameter_group_family: str = f"redis{engine_version}"
         parameter_group: elasticache.CfnParameterGroup = elasticache.CfnParameterGroup(
@@ -5026,7 +5880,8 @@ class CdkConstructsFactory:
             cache_parameter_group_family=cache_parameter_group_family,
             description=f"ElastiCache Redis cluster parameter group for '{cache_parameter_group_family}'.",
             properties={
-                "notify-keyspace-events": "AKE"  # https://repost.aws/knowledge-center/elasticache-redis-keyspace-notifications
+                **({"cluster-enabled": "yes"} if is_cluster_mode else {}),
+                "notify-keyspace-events": "AKE",  # https://repost.aws/knowledge-center/elasticache-redis-keyspace-notifications
             },
         )
         replication_group_props: list[str] = [self.REPLICATION_, self.GROUP_]
@@ -5073,6 +5928,7 @@ class CdkConstructsFactory:
             ),
             "cache_parameter_group_name": parameter_group.ref,  # f"default.redis{engine_version}"
             "cache_subnet_group_name": subnet_group.cache_subnet_group_name,  # For HIPAA compliance
+            **({"cluster_mode": self.ENABLED_} if is_cluster_mode else {}),
             "engine": self.REDIS_.capitalize(),
             "engine_version": engine_version,
             # "global_replication_group_id": ,  # The name of the Global datastore.
@@ -5117,14 +5973,21 @@ class CdkConstructsFactory:
             ).topic_arn,
             # "num_cache_clusters": len(getattr(self_obj, self.vpc).availability_zones),
             # Cannot define num_cache_clusters with: num_node_groups, replicas_per_node_group or node_group_configuration
-            "num_node_groups": 1,
+            "num_node_groups": shards,
             "port": getattr(self_obj, self.REDIS_PORT_),
-            "preferred_cache_cluster_a_zs": (
-                self.get_attr_vpc(self_obj).availability_zones[
-                    : (len(self.get_attr_vpc(self_obj).availability_zones) - diff)
-                ]
-                if (diff := len(self.get_attr_vpc(self_obj).availability_zones) > (1 + replicas))
-                else self.get_attr_vpc(self_obj).availability_zones
+            # Not used with more than 1 node group (shard), and node_group_configuration prevents online resharding
+            **(
+                {}
+                if is_cluster_mode
+                else {
+                    "preferred_cache_cluster_a_zs": (
+                        self.get_attr_vpc(self_obj).availability_zones[
+                            : (len(self.get_attr_vpc(self_obj).availability_zones) - diff)
+                        ]
+                        if (diff := len(self.get_attr_vpc(self_obj).availability_zones) > (1 + replicas))
+                        else self.get_attr_vpc(self_obj).availability_zones
+                    )
+                }
             ),
             "preferred_maintenance_window": getattr(
                 self_obj, self.SCHEDULE_WINDOW_ELASTICACHE_WEEKLY_MAINTENANCE_TIMESTAMP_
@@ -5154,9 +6017,12 @@ class CdkConstructsFactory:
         if dependant_constructs:
             for i in dependant_constructs:
                 replication_group.node.add_dependency(i)
-        if num_node_groups_max > 1 and replication_group.cache_parameter_group_name.endswith(
-            self.join_sep_empty([self.SEP_DOT_, self.CLUSTER_, self.SEP_DOT_, self.ON_])
-        ):
+        if is_cluster_mode:
+            replication_group.cfn_options.update_policy = CfnUpdatePolicy(use_online_resharding=True)
+        self._elasticache_replication_group_endpoints(
+            self_obj, self_obj.ec_redis_props, replication_group, replication_group_desc_prefix
+        )
+        if num_node_groups_max > shards:
             self._elasticache_replication_group_auto_scaling(
                 self_obj, self_obj.ec_redis_props, replication_group, replication_group_props, num_node_groups_max
             )
@@ -5165,6 +6031,11 @@ class CdkConstructsFactory:
             if ec_redis_auto_scaling_custom is None
             else ec_redis_auto_scaling_custom
         ):
+            if is_cluster_mode:
+                sys.exit(
+                    f"## Cannot auto start/stop the cluster mode enabled ({shards} shards) ElastiCache Redis replication "
+                    f"group, for CDK stack '{self_obj.stack_name}' (use 1 shard, or `ec_redis_auto_scaling_custom=False`)."
+                )
             self._elasticache_replication_group_auto_scaling_custom(
                 self_obj,
                 self_obj.ec_redis_props,
@@ -5341,9 +6212,42 @@ class CdkConstructsFactory:
             ]
         )
 
-    def events_event_pattern_s3_object_created(self, s3_bucket_arn: str) -> events.EventPattern:
+    def events_event_pattern_s3_object_created(
+        self,
+        s3_bucket_arn: str,
+        prefixes: list[str] = None,
+        suffixes: list[str] = None,
+        size_range: tuple[Optional[int], Optional[int]] = None,
+    ) -> events.EventPattern:
+        """
+        Generate an Events pattern, for S3 object created events (from an S3 bucket, with EventBridge notifications),
+        optionally filtered by S3 object key and size, so unwanted events are dropped by EventBridge (i.e. before
+        invoking any targets).
+
+        :param s3_bucket_arn: The S3 bucket ARN.
+        :param prefixes: Optional S3 object key prefixes, to match any of.
+        :param suffixes: Optional S3 object key suffixes, to match any of (and any of the prefixes, if set).
+        :param size_range: Optional min. and/or max. S3 object size (in bytes), e.g. (1, None).
+        :return: The Events pattern.
+        """
+        obj_filters: dict[str, list] = {}
+        if prefixes and suffixes:
+            # An EventBridge content filter can't match both a prefix and a suffix of the same field, use a wildcard
+            obj_filters[self.KEY_] = [
+                {self.WILDCARD_: self.join_sep_empty([i.replace("*", "\\*"), "*", j.replace("*", "\\*")])}
+                for i in prefixes
+                for j in suffixes
+            ]
+        elif prefixes or suffixes:
+            obj_filters[self.KEY_] = [{self.PREFIX_: i} for i in prefixes or []] + [
+                {self.SUFFIX_: i} for i in suffixes or []
+            ]
+        if size_range and any(i is not None for i in size_range):
+            obj_filters[self.SIZE_] = [
+                {self.NUMERIC_: [k for i, j in zip([">=", "<="], size_range) if j is not None for k in [i, j]]}
+            ]
         return events.EventPattern(
-            detail={self.REASON_: ["PutObject"]},
+            detail={self.REASON_: ["PutObject"], **({self.OBJECT_: obj_filters} if obj_filters else {})},
             detail_type=["Object Created"],
             resources=[s3_bucket_arn],
             source=[self.join_sep_dot([self.AWS_, self.S3_])],
@@ -5368,7 +6272,12 @@ class CdkConstructsFactory:
         )
 
     def file_json_load_cdk_custom_outputs(self) -> dict:
-        return self._file_json_load(self.cdk_custom_outputs_path)
+        """
+        Get the parsed CDK custom outputs JSON file, from the process-wide cache (to be treated as read-only).
+
+        :return: The CDK custom outputs.
+        """
+        return self._file_json_load_cdk_custom_outputs_cached()[self.OUTPUTS_]
 
     def file_yaml_safe_load_codebuild_buildspec(self, buildspec_path: str) -> codebuild.BuildSpec:
         with open(buildspec_path, "r", encoding=self.ENCODING) as f:
@@ -5399,6 +6308,7 @@ class CdkConstructsFactory:
             resource_name = self.SEP_ASTERISK_
         arn_format: ArnFormat = {
             self.ACM_: ArnFormat.SLASH_RESOURCE_NAME,
+            self.CF_: ArnFormat.SLASH_RESOURCE_NAME,
             self.CLOUDFORMATION_: ArnFormat.SLASH_RESOURCE_NAME,
             self.CODEBUILD_: ArnFormat.SLASH_RESOURCE_NAME,
             self.EC2_: ArnFormat.SLASH_RESOURCE_NAME,
@@ -5420,7 +6330,7 @@ class CdkConstructsFactory:
             arn_format=arn_format,
             resource_name=resource_name if arn_format != ArnFormat.NO_RESOURCE_NAME else None,
             account=self.SEP_EMPTY_ if service == self.S3_ else account,
-            region=self.SEP_EMPTY_ if service == self.S3_ else region,
+            region=self.SEP_EMPTY_ if service in [self.CF_, self.S3_] else region,
         )
 
     def format_database_server(self, database_server: str, hyphen_sep: bool = False) -> str:
@@ -5439,9 +6349,54 @@ class CdkConstructsFactory:
             else ([self.DEV_] if deploy_env == self.STAGING_ else [])
         )
 
+    def get_architecture(self, self_obj, function_name: str = None, project_name_comp: str = None) -> str:
+        """
+        Get the CPU architecture (i.e. 'arm64' or 'x86_64'), as per the architecture policy (see
+        ``set_factory_architectures``), looked up by Lambda function name, then project name and component, then
+        project name. Default: 'x86_64'.
+
+        :param self_obj: The CDK stack class object.
+        :param function_name: An optional Lambda function name.
+        :param project_name_comp: The project name and component to use instead of the CDK stack class default.
+        :return: The CPU architecture.
+        """
+        architectures: dict[str, str] = getattr(self, self.ARCHITECTURES_, {})
+        for k in (
+            [function_name, project_name_comp, self.get_attr_project_name(self_obj)]
+            if project_name_comp
+            else [function_name, self.get_attr_project_name_comp(self_obj), self.get_attr_project_name(self_obj)]
+        ):
+            if k and k in architectures:
+                return architectures[k]
+        return self.X86_64_
+
+    def get_attr_cloudfront_cache_policies(self, self_obj) -> dict[str, cloudfront.ICachePolicy]:
+        if (cache_policies := getattr(self_obj, self.CLOUDFRONT_CACHE_POLICIES_, None)) is None:
+            sys.exit(
+                f"## Cannot find the shared CloudFront cache policies, for CDK stack '{self_obj.stack_name}' "
+                f"(see: `CdkVpcSihStack.set_attrs_cloudfront_cache_policies`)."
+            )
+        return cache_policies
+
+    def get_attr_cloudfront_log_bucket(self, self_obj) -> s3.IBucket:
+        if (log_bucket := getattr(self_obj, self.CLOUDFRONT_LOG_BUCKET_, None)) is None:
+            sys.exit(
+                f"## Cannot find the shared CloudFront log bucket, for CDK stack '{self_obj.stack_name}' "
+                f"(see: `CdkVpcSihStack.set_attrs_cloudfront_log_bucket`)."
+            )
+        return log_bucket
+
     def get_attr_deploy_env(self, self_obj):
         return getattr(self_obj, self.DEPLOY_ENV_)
 
+    def get_attr_ecs_clusters(self, self_obj) -> dict[str, ecs.Cluster]:
+        if (clusters := getattr(self_obj, self.ECS_CLUSTERS_, None)) is None:
+            sys.exit(
+                f"## Cannot find the shared ECS clusters, for CDK stack '{self_obj.stack_name}' "
+                f"(see: `CdkVpcSihStack.set_attrs_ecs_clusters`)."
+            )
+        return clusters
+
     def get_attr_env_account(self, self_obj) -> str:
         return getattr(self_obj, self.ENV_).account
 
@@ -5580,6 +6535,25 @@ class CdkConstructsFactory:
             return self._CF_PRICE_CLASS_DEFAULT
         return self._REGION_META[self.region][self._CF_PRICE_CLASS_]
 
+    def get_cloudfront_log_file_prefix(self, distribution_name: str) -> str:
+        """
+        Get the CloudFront (standard) logs prefix, in the shared log bucket, partitioned by distribution. The log files
+        are named by CloudFront with the distribution ID, date and hour (i.e. '<ID>.YYYY-MM-DD-HH.<unique ID>.gz').
+
+        :param distribution_name: The distribution name, e.g. the short CDK stack name.
+        :return: The CloudFront logs prefix.
+        """
+        return self.get_path([distribution_name, self.SEP_EMPTY_])
+
+    def get_cloudfront_origin_shield_region(self) -> Optional[str]:
+        """
+        Get the CloudFront Origin Shield region, for origins in the AWS region (i.e. the nearest region with Origin
+        Shield), see: https://docs.aws.amazon.com/AmazonCloudFront/latest/DeveloperGuide/origin-shield.html
+
+        :return: The CloudFront Origin Shield region, or None if Origin Shield is not available.
+        """
+        return self._REGION_META[self.region][self._CF_ORIGIN_SHIELD_REGION_]
+
     def get_cloudfront_stack_outputs(self, stack_name: str, comp_upper: str, inc_comp: bool) -> dict[str, str]:
         if comp_upper is None:
             comp_upper = self.lookup_word_map(self.SERVER_)
@@ -5588,6 +6562,25 @@ class CdkConstructsFactory:
             replacement = self.join_sep_empty([comp_upper, replacement])
         return self.file_json_load_cdk_custom_outputs()[stack_name.replace(comp_upper, replacement, 1)]
 
+    def get_cdk_custom_output(self, *keys: str) -> str:
+        """
+        Get a CDK custom output value, from the lookup index of the process-wide cache.
+
+        :param keys: The keys of the output, e.g. (stack name, output key), or (region, stack name, output key).
+        :return: The CDK custom output value.
+        """
+        if (value := self._file_json_load_cdk_custom_outputs_cached()[self.INDEX_].get(keys)) is None:
+            sys.exit(f"## Cannot find CDK custom output {keys} in '{self.cdk_custom_outputs_path}'.")
+        return value
+
+    def get_cdk_custom_outputs_cache_stats(self) -> dict[str, int]:
+        """
+        Get the hit/miss counts of the process-wide CDK custom outputs cache.
+
+        :return: The cache stats.
+        """
+        return dict(self._CDK_CUSTOM_OUTPUTS_CACHE_STATS)
+
     def get_construct_id(
         self,
         self_obj,
@@ -5603,10 +6596,26 @@ class CdkConstructsFactory:
         :param construct_type: The CDK construct class name (e.g. for the 'aws_cdk.aws_s3.Bucket' construct, specify 'Bucket').
         :return: The CDK construct ID.
         """
-        method_name: str = self.get_construct_id.__name__
-        if hasattr(self_obj.__class__, method_name) and callable(getattr(self_obj.__class__, method_name)):
-            return self_obj.get_construct_id(construct_id_props, construct_type, **kwargs)
-        return self.get_construct_id_default(self_obj, construct_id_props, construct_type, **kwargs)
+        cls: type = self_obj.__class__
+        if (is_custom := self._CONSTRUCT_ID_METHODS.get(cls)) is None:
+            method_name: str = self.get_construct_id.__name__
+            is_custom = hasattr(cls, method_name) and callable(getattr(cls, method_name))
+            self._CONSTRUCT_ID_METHODS[cls] = is_custom
+        construct_id: str = (
+            self_obj.get_construct_id(construct_id_props, construct_type, **kwargs)
+            if is_custom
+            else self.get_construct_id_default(self_obj, construct_id_props, construct_type, **kwargs)
+        )
+        # Detect a duplicate CDK construct ID here, with the props it was generated from, instead of deep inside jsii.
+        #  Only a repeated ID (for the CDK stack class object) is looked up, as IDs can be generated more than once.
+        construct_ids: set[str] = self._get_naming_context(self_obj)[self.ID_]
+        if construct_id in construct_ids and self_obj.node.try_find_child(construct_id) is not None:
+            sys.exit(
+                f"## Duplicate CDK construct ID '{construct_id}' in '{self_obj.node.path}', "
+                f"for construct ID props: {construct_id_props}, and construct type: '{construct_type}'."
+            )
+        construct_ids.add(construct_id)
+        return construct_id
 
     def get_construct_id_default(
         self,
@@ -5630,29 +6639,28 @@ class CdkConstructsFactory:
         :param lambda_layer: True if ID is for a Lambda layer.
         :return: The CDK construct ID.
         """
+        context: dict = self._get_naming_context(self_obj)
+        key: tuple = (tuple(construct_id_props), construct_type, project_name_comp, deploy_env, global_, lambda_layer)
+        if (construct_id := context[self.IDS_].get(key)) is not None:
+            return construct_id
         props: list[str] = [self.CDK_STACK_PREFIX]
         if global_:
             props.append(self.get_attr_env_region(self_obj))
-        is_not_lambda_layer: bool = bool(not lambda_layer)
-        for i in (
-            (
-                self.get_attr_project_name_comp_props(self_obj, project_name_comp=project_name_comp)
-                if is_not_lambda_layer
-                else [None]
-            )
-            + [
-                (
-                    (deploy_env if deploy_env else getattr(self_obj, self.DEPLOY_ENV_, None))
-                    if is_not_lambda_layer
-                    else None
-                )
+        if lambda_layer:
+            pass
+        elif project_name_comp or deploy_env:
+            props += [
+                i
+                for i in self.get_attr_project_name_comp_props(self_obj, project_name_comp=project_name_comp)
+                + [deploy_env if deploy_env else context[self.KEY_][1]]
+                if i
             ]
-            + construct_id_props
-            + [construct_type]
-        ):
-            if i:
-                props.append(i)
-        return self.join_sep_score(props)
+        else:
+            props += context[self.PREFIX_]
+        props += [i for i in construct_id_props + [construct_type] if i]
+        construct_id = self.join_sep_score(props)
+        context[self.IDS_][key] = construct_id
+        return construct_id
 
     def get_construct_name(
         self,
@@ -5678,19 +6686,34 @@ class CdkConstructsFactory:
         :param is_codepipeline: True if name is for a CodePipeline pipeline.
         :return: The CDK construct name.
         """
+        context: dict = self._get_naming_context(self_obj)
+        key: tuple = (
+            self.get_construct_name.__name__,
+            tuple(name_props),
+            project_name_comp,
+            underscore,
+            no_trim,
+            global_,
+            is_codebuild,
+            is_codepipeline,
+        )
+        if (name := context[self.NAMES_].get(key)) is not None:
+            return name
         props: list[str] = list(name_props)
         if project_name_comp is not None:
             props = self.get_attr_project_name_comp_props(self_obj, project_name_comp=project_name_comp) + props
         if global_:
             props.insert(0, self.get_attr_env_region(self_obj))
-        s: str = self.get_cdk_stack_name_short(self_obj.stack_name)
+        if self.NAME_ not in context:
+            context[self.NAME_] = self.get_cdk_stack_name_short(self_obj.stack_name)
         p: str = (
             self.join_sep_empty(props).replace(self.SEP_SCORE_, self.SEP_EMPTY_)
             if is_codebuild or is_codepipeline
             else self.join_sep_score(props)
         )
-        name: str = self.join_sep_empty([s, self.SEP_UNDER_ if underscore else self.SEP_FW_, p])
-        return name if no_trim else name[:64]
+        name = self.join_sep_empty([context[self.NAME_], self.SEP_UNDER_ if underscore else self.SEP_FW_, p])
+        context[self.NAMES_][key] = name if no_trim else name[:64]
+        return context[self.NAMES_][key]
 
     def get_construct_name_short(
         self,
@@ -5712,13 +6735,41 @@ class CdkConstructsFactory:
         :param length: An optional length of construct name, as different AWS services can have different limits. Default: 32
         :return: The short CDK construct name.
         """
-        props: list[str] = self.get_attr_project_name_comp_props(self_obj, project_name_comp=project_name_comp)
+        context: dict = self._get_naming_context(self_obj)
+        key: tuple = (
+            self.get_construct_name_short.__name__,
+            tuple(name_props),
+            project_name_comp,
+            deploy_env,
+            global_,
+            length,
+        )
+        if (name := context[self.NAMES_].get(key)) is not None:
+            return name
+        props: list[str] = (
+            self.get_attr_project_name_comp_props(self_obj, project_name_comp=project_name_comp)
+            if project_name_comp
+            else list(context[self.PROPS_])
+        )
         if global_:
             props.insert(0, self.get_attr_env_region(self_obj))
-        if d := deploy_env if deploy_env else getattr(self_obj, self.DEPLOY_ENV_, None):
+        if d := deploy_env if deploy_env else context[self.KEY_][1]:
             props.append(d)
-        name: str = self.join_sep_score(props + name_props)[:length]
-        return name[:-1] if name[-1] == self.SEP_SCORE_ else name  # Ensure must not end with a hyphen
+        name = self.join_sep_score(props + name_props)[:length]
+        context[self.NAMES_][key] = name[:-1] if name[-1] == self.SEP_SCORE_ else name  # Must not end with a hyphen
+        return context[self.NAMES_][key]
+
+    def get_cron_options(self, hours: list[Union[int, str]], week_days: Optional[str] = None) -> dict[str, str]:
+        """
+        Generate the cron options, for a schedule on the hour (e.g. for ``Schedule.cron(**cron_options)``),
+        with the hours compressed into a single cron hour expression (see ``Schedules.get_crons``).
+
+        :param hours: The UTC hours.
+        :param week_days: An optional cron day-of-week expression (e.g. 'MON-FRI'). Default: every day.
+        :return: The cron options.
+        """
+        hour, week_days, _ = self.schedules.get_crons([(i, week_days) for i in hours])[0]
+        return {k: v for k, v in {"minute": str(0), "hour": hour, "week_day": week_days}.items() if v}
 
     def get_database_server_deploy_env_map(
         self,
@@ -5738,6 +6789,46 @@ class CdkConstructsFactory:
                 new_map[k] = v
         return new_map
 
+    def get_db_connections_plan(
+        self, db_max_connections: int, deploy_envs: list[str], db_consumers: dict[str, dict[str, int]] = None
+    ) -> dict[str, dict[str, int]]:
+        """
+        Plan the DB connections of a DB server, across its deploy envs (i.e. DB schemas), weighted by the peak
+        concurrency of the DB consumers of each (otherwise, split evenly), less the DB connections reserved for the
+        admin user.
+
+        :param db_max_connections: The DB server max. connections.
+        :param deploy_envs: The deploy envs of the DB server.
+        :param db_consumers: The peak concurrency of each DB consumer (e.g. the Gw ECS service), per deploy env.
+        :return: The peak concurrency, DB connections budget, and RDS proxy max. (idle) connections (%), per deploy env.
+        """
+        peaks: dict[str, int] = {
+            i: sum(j.get(i, 0) for j in db_consumers.values()) if db_consumers else 1 for i in deploy_envs
+        }
+        peak_total: int = sum(peaks.values())
+        plan: dict[str, dict[str, int]] = {}
+        for deploy_env, peak in peaks.items():
+            max_connections_percent: int = max(
+                1,
+                int(
+                    (100 - self.RDS_MAX_CONNECTIONS_RESERVED_PERCENT)
+                    * (peak / peak_total if peak_total else 1 / len(peaks))
+                ),
+            )
+            plan[deploy_env] = {
+                self.PEAK_: peak,
+                self.BUDGET_: int(db_max_connections * max_connections_percent / 100),
+                self.MAX_CONNECTIONS_PERCENT_: max_connections_percent,
+                self.MAX_IDLE_CONNECTIONS_PERCENT_: max(
+                    1,
+                    int(
+                        max_connections_percent
+                        * self.RDS_PROXY_MAX_IDLE_CONNECTIONS_RATIO[self.is_deploy_env_internal(deploy_env)]
+                    ),
+                ),
+            }
+        return plan
+
     def get_deploy_env_chosen(self, deploy_env: str, always_prod: bool = None) -> str:
         if always_prod is None:
             always_prod = True
@@ -5754,6 +6845,7 @@ class CdkConstructsFactory:
         self,
         opt_meta: dict[str, tuple[str, str]] = None,
         ec_redis_instance_type_custom: str = None,
+        ec_redis_shards_custom: int = None,
         ecs_service_max_val_custom: int = None,
     ) -> dict[str, dict]:
         meta: dict[str, dict] = {}
@@ -5765,6 +6857,7 @@ class CdkConstructsFactory:
             ec_redis_meta: str = self.EC_REDIS_META[weight]
             ecs_service_min_val: int = self.ECS_META[weight][self.ECS_SERVICE_MIN_]
             ecs_service_max_val: int = self.ECS_META[weight][self.ECS_SERVICE_MAX_]
+            ecs_meta: dict[str, int] = self.ECS_META[weight]
             is_stag_prod: bool = deploy_env in set(self.STAG_PROD_LIST)
             meta[deploy_env] = {
                 self.EC_REDIS_INSTANCE_TYPE_: self.join_sep_dot(
@@ -5778,6 +6871,11 @@ class CdkConstructsFactory:
                     ]
                 ),
                 self.EC_REDIS_REPLICAS_: ec_redis_meta[self.EC_REDIS_REPLICAS_],
+                self.EC_REDIS_SHARDS_: (
+                    ec_redis_shards_custom
+                    if ec_redis_shards_custom and is_stag_prod
+                    else ec_redis_meta[self.EC_REDIS_SHARDS_]
+                ),
                 self.ECS_SERVICE_MIN_: ecs_service_min_val,
                 self.ECS_SERVICE_MAX_: (
                     (
@@ -5788,6 +6886,14 @@ class CdkConstructsFactory:
                     if is_stag_prod
                     else ecs_service_min_val
                 ),
+                **{
+                    k: ecs_meta[k]
+                    for k in [
+                        self.ECS_SERVICE_SCALE_IN_COOLDOWN_,
+                        self.ECS_SERVICE_SCALE_IN_DISABLE_,
+                        self.ECS_SERVICE_SCALE_OUT_COOLDOWN_,
+                    ]
+                },
                 self.TAG_KEY_ENV_TYPE_: (
                     EnvType.INTERNAL
                     if self.is_deploy_env_internal(deploy_env)
@@ -5811,9 +6917,53 @@ class CdkConstructsFactory:
         """
         return f"Allow {description} on {f'port {port}' if port else 'all TCP ports'}."
 
+    def get_ec2_instance_public_ipv4_parameter_name(self, stack_name: str) -> str:
+        """
+        Generate the SSM parameter name to store the public (IPv4) address of an EC2 instance.
+
+        Known ahead of CDK stack instantiation, so dependant CDK stacks needn't instantiate the EC2 instance CDK stack.
+
+        :param stack_name: The name of the CDK stack, for the EC2 instance.
+        :return: The SSM parameter name, e.g. /CdkIpsecVpnServerStack/public-ipv4.
+        """
+        return self.get_path([stack_name, self.join_sep_score([self.PUBLIC_, self.IPV4_])], lead=True)
+
     def get_ecs_container_name(self, self_obj, **kwargs) -> str:
         return self.get_construct_name_short(self_obj, [self.ECS_, self.TASK_, self.CONTAINER_], **kwargs)
 
+    def get_ecs_fargate_cpu_units(self, memory_mib: int, memory_mib_per_vcpu: int = 2048) -> int:
+        """
+        Get the ECS Fargate task CPU units for the task memory, i.e. the most CPU units (supported with the memory)
+        without going below the memory per vCPU.
+
+        :param memory_mib: The amount (in MiB) of memory used by the task.
+        :param memory_mib_per_vcpu: The min. memory (in MiB) per vCPU. Default: 2048.
+        :return: The ECS Fargate task CPU units.
+        """
+        cpu_units: list[int] = [
+            k
+            for k, (min_mib, max_mib) in self.ECS_FARGATE_CPU_MEMORY_MIB.items()
+            if min_mib <= memory_mib <= max_mib and k * memory_mib_per_vcpu <= memory_mib * 1024
+        ]
+        if not cpu_units:
+            sys.exit(f"## No ECS Fargate task CPU units supported with {memory_mib} MiB of memory.")
+        return max(cpu_units)
+
+    def get_ecs_peak_concurrency(self, env_meta: dict, memory_mib: int) -> int:
+        """
+        Get the peak concurrency of an ECS web server (e.g. Gw) service, i.e. the threads of every worker, of the max.
+        ECS tasks.
+
+        :param env_meta: The deploy env metadata.
+        :param memory_mib: The amount (in MiB) of memory used by the task.
+        :return: The ECS service peak concurrency.
+        """
+        return (
+            env_meta[self.ECS_SERVICE_MAX_]
+            * self.get_ecs_workers(self.get_ecs_fargate_cpu_units(memory_mib), memory_mib)
+            * self.ECS_WORKER_THREADS
+        )
+
     def get_ecs_secret_from_secrets_manager(self, self_obj, base_stack: IConstruct, attr_name: str) -> ecs.Secret:
         secret: secretsmanager.ISecret = (
             getattr(base_stack, self.PLURAL_MAPPINGS[attr_name])[self.get_attr_deploy_env(self_obj)]
@@ -5822,6 +6972,18 @@ class CdkConstructsFactory:
         )
         return self.ecs_secret_from_secrets_manager(self_obj, secret.secret_name, secret.secret_full_arn)
 
+    def get_ecs_workers(self, cpu_units: int, memory_mib: int) -> int:
+        """
+        Get the workers of an ECS web server (e.g. Gw) task, per vCPU (as I/O-bound), capped by the memory per worker.
+
+        :param cpu_units: The number of CPU units used by the task.
+        :param memory_mib: The amount (in MiB) of memory used by the task.
+        :return: The ECS task workers.
+        """
+        return max(
+            1, min(int(cpu_units / 1024 * self.ECS_WORKERS_PER_VCPU), int(memory_mib / self.ECS_WORKER_MEMORY_MIB))
+        )
+
     def get_elastic_ip_ranges(
         self,
         self_obj,
@@ -5839,7 +7001,7 @@ class CdkConstructsFactory:
         :return: The list of IP addresses in CIDR notation.
         """
         return [
-            self.get_path([self.file_json_load_cdk_custom_outputs()[cdk_base_stack_name][output_key], str(32)])
+            self.get_path([self.get_cdk_custom_output(cdk_base_stack_name, output_key), str(32)])
             for i in elastic_ip_str_list
             if (
                 output_key := self.CDK_STACK_PREFIX
@@ -5850,12 +7012,103 @@ class CdkConstructsFactory:
             )
         ]
 
+    def get_elasticache_replication_group_endpoint(
+        self, replication_group: elasticache.CfnReplicationGroup, is_reader: bool = False
+    ) -> tuple[str, str]:
+        """
+        Get the address and port of an ElastiCache replication group endpoint.
+
+        Cluster mode enabled (i.e. sharded) replication groups only have a configuration endpoint,
+          read-heavy consumers use it with a cluster aware Redis client, reading from the replicas (i.e. `READONLY`),
+          see the `REDIS_CLUSTER` env var of the consumers, i.e. ``CdkCacheStack.ec_redis_cluster``.
+
+        :param replication_group: The ElastiCache replication group.
+        :param is_reader: If True, get the reader endpoint, otherwise the primary (or configuration) endpoint.
+        :return: The endpoint address and port.
+        """
+        if replication_group.cluster_mode == self.ENABLED_:
+            return (
+                replication_group.attr_configuration_end_point_address,
+                replication_group.attr_configuration_end_point_port,
+            )
+        if is_reader:
+            return replication_group.attr_reader_end_point_address, replication_group.attr_reader_end_point_port
+        return replication_group.attr_primary_end_point_address, replication_group.attr_primary_end_point_port
+
     def get_file_name_yml(self, name_props: list[str]) -> str:
         return self._get_file_name_base(name_props, self.YML_)
 
     def get_file_name_zip(self, name_props: list[str]) -> str:
         return self._get_file_name_base(name_props, self.ZIP_)
 
+    def get_ecs_cluster_shared_key(self, self_obj) -> Optional[str]:
+        """
+        Get the shared ECS cluster key (see ``set_factory_ecs_clusters_shared``), to be joined by the ECS service of the
+        CDK stack (if any), looked up by project name and deploy env, then project name, then '*' (i.e. all ECS services).
+
+        :param self_obj: The CDK stack class object.
+        :return: The shared ECS cluster key, otherwise None.
+        """
+        project_name: str = self.get_attr_project_name(self_obj, no_custom=True)
+        return next(
+            (
+                i
+                for i in [
+                    self.join_sep_score([project_name, self.get_attr_deploy_env(self_obj)]),
+                    project_name,
+                    self.SEP_ASTERISK_,
+                ]
+                if i in getattr(self, self.ECS_CLUSTERS_SHARED_, [])
+            ),
+            None,
+        )
+
+    def get_ecs_cluster_shared_name(self, self_obj, key: str = None) -> Optional[str]:
+        """
+        Get the shared ECS cluster name (see ``set_factory_ecs_clusters_shared``), for the shared ECS cluster key, or
+        to be joined by the ECS service of the CDK stack (if any, see ``get_ecs_cluster_shared_key``).
+
+        :param self_obj: The CDK stack class object.
+        :param key: An optional shared ECS cluster key.
+        :return: The shared ECS cluster name, otherwise None.
+        """
+        if key is None and (key := self.get_ecs_cluster_shared_key(self_obj)) is None:
+            return None
+        return self.join_sep_score([self.SHARED_ if key == self.SEP_ASTERISK_ else key, self.ECS_])
+
+    def get_image_tag(self, self_obj, image_tag: str, project_name_comp: str = None) -> str:
+        """
+        Get a Docker image tag, per CPU architecture, i.e. suffixed with '-arm64' if the CDK stack architecture is
+        'arm64' (otherwise unchanged).
+
+        :param self_obj: The CDK stack class object.
+        :param image_tag: The Docker image tag, e.g. the deployment environment.
+        :param project_name_comp: The project name and component to use instead of the CDK stack class default.
+        :return: The Docker image tag.
+        """
+        architecture: str = self.get_architecture(self_obj, project_name_comp=project_name_comp)
+        return image_tag if architecture == self.X86_64_ else self.join_sep_score([image_tag, architecture])
+
+    def get_image_tag_base(self, self_obj, base_self_obj, image_tag: str) -> str:
+        """
+        Get a base Docker image tag (see ``get_image_tag``), for a Docker image built (by the base CDK stack) for the
+        base CDK stack architecture only. The CDK stack architecture must match it, to build Docker images on top.
+
+        :param self_obj: The CDK stack class object.
+        :param base_self_obj: The base CDK stack class object.
+        :param image_tag: The base Docker image tag, e.g. 'latest'.
+        :return: The base Docker image tag.
+        """
+        if (architecture := self.get_architecture(self_obj)) != (
+            base_architecture := self.get_architecture(base_self_obj)
+        ):
+            sys.exit(
+                f"## Inconsistent CPU architectures for CDK stack '{self_obj.stack_name}' ('{architecture}') and its "
+                f"base CDK stack '{base_self_obj.stack_name}' ('{base_architecture}'), for the base Docker image "
+                f"(see: `set_factory_architectures`)."
+            )
+        return self.get_image_tag(base_self_obj, image_tag)
+
     def get_lambda_func_name(
         self, self_obj, props: list[str], project_name_comp: str = None, code_path: bool = False
     ) -> str:
@@ -5886,6 +7139,17 @@ class CdkConstructsFactory:
             props_joined = self.join_sep_empty([self.SEP_FW_, props_joined])
         return props_joined
 
+    def get_rds_max_connections(self, instance_type: str) -> int:
+        """
+        Get the RDS MySQL default 'max_connections', for the RDS instance type.
+
+        :param instance_type: The RDS instance type, e.g. 't3.medium'.
+        :return: The RDS MySQL max. connections.
+        """
+        if (max_connections := self.RDS_MYSQL_MAX_CONNECTIONS.get(instance_type)) is None:
+            sys.exit(f"## Cannot find the RDS MySQL max. connections for RDS instance type: {instance_type}")
+        return max_connections
+
     def get_region_meta_cidrs(self) -> list[str]:
         return self._REGION_META[self.region][self.CIDRS_]
 
@@ -6123,6 +7387,39 @@ class CdkConstructsFactory:
             resources=lambda_func_arns,
         )
 
+    def iam_policy_statement_s3_cloudfront_origin_access_control(
+        self, self_obj, s3_bucket_name: str, cf_dist: cloudfront.IDistribution
+    ) -> iam.PolicyStatement:
+        """
+        Generate an S3 bucket policy statement, allowing only the CloudFront distribution to read objects, using an
+        Origin Access Control (OAC), see: ``cloudfront_origin_s3``.
+
+        NB. Added to the S3 bucket policy in the S3 bucket CDK stack, instead of by the CloudFront distribution in
+        another CDK stack (i.e. to avoid a cyclic reference between CDK stacks).
+
+        :param self_obj: The CDK stack class object, of the S3 bucket.
+        :param s3_bucket_name: The S3 bucket name.
+        :param cf_dist: The CloudFront distribution.
+        :return: The S3 bucket policy statement.
+        """
+        return iam.PolicyStatement(
+            actions=[self.join_sep_colon([self.S3_, "GetObject"])],
+            conditions={
+                "StringEquals": {
+                    "AWS:SourceAccount": self.get_attr_env_account(self_obj),
+                    "AWS:SourceArn": self.format_arn_custom(
+                        self_obj, service=self.CF_, resource="distribution", resource_name=cf_dist.distribution_id
+                    ),
+                }
+            },
+            principals=[self.iam_service_principal(self.CF_)],
+            resources=[
+                self.format_arn_custom(
+                    self_obj, service=self.S3_, resource=self.get_path([s3_bucket_name, self.SEP_ASTERISK_])
+                )
+            ],
+        )
+
     def iam_policy_statement_s3_delete_objects(self, self_obj, s3_bucket_prefixes: list[str]) -> iam.PolicyStatement:
         return iam.PolicyStatement(
             actions=[
@@ -6524,6 +7821,21 @@ class CdkConstructsFactory:
             enable_key_rotation=True,
         )
 
+    def lambda_architecture(
+        self, self_obj, function_name: str = None, str_: bool = False
+    ) -> Union[lambda_.Architecture, str]:
+        """
+        Generate a Lambda architecture, as per the architecture policy (see ``get_architecture``).
+
+        :param self_obj: The CDK stack class object.
+        :param function_name: An optional Lambda function name.
+        :param str_: True if needing the string representation of the architecture.
+        :return: The Lambda architecture.
+        """
+        if self.get_architecture(self_obj, function_name) == self.ARM64_:
+            return self.ARM64_ if str_ else lambda_.Architecture.ARM_64
+        return self.lambda_architecture_x86_64(str_=str_)
+
     @staticmethod
     def lambda_architecture_x86_64(str_: bool = False) -> Union[lambda_.Architecture, str]:
         """
@@ -6592,7 +7904,7 @@ class CdkConstructsFactory:
                 repository=project_repo,
                 # cmd=,  # Default: - use the CMD specified in the docker image or Dockerfile.
                 # entrypoint=,  # Default: - use the ENTRYPOINT in the docker image or Dockerfile.
-                tag_or_digest=self.get_attr_deploy_env(self_obj),
+                tag_or_digest=self.get_image_tag(self_obj, self.get_attr_deploy_env(self_obj)),
                 # working_directory=,  # Default: - use the WORKDIR in the docker image or Dockerfile.
             ),
             # adot_instrumentation  # AWS Distro for OpenTelemetry (ADOT) instrumentation. Default: - No ADOT instrum.
@@ -6815,19 +8127,61 @@ class CdkConstructsFactory:
         :return: The list Event rules, for a Lambda function.
         """
         key: str = self.join_sep_under([start_end, self.WEEK_, self.DAYS_])
-        return [
-            (
-                self.events_rule(
-                    self_obj,
-                    name_props,
-                    f"Trigger Lambda function {function_name} on {meta[key]} @ {s.zfill(2)}:00 UTC.",
-                    events.Schedule.cron(minute=str(0), hour=s, week_day=meta[key]),
-                ),
-                payload,
-            )
-            for name_props, meta, payload in name_props_meta_payload
-            if (s := str(meta[start_end]))
-        ]
+        return self.lambda_function_events_rules_crons(
+            self_obj,
+            function_name,
+            [
+                (name_props, [meta[start_end]], meta[key], payload)
+                for name_props, meta, payload in name_props_meta_payload
+            ],
+        )
+
+    def lambda_function_events_rules_crons(
+        self,
+        self_obj,
+        function_name: str,
+        name_props_hours_payload: list[tuple[list[str], list[Union[int, str]], Optional[str], dict]],
+    ) -> list[tuple[events.Rule, dict]]:
+        """
+        Generate a list Events rules, with cron schedules, for a Lambda function.
+
+        For each payload, the hours (and days of the week) are compressed into as few cron schedules as possible
+        (see ``Schedules.get_crons``), i.e. as few Events rules, each named after the first hours it includes.
+
+        :param self_obj: The CDK stack class object.
+        :param function_name: A name for the Lambda function.
+        :param name_props_hours_payload: A list of tuples, each tuple containing:
+            name_props: Specific property details to include in the CDK construct ID.
+            hours: The UTC hours.
+            week_days: An optional cron day-of-week expression (e.g. 'MON-FRI'). Default: every day.
+            payload: The payload (JSON) object to the event target.
+        :return: The list Event rules, for a Lambda function.
+        """
+        payloads: dict[str, list[tuple[int, Union[int, str], Optional[str]]]] = {}
+        for i, (_, hours, week_days, payload) in enumerate(name_props_hours_payload):
+            payloads.setdefault(json.dumps(payload, sort_keys=True), []).extend((i, h, week_days) for h in hours)
+        events_rules: list[tuple[events.Rule, dict]] = []
+        rules_name_props: list[list[str]] = []
+        for hours_week_days in payloads.values():
+            for hour, week_days, index in self.schedules.get_crons([(h, w) for _, h, w in hours_week_days]):
+                name_props, _, _, payload = name_props_hours_payload[hours_week_days[index][0]]
+                if name_props in rules_name_props:
+                    name_props = name_props + [hour.split(self.SEP_COMMA_)[0]]
+                rules_name_props.append(name_props)
+                hours_desc: str = ", ".join([f"{i.zfill(2)}:00" for i in hour.split(self.SEP_COMMA_)])
+                events_rules.append(
+                    (
+                        self.events_rule(
+                            self_obj,
+                            name_props,
+                            f"Trigger Lambda function {function_name} on {week_days if week_days else 'every day'} "
+                            f"@ {hours_desc} UTC.",
+                            events.Schedule.cron(minute=str(0), hour=hour, week_day=week_days),
+                        ),
+                        payload,
+                    )
+                )
+        return events_rules
 
     def lambda_function_events_rules_rate(
         self, self_obj, function_name: str, rate: int, payload: dict = None
@@ -6991,8 +8345,77 @@ class CdkConstructsFactory:
             **kwargs,
         )
 
+    def lambda_function_sqs_buffer(
+        self,
+        self_obj,
+        lambda_func: Union[lambda_.Function, lambda_.DockerImageFunction],
+        function_name: str,
+        timeout: Duration,
+        batch_size: int = 10,
+        max_batching_window: Duration = None,
+        max_concurrency: int = None,
+        max_receive_count: int = 3,
+    ) -> sqs.Queue:
+        """
+        Generate an SQS queue (with a dead-letter queue), to buffer events for a Lambda function,
+        invoking the Lambda function (by an event source mapping) with batches of messages, at a capped concurrency.
+
+        Reports batch item failures, i.e. the Lambda function returns the failed messages (as
+          `{"batchItemFailures": [{"itemIdentifier": <message ID>}]}`), so only those are retried (and moved to the
+          dead-letter queue after `max_receive_count`). NB. A Lambda function error retries the whole batch.
+
+        :param self_obj: The CDK stack class object.
+        :param lambda_func: The Lambda function.
+        :param function_name: A name for the Lambda function.
+        :param timeout: The Lambda function timeout, to set the SQS queue visibility timeout (at 6x, as recommended).
+        :param batch_size: The max. number of messages, in each batch to the Lambda function.
+            Valid: 1 - 10000 (if over 10, the `max_batching_window` is required). Default: 10.
+        :param max_batching_window: The max. time to gather messages into a batch, before invoking the Lambda
+            function. Max: 5 minutes. Default: no batching window.
+        :param max_concurrency: The max. concurrent Lambda function invocations by the event source mapping.
+            Valid: 2 - 1000. Default: no limit.
+        :param max_receive_count: The number of times a message can be unsuccessfully dequeued,
+            before being moved to the dead-letter queue. Default: 3.
+        :return: The SQS queue, to send the events to (e.g. as an Events rule target).
+        """
+        name_props: list[str] = [function_name, self.SQS_]
+        # Trim the base name (i.e. not the suffixes) to fit the max. SQS queue name length (64 chars),
+        #  so the SQS queue and dead-letter queue names never collide
+        queue_name_base: str = self.get_construct_name(self_obj, [function_name], underscore=True, no_trim=True)
+        queue_name, dlq_name = [
+            self.join_sep_score([queue_name_base[: 64 - len(self.join_sep_score([self.SEP_EMPTY_] + i))]] + i)
+            for i in [[self.SQS_], [self.SQS_, self.DLQ_]]
+        ]
+        kms_key: kms.Key = self.get_attr_kms_key_stack(self_obj)
+        dlq: sqs.Queue = self.sqs_queue(
+            self_obj,
+            name_props + [self.DLQ_],
+            dlq_name,
+            encryption_master_key=kms_key,
+            retention_period=Duration.days(14),
+        )
+        queue: sqs.Queue = self.sqs_queue(
+            self_obj,
+            name_props,
+            queue_name,
+            encryption_master_key=kms_key,
+            dead_letter_queue=sqs.DeadLetterQueue(max_receive_count=max_receive_count, queue=dlq),
+            visibility_timeout=Duration.seconds(timeout.to_seconds() * 6),
+        )
+        queue.grant_consume_messages(lambda_func)
+        lambda_func.add_event_source_mapping(
+            id=self.get_construct_id(self_obj, name_props, "EventSourceMapping"),
+            batch_size=batch_size,
+            enabled=True,
+            event_source_arn=queue.queue_arn,
+            max_batching_window=max_batching_window,
+            max_concurrency=max_concurrency,
+            report_batch_item_failures=True,
+        )
+        return queue
+
     def lambda_layer_version(
-        self, self_obj, name_props: list[str], code_path: str, description: str
+        self, self_obj, name_props: list[str], code_path: str, description: str, function_name: str = None
     ) -> lambda_.LayerVersion:
         """
         Generate a Lambda layer version.
@@ -7001,13 +8424,14 @@ class CdkConstructsFactory:
         :param name_props: Specific property details to include in the CDK construct ID.
         :param code_path: The relative system file path to a folder containing the Lambda layer source files.
         :param description: A description of the CDK construct.
+        :param function_name: An optional name of the Lambda function using the Lambda layer, to match its architecture.
         :return: The Lambda layer version.
         """
         return lambda_.LayerVersion(
             scope=self_obj,
             id=self.get_construct_id(self_obj, name_props, "LayerVersion", lambda_layer=True),
             code=lambda_.Code.from_asset(path=self.get_path([self.sub_paths[self.LAMBDA_], code_path])),
-            compatible_architectures=[self.lambda_architecture_x86_64()],
+            compatible_architectures=[self.lambda_architecture(self_obj, function_name)],
             compatible_runtimes=[self.lambda_runtime_python_3_9()],
             description=description,
             layer_version_name=self.join_sep_score(name_props),
@@ -7015,21 +8439,33 @@ class CdkConstructsFactory:
             removal_policy=RemovalPolicy.DESTROY,
         )
 
-    def lambda_layer_version_base(self, self_obj, function_name: str) -> lambda_.LayerVersion:
+    def lambda_layer_version_base(self, self_obj, function_name: str = None) -> lambda_.LayerVersion:
         """
         Generate a Lambda layer version, inc. base resources.
 
+        Generated once per CDK stack and architecture, and shared by all Lambda functions in the CDK stack with that
+        architecture. Lambda layers for an architecture other than the CDK stack architecture are suffixed with it.
+
         :param self_obj: The CDK stack class object.
-        :param function_name: A name for the Lambda function.
+        :param function_name: An optional name of the Lambda function using the Lambda layer, to match its architecture.
         :return: The Lambda layer version.
         """
+        layer_versions: dict[str, lambda_.LayerVersion] = getattr(self_obj, self._LAMBDA_LAYER_VERSION_BASE_, {})
+        architecture: str = self.get_architecture(self_obj, function_name)
+        if architecture in layer_versions:
+            return layer_versions[architecture]
         name_props: list[str] = [self.PY_, self.LAYER_]
-        return self.lambda_layer_version(
+        layer_versions[architecture] = self.lambda_layer_version(
             self_obj,
-            [function_name] + name_props,
+            [self.get_cdk_stack_name_short(self_obj.stack_name)]
+            + name_props
+            + ([architecture] if architecture != self.get_architecture(self_obj) else []),
             self.get_file_name_zip(name_props),
             "Lambda layer that contains: boto3 and botocore py modules.",
+            function_name=function_name,
         )
+        setattr(self_obj, self._LAMBDA_LAYER_VERSION_BASE_, layer_versions)
+        return layer_versions[architecture]
 
     def lambda_layer_version_mysql(self, self_obj, function_name: str) -> lambda_.LayerVersion:
         """
@@ -7045,6 +8481,7 @@ class CdkConstructsFactory:
             [function_name, self.MYSQL_] + name_props,
             self.join_sep_fw([self.RDS_, self.MYSQL_, self.get_file_name_zip(name_props)]),
             "Lambda layer that contains: mysql py modules.",
+            function_name=function_name,
         )
 
     @staticmethod
@@ -7447,6 +8884,29 @@ class CdkConstructsFactory:
                 s3_bucket_.add_to_resource_policy(permission=policy_statement)
         return s3_bucket_
 
+    def s3_bucket_cloudfront_logs(self, self_obj) -> s3.Bucket:
+        """
+        Generate the S3 bucket shared by all CloudFront distributions (in the AWS account and region), for CloudFront
+        (standard) logs, each distribution logging to its own prefix (see ``get_cloudfront_log_file_prefix``).
+
+        :param self_obj: The CDK stack class object.
+        :return: The S3 bucket.
+        """
+        bucket_name_prefix_props: list[str] = [self.organisation_abbrev, self.CF_, self.LOGS_]
+        if self.aws_profile is not None:
+            bucket_name_prefix_props.append(self.aws_profile)
+        bucket_name: str = self.get_s3_bucket_name(self_obj, self.join_sep_score(bucket_name_prefix_props))
+        # NB. CloudFront (standard) logs need S3 ACLs enabled (i.e. object writer), and SSE-S3 (or a KMS key policy)
+        return s3.Bucket(
+            access_control=s3.BucketAccessControl.PRIVATE,
+            **{
+                **self._s3_bucket_kwargs(self_obj, bucket_name, False),
+                "lifecycle_rules": self.s3_bucket_lifecycle_rules_delete_objects_days(
+                    self_obj, bucket_name, self.CLOUDFRONT_LOGS_RETENTION_DAYS
+                ),
+            },
+        )
+
     def s3_bucket_lifecycle_rules_delete_objects_days(
         self, self_obj, bucket_name: str, num_of_days: int, prefix: str = None
     ) -> list[s3.LifecycleRule]:
@@ -7793,6 +9253,7 @@ class CdkConstructsFactory:
                             ),
                         ),
                     )
+        self._set_attr_naming_context(self_obj)
 
     def set_attrs_deploy_env_preview_demo_meta(self, self_obj, deploy_env_preview_demo_meta: dict[str, str]) -> None:
         setattr(
@@ -7899,6 +9360,7 @@ class CdkConstructsFactory:
         setattr(self_obj, self.COMPONENT_, component)
         setattr(self_obj, self.PROJECT_NAME_COMP_, self.join_sep_score(props + [component]))
         self._set_attrs_word_map_project_name_comp(self_obj, project_name, component, is_custom=is_custom)
+        self._set_attr_naming_context(self_obj)
         if inc_cfn_output:
             self._cfn_output_project_name_comp(self_obj)
 
@@ -7983,6 +9445,20 @@ class CdkConstructsFactory:
             self._generate_url_private(self_obj, origin_path),
         )
 
+    def set_factory_architectures(self, architectures: dict[str, str]) -> None:
+        if invalid := {k: v for k, v in architectures.items() if v not in [self.ARM64_, self.X86_64_]}:
+            sys.exit(f"## Invalid CPU architectures (must be '{self.ARM64_}' or '{self.X86_64_}'): {invalid}")
+        setattr(self, self.ARCHITECTURES_, architectures)
+
+    def set_factory_cloudfront_realtime_logs(self, cloudfront_realtime_logs: list[str]) -> None:
+        setattr(self, self.CLOUDFRONT_REALTIME_LOGS_, cloudfront_realtime_logs)
+
+    def set_factory_ecs_clusters_shared(self, ecs_clusters_shared: list[str]) -> None:
+        setattr(self, self.ECS_CLUSTERS_SHARED_, ecs_clusters_shared)
+
+    def set_factory_ecs_fargate_spot(self, ecs_fargate_spot: list[str]) -> None:
+        setattr(self, self.ECS_FARGATE_SPOT_, ecs_fargate_spot)
+
     def set_factory_ms_teams(self, ms_teams: dict) -> None:
         setattr(self, self.MS_TEAMS_, ms_teams)
 
@@ -8125,7 +9601,6 @@ class CdkConstructsFactory:
             Valid: 0 to 43200 seconds (12 hours). Default: 0 seconds.
         :return: The SQS queue.
         """
-        # TODO: (OPTIONAL) Since this method is not currently in use, could be removed
         return sqs.Queue(
             scope=self_obj,
             id=self.get_construct_id(self_obj, name_props, "Queue"),
@@ -8283,8 +9758,27 @@ class CdkConstructsFactory:
         adjective_past: str,
         continue_: stepfunctions.IChainable = None,
         wait_duration: int = 30,
+        wait_retry: bool = True,
     ) -> stepfunctions.Choice:
         wait_comment: str = f"Wait {str(wait_duration)} Seconds, retry {lambda_invoke_last_comment}"
+        if not continue_:
+            failed_next: stepfunctions.IChainable = self.stepfunctions_fail(
+                self_obj, lambda_invoke_last_lambda_func, adjective_past, end=True
+            )
+        elif wait_retry:
+            failed_next: stepfunctions.IChainable = stepfunctions.Wait(
+                scope=self_obj,
+                id=self.get_construct_id(self_obj, [lambda_invoke_last_lambda_func.function_name], "Wait"),
+                time=stepfunctions.WaitTime.duration(Duration.seconds(wait_duration)),
+                comment=wait_comment,
+            ).next(next=lambda_invoke_last)
+        else:
+            # Nothing to do (yet), i.e. leave the retry to the next (scheduled) execution
+            failed_next: stepfunctions.IChainable = stepfunctions.Succeed(
+                scope=self_obj,
+                id=self.get_construct_id(self_obj, [lambda_invoke_last_lambda_func.function_name], "Succeeded"),
+                comment=f"Nothing to do yet, retry {lambda_invoke_last_comment} on the next execution.",
+            )
         return (
             stepfunctions.Choice(
                 scope=self_obj,
@@ -8295,16 +9789,7 @@ class CdkConstructsFactory:
             )
             .when(
                 condition=self.stepfunctions_condition_string_equals(self.STATUS_FAILED_),
-                next=(
-                    stepfunctions.Wait(
-                        scope=self_obj,
-                        id=self.get_construct_id(self_obj, [lambda_invoke_last_lambda_func.function_name], "Wait"),
-                        time=stepfunctions.WaitTime.duration(Duration.seconds(wait_duration)),
-                        comment=wait_comment,
-                    ).next(next=lambda_invoke_last)
-                    if continue_
-                    else self.stepfunctions_fail(self_obj, lambda_invoke_last_lambda_func, adjective_past, end=True)
-                ),
+                next=failed_next,
             )
             .when(
                 condition=self.stepfunctions_condition_string_equals(self.STATUS_SUCCEEDED_),
@@ -8343,3 +9828,57 @@ class CdkConstructsFactory:
             comment=f"Check Lambda function logs: {lambda_func.log_group.log_group_arn}.",
             error=f"Failed to {adjective_current} the latest {getattr(self_obj, self.WORD_MAP_PROJECT_NAME_)} Sat Data{error_msg_suffix}",
         )
+
+    def stepfunctions_state_machine(
+        self,
+        self_obj,
+        state_machine_name: str,
+        chainable: stepfunctions.IChainable,
+        role: iam.Role,
+        timeout: Duration,
+        state_machine_type: stepfunctions.StateMachineType = stepfunctions.StateMachineType.STANDARD,
+        logs: list[tuple[stepfunctions.LogLevel, bool]] = None,
+    ) -> stepfunctions.StateMachine:
+        """
+        Generate a Step Functions state machine, logging to a vended logs log group.
+
+        :param self_obj: The CDK stack class object.
+        :param state_machine_name: The name to give the state machine.
+        :param chainable: The state machine definition.
+        :param role: The state machine execution role.
+        :param timeout: The maximum time for an execution.
+        :param state_machine_type: The state machine type, e.g. EXPRESS for high-frequency (short) executions.
+        :param logs: The log level, and whether to include execution data, for each step of the state machine.
+            As logging is per state machine, the most verbose log level (of any step) is used, and execution data is
+            included if required by any step. Default: all logs, including execution data.
+        :return: The Step Functions state machine.
+        """
+        log_levels: list[stepfunctions.LogLevel] = [
+            stepfunctions.LogLevel.OFF,
+            stepfunctions.LogLevel.FATAL,
+            stepfunctions.LogLevel.ERROR,
+            stepfunctions.LogLevel.ALL,
+        ]
+        if not logs:
+            logs = [(stepfunctions.LogLevel.ALL, True)]
+        return stepfunctions.StateMachine(
+            self_obj,
+            self.get_construct_id(self_obj, [state_machine_name], "StateMachine"),
+            definition_body=stepfunctions.DefinitionBody.from_chainable(chainable=chainable),
+            # definition_substitutions={}  # Substitutions for the definition body as a key-value map
+            logs=stepfunctions.LogOptions(
+                destination=self.logs_log_group(
+                    self_obj,
+                    [state_machine_name],
+                    self.get_path([self.log_groups[self.VENDEDLOGS_], self.STATES_, state_machine_name]),
+                ),
+                include_execution_data=any(i[1] for i in logs),
+                level=max((i[0] for i in logs), key=log_levels.index),
+            ),
+            removal_policy=RemovalPolicy.DESTROY,
+            role=role,
+            state_machine_name=state_machine_name,
+            state_machine_type=state_machine_type,
+            timeout=timeout,
+            tracing_enabled=False,
+        )
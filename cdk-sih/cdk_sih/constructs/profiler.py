@@ -0,0 +1,210 @@
+import atexit
+import functools
+import inspect
+import json
+import os
+import sys
+import time
+from collections.abc import Mapping
+from typing import Callable, Optional
+
+from aws_cdk import App, Stack, aws_lambda as lambda_
+from constructs import Construct
+
+from cdk_sih.constructs.factory import CdkConstructsFactory
+
+
+class CdkSynthProfiler:
+    """
+    CDK synth profiler class, for an opt-in report of where CDK synth time goes.
+
+    Enabled by setting the env var `CDK_SYNTH_PROFILE`, to either '1' (using the default report path prefix), or a
+    report path prefix, e.g. `CDK_SYNTH_PROFILE=/tmp/synth cdk synth`.
+
+    Instruments every public CDK constructs factory method, every CDK stack constructor, asset staging
+    (i.e. `lambda_.Code.from_asset`, and the Lambda constructs staging those assets), and the CDK app synth.
+    For each, records the call count, wall time (total and self), and CDK constructs created.
+
+    At exit, writes:
+      - `<prefix>.json`: A report, sorted by total wall time.
+      - `<prefix>.collapsed`: A collapsed-stack file (self time in microseconds),
+        for use with flamegraph tools, e.g. `flamegraph.pl <prefix>.collapsed > synth.svg`
+    """
+
+    ENV_VAR: str = "CDK_SYNTH_PROFILE"
+    REPORT_PATH_PREFIX_DEFAULT: str = "cdk-synth-profile"
+    ROOT_FRAME: str = "app"
+
+    CATEGORY_APP: str = "app"
+    CATEGORY_ASSET: str = "asset"
+    CATEGORY_FACTORY: str = "factory"
+    CATEGORY_STACK: str = "stack"
+
+    def __init__(self, report_path_prefix: str = REPORT_PATH_PREFIX_DEFAULT) -> None:
+        self.report_path_prefix: str = report_path_prefix
+        self.start: float = time.perf_counter()
+
+        self.stats: dict[str, dict] = {}
+        self.collapsed: dict[str, float] = {}
+        self.stacks: list[dict] = []
+
+        # Call stack, of [name, start time, child time] frames
+        self._frames: list[list] = []
+        self._active: dict[str, int] = {}
+
+    # --- Private methods ---
+
+    @staticmethod
+    def _count_constructs(result) -> int:
+        if isinstance(result, Construct):
+            return 1
+        if isinstance(result, Mapping):
+            result = list(result.values())
+        if isinstance(result, (list, tuple)):
+            return sum(1 for i in result if isinstance(i, Construct))
+        return 0
+
+    def _enter(self, name: str) -> None:
+        self._frames.append([name, time.perf_counter(), 0.0])
+        self._active[name] = self._active.get(name, 0) + 1
+
+    def _exit(self, name: str, category: str, constructs: int) -> None:
+        _, start, child = self._frames.pop()
+        elapsed: float = time.perf_counter() - start
+        self._active[name] -= 1
+        if self._frames:
+            self._frames[-1][2] += elapsed
+
+        stat: dict = self.stats.setdefault(
+            name, {"category": category, "calls": 0, "total_s": 0.0, "self_s": 0.0, "constructs": 0}
+        )
+        stat["calls"] += 1
+        if not self._active[name]:  # Only the outermost call, of a recursive call, counts towards the total time
+            stat["total_s"] += elapsed
+        stat["self_s"] += elapsed - child
+        stat["constructs"] += constructs
+
+        stack_key: str = ";".join([self.ROOT_FRAME] + [i[0] for i in self._frames] + [name])
+        self.collapsed[stack_key] = self.collapsed.get(stack_key, 0.0) + (elapsed - child)
+
+    def _wrap(self, func: Callable, name: str, category: str, count_constructs: Callable = None) -> Callable:
+        if getattr(func, "__wrapped_by_profiler__", False):
+            return func
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            self._enter(name)
+            result, constructs = None, 0
+            try:
+                result = func(*args, **kwargs)
+                constructs = count_constructs(args, result) if count_constructs else self._count_constructs(result)
+                return result
+            finally:
+                self._exit(name, category, constructs)
+
+        wrapper.__wrapped_by_profiler__ = True
+        return wrapper
+
+    def _wrap_method(self, cls: type, attr: str, name: str, category: str, count_constructs: Callable = None) -> None:
+        static_attr = inspect.getattr_static(cls, attr)
+        if isinstance(static_attr, staticmethod):
+            setattr(cls, attr, staticmethod(self._wrap(static_attr.__func__, name, category, count_constructs)))
+        elif isinstance(static_attr, classmethod):
+            setattr(cls, attr, classmethod(self._wrap(static_attr.__func__, name, category, count_constructs)))
+        else:
+            setattr(cls, attr, self._wrap(static_attr, name, category, count_constructs))
+
+    def _count_stack_constructs(self, cls: type) -> Callable:
+        def count_constructs(args, _) -> int:
+            # Only count once the most derived CDK stack constructor is done, i.e. not for any super() constructors
+            stack: Stack = args[0]
+            if next(i for i in type(stack).__mro__ if "__init__" in i.__dict__) is not cls:
+                return 0
+            constructs: int = len(stack.node.find_all())
+            self.stacks.append(
+                {
+                    "stack_id": stack.node.id,
+                    "class": cls.__name__,
+                    "wall_s": round(time.perf_counter() - self._frames[-1][1], 6),
+                    "constructs": constructs,
+                }
+            )
+            return constructs
+
+        return count_constructs
+
+    @staticmethod
+    def _get_stack_classes(base_cls: type = Stack) -> list[type]:
+        classes: list[type] = []
+        for subclass in base_cls.__subclasses__():
+            if subclass.__module__.startswith("cdk_sih.") and "__init__" in subclass.__dict__:
+                classes.append(subclass)
+            classes += [i for i in CdkSynthProfiler._get_stack_classes(subclass) if i not in classes]
+        return classes
+
+    # --- Public methods ---
+
+    @classmethod
+    def from_env(cls) -> Optional["CdkSynthProfiler"]:
+        """
+        Instrument the CDK app for profiling, if the `CDK_SYNTH_PROFILE` env var is set.
+
+        NB. Call once all CDK stack classes are imported, and before any CDK stacks are instantiated.
+
+        :return: The CDK synth profiler, or None if not enabled.
+        """
+        if not (val := os.getenv(cls.ENV_VAR)):
+            return None
+        profiler = cls(cls.REPORT_PATH_PREFIX_DEFAULT if val.lower() in {"1", "true", "yes"} else val)
+        profiler.instrument()
+        atexit.register(profiler.write_report)
+        return profiler
+
+    def instrument(self) -> None:
+        """
+        Instrument all public CDK constructs factory methods, CDK stack constructors, asset staging and CDK app synth.
+        """
+        for attr, _ in inspect.getmembers(CdkConstructsFactory, predicate=inspect.isroutine):
+            if not attr.startswith("_"):
+                self._wrap_method(
+                    CdkConstructsFactory, attr, f"{CdkConstructsFactory.__name__}.{attr}", self.CATEGORY_FACTORY
+                )
+
+        for cls in self._get_stack_classes():
+            self._wrap_method(cls, "__init__", cls.__name__, self.CATEGORY_STACK, self._count_stack_constructs(cls))
+
+        # NB. `Code.from_asset` only fingerprints, the asset gets staged when bound to its Lambda construct
+        self._wrap_method(lambda_.Code, "from_asset", "aws_lambda.Code.from_asset", self.CATEGORY_ASSET)
+        for cls in [lambda_.Function, lambda_.LayerVersion]:
+            self._wrap_method(cls, "__init__", f"aws_lambda.{cls.__name__}", self.CATEGORY_ASSET, lambda args, _: 1)
+
+        self._wrap_method(App, "synth", "aws_cdk.App.synth", self.CATEGORY_APP)
+
+    def get_report(self) -> dict:
+        """
+        Generate the CDK synth profile report.
+
+        :return: The report, with stats sorted by total wall time (descending).
+        """
+        return {
+            "total_s": round(time.perf_counter() - self.start, 6),
+            "stacks": sorted(self.stacks, key=lambda i: -i["wall_s"]),
+            "stats": [
+                {"name": k, **{i: round(j, 6) if isinstance(j, float) else j for i, j in v.items()}}
+                for k, v in sorted(self.stats.items(), key=lambda i: -i[1]["total_s"])
+            ],
+        }
+
+    def write_report(self) -> None:
+        """
+        Write the CDK synth profile report (JSON), and collapsed-stack file (for flamegraphs).
+        """
+        report_path: str = f"{self.report_path_prefix}.json"
+        collapsed_path: str = f"{self.report_path_prefix}.collapsed"
+        with open(report_path, "w", encoding="utf-8") as f:
+            json.dump(self.get_report(), f, indent=2)
+        with open(collapsed_path, "w", encoding="utf-8") as f:
+            for k, v in sorted(self.collapsed.items()):
+                if (us := int(v * 1_000_000)) > 0:
+                    f.write(f"{k} {us}\n")
+        print(f"## CDK synth profile written to: {report_path}, {collapsed_path}", file=sys.stderr)
@@ -0,0 +1,247 @@
+import contextlib
+import fnmatch
+import os
+import sys
+from collections.abc import Mapping
+from typing import Callable, Iterator, Optional
+
+from aws_cdk import App, Stack, cx_api
+
+
+class CdkLazyStack:
+    """
+    A deferred CDK stack builder, the CDK stack is instantiated (once) on first call.
+    """
+
+    def __init__(
+        self,
+        registry,
+        stack_id: str,
+        builder: Callable[..., Stack],
+        args: tuple,
+        dependencies: list = None,
+        post_build: Callable[[Stack], None] = None,
+    ) -> None:
+        self.registry = registry
+        self.stack_id: str = stack_id
+        self.builder: Callable[..., Stack] = builder
+        self.args: tuple = args
+        self.dependencies: list = dependencies if dependencies else []
+        self.post_build: Optional[Callable[[Stack], None]] = post_build
+
+    def __call__(self) -> Stack:
+        return self.registry.build_stack(self.stack_id)
+
+
+class CdkLazyStackMap(Mapping):
+    """
+    A mapping of keys (e.g. deploy envs, database servers) to deferred CDK stack builders,
+    each CDK stack is instantiated (once) on first lookup.
+    """
+
+    def __init__(self, lazy_stacks: dict[str, CdkLazyStack]) -> None:
+        self.lazy_stacks: dict[str, CdkLazyStack] = lazy_stacks
+
+    def __getitem__(self, key: str) -> Stack:
+        return self.lazy_stacks[key]()
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self.lazy_stacks)
+
+    def __len__(self) -> int:
+        return len(self.lazy_stacks)
+
+    def get_stack_id(self, key: str) -> str:
+        return self.lazy_stacks[key].stack_id
+
+
+class CdkStackRegistry:
+    """
+    CDK stack registry class, for lazy and selective instantiation of CDK stacks.
+
+    Each CDK stack is registered as a deferred builder, along with any dependencies not already implied by the
+    builder itself (e.g. a CDK stack setting CDK constructs factory attributes). Only the selected CDK stacks, and
+    their transitive dependencies, get instantiated. If no CDK stacks are selected, all CDK stacks get instantiated.
+
+    CDK stacks are selected by CDK stack ID (wildcards supported, e.g. 'CdkDog*'), using either:
+      - CDK context, e.g. `cdk deploy -c stacks=CdkProxyServerStack CdkProxyServerStack`
+      - Env var, e.g. `CDK_STACKS=CdkProxyServerStack,CdkPypi* cdk synth`
+    """
+
+    SELECTION_CONTEXT_KEY: str = "stacks"
+    SELECTION_ENV_VAR: str = "CDK_STACKS"
+
+    def __init__(self, app: App) -> None:
+        self.app: App = app
+        self.selection: list[str] = self._get_selection()
+        self.synth_cache = None
+
+        self.lazy_stacks: dict[str, CdkLazyStack] = {}
+        self.stacks: dict[str, Stack] = {}
+        self.dependencies: dict[str, set[str]] = {}
+        self._building: list[str] = []
+
+    # --- Private methods ---
+
+    def _add(
+        self,
+        stack_id: str,
+        builder: Callable[..., Stack],
+        args: tuple,
+        dependencies: list = None,
+        post_build: Callable[[Stack], None] = None,
+    ) -> CdkLazyStack:
+        if stack_id in self.lazy_stacks:
+            sys.exit(f"## CDK stack '{stack_id}' is already registered.")
+        self.lazy_stacks[stack_id] = CdkLazyStack(self, stack_id, builder, args, dependencies, post_build)
+        return self.lazy_stacks[stack_id]
+
+    def _get_selection(self) -> list[str]:
+        selection = self.app.node.try_get_context(self.SELECTION_CONTEXT_KEY) or os.getenv(self.SELECTION_ENV_VAR)
+        if not selection:
+            return []
+        if isinstance(selection, str):
+            selection = selection.replace(" ", ",").split(",")
+        return [i.strip() for i in selection if i and i.strip()]
+
+    def _build_or_defer(self, stack_ids: list[str]) -> list[Stack]:
+        # Unchanged CDK stacks get emitted from the CDK synth cache (if enabled), once the CDK app is synthesized
+        return [self.build_stack(i) for i in stack_ids if not (self.synth_cache and self.synth_cache.defer(i))]
+
+    # --- Public methods ---
+
+    @property
+    def building(self) -> Optional[str]:
+        """
+        :return: The ID of the CDK stack currently being instantiated, if any.
+        """
+        return self._building[-1] if self._building else None
+
+    def build(self) -> list[Stack]:
+        """
+        Instantiate the selected CDK stacks (and their transitive dependencies), or all CDK stacks if none selected.
+
+        :return: The selected CDK stacks (excluding any deferred to the CDK synth cache).
+        """
+        if not self.selection:
+            return self._build_or_defer(list(self.lazy_stacks))
+        stack_ids: list[str] = []
+        for pattern in self.selection:
+            if not (matches := [i for i in self.lazy_stacks if fnmatch.fnmatchcase(i, pattern)]):
+                sys.exit(
+                    f"## No CDK stacks match the selection '{pattern}' "
+                    f"(from '-c {self.SELECTION_CONTEXT_KEY}=' or '{self.SELECTION_ENV_VAR}')."
+                )
+            stack_ids += [i for i in matches if i not in stack_ids]
+        stacks: list[Stack] = self._build_or_defer(stack_ids)
+        print(
+            f"## CDK stacks selected: {len(stack_ids)}, instantiated (inc. dependencies): "
+            f"{len(self.stacks)} of {len(self.lazy_stacks)}",
+            file=sys.stderr,
+        )
+        return stacks
+
+    def build_stack(self, stack_id: str) -> Stack:
+        """
+        Instantiate a CDK stack (once), instantiating its dependencies first.
+
+        :param stack_id: The CDK stack ID.
+        :return: The CDK stack.
+        """
+        if self._building:
+            self.dependencies.setdefault(self._building[-1], set()).add(stack_id)
+        if stack := self.stacks.get(stack_id):
+            return stack
+        if stack_id in self._building:
+            sys.exit(f"## Circular CDK stack dependency: {' -> '.join(self._building + [stack_id])}")
+        lazy_stack: CdkLazyStack = self.lazy_stacks[stack_id]
+        # Record the inputs of each CDK stack for the CDK synth cache (if enabled), instrumenting the outermost
+        #  CDK stack instantiation only (i.e. inc. its dependencies)
+        instrument = (
+            self.synth_cache.instrument() if self.synth_cache and not self._building else contextlib.nullcontext()
+        )
+        self._building.append(stack_id)
+        try:
+            with instrument:
+                for dependency in lazy_stack.dependencies:
+                    dependency()
+                stack = lazy_stack.builder(*lazy_stack.args)
+        finally:
+            self._building.pop()
+        self.stacks[stack_id] = stack
+        if lazy_stack.post_build:
+            lazy_stack.post_build(stack)
+        return stack
+
+    def set_synth_cache(self, synth_cache) -> None:
+        """
+        Set the CDK synth cache, for unchanged CDK stacks to be emitted from the cache, instead of instantiated.
+
+        :param synth_cache: The CDK synth cache (a CdkSynthCache object), or None if not enabled.
+        """
+        self.synth_cache = synth_cache
+
+    def synth(self) -> cx_api.CloudAssembly:
+        """
+        Synthesize the CDK app, and then update the cloud assembly dir from the CDK synth cache (if enabled).
+
+        :return: The cloud assembly.
+        """
+        cloud_assembly: cx_api.CloudAssembly = self.app.synth()
+        if self.synth_cache:
+            self.synth_cache.update(cloud_assembly.directory)
+        return cloud_assembly
+
+    def stack(
+        self, stack_id: str, dependencies: list = None, post_build: Callable[[Stack], None] = None
+    ) -> Callable[[Callable[[str], Stack]], CdkLazyStack]:
+        """
+        Decorator, to register a CDK stack builder function, taking the CDK stack ID.
+
+        The deferred CDK stack is called without args, so the builder function gives the CDK stack ID a default
+        (i.e. `stack_id: str = None`), keeping its signature consistent for linters (e.g. pylint).
+
+        :param stack_id: The CDK stack ID.
+        :param dependencies: Any additional CDK stack dependencies (CdkLazyStack objects), to instantiate first.
+        :param post_build: A function to call with the CDK stack, once instantiated (e.g. to add tags).
+        :return: The deferred CDK stack, call it to get the CDK stack.
+        """
+
+        def decorator(builder: Callable[[str], Stack]) -> CdkLazyStack:
+            return self._add(stack_id, builder, (stack_id,), dependencies, post_build)
+
+        return decorator
+
+    def stack_map(
+        self,
+        items: dict,
+        stack_id: Callable[[str], str],
+        dependencies: list = None,
+        post_build: Callable[[dict[str, Stack]], None] = None,
+    ) -> Callable[[Callable[[str, str, dict], Stack]], CdkLazyStackMap]:
+        """
+        Decorator, to register a CDK stack builder function for each item, taking the CDK stack ID, item key and
+        item value (e.g. a deploy env, and its metadata).
+
+        :param items: The mapping of item keys to item values.
+        :param stack_id: A function to get the CDK stack ID, for an item key.
+        :param dependencies: Any additional CDK stack dependencies (CdkLazyStack objects), to instantiate first.
+        :param post_build: A function to call with a mapping of item key to CDK stack, once instantiated
+            (e.g. to add tags).
+        :return: The mapping of item keys to deferred CDK stacks, lookup a key to get the CDK stack.
+        """
+
+        def decorator(builder: Callable[[str, str, dict], Stack]) -> CdkLazyStackMap:
+            lazy_stacks: dict[str, CdkLazyStack] = {}
+            for k, v in items.items():
+                id_: str = stack_id(k)
+                lazy_stacks[k] = self._add(
+                    id_,
+                    builder,
+                    (id_, k, v),
+                    dependencies,
+                    (lambda s, k=k: post_build({k: s})) if post_build else None,
+                )
+            return CdkLazyStackMap(lazy_stacks)
+
+        return decorator
@@ -0,0 +1,480 @@
+import ast
+import builtins
+import contextlib
+import functools
+import hashlib
+import importlib.metadata
+import inspect
+import json
+import os
+import re
+import shutil
+import sys
+import textwrap
+from enum import Enum
+from typing import Callable, Iterator, Optional
+
+from aws_cdk import aws_iam as iam, aws_lambda as lambda_
+
+from cdk_sih.constructs.factory import CdkConstructsFactory
+
+
+class CdkSynthCache:
+    """
+    CDK synth cache class, for an opt-in, content-addressed cache of synthesized CDK stack templates and assets.
+
+    Enabled by setting the env var `CDK_SYNTH_CACHE`, to either '1' (using the default cache dir), or a cache dir,
+    e.g. `CDK_SYNTH_CACHE=1 cdk synth`.
+
+    Each CDK stack's cache key fingerprints:
+      - The CDK library version, the CDK constructs (inc. factory and schedules) source, and the CDK app config
+        (i.e. all of `app.py`, except the CDK stack builder functions), inc. the factory word map and env vars.
+      - The CDK stack builder function source, and its item (e.g. the deploy env, and its `env_meta`).
+      - The source of the CDK stack class (and its base classes), and the `cdk_sih` modules they import.
+      - The contents of all files read, and Lambda code (and other asset) dirs referenced, when instantiating the
+        CDK stack (e.g. buildspecs, SES templates, CDK custom outputs), and the values of env vars read.
+      - The cache keys of the CDK stacks it depends on.
+
+    Unchanged CDK stacks are emitted from the cache, into the cloud assembly dir, without being instantiated.
+    CDK stacks which are unchanged, but still instantiated (as a dependency of a changed CDK stack), keep their
+    cached outputs, so that exports used by CDK stacks emitted from the cache are kept.
+    """
+
+    ENV_VAR: str = "CDK_SYNTH_CACHE"
+    CACHE_DIR_DEFAULT: str = ".cdk.synth-cache"
+
+    ASSETS_DIR: str = "assets"
+    STACKS_DIR: str = "stacks"
+    TEMPLATES_DIR: str = "templates"
+
+    DIRS_: str = "dirs"
+    ENV_: str = "env"
+    FILES_: str = "files"
+
+    MANIFEST_FILE: str = "manifest.json"
+    STACK_ARTIFACT_TYPE: str = "aws:cloudformation:stack"
+    ASSETS_ARTIFACT_SUFFIX: str = ".assets"
+
+    ENCODING: str = "utf-8"
+    HASH_MISSING: str = "<missing>"
+
+    def __init__(self, registry, cache_dir: str = CACHE_DIR_DEFAULT, app_inputs: dict = None) -> None:
+        self.registry = registry
+        self.cache_dir: str = os.path.abspath(cache_dir)
+        self.app_inputs: dict = app_inputs if app_inputs else {}
+
+        # The inputs (files read, asset dirs, env vars) recorded per CDK stack, whilst instantiating it
+        self.inputs: dict[str, dict[str, set[str]]] = {}
+        self.deferred: list[str] = []
+
+        self._global_key: Optional[str] = None
+        self._static_keys: dict[str, str] = {}
+        self._keys: dict[str, Optional[str]] = {}
+        self._app_keys: dict[str, str] = {}
+        self._path_hashes: dict[str, str] = {}
+        self._exclude_paths: list[str] = [self.cache_dir, sys.prefix, sys.base_prefix]
+
+    # --- Private methods ---
+
+    @staticmethod
+    def _hash(obj) -> str:
+        def default(o) -> str:
+            if isinstance(o, Enum):
+                return o.name
+            if isinstance(o, set):
+                return sorted(o)
+            # Exclude object addresses, e.g. '<... object at 0x7f...>'
+            return re.sub(r" at 0x[0-9a-f]+", "", repr(o))
+
+        return hashlib.sha256(
+            json.dumps(obj, sort_keys=True, default=default).encode(CdkSynthCache.ENCODING)
+        ).hexdigest()
+
+    def _hash_path(self, path: str) -> str:
+        if (path_hash := self._path_hashes.get(path)) is not None:
+            return path_hash
+        h = hashlib.sha256()
+        if os.path.isfile(path):
+            with open(path, "rb") as f:
+                h.update(f.read())
+        elif os.path.isdir(path):
+            for root, dirs, files in os.walk(path):
+                dirs[:] = sorted(i for i in dirs if i != "__pycache__")
+                for file in sorted(files):
+                    file_path: str = os.path.join(root, file)
+                    h.update(os.path.relpath(file_path, path).encode(self.ENCODING))
+                    with open(file_path, "rb") as f:
+                        h.update(f.read())
+        else:
+            h.update(self.HASH_MISSING.encode(self.ENCODING))
+        self._path_hashes[path] = h.hexdigest()
+        return self._path_hashes[path]
+
+    @staticmethod
+    def _get_app_config(path: str) -> str:
+        # The CDK app config, as an AST dump (i.e. ignoring comments and formatting), except the
+        # CDK stack builder functions (registered with the CDK stack registry), which are fingerprinted per CDK stack
+        def dump(nodes: list) -> list[str]:
+            dumps: list[str] = []
+            for node in nodes:
+                if isinstance(node, ast.FunctionDef) and any(
+                    isinstance(i, ast.Call) and ast.unparse(i.func).startswith("registry.") for i in node.decorator_list
+                ):
+                    continue
+                if isinstance(node, (ast.If, ast.For, ast.While)):
+                    dumps.append(ast.dump(node.test if isinstance(node, (ast.If, ast.While)) else node.iter))
+                    dumps += dump(node.body) + dump(node.orelse)
+                else:
+                    dumps.append(ast.dump(node))
+            return dumps
+
+        with open(path, "r", encoding=CdkSynthCache.ENCODING) as f:
+            return CdkSynthCache._hash(dump(ast.parse(f.read()).body))
+
+    @staticmethod
+    def _get_module_paths(stack_cls: type) -> set[str]:
+        # The `cdk_sih` modules, of the CDK stack class (and its base classes), and the `cdk_sih` modules they import
+        modules: set = set()
+        for base_cls in stack_cls.__mro__:
+            if (module := sys.modules.get(base_cls.__module__)) and module.__name__.startswith("cdk_sih"):
+                modules.add(module)
+                for val in vars(module).values():
+                    if (val_module := inspect.getmodule(val)) and val_module.__name__.startswith("cdk_sih"):
+                        modules.add(val_module)
+        return {os.path.abspath(inspect.getfile(i)) for i in modules}
+
+    def _get_global_key(self) -> str:
+        if self._global_key is None:
+            constructs_dir: str = os.path.dirname(os.path.abspath(__file__))
+            global_paths: list[str] = sorted(
+                [os.path.join(constructs_dir, i) for i in os.listdir(constructs_dir) if i.endswith(".py")]
+                + [os.path.abspath(inspect.getfile(sys.modules["schedules"]))]
+            )
+            context: dict = json.loads(os.getenv("CDK_CONTEXT_JSON", "{}"))
+            context.pop(self.registry.SELECTION_CONTEXT_KEY, None)
+            self._global_key = self._hash(
+                {
+                    "aws_cdk_lib": importlib.metadata.version("aws-cdk-lib"),
+                    "app_inputs": self.app_inputs,
+                    "context": context,
+                    "paths": {i: self._hash_path(i) for i in global_paths},
+                }
+            )
+        return self._global_key
+
+    def _get_static_key(self, stack_id: str) -> str:
+        if (static_key := self._static_keys.get(stack_id)) is None:
+            lazy_stack = self.registry.lazy_stacks[stack_id]
+            builder: Callable = lazy_stack.builder
+            app_path: str = os.path.abspath(inspect.getsourcefile(builder))
+            if app_path not in self._app_keys:
+                self._app_keys[app_path] = self._get_app_config(app_path)
+            stack_cls = inspect.signature(builder).return_annotation
+            static_key = self._hash(
+                {
+                    "global": self._get_global_key(),
+                    "app": self._app_keys[app_path],
+                    "stack_id": stack_id,
+                    "builder": ast.dump(ast.parse(textwrap.dedent(inspect.getsource(builder)))),
+                    "args": lazy_stack.args,
+                    "paths": {
+                        i: self._hash_path(i)
+                        for i in sorted(self._get_module_paths(stack_cls) if inspect.isclass(stack_cls) else set())
+                    },
+                }
+            )
+            self._static_keys[stack_id] = static_key
+        return static_key
+
+    def _get_inputs_key(self, inputs: dict[str, list[str]]) -> str:
+        return self._hash(
+            {
+                self.FILES_: {i: self._hash_path(i) for i in inputs.get(self.FILES_, [])},
+                self.DIRS_: {i: self._hash_path(i) for i in inputs.get(self.DIRS_, [])},
+                self.ENV_: {i: os.environ.get(i) for i in inputs.get(self.ENV_, [])},
+            }
+        )
+
+    def _get_entry_path(self, stack_id: str) -> str:
+        return os.path.join(self.cache_dir, self.STACKS_DIR, stack_id, f"{self._get_static_key(stack_id)}.json")
+
+    def _load_entry(self, stack_id: str) -> Optional[dict]:
+        if not os.path.isfile(entry_path := self._get_entry_path(stack_id)):
+            return None
+        with open(entry_path, "r", encoding=self.ENCODING) as f:
+            return json.load(f)
+
+    def _get_key(self, stack_id: str, inputs: dict[str, list[str]], dependencies: list[str]) -> Optional[str]:
+        dependency_keys: dict[str, Optional[str]] = {i: self.get_key(i) for i in sorted(dependencies)}
+        if not all(dependency_keys.values()):
+            return None
+        return self._hash(
+            {
+                "static": self._get_static_key(stack_id),
+                "inputs": self._get_inputs_key(inputs),
+                "dependencies": dependency_keys,
+            }
+        )
+
+    def _record(self, kind: str, path: str) -> None:
+        if not (stack_id := self.registry.building):
+            return
+        if kind != self.ENV_:
+            path = os.path.abspath(path)
+            if any(path.startswith(i) for i in self._exclude_paths):
+                return
+        self.inputs.setdefault(stack_id, {}).setdefault(kind, set()).add(path)
+
+    def _wrap(self, func: Callable, kind: str) -> Callable:
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            if args and isinstance(args[0], (str, os.PathLike)):
+                self._record(kind, os.fspath(args[0]))
+            return func(*args, **kwargs)
+
+        return wrapper
+
+    def _wrap_method(self, cls: type, attr: str, kind: str):
+        static_attr = inspect.getattr_static(cls, attr)
+        if isinstance(static_attr, staticmethod):
+            return staticmethod(self._wrap(static_attr.__func__, kind))
+        if isinstance(static_attr, classmethod):
+            return classmethod(self._wrap(static_attr.__func__, kind))
+        return self._wrap(static_attr, kind)
+
+    def _wrap_open(self, func: Callable) -> Callable:
+        @functools.wraps(func)
+        def wrapper(file, *args, **kwargs):
+            mode: str = args[0] if args else kwargs.get("mode", "r")
+            if isinstance(file, (str, os.PathLike)) and not any(i in mode for i in "wax+"):
+                self._record(self.FILES_, os.fspath(file))
+            return func(file, *args, **kwargs)
+
+        return wrapper
+
+    def _wrap_custom_outputs(self, func: Callable) -> Callable:
+        # NB. The CDK custom outputs file is only opened once per process (see the CDK constructs factory cache)
+        @functools.wraps(func)
+        def wrapper(factory: CdkConstructsFactory, *args, **kwargs):
+            self._record(self.FILES_, factory.cdk_custom_outputs_path)
+            return func(factory, *args, **kwargs)
+
+        return wrapper
+
+    def _get_artifacts(self, manifest: dict, stack_id: str) -> dict[str, dict]:
+        artifacts: dict[str, dict] = manifest.get("artifacts", {})
+        return {k: v for k, v in artifacts.items() if k in {stack_id, f"{stack_id}{self.ASSETS_ARTIFACT_SUFFIX}"}}
+
+    @staticmethod
+    def _get_artifact_files(artifacts: dict[str, dict]) -> list[str]:
+        return [
+            (
+                v["properties"]["templateFile"]
+                if v.get("type") == CdkSynthCache.STACK_ARTIFACT_TYPE
+                else v["properties"]["file"]
+            )
+            for v in artifacts.values()
+            if v.get("properties", {}).get("templateFile") or v.get("properties", {}).get("file")
+        ]
+
+    def _get_asset_paths(self, assets_path: str) -> list[str]:
+        with open(assets_path, "r", encoding=self.ENCODING) as f:
+            assets: dict = json.load(f)
+        return sorted(
+            {v["source"]["path"] for v in assets.get("files", {}).values() if v.get("source", {}).get("path")}
+            | {
+                v["source"]["directory"]
+                for v in assets.get("dockerImages", {}).values()
+                if v.get("source", {}).get("directory")
+            }
+        )
+
+    @staticmethod
+    def _copy(src: str, dst: str) -> None:
+        os.makedirs(os.path.dirname(dst), exist_ok=True)
+        if os.path.isdir(src):
+            if not os.path.exists(dst):  # Asset dirs are content-addressed by CDK, i.e. 'asset.<hash>'
+                shutil.copytree(src, dst)
+        else:
+            shutil.copy2(src, dst)
+
+    def _store(self, outdir: str, manifest: dict, stack_id: str) -> None:
+        inputs: dict[str, list[str]] = {k: sorted(v) for k, v in self.inputs.get(stack_id, {}).items()}
+        dependencies: list[str] = sorted(
+            self.registry.dependencies.get(stack_id, set())
+            | {
+                i
+                for i in manifest["artifacts"].get(stack_id, {}).get("dependencies", [])
+                if not i.endswith(self.ASSETS_ARTIFACT_SUFFIX)
+            }
+        )
+        if not (key := self._get_key(stack_id, inputs, dependencies)):
+            return
+        artifacts: dict[str, dict] = self._get_artifacts(manifest, stack_id)
+        files: list[str] = self._get_artifact_files(artifacts)
+        asset_paths: list[str] = []
+        for file in files:
+            self._copy(os.path.join(outdir, file), os.path.join(self.cache_dir, self.TEMPLATES_DIR, key, file))
+            if file.endswith(".assets.json"):
+                asset_paths += self._get_asset_paths(os.path.join(outdir, file))
+        asset_paths = [i for i in asset_paths if i not in files]  # i.e. Excluding the template itself
+        for asset_path in asset_paths:
+            self._copy(os.path.join(outdir, asset_path), os.path.join(self.cache_dir, self.ASSETS_DIR, asset_path))
+
+        os.makedirs(os.path.dirname(entry_path := self._get_entry_path(stack_id)), exist_ok=True)
+        with open(entry_path, "w", encoding=self.ENCODING) as f:
+            json.dump(
+                {
+                    "key": key,
+                    "inputs": inputs,
+                    "dependencies": dependencies,
+                    "artifacts": artifacts,
+                    "files": files,
+                    "asset_paths": asset_paths,
+                },
+                f,
+                indent=2,
+                sort_keys=True,
+            )
+        self._keys[stack_id] = key
+
+    def _emit(self, outdir: str, manifest: dict, stack_id: str, entry: dict) -> None:
+        for file in entry["files"]:
+            self._copy(os.path.join(self.cache_dir, self.TEMPLATES_DIR, entry["key"], file), os.path.join(outdir, file))
+        for asset_path in entry["asset_paths"]:
+            self._copy(os.path.join(self.cache_dir, self.ASSETS_DIR, asset_path), os.path.join(outdir, asset_path))
+        manifest["artifacts"].update(entry["artifacts"])
+
+    def _merge_outputs(self, outdir: str, stack_id: str, entry: dict) -> None:
+        # Keep the cached outputs (e.g. exports used by CDK stacks emitted from the cache) of an unchanged CDK stack,
+        # re-instantiated as a dependency of a changed CDK stack.
+        template_file: str = entry["artifacts"][stack_id]["properties"]["templateFile"]
+        cached_template_path: str = os.path.join(self.cache_dir, self.TEMPLATES_DIR, entry["key"], template_file)
+        with open(cached_template_path, "r", encoding=self.ENCODING) as f:
+            cached_outputs: dict = json.load(f).get("Outputs", {})
+        with open(template_path := os.path.join(outdir, template_file), "r", encoding=self.ENCODING) as f:
+            template: dict = json.load(f)
+        if missing := {k: v for k, v in cached_outputs.items() if k not in template.get("Outputs", {})}:
+            template.setdefault("Outputs", {}).update(missing)
+            with open(template_path, "w", encoding=self.ENCODING) as f:
+                json.dump(template, f, indent=1)
+
+    # --- Public methods ---
+
+    @classmethod
+    def from_env(cls, registry, app_inputs: dict = None) -> Optional["CdkSynthCache"]:
+        """
+        Get the CDK synth cache, if the `CDK_SYNTH_CACHE` env var is set.
+
+        NB. Set on the CDK stack registry before any CDK stacks are instantiated, so each CDK stack instantiation is
+        instrumented, see: ``instrument``.
+
+        :param registry: The CDK stack registry.
+        :param app_inputs: The CDK app inputs, not visible from the CDK app source (e.g. the AWS account and region).
+        :return: The CDK synth cache, or None if not enabled.
+        """
+        if not (val := os.getenv(cls.ENV_VAR)):
+            return None
+        return cls(
+            registry, cls.CACHE_DIR_DEFAULT if val.lower() in {"1", "true", "yes"} else val, app_inputs=app_inputs
+        )
+
+    @contextlib.contextmanager
+    def instrument(self) -> Iterator[None]:
+        """
+        Instrument file reads, asset dirs and env var reads, to record the inputs of each CDK stack, whilst
+        instantiating CDK stacks (see ``CdkStackRegistry.build_stack``). The originals are restored on exit.
+        """
+        wrappers: list[tuple] = [
+            (builtins, "open", self._wrap_open(builtins.open)),
+            (os, "getenv", self._wrap(os.getenv, self.ENV_)),
+            (lambda_.Code, "from_asset", self._wrap_method(lambda_.Code, "from_asset", self.DIRS_)),
+            (
+                iam.SamlMetadataDocument,
+                "from_file",
+                self._wrap_method(iam.SamlMetadataDocument, "from_file", self.FILES_),
+            ),
+        ] + [
+            (CdkConstructsFactory, i, self._wrap_custom_outputs(getattr(CdkConstructsFactory, i)))
+            for i in ["file_json_load_cdk_custom_outputs", "get_cdk_custom_output"]
+        ]
+        originals: list[tuple] = [(obj, attr, vars(obj).get(attr)) for obj, attr, _ in wrappers]
+        try:
+            for obj, attr, wrapper in wrappers:
+                setattr(obj, attr, wrapper)
+            yield
+        finally:
+            for obj, attr, original in originals:
+                if original is None:
+                    delattr(obj, attr)  # i.e. Inherited, not set on the object itself
+                else:
+                    setattr(obj, attr, original)
+
+    def get_key(self, stack_id: str) -> Optional[str]:
+        """
+        Get the cache key of an unchanged (i.e. cached) CDK stack, which has not been instantiated.
+
+        :param stack_id: The CDK stack ID.
+        :return: The cache key, or None if the CDK stack is not cached, or has changed.
+        """
+        if stack_id in self._keys:
+            return self._keys[stack_id]
+        self._keys[stack_id] = None  # Guard against circular CDK stack dependencies
+        if stack_id in self.registry.lazy_stacks and (entry := self._load_entry(stack_id)):
+            if self._get_key(stack_id, entry["inputs"], entry["dependencies"]) == entry["key"]:
+                self._keys[stack_id] = entry["key"]
+        return self._keys[stack_id]
+
+    def defer(self, stack_id: str) -> bool:
+        """
+        Defer instantiating a CDK stack, if unchanged (i.e. it can be emitted from the cache).
+
+        :param stack_id: The CDK stack ID.
+        :return: True if deferred.
+        """
+        if self.get_key(stack_id) is None:
+            return False
+        if stack_id not in self.deferred:
+            self.deferred.append(stack_id)
+        return True
+
+    def update(self, outdir: str) -> list[str]:
+        """
+        Once the CDK app is synthesized: emit the deferred (and not since instantiated) CDK stacks, and the CDK stacks
+        they depend on, from the cache into the cloud assembly dir, and store all instantiated CDK stacks in the cache.
+
+        :param outdir: The cloud assembly dir.
+        :return: The CDK stack IDs emitted from the cache.
+        """
+        with open(manifest_path := os.path.join(outdir, self.MANIFEST_FILE), "r", encoding=self.ENCODING) as f:
+            manifest: dict = json.load(f)
+        manifest.setdefault("artifacts", {})
+
+        emitted: list[str] = []
+        pending: list[str] = list(self.deferred)
+        while pending:
+            if (stack_id := pending.pop(0)) in emitted or stack_id in self.registry.stacks:
+                continue
+            entry: dict = self._load_entry(stack_id)
+            self._emit(outdir, manifest, stack_id, entry)
+            emitted.append(stack_id)
+            pending += entry["dependencies"]
+
+        for stack_id in self.registry.stacks:
+            if self._keys.get(stack_id) and (entry := self._load_entry(stack_id)):
+                self._merge_outputs(outdir, stack_id, entry)
+            elif manifest.get("missing"):
+                # Context lookups still to be done by the CDK CLI (i.e. templates with dummy values), don't cache
+                continue
+            else:
+                self._keys.pop(stack_id, None)
+                self._store(outdir, manifest, stack_id)
+
+        with open(manifest_path, "w", encoding=self.ENCODING) as f:
+            json.dump(manifest, f, indent=2)
+        print(
+            f"## CDK synth cache: {len(emitted)} CDK stacks emitted from cache, "
+            f"{len(self.registry.stacks)} instantiated ('{self.cache_dir}').",
+            file=sys.stderr,
+        )
+        return emitted
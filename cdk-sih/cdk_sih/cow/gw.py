@@ -38,16 +38,17 @@ class CdkCowGwStack(CdkGwStack):
             ),
             "APP_NAME": self.get_app_name(self.admin),
             "BASE_URL": getattr(self, factory.URL_PRIVATE_),
-            "DB_ENGINE_OPTIONS": json.dumps(self.get_sqlalchemy_database_engine_options()),
+            "DB_ENGINE_OPTIONS": json.dumps(self.get_sqlalchemy_database_engine_options(database_stack)),
             "DB_URL": self.get_sqlalchemy_database_uri(database_stack, deploy_env, secret_db_pw=False),
             "DEBUG": json.dumps(True),  # Local dev against Sih-Preview deploy env
             "GW_AUTOIOD": self.auto_iod,
             "INTERNAL_NAME": self.internal_name,
             "OPENAPI_OFF": json.dumps(False),  # Local dev against Sih-Preview deploy env
             "PASSLIB_SCHEMES": self.passlib_schemes,
-            "REDIS_HOST": cache_stack.ec_redis_cluster_rep_group.attr_primary_end_point_address,
-            "REDIS_HOST_READER": cache_stack.ec_redis_cluster_rep_group.attr_reader_end_point_address,
-            "REDIS_PORT": cache_stack.ec_redis_cluster_rep_group.attr_primary_end_point_port,
+            "REDIS_CLUSTER": cache_stack.ec_redis_cluster,
+            "REDIS_HOST": cache_stack.ec_redis_host,
+            "REDIS_HOST_READER": cache_stack.ec_redis_host_reader,
+            "REDIS_PORT": cache_stack.ec_redis_port,
             "REDIS_SSL": self.redis_ssl,
             "STATUS_ROUTE": self.status_route,
             "TOKEN_ALGORITHM": self.token_algorithm,
@@ -57,6 +58,7 @@ class CdkCowGwStack(CdkGwStack):
             "UVICORN_WORKERS": self.workers,
             "VERSION": deploy_env,
             "WEB_PORTAL_URL": self.url_portal,
+            "WORKER_THREADS": self.get_worker_threads(database_stack),
             # "TOKEN_DURATION_MINS": self.token_duration_mins,  # (?) Using default value in Gw app
             # "TOKEN_REFRESH_DURATION_MINS": self.token_refresh_duration_mins,  # (?) Using default value in Gw app
         }
@@ -193,7 +193,9 @@ class CdkDogEmStack(Stack):
             self,
             ecs_task_definition,
             # ecs.ContainerImage.from_registry(name="public.ecr.aws/docker/library/wordpress:latest"),
-            ecs.RepositoryImage.from_ecr_repository(repository=base_stack.repo_ecomm, tag=deploy_env),
+            ecs.RepositoryImage.from_ecr_repository(
+                repository=base_stack.repo_ecomm, tag=factory.get_image_tag(self, deploy_env)
+            ),
             self.ecs_container_name,
             getattr(self, factory.ALB_PORT_),
             ecs_task_definition_container_memory_mib,
@@ -124,7 +124,7 @@ class CdkDogGwStack(CdkGwStack):
             "APP_NAME": self.get_app_name(self.admin),
             "BACKGROUND_URL": self.get_url_background(self, bkg_ms_stack),
             "BASE_URL": getattr(self, factory.URL_PRIVATE_),
-            "DB_ENGINE_OPTIONS": json.dumps(self.get_sqlalchemy_database_engine_options()),
+            "DB_ENGINE_OPTIONS": json.dumps(self.get_sqlalchemy_database_engine_options(database_stack)),
             "DB_URL": self.get_sqlalchemy_database_uri(database_stack, deploy_env, secret_db_pw=False),
             "DEBUG": self.debug,
             "LIONAPI_BASE_URL": factory.get_url_for_ms_from_cdk_stack(self, lion_ms_stack),
@@ -135,9 +135,10 @@ class CdkDogGwStack(CdkGwStack):
             "PDF_CDK_STACK_REGION": factory.get_attr_env_region(self),
             "PDF_LAMBDA_FUNCTION_NAME": pdf_ms_stack.pdf_lambda_func.function_name,
             "PORTAL_BASE_URL": self.url_portal,
-            "REDIS_HOST": cache_stack.ec_redis_cluster_rep_group.attr_primary_end_point_address,
-            "REDIS_HOST_READER": cache_stack.ec_redis_cluster_rep_group.attr_reader_end_point_address,
-            "REDIS_PORT": cache_stack.ec_redis_cluster_rep_group.attr_primary_end_point_port,
+            "REDIS_CLUSTER": cache_stack.ec_redis_cluster,
+            "REDIS_HOST": cache_stack.ec_redis_host,
+            "REDIS_HOST_READER": cache_stack.ec_redis_host_reader,
+            "REDIS_PORT": cache_stack.ec_redis_port,
             "REDIS_SSL": self.redis_ssl,
             "S3_BUCKET_NAME": getattr(self, factory.STORAGE_S3_BUCKET_NAME_),
             "S3_CDK_STACK_ACCOUNT_ID": factory.get_attr_env_account(self),
@@ -159,6 +160,7 @@ class CdkDogGwStack(CdkGwStack):
             "UVICORN_LOG_LEVEL": self.log_level,
             "UVICORN_PORT": str(getattr(self, factory.ALB_PORT_)),
             "UVICORN_WORKERS": self.workers,
+            "WORKER_THREADS": self.get_worker_threads(database_stack),
         }
 
         ecs_container_secret: secretsmanager.ISecret = getattr(base_stack, factory.ECS_CONTAINER_SECRET_)
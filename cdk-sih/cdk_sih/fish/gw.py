@@ -44,7 +44,7 @@ class CdkFishGwStack(CdkGwStack):
             "BASE_URL": getattr(self, factory.URL_PRIVATE_),
             "BACKGROUND_DEBUG_LEVEL": str(int(json.loads(self.debug))),
             "BACKGROUND_URL": f"{factory.HTTPS_}www.google.com/search?q=",
-            "DB_ENGINE_OPTIONS": json.dumps(self.get_sqlalchemy_database_engine_options()),
+            "DB_ENGINE_OPTIONS": json.dumps(self.get_sqlalchemy_database_engine_options(database_stack)),
             "DB_URL": self.get_sqlalchemy_database_uri(database_stack, deploy_env, secret_db_pw=False),
             "DEBUG": self.debug,
             "FIREBASE_ACCOUNT_INFO": base_stack.firebase_account_info_param.string_value,
@@ -57,9 +57,10 @@ class CdkFishGwStack(CdkGwStack):
             "MAIL_USERNAME": getattr(base_stack, factory.MAIL_USER_),
             "OPENAPI_OFF": self.openapi_off,
             "PASSLIB_SCHEMES": self.passlib_schemes,
-            "REDIS_HOST": cache_stack.ec_redis_cluster_rep_group.attr_primary_end_point_address,
-            "REDIS_HOST_READER": cache_stack.ec_redis_cluster_rep_group.attr_reader_end_point_address,
-            "REDIS_PORT": cache_stack.ec_redis_cluster_rep_group.attr_primary_end_point_port,
+            "REDIS_CLUSTER": cache_stack.ec_redis_cluster,
+            "REDIS_HOST": cache_stack.ec_redis_host,
+            "REDIS_HOST_READER": cache_stack.ec_redis_host_reader,
+            "REDIS_PORT": cache_stack.ec_redis_port,
             "REDIS_SSL": self.redis_ssl,
             "S3_BUCKET_NAME": getattr(self, factory.STORAGE_S3_BUCKET_NAME_),
             "S3_CDK_STACK_ACCOUNT_ID": factory.get_attr_env_account(self),
@@ -82,6 +83,7 @@ class CdkFishGwStack(CdkGwStack):
             "UVICORN_PORT": str(getattr(self, factory.ALB_PORT_)),
             "UVICORN_WORKERS": self.workers,
             "WEB_PORTAL_URL": self.url_portal,
+            "WORKER_THREADS": self.get_worker_threads(database_stack),
         }
 
         ecs_container_secret: secretsmanager.ISecret = getattr(base_stack, factory.ECS_CONTAINER_SECRET_)
@@ -1,3 +1,5 @@
+import json
+
 from aws_cdk import (
     Stack,
     aws_elasticache as elasticache,
@@ -22,6 +24,7 @@ class CdkCacheStack(Stack):
         vpc_stack: CdkVpcSihStack,
         ec_redis_auto_scaling_custom: bool = None,
         ec_redis_instance_type_custom: str = None,
+        ec_redis_shards_custom: int = None,
         **kwargs,
     ) -> None:
         setattr(self, factory.ENV_, factory.check_env_exists(kwargs))
@@ -62,4 +65,13 @@ class CdkCacheStack(Stack):
             self.ec_redis_auth_secret,
             ec_redis_auto_scaling_custom=ec_redis_auto_scaling_custom,
             ec_redis_instance_type_custom=ec_redis_instance_type_custom,
+            ec_redis_shards_custom=ec_redis_shards_custom,
+        )
+        self.ec_redis_host, self.ec_redis_port = factory.get_elasticache_replication_group_endpoint(
+            self.ec_redis_cluster_rep_group
+        )
+        self.ec_redis_host_reader, self.ec_redis_port_reader = factory.get_elasticache_replication_group_endpoint(
+            self.ec_redis_cluster_rep_group, is_reader=True
         )
+        # Cluster mode enabled (i.e. more than 1 shard), consumers need a cluster aware Redis client
+        self.ec_redis_cluster: str = json.dumps(self.ec_redis_cluster_rep_group.cluster_mode == factory.ENABLED_)
@@ -1,6 +1,7 @@
 import json
 
 from aws_cdk import (
+    Annotations,
     Duration,
     Stack,
     aws_ec2 as ec2,
@@ -27,6 +28,7 @@ class CdkDatabaseStack(Stack):
         project_name: str,
         vpc_stack: CdkVpcSihStack,
         customisations: list[str] = None,
+        db_consumers: dict[str, dict[str, int]] = None,
         engine_version: rds.MysqlEngineVersion = None,
         inc_proxy: bool = False,
         **kwargs,
@@ -136,10 +138,36 @@ class CdkDatabaseStack(Stack):
                 )
 
         db_port: int = getattr(self, factory.DB_PORT_)
+        # The DB connections plan, per deploy env (i.e. DB schema), weighted by the peak concurrency of the
+        #  DB consumers (e.g. the Gw ECS services) of each
+        db_connections_plan: dict[str, dict[str, int]] = factory.get_db_connections_plan(
+            factory.get_rds_max_connections(database_meta[factory.RDS_INSTANCE_TYPE_]),
+            list(db_schemas.keys()),
+            db_consumers=db_consumers,
+        )
+        setattr(self, factory.DB_CONNECTIONS_BUDGET_, {k: v[factory.BUDGET_] for k, v in db_connections_plan.items()})
+        for deploy_env, plan in db_connections_plan.items():
+            Annotations.of(self).add_info(f"DB connections plan, for deploy env '{deploy_env}': {json.dumps(plan)}")
+            factory.ssm_string_parameter(
+                self,
+                self.rds_mysql_props + [factory.CONNECTIONS_],
+                factory.AWS_PRIVATE_DESCRIPTION_,
+                factory.get_path(
+                    [
+                        factory.AWS_PRIVATE_PARAMETER_PREFIX_,
+                        factory.join_sep_score(self.rds_mysql_props),
+                        factory.CONNECTIONS_,
+                        factory.join_sep_score(project_name_comp_props + [deploy_env]),
+                    ]
+                ),
+                json.dumps(plan),
+                deploy_env=deploy_env,
+                data_type=ssm.ParameterDataType.TEXT,
+                tier=ssm.ParameterTier.STANDARD,
+            )
 
         if inc_proxy:
             db_proxy_sg_list: list[int] = [getattr(self, factory.DB_SERVER_SG_)]
-            db_proxy_max_connections_percent: int = int(100 / len(db_schemas))
             db_proxies: dict[str, rds.DatabaseProxy] = {}
             db_proxy_secrets_list: list[rds.DatabaseSecret] = [self.db_api_user_creds_secret]
             db_proxy_role: iam.Role = factory.iam_role(
@@ -175,12 +203,8 @@ class CdkDatabaseStack(Stack):
                     iam_auth=False,
                     idle_client_timeout=Duration.minutes(1),  # Default: Duration.minutes(30)
                     # init_query=,   # TODO: (NEXT) Default: - no initialization query
-                    max_connections_percent=db_proxy_max_connections_percent,
-                    max_idle_connections_percent=(
-                        20
-                        if getattr(self, factory.DEPLOY_ENV_TYPE_INTERNAL_)
-                        else min([db_proxy_max_connections_percent, 40])
-                    ),
+                    max_connections_percent=db_connections_plan[deploy_env][factory.MAX_CONNECTIONS_PERCENT_],
+                    max_idle_connections_percent=db_connections_plan[deploy_env][factory.MAX_IDLE_CONNECTIONS_PERCENT_],
                     require_tls=True,
                     role=db_proxy_role,
                     security_groups=db_proxy_sg_list,
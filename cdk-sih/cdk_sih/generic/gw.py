@@ -1,6 +1,7 @@
 import json
 
 from aws_cdk import (
+    Annotations,
     Resource,
     Stack,
     aws_cloudfront as cloudfront,
@@ -22,6 +23,10 @@ from cdk_sih.vpc_sih import CdkVpcSihStack
 
 
 class CdkGwStack(Stack):
+    # Cacheable routes (by path pattern), see: ``CdkConstructsFactory.cloudfront_distribution``
+    CLOUDFRONT_CACHE_BEHAVIORS: dict[str, dict] = CdkConstructsFactory.CLOUDFRONT_CACHE_BEHAVIORS_OPENAPI
+    ECS_TASK_DEFINITION_CONTAINER_MEMORY_MIB: int = 4096
+
     def __init__(
         self,
         base_stack: Stack,
@@ -111,7 +116,9 @@ class CdkGwStack(Stack):
         self.auto_iod: str = json.dumps(True)
         self.debug: str = json.dumps(is_debug)
         self.ecs_task_definition_container_memory_mib: int = (
-            ecs_task_definition_container_memory_mib if ecs_task_definition_container_memory_mib else 4096
+            ecs_task_definition_container_memory_mib
+            if ecs_task_definition_container_memory_mib
+            else self.ECS_TASK_DEFINITION_CONTAINER_MEMORY_MIB
         )
         self.internal_name: str = factory.join_sep_score(factory.get_attr_project_name_comp_props(self) + [deploy_env])
         self.local_host: str = factory.WILDCARD_ADDRESS
@@ -128,7 +135,6 @@ class CdkGwStack(Stack):
         self.token_duration_mins: str = str(30)
         self.token_refresh_duration_mins: str = str(2880)
         self.url_portal: str = self.get_url_portal(self.fqdn, multi_region)
-        self.workers: str = str(4)
 
         self.ecomm_api_key: str = factory.join_sep_under([factory.ECOMM_, factory.API_, factory.KEY_]).upper()
         self.secret_key: str = factory.join_sep_under([factory.SECRET_, factory.KEY_]).upper()
@@ -150,6 +156,7 @@ class CdkGwStack(Stack):
             subdomain,
             cf_origin_path,
             origin_custom_headers=[(cf_origin_custom_header, cf_origin_custom_header_secret)],
+            cache_behaviors=self.CLOUDFRONT_CACHE_BEHAVIORS,
         )
 
         self.alb_target_group: elasticloadbalancing.ApplicationTargetGroup = (
@@ -221,7 +228,9 @@ class CdkGwStack(Stack):
         )
         self.ecs_task_role: iam.Role = self.ecs_exec_role
 
-        ecs_task_definition_container_cpu_units: int = int(self.ecs_task_definition_container_memory_mib / 2)
+        ecs_task_definition_container_cpu_units: int = factory.get_ecs_fargate_cpu_units(
+            self.ecs_task_definition_container_memory_mib
+        )
         self.ecs_task_definition: ecs.TaskDefinition = factory.ecs_fargate_service_task_definition(
             self,
             str(ecs_task_definition_container_cpu_units),
@@ -231,6 +240,22 @@ class CdkGwStack(Stack):
         )
         self.ecs_task_definition_container_cpu_cores: str = str(int(ecs_task_definition_container_cpu_units / 1024))
 
+        # Web server sizing, workers per ECS task (from the vCPU and memory), and the max. threads per worker (i.e. the
+        #  max. concurrent DB sessions of each, sizing the SQLAlchemy pool, see ``get_worker_threads`` and
+        #  ``get_sqlalchemy_database_engine_options``), passed to the ECS container as 'UVICORN_WORKERS' and
+        #  'WORKER_THREADS'.
+        self.workers: str = str(
+            factory.get_ecs_workers(
+                ecs_task_definition_container_cpu_units, self.ecs_task_definition_container_memory_mib
+            )
+        )
+        self.threads: int = factory.ECS_WORKER_THREADS
+
+        # ECS service auto-scaling, on ALB requests (per minute) per ECS task, and step scaling on ALB target response
+        #  time (p90, in secs), as the client servers are I/O-bound (i.e. saturate on requests before CPU/memory)
+        self.ecs_requests_per_target: int = 600
+        self.ecs_response_time_p90_secs: float = 1.5
+
         self.ecs_task_container_log_group: logs.LogGroup = factory.logs_log_group_ecs_task_container(self)
 
         self.ecs_container_name: str = factory.get_ecs_container_name(self)
@@ -275,7 +300,7 @@ class CdkGwStack(Stack):
             self,
             self.ecs_task_definition,
             ecs.RepositoryImage.from_ecr_repository(
-                repository=project_repo, tag=self.factory.get_attr_deploy_env(self)
+                repository=project_repo, tag=self.factory.get_image_tag(self, self.factory.get_attr_deploy_env(self))
             ),
             self.ecs_container_name,
             getattr(self, self.factory.ALB_PORT_),
@@ -293,11 +318,39 @@ class CdkGwStack(Stack):
             dependant_constructs=dependant_constructs,
             target_group=self.alb_target_group,
             admin=self.admin,
+            requests_per_target=self.ecs_requests_per_target,
+            response_time_p90_secs=self.ecs_response_time_p90_secs,
             **{k: v for k, v in {"http_error_code": http_error_code}.items() if http_error_code},
         )
 
-    @staticmethod
-    def get_sqlalchemy_database_engine_options(pool_size: int = 10, max_overflow: int = 30) -> dict:
+    def get_sqlalchemy_database_engine_options(
+        self, database_stack: CdkDatabaseStack, pool_size: int = None, max_overflow: int = None
+    ) -> dict:
+        # The worst-case DB connections: every worker, of the max. ECS tasks (doubled, as a rolling deployment starts
+        #  new ECS tasks before stopping the old), with a full pool (inc. overflow), within the DB connections budget
+        db_connections_budget: int = getattr(database_stack, self.factory.DB_CONNECTIONS_BUDGET_)[
+            self.factory.get_attr_deploy_env(self)
+        ]
+        workers_max: int = self.env_meta[self.factory.ECS_SERVICE_MAX_] * 2 * int(self.workers)
+        worker_connections: int = int(db_connections_budget / workers_max)
+        if worker_connections < 1:
+            # Clamp to 1 DB connection per worker (i.e. over the DB connections budget, only in the worst case)
+            worker_connections = 1
+            Annotations.of(self).add_warning_v2(
+                "sih:dbConnectionsBudgetWorkers",
+                f"DB connections budget ({db_connections_budget}) of {database_stack.stack_name} is too small for "
+                f"{workers_max} workers, clamped to 1 DB connection per worker, reduce the workers or max. ECS tasks.",
+            )
+        if pool_size is None:
+            pool_size = min(self.threads, worker_connections)
+        if max_overflow is None:
+            max_overflow = worker_connections - pool_size
+        if (worst_case := workers_max * (pool_size + max_overflow)) > db_connections_budget:
+            Annotations.of(self).add_warning_v2(
+                "sih:dbConnectionsBudget",
+                f"Worst-case DB connections ({worst_case}) exceeds the DB connections budget ({db_connections_budget}) "
+                f"of {database_stack.stack_name}.",
+            )
         return {
             "pool_pre_ping": True,
             "pool_size": pool_size,
@@ -316,7 +369,7 @@ class CdkGwStack(Stack):
                             database_stack, deploy_env, secret_db_pw=False
                         )
                     },
-                    **self.get_sqlalchemy_database_engine_options(),
+                    **self.get_sqlalchemy_database_engine_options(database_stack),
                 }.items()
             }
         )
@@ -354,3 +407,9 @@ class CdkGwStack(Stack):
         return self.factory.join_sep_empty(
             [self.factory.HTTPS_, self.factory.join_sep_dot([self.factory.PORTAL_, new_fqdn])]
         )
+
+    def get_worker_threads(self, database_stack: CdkDatabaseStack) -> str:
+        # Threads per worker, within the DB connections per worker (i.e. the SQLAlchemy pool, inc. overflow),
+        #  so threads never wait for a DB connection, see ``get_sqlalchemy_database_engine_options``
+        engine_options: dict = self.get_sqlalchemy_database_engine_options(database_stack)
+        return str(min(self.threads, engine_options["pool_size"] + engine_options["max_overflow"]))
@@ -112,6 +112,7 @@ class CdkBkgMsStack(Stack):
             subdomain,
             cf_origin_path,
             origin_custom_headers=[(cf_origin_custom_header, cf_origin_custom_header_secret)],
+            cache_behaviors=factory.CLOUDFRONT_CACHE_BEHAVIORS_OPENAPI,
         )
 
         factory.set_attrs_url(self, cf_origin_path)
@@ -252,9 +253,10 @@ class CdkBkgMsStack(Stack):
                 "MAIL_HOST": "smtp.office365.com",  # TODO: (IMPORTANT) Remove when AWS SES replaces mail sending
                 "MAIL_PORT": str(587),  # TODO: (IMPORTANT) Remove when AWS SES replaces mail sending
                 "MAIL_USER": getattr(base_stack, factory.MAIL_USER_),
-                "REDIS_HOST": cache_stack.ec_redis_cluster_rep_group.attr_primary_end_point_address,
-                "REDIS_HOST_READER": cache_stack.ec_redis_cluster_rep_group.attr_reader_end_point_address,
-                "REDIS_PORT": cache_stack.ec_redis_cluster_rep_group.attr_primary_end_point_port,
+                "REDIS_CLUSTER": cache_stack.ec_redis_cluster,
+                "REDIS_HOST": cache_stack.ec_redis_host,
+                "REDIS_HOST_READER": cache_stack.ec_redis_host_reader,
+                "REDIS_PORT": cache_stack.ec_redis_port,
                 "REDIS_SSL": json.dumps(True),
                 "S3_BUCKET_NAME": getattr(self, factory.STORAGE_S3_BUCKET_NAME_),
                 "S3_CDK_STACK_ACCOUNT_ID": factory.get_attr_env_account(self),
@@ -339,7 +341,7 @@ class CdkBkgMsStack(Stack):
                 self,
                 ecs_task_definition,
                 ecs.RepositoryImage.from_ecr_repository(
-                    repository=base_stack.repos[project_name_comp_sub], tag=deploy_env
+                    repository=base_stack.repos[project_name_comp_sub], tag=factory.get_image_tag(self, deploy_env)
                 ),
                 self.ecs_container_names[comp_sub],
                 comp_sub_port,
@@ -1,15 +1,20 @@
 from aws_cdk import (
+    Names,
     Stack,
+    aws_cloudfront as cloudfront,
+    aws_iam as iam,
     aws_s3 as s3,
 )
 
 from cdk_sih.constructs.factory import CdkConstructsFactory
+from cdk_sih.internal_domain.cdn.assets import CdkCdnAssetsStack
 from cdk_sih.internal_domain.cdn.base import CdkCdnBaseStack
 
 
 class CdkCdnStorageStack(Stack):
     def __init__(
         self,
+        assets_stack: CdkCdnAssetsStack,
         base_stack: CdkCdnBaseStack,
         component: str,
         deploy_env: str,
@@ -24,6 +29,38 @@ class CdkCdnStorageStack(Stack):
         factory.set_attrs_project_name_comp(self, project_name, component)
         factory.set_attrs_deploy_env(self, base_stack, deploy_env, env_meta)
 
+        # TODO: (NEXT) Remove after one release, once the CDN assets CDK stack (with the OAC) is deployed. Keeps the
+        #  legacy Origin Access Identity (OAI), and the CDK stack exports imported by the previously deployed CDN
+        #  assets CDK stack, i.e. so the CDK stack exports are not removed whilst still in use.
+        cf_origin_id: str = Names.unique_id(assets_stack.cf_dist.node.find_child("Origin1"))
+        cf_oai: cloudfront.OriginAccessIdentity = cloudfront.OriginAccessIdentity(
+            scope=self,
+            id=factory.join_sep_empty([cf_origin_id, "S3Origin"]),
+            comment=f"Identity for {cf_origin_id}",
+        )
+
+        # S3 bucket, only allowing the CloudFront distribution (in the CDN assets CDK stack) to read objects,
+        #  using an Origin Access Control (OAC)
+        s3_bucket_name: str = factory.get_s3_bucket_name(self, assets_stack.s3_bucket_name_prefix)
         self.s3_bucket_: s3.Bucket = factory.s3_bucket(
-            self, factory.join_sep_empty([project_name, component, deploy_env])
+            self,
+            assets_stack.s3_bucket_name_prefix,
+            custom_policies=[
+                factory.iam_policy_statement_s3_cloudfront_origin_access_control(
+                    self, s3_bucket_name, assets_stack.cf_dist
+                ),
+                iam.PolicyStatement(
+                    actions=[factory.join_sep_colon([factory.S3_, "GetObject"])],
+                    principals=[cf_oai.grant_principal],
+                    resources=[
+                        factory.format_arn_custom(
+                            self,
+                            service=factory.S3_,
+                            resource=factory.get_path([s3_bucket_name, factory.SEP_ASTERISK_]),
+                        )
+                    ],
+                ),
+            ],
         )
+        self.export_value(self.s3_bucket_.bucket_regional_domain_name)
+        self.export_value(cf_oai.origin_access_identity_id)
@@ -162,7 +162,7 @@ class CdkLionBaseStack(Stack):
 
         self.lion_producer: str = factory.join_sep_score([project_name, self.producer_])
 
-        self.image_tag: str = factory.LATEST_
+        self.image_tag: str = factory.get_image_tag(self, factory.LATEST_)
 
         self.codepipeline_source_repo: str = "aws-lambda"  # Git repo name, as shown in Bitbucket
         self.codepipeline_source_branch: str = "main"  # TODO: (OPTIONAL) Change branch for testing purposes
@@ -222,7 +222,9 @@ class CdkLionBaseStack(Stack):
                     description=f"CodeBuild project for {getattr(self, factory.WORD_MAP_PROJECT_NAME_)}, "
                     f"to generate latest {self.producer_.capitalize()} {step_name.capitalize()} Docker image.",
                     environment=factory.codebuild_build_environment(
-                        factory.get_attr_project_name_comp(self), base_ignore=True
+                        factory.get_attr_project_name_comp(self),
+                        base_ignore=True,
+                        architecture=factory.get_architecture(self),
                     ),
                     environment_variables={
                         k: codebuild.BuildEnvironmentVariable(value=v)
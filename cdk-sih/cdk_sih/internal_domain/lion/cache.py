@@ -3,6 +3,10 @@ from cdk_sih.generic.cache import CdkCacheStack
 
 
 class CdkLionCacheStack(CdkCacheStack):
+    # An optional number of shards (i.e. node groups), for cluster mode enabled (e.g. 2), for the staging and prod
+    #  deploy envs only, see ``EC_REDIS_META``
+    EC_REDIS_SHARDS_CUSTOM: int = None
+
     def __init__(self, env_meta: dict, factory: CdkConstructsFactory, **kwargs) -> None:
 
         super().__init__(
@@ -10,5 +14,6 @@ class CdkLionCacheStack(CdkCacheStack):
             factory=factory,
             ec_redis_auto_scaling_custom=False,
             ec_redis_instance_type_custom=factory.M6G_LARGE_,
+            ec_redis_shards_custom=self.EC_REDIS_SHARDS_CUSTOM,
             **kwargs
         )
@@ -8,7 +8,6 @@ from aws_cdk import (
     aws_codepipeline as codepipeline,
     aws_codestarnotifications as codestar_notifications,
     aws_ec2 as ec2,
-    aws_events as events,
     aws_iam as iam,
     aws_kms as kms,
     aws_lambda as lambda_,
@@ -173,7 +172,9 @@ class CdkLionCollectorStack(Stack):
                     check_secrets_in_plain_text_env_variables=True,
                     description=f"CodeBuild project for {word_map_project_name_comp}, "
                     f"to generate latest {word_map_component_alt} Docker image.",
-                    environment=factory.codebuild_build_environment(project_name_comp, base_ignore=True),
+                    environment=factory.codebuild_build_environment(
+                        project_name_comp, base_ignore=True, architecture=factory.get_architecture(self)
+                    ),
                     environment_variables={
                         k: codebuild.BuildEnvironmentVariable(value=v)
                         for k, v in {
@@ -181,9 +182,9 @@ class CdkLionCollectorStack(Stack):
                             "AWS_DEFAULT_REGION": factory.get_attr_env_region(self),
                             "ORGANISATION": factory.organisation,
                             "PROJECT_NAME": p,
-                            "IMAGE_TAG": deploy_env,
+                            "IMAGE_TAG": factory.get_image_tag(self, deploy_env),
                             "BASE_PROJECT_NAME": factory.join_sep_score([base_stack.lion_producer, factory.BIN_]),
-                            "BASE_IMAGE_TAG": base_stack.image_tag,
+                            "BASE_IMAGE_TAG": factory.get_image_tag_base(self, base_stack, factory.LATEST_),
                             "SIH_LION_EXTRAS": f"[{component_alt}s]",
                             "SIH_LION_VERSION_META_PARAMETER": pypi_package_base_stack.version_meta_param_names[
                                 base_stack.pypi_package_name
@@ -298,22 +299,9 @@ class CdkLionCollectorStack(Stack):
                 timeout=Duration.seconds(60 * 15),
                 ephemeral_storage_size=Size.mebibytes(4096),
                 memory_size=512,  # in MiB
-                events_rules=[
-                    (
-                        factory.events_rule(
-                            self,
-                            [lambda_func_name, i],
-                            f"Trigger Lambda function {lambda_func_name} "
-                            f"every day @ {i} UTC{factory.schedules.utc_offset}.",
-                            events.Schedule.cron(
-                                minute=str(0),
-                                hour=i,
-                            ),
-                        ),
-                        {},  # Payload
-                    )
-                    for i in lion_collector_hours
-                ],
+                events_rules=factory.lambda_function_events_rules_crons(
+                    self, lambda_func_name, [([lambda_func_name], lion_collector_hours, None, {})]
+                ),
             )
             lambda_func_arns.append(lambda_func.function_arn)
 
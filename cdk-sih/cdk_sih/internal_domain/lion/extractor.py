@@ -38,6 +38,13 @@ class CdkLionExtractorStack(Stack):
         pypi_package_base_stack: CdkPypiPackageBaseStack,
         storage_stack: CdkLionStorageStack,
         vpc_stack: CdkVpcSihStack,
+        data_source_obj_prefixes: dict[str, str] = None,
+        sqs_buffer: bool = False,
+        # The Lambda function (with the 'SQS_BUFFER' env var) returns the failed S3 events, otherwise an error retries
+        #  the whole batch (hence small), see: ``CdkConstructsFactory.lambda_function_sqs_buffer``
+        sqs_batch_size: int = 10,
+        sqs_max_batching_window: int = 60,  # in seconds
+        sqs_max_concurrency: int = 2,
         **kwargs,
     ) -> None:
         setattr(self, factory.ENV_, factory.check_env_exists(kwargs))
@@ -126,6 +133,13 @@ class CdkLionExtractorStack(Stack):
             ),
         ]
 
+        # If `data_source_obj_prefixes` is set, a rule per Extractor Lambda function, only matching the S3 object
+        #  creation events for the data sources (i.e. S3 object key prefixes) of its cache region.
+        obj_prefixes: list[str] = (
+            sorted({data_source_obj_prefixes[j] for i in cache_regions.values() for j in i})
+            if data_source_obj_prefixes
+            else None
+        )
         extractor_rule: events.Rule = events.Rule(
             scope=self,
             id=factory.get_construct_id(self, [component_alt], "Rule"),
@@ -134,8 +148,14 @@ class CdkLionExtractorStack(Stack):
             # schedule=,  # Default: - None.
             # targets=[],  # Default: - No targets.
             # cross_stack_scope=,  # Default: - none (the main scope will be used, even for cross-stack Events)
-            description="Trigger all Extractor Lambda function(s), based on events from the S3 Param Data bucket.",
-            event_pattern=factory.events_event_pattern_s3_object_created(storage_stack.s3_param_data_bucket.bucket_arn),
+            description=(
+                "Log events from the S3 Param Data bucket, for all data sources."
+                if data_source_obj_prefixes
+                else "Trigger all Extractor Lambda function(s), based on events from the S3 Param Data bucket."
+            ),
+            event_pattern=factory.events_event_pattern_s3_object_created(
+                storage_stack.s3_param_data_bucket.bucket_arn, prefixes=obj_prefixes
+            ),
             rule_name=factory.get_construct_name(self, [component_alt], underscore=True),
         )
 
@@ -148,6 +168,11 @@ class CdkLionExtractorStack(Stack):
             ]
         )
 
+        # SQS buffer mode, if `sqs_buffer` is set:
+        #  Each Extractor Lambda function is invoked from an SQS queue (instead of directly, by the Events rule),
+        #  to coalesce bursts of S3 events into batches, and cap the concurrent connections to the ElastiCache cluster.
+        lambda_func_timeout: Duration = Duration.seconds(60 * 15)
+
         lambda_func_names: list[str] = []
         lambda_func_arns: list[str] = []
         for cache_region_code, lambda_func_name in {
@@ -192,18 +217,20 @@ class CdkLionExtractorStack(Stack):
                     "CACHE_SQUARE_CODE": cache_region_code,
                     "CACHE_SQUARE_SOURCE_NAMES": json.dumps(cache_square_source_names),
                     "CACHE_SQUARE_META": cache_regions_meta_params[cache_region_code].string_value,
-                    "REDIS_HOST": cache_stack.ec_redis_cluster_rep_group.attr_primary_end_point_address,
-                    "REDIS_PORT": cache_stack.ec_redis_cluster_rep_group.attr_primary_end_point_port,
+                    "REDIS_CLUSTER": cache_stack.ec_redis_cluster,
+                    "REDIS_HOST": cache_stack.ec_redis_host,
+                    "REDIS_PORT": cache_stack.ec_redis_port,
                     "REDIS_SSL": json.dumps(True),
                     "REDIS_PW_SECRET": cache_stack.ec_redis_auth_secret.secret_full_arn,
                     "REDIS_DECODE_RESPONSES": json.dumps(True),
                     filenames_info_: filenames_info_param.string_value,
+                    **({"SQS_BUFFER": json.dumps(True)} if sqs_buffer else {}),
                 },
                 lambda_func_role,
                 vpc_props=(factory.get_attr_vpc(self), security_groups, ec2.SubnetType.PRIVATE_WITH_EGRESS),
                 layers=[factory.lambda_layer_version_base(self, lambda_func_name)],
                 params_and_secrets_ext=True,
-                timeout=Duration.seconds(60 * 15),
+                timeout=lambda_func_timeout,
                 ephemeral_storage_size=Size.mebibytes(
                     1024 if CdkLionProcessorStack.HIMAWARI9_ in cache_square_source_names else 512
                 ),
@@ -212,15 +239,49 @@ class CdkLionExtractorStack(Stack):
             lambda_func_names.append(lambda_func.function_name)
             lambda_func_arns.append(lambda_func.function_arn)
 
-            extractor_rule.add_target(
-                target=targets.LambdaFunction(
-                    handler=lambda_func,
-                    # event=,  # Default: the entire EventBridge event
-                    # dead_letter_queue=,  # Default: - no dead-letter queue  # TODO: (OPTIONAL) Add an SQS queue to be used as DLQ ?
-                    max_event_age=Duration.hours(24),
-                    retry_attempts=185,
+            lambda_func_rule: events.Rule = extractor_rule
+            if data_source_obj_prefixes:
+                lambda_func_rule_name_props: list[str] = [component_alt, cache_region_code.lower()]
+                lambda_func_rule = events.Rule(
+                    scope=self,
+                    id=factory.get_construct_id(self, lambda_func_rule_name_props, "Rule"),
+                    enabled=True,
+                    description=f"Trigger the {cache_region_code} Extractor Lambda function, based on events from the "
+                    f"S3 Param Data bucket (for data sources: {', '.join(cache_square_source_names)}).",
+                    event_pattern=factory.events_event_pattern_s3_object_created(
+                        storage_stack.s3_param_data_bucket.bucket_arn,
+                        prefixes=sorted({data_source_obj_prefixes[i] for i in cache_square_source_names}),
+                    ),
+                    rule_name=factory.get_construct_name(self, lambda_func_rule_name_props, underscore=True),
+                )
+
+            if sqs_buffer:
+                lambda_func_rule.add_target(
+                    target=targets.SqsQueue(
+                        queue=factory.lambda_function_sqs_buffer(
+                            self,
+                            lambda_func,
+                            lambda_func_name,
+                            lambda_func_timeout,
+                            batch_size=sqs_batch_size,
+                            max_batching_window=Duration.seconds(sqs_max_batching_window),
+                            max_concurrency=sqs_max_concurrency,
+                        ),
+                        # message=,  # Default: the entire EventBridge event
+                        max_event_age=Duration.hours(24),
+                        retry_attempts=185,
+                    )
+                )
+            else:
+                lambda_func_rule.add_target(
+                    target=targets.LambdaFunction(
+                        handler=lambda_func,
+                        # event=,  # Default: the entire EventBridge event
+                        # dead_letter_queue=,  # Default: - no dead-letter queue  # TODO: (OPTIONAL) Add an SQS queue to be used as DLQ ?
+                        max_event_age=Duration.hours(24),
+                        retry_attempts=185,
+                    )
                 )
-            )
 
         custom_events_: str = factory.join_sep_score([factory.CUSTOM_, factory.EVENTS_])
         extractor_rule.add_target(
@@ -293,7 +354,7 @@ class CdkLionExtractorStack(Stack):
                 ),
                 "LAMBDA_LAYER_DESC": f"Lambda layer that contains: {pypi_package_name} py modules.",
                 "LAMBDA_LAYER_RUNTIMES": factory.lambda_runtime_python_3_9(str_=True),
-                "LAMBDA_LAYER_ARCHITECTURES": factory.lambda_architecture_x86_64(str_=True),
+                "LAMBDA_LAYER_ARCHITECTURES": factory.lambda_architecture(self, str_=True),
             },
             lambda_func_layer_role,
             vpc_props=(factory.get_attr_vpc(self), security_groups, ec2.SubnetType.PRIVATE_WITH_EGRESS),
@@ -321,7 +382,9 @@ class CdkLionExtractorStack(Stack):
             check_secrets_in_plain_text_env_variables=True,
             description=f"CodeBuild project for {word_map_project_name_comp}, "
             f"to generate latest {word_map_component_alt} package Lambda layer.",
-            environment=factory.codebuild_build_environment(project_name_comp, base_ignore=True),
+            environment=factory.codebuild_build_environment(
+                project_name_comp, base_ignore=True, architecture=factory.get_architecture(self)
+            ),
             environment_variables={
                 k: codebuild.BuildEnvironmentVariable(value=v)
                 for k, v in {
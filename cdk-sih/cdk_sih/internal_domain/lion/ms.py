@@ -104,6 +104,7 @@ class CdkLionMsStack(Stack):
             subdomain,
             cf_origin_path,
             origin_custom_headers=[(cf_origin_custom_header, cf_origin_custom_header_secret)],
+            cache_behaviors=factory.CLOUDFRONT_CACHE_BEHAVIORS_OPENAPI,
         )
 
         factory.set_attrs_url(self, cf_origin_path)
@@ -178,8 +179,9 @@ class CdkLionMsStack(Stack):
             "DEBUG": json.dumps(is_internal),
             "CACHE_SQUARES_META": f"{{{factory.join_sep_comma(cache_regions)}}}",  # Nick H. was very helpful here ^_^
             "CACHE_UNIQUE_CLIENTS": json.dumps(False),
-            "REDIS_HOST": cache_stack.ec_redis_cluster_rep_group.attr_reader_end_point_address,
-            "REDIS_PORT": cache_stack.ec_redis_cluster_rep_group.attr_reader_end_point_port,
+            "REDIS_CLUSTER": cache_stack.ec_redis_cluster,
+            "REDIS_HOST": cache_stack.ec_redis_host_reader,
+            "REDIS_PORT": cache_stack.ec_redis_port_reader,
             "REDIS_SSL": json.dumps(True),
             "STATUS_ROUTE": self.status_route,
             "UVICORN_PORT": str(alb_port),
@@ -217,7 +219,9 @@ class CdkLionMsStack(Stack):
         factory.ecs_fargate_service_task_definition_add_container(
             self,
             ecs_task_definition,
-            ecs.RepositoryImage.from_ecr_repository(repository=base_stack.repos[project_name_comp], tag=deploy_env),
+            ecs.RepositoryImage.from_ecr_repository(
+                repository=base_stack.repos[project_name_comp], tag=factory.get_image_tag(self, deploy_env)
+            ),
             self.ecs_container_name,
             alb_port,
             ecs_task_definition_container_memory_mib,
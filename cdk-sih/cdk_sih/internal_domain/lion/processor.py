@@ -1,9 +1,9 @@
 import json
 from datetime import datetime, timedelta, timezone
+from typing import Optional
 
 from aws_cdk import (
     Duration,
-    RemovalPolicy,
     Size,
     Stack,
     aws_codebuild as codebuild,
@@ -50,6 +50,9 @@ class CdkLionProcessorStack(Stack):
         pypi_package_base_stack: CdkPypiPackageBaseStack,
         storage_stack: CdkLionStorageStack,
         vpc_stack: CdkVpcSihStack,
+        step_func_map_max_concurrency: int = None,
+        step_func_express_check: bool = False,
+        step_func_logs: dict[str, tuple[stepfunctions.LogLevel, bool]] = None,
         **kwargs,
     ) -> None:
         setattr(self, factory.ENV_, factory.check_env_exists(kwargs))
@@ -304,7 +307,9 @@ class CdkLionProcessorStack(Stack):
                     check_secrets_in_plain_text_env_variables=True,
                     description=f"CodeBuild project for {word_map_project_name_comp}, "
                     f"to generate latest {word_map_component_alt} {step_name.capitalize()} Docker image.",
-                    environment=factory.codebuild_build_environment(project_name_comp, base_ignore=True),
+                    environment=factory.codebuild_build_environment(
+                        project_name_comp, base_ignore=True, architecture=factory.get_architecture(self)
+                    ),
                     environment_variables={
                         k: codebuild.BuildEnvironmentVariable(value=v)
                         for k, v in {
@@ -312,9 +317,9 @@ class CdkLionProcessorStack(Stack):
                             "AWS_DEFAULT_REGION": factory.get_attr_env_region(self),
                             "ORGANISATION": factory.organisation,
                             "PROJECT_NAME": p,
-                            "IMAGE_TAG": deploy_env,
+                            "IMAGE_TAG": factory.get_image_tag(self, deploy_env),
                             "BASE_PROJECT_NAME": factory.join_sep_score([base_stack.lion_producer, factory.BIN_]),
-                            "BASE_IMAGE_TAG": base_stack.image_tag,
+                            "BASE_IMAGE_TAG": factory.get_image_tag_base(self, base_stack, factory.LATEST_),
                             "SIH_LION_EXTRAS": f"[{component_alt}s]",
                             "SIH_LION_VERSION_META_PARAMETER": pypi_package_base_stack.version_meta_param_names[
                                 base_stack.pypi_package_name
@@ -384,6 +389,7 @@ class CdkLionProcessorStack(Stack):
         step_func_rate: int = 1  # in minutes
         lambda_func_timeout: int = 300  # in seconds
         step_func_state_machine_timeout: int = 30  # in minutes
+        step_func_express_state_machine_timeout: int = 5  # in minutes, the max. for an EXPRESS state machine
 
         custom_policies_step_func_state_machine: list[iam.PolicyStatement] = [
             iam.PolicyStatement(
@@ -442,6 +448,62 @@ class CdkLionProcessorStack(Stack):
 
         storage_kms_key: kms.Key = factory.get_attr_kms_key_stack(storage_stack)
 
+        # Step Functions Map state mode, if `step_func_map_max_concurrency` is set (0 for no limit):
+        #  A single state machine processes all sat data sources in parallel (using a Map state),
+        #  instead of a state machine per sat data source. The Lambda functions remain per sat data source.
+        is_step_func_map: bool = step_func_map_max_concurrency is not None
+        step_func_map_state_machine_name: str = factory.get_lambda_func_name(
+            self, [word_map_component_alt, factory.MAP_.capitalize()]
+        )
+        step_func_map_state_machine_role: Optional[iam.Role] = None
+        if is_step_func_map:
+            step_func_map_state_machine_role = factory.iam_role(
+                self,
+                [step_func_map_state_machine_name],
+                factory.iam_service_principal(factory.STATES_),
+                f"Step Function execution role for {step_func_map_state_machine_name}.",
+            )
+            for policy_statement in custom_policies_step_func_state_machine:
+                step_func_map_state_machine_role.add_to_policy(statement=policy_statement)
+        step_func_map_branches: dict[str, stepfunctions.Parallel] = {}
+
+        # Step Functions EXPRESS check mode, if `step_func_express_check` is set:
+        #  The (scheduled) state machine only runs the latest and available steps, as an EXPRESS state machine,
+        #  and starts a (STANDARD) process state machine execution only when all files are available.
+        step_func_check_: str = factory.CHECK_.capitalize()
+        step_func_check_state_machine_type: stepfunctions.StateMachineType = (
+            stepfunctions.StateMachineType.EXPRESS
+            if step_func_express_check
+            else stepfunctions.StateMachineType.STANDARD
+        )
+        step_func_check_state_machine_timeout: Duration = Duration.minutes(
+            step_func_express_state_machine_timeout if step_func_express_check else step_func_state_machine_timeout
+        )
+
+        # The log level, and whether to include execution data, per step (default: all logs, with execution data)
+        step_func_logs = {
+            i: (step_func_logs or {}).get(i, (stepfunctions.LogLevel.ALL, True))
+            for i in [processor_step_latest, processor_step_available, processor_step_process]
+        }
+        step_func_check_logs: list[tuple[stepfunctions.LogLevel, bool]] = [
+            step_func_logs[processor_step_latest],
+            step_func_logs[processor_step_available],
+        ]
+        if not step_func_express_check:
+            step_func_check_logs.append(step_func_logs[processor_step_process])
+
+        # The (scheduled) state machine definitions, execution roles, types, timeouts and logs, by state machine name
+        step_func_state_machines: dict[
+            str,
+            tuple[
+                stepfunctions.IChainable,
+                iam.Role,
+                stepfunctions.StateMachineType,
+                Duration,
+                list[tuple[stepfunctions.LogLevel, bool]],
+            ],
+        ] = {}
+
         lambda_func_arns: list[str] = []
         for sat_data_source_name, n in sat_data_source_step_func_state_machine_name.items():
             self.step_func_state_machine_name = n
@@ -542,22 +604,39 @@ class CdkLionProcessorStack(Stack):
                 tier=ssm.ParameterTier.STANDARD,
             )
 
-            step_func_state_machine_role: iam.Role = factory.iam_role(
-                self,
-                [self.step_func_state_machine_name],
-                factory.iam_service_principal(factory.STATES_),
-                f"Step Function execution role for {self.step_func_state_machine_name}.",
-            )
-            for policy_statement in custom_policies_step_func_state_machine:
-                step_func_state_machine_role.add_to_policy(statement=policy_statement)
+            step_func_check_state_machine_name: str = self.step_func_state_machine_name
+            if step_func_express_check:
+                step_func_check_state_machine_name = self.step_func_state_machine_name.replace(
+                    word_map_component_alt, factory.join_sep_empty([word_map_component_alt, step_func_check_]), 1
+                )
+
+            if is_step_func_map:
+                step_func_state_machine_role: iam.Role = step_func_map_state_machine_role
+            else:
+                step_func_state_machine_role: iam.Role = factory.iam_role(
+                    self,
+                    [step_func_check_state_machine_name],
+                    factory.iam_service_principal(factory.STATES_),
+                    f"Step Function execution role for {step_func_check_state_machine_name}.",
+                )
+                for policy_statement in custom_policies_step_func_state_machine:
+                    step_func_state_machine_role.add_to_policy(statement=policy_statement)
+            # The process state machine (EXPRESS check mode only) gets its own execution role, as the check state
+            #  machine role is granted `states:StartExecution` on it (i.e. a shared role is a circular dependency)
+            step_func_process_state_machine_role: Optional[iam.Role] = None
+            if step_func_express_check:
+                step_func_process_state_machine_role = factory.iam_role(
+                    self,
+                    [self.step_func_state_machine_name],
+                    factory.iam_service_principal(factory.STATES_),
+                    f"Step Function execution role for {self.step_func_state_machine_name}.",
+                )
+                for policy_statement in custom_policies_step_func_state_machine:
+                    step_func_process_state_machine_role.add_to_policy(statement=policy_statement)
 
             step_func_lambda_funcs: dict[str, lambda_.Function] = {}
             step_func_lambda_invokes: dict[str, stepfunctions_tasks.LambdaInvoke] = {}
 
-            lambda_layers: list[lambda_.LayerVersion] = [
-                factory.lambda_layer_version_base(self, self.step_func_state_machine_name),
-            ]
-
             lambda_func_cloudwatch_custom: lambda_.Function = factory.lambda_function_cloudwatch(
                 self, self.step_func_state_machine_name, security_groups=security_groups
             )
@@ -670,11 +749,15 @@ class CdkLionProcessorStack(Stack):
                             ],
                             lead=True,
                         ),
-                        layers=lambda_layers,
+                        layers=[factory.lambda_layer_version_base(self, lambda_func_name)],
                         **lambda_func_kwargs,
                     )
                 lambda_func_arns.append(lambda_func.function_arn)
-                lambda_func.grant_invoke(step_func_state_machine_role)
+                lambda_func.grant_invoke(
+                    step_func_process_state_machine_role
+                    if step_func_process_state_machine_role and step_name == processor_step_process
+                    else step_func_state_machine_role
+                )
 
                 step_func_lambda_funcs[step_name] = lambda_func
                 step_func_lambda_invokes[step_name] = stepfunctions_tasks.LambdaInvoke(
@@ -706,6 +789,29 @@ class CdkLionProcessorStack(Stack):
                 word_map_component_alt_past,
             )
 
+            step_func_process_chain: stepfunctions.IChainable = step_func_lambda_invokes[processor_step_process].next(
+                next=process_choice
+            )
+            if step_func_express_check:
+                step_func_process_state_machine: stepfunctions.StateMachine = factory.stepfunctions_state_machine(
+                    self,
+                    self.step_func_state_machine_name,
+                    step_func_process_chain,
+                    step_func_process_state_machine_role,
+                    Duration.minutes(step_func_state_machine_timeout),
+                    logs=[step_func_logs[processor_step_process]],
+                )
+                # Fire-and-forget, the process state machine execution outlives the EXPRESS state machine execution
+                step_func_process_chain = stepfunctions_tasks.StepFunctionsStartExecution(
+                    scope=self,
+                    id=factory.get_construct_id(self, [self.step_func_state_machine_name], "StartExecution"),
+                    state_machine=step_func_process_state_machine,
+                    comment=steps_comment[processor_step_process],
+                    input=stepfunctions.TaskInput.from_json_path_at("$"),
+                    integration_pattern=stepfunctions.IntegrationPattern.REQUEST_RESPONSE,
+                    result_path=stepfunctions.JsonPath.DISCARD,
+                )
+
             available_choice: stepfunctions.Choice = factory.stepfunctions_choice_failed_succeeded(
                 self,
                 "All Files Available?",
@@ -713,7 +819,9 @@ class CdkLionProcessorStack(Stack):
                 steps_comment[processor_step_available],
                 step_func_lambda_invokes[processor_step_available],
                 word_map_component_alt_past,
-                continue_=step_func_lambda_invokes[processor_step_process].next(next=process_choice),
+                continue_=step_func_process_chain,
+                # An EXPRESS state machine cannot wait for the files, leave it to the next (scheduled) execution
+                wait_retry=not step_func_express_check,
             )
 
             latest_choice: stepfunctions.Choice = (
@@ -737,52 +845,37 @@ class CdkLionProcessorStack(Stack):
                 )
             )
 
-            stepfunctions_state_machine = stepfunctions.StateMachine(
-                self,
-                factory.get_construct_id(self, [self.step_func_state_machine_name], "StateMachine"),
-                definition_body=stepfunctions.DefinitionBody.from_chainable(
-                    chainable=step_func_lambda_invokes[processor_step_latest].next(next=latest_choice)
-                ),
-                # definition_substitutions={}  # Substitutions for the definition body as a key-value map
-                logs=stepfunctions.LogOptions(
-                    destination=factory.logs_log_group(
-                        self,
-                        [self.step_func_state_machine_name],
-                        factory.get_path(
-                            [
-                                factory.log_groups[factory.VENDEDLOGS_],
-                                factory.STATES_,
-                                self.step_func_state_machine_name,
-                            ]
-                        ),
-                    ),
-                    include_execution_data=True,
-                    level=stepfunctions.LogLevel.ALL,
-                ),
-                removal_policy=RemovalPolicy.DESTROY,
-                role=step_func_state_machine_role,
-                state_machine_name=self.step_func_state_machine_name,
-                state_machine_type=stepfunctions.StateMachineType.STANDARD,
-                timeout=Duration.minutes(step_func_state_machine_timeout),
-                tracing_enabled=False,
+            step_func_chain: stepfunctions.IChainable = step_func_lambda_invokes[processor_step_latest].next(
+                next=latest_choice
             )
-
-            factory.events_rule(
-                self,
-                [self.step_func_state_machine_name],
-                f"Trigger Step Functions state machine {self.step_func_state_machine_name} "
-                f"every {step_func_rate} minutes.",
-                events.Schedule.cron(minute=factory.get_path([factory.SEP_ASTERISK_, step_func_rate])),
-            ).add_target(
-                target=targets.SfnStateMachine(
-                    machine=stepfunctions_state_machine,
-                    # input=,  # Default: the entire EventBridge event
-                    # role=,  # Default: - a new role will be created
-                    # dead_letter_queue=,  # Default: - no dead-letter queue  # TODO: (OPTIONAL) Add an SQS queue to be used as DLQ ?
-                    max_event_age=Duration.hours(24),
-                    retry_attempts=185,
+            if is_step_func_map:
+                # Catch any failure, so as not to stop the Map state iterations for the other sat data sources
+                step_func_map_branches[sat_data_source_name] = (
+                    stepfunctions.Parallel(
+                        scope=self,
+                        id=factory.get_construct_id(self, [self.step_func_state_machine_name], "Parallel"),
+                        comment=f"{word_map_component_alt_current} {sat_data_source_name} Sat Data.",
+                        result_path=stepfunctions.JsonPath.DISCARD,
+                    )
+                    .branch(step_func_chain)
+                    .add_catch(
+                        handler=stepfunctions.Pass(
+                            scope=self,
+                            id=factory.get_construct_id(self, [self.step_func_state_machine_name, "Caught"], "Pass"),
+                            comment=f"Failed to {word_map_component_alt_current.lower()} {sat_data_source_name} "
+                            "Sat Data, see the execution event history.",
+                        ),
+                        result_path=factory.join_sep_dot(["$", factory.ERROR_]),
+                    )
+                )
+            else:
+                step_func_state_machines[step_func_check_state_machine_name] = (
+                    step_func_chain,
+                    step_func_state_machine_role,
+                    step_func_check_state_machine_type,
+                    step_func_check_state_machine_timeout,
+                    step_func_check_logs,
                 )
-            )
 
             archive_: str = factory.ARCHIVE_.capitalize()
             lambda_func_archive_description: str = (
@@ -835,6 +928,107 @@ class CdkLionProcessorStack(Stack):
                 ],
             )
 
+        if is_step_func_map:
+            self.step_func_state_machine_name = step_func_map_state_machine_name
+            sat_data_source_key: str = factory.join_sep_under([factory.SAT_, factory.DATA_, factory.SOURCE_])
+            step_func_map_choice: stepfunctions.Choice = stepfunctions.Choice(
+                scope=self,
+                id=factory.get_construct_id(self, [self.step_func_state_machine_name], "Choice"),
+                comment="Which Sat Data Source?",
+            ).otherwise(
+                def_=stepfunctions.Fail(
+                    scope=self,
+                    id=factory.get_construct_id(self, [self.step_func_state_machine_name], "Fail"),
+                    cause=f"Unknown '{sat_data_source_key}'.",
+                    error=f"Failed to {word_map_component_alt_current.lower()} the latest "
+                    f"{getattr(self, factory.WORD_MAP_PROJECT_NAME_)} Sat Data.",
+                )
+            )
+            for sat_data_source_name, branch in step_func_map_branches.items():
+                step_func_map_choice.when(
+                    condition=stepfunctions.Condition.string_equals(
+                        variable=factory.join_sep_dot(["$", sat_data_source_key]), value=sat_data_source_name
+                    ),
+                    next=branch,
+                )
+            sat_data_sources_path: str = factory.join_sep_dot(["$", f"{sat_data_source_key}s"])
+            step_func_state_machines[self.step_func_state_machine_name] = (
+                stepfunctions.Pass(
+                    scope=self,
+                    id=factory.get_construct_id(self, [self.step_func_state_machine_name], "Pass"),
+                    comment="Sat Data Sources.",
+                    result=stepfunctions.Result.from_array(list(step_func_map_branches)),
+                    result_path=sat_data_sources_path,
+                ).next(
+                    next=stepfunctions.Map(
+                        scope=self,
+                        id=factory.get_construct_id(self, [self.step_func_state_machine_name], "Map"),
+                        comment=f"{word_map_component_alt_current} all Sat Data Sources.",
+                        items_path=sat_data_sources_path,
+                        # Each iteration input: the EventBridge event (as per a state machine per sat data source),
+                        #  with the sat data source.
+                        item_selector={
+                            **{
+                                i: stepfunctions.JsonPath.object_at(factory.join_sep_dot(["$", i]))
+                                for i in [
+                                    "version",
+                                    "id",
+                                    "detail-type",
+                                    "source",
+                                    "account",
+                                    "time",
+                                    "region",
+                                    "resources",
+                                    "detail",
+                                ]
+                            },
+                            sat_data_source_key: stepfunctions.JsonPath.string_at("$$.Map.Item.Value"),
+                        },
+                        max_concurrency=step_func_map_max_concurrency,
+                        result_path=stepfunctions.JsonPath.DISCARD,
+                    ).item_processor(processor=step_func_map_choice)
+                ),
+                step_func_map_state_machine_role,
+                step_func_check_state_machine_type,
+                step_func_check_state_machine_timeout,
+                step_func_check_logs,
+            )
+
+        for step_func_state_machine_name, step_func_state_machine_meta in step_func_state_machines.items():
+            (
+                step_func_chain,
+                step_func_state_machine_role,
+                step_func_state_machine_type,
+                step_func_state_machine_duration,
+                step_func_state_machine_logs,
+            ) = step_func_state_machine_meta
+            stepfunctions_state_machine: stepfunctions.StateMachine = factory.stepfunctions_state_machine(
+                self,
+                step_func_state_machine_name,
+                step_func_chain,
+                step_func_state_machine_role,
+                step_func_state_machine_duration,
+                state_machine_type=step_func_state_machine_type,
+                logs=step_func_state_machine_logs,
+            )
+
+            factory.events_rule(
+                self,
+                [step_func_state_machine_name],
+                f"Trigger Step Functions state machine {step_func_state_machine_name} "
+                f"every {step_func_rate} minutes.",
+                events.Schedule.cron(minute=factory.get_path([factory.SEP_ASTERISK_, step_func_rate])),
+            ).add_target(
+                target=targets.SfnStateMachine(
+                    machine=stepfunctions_state_machine,
+                    # input=,  # Default: the entire EventBridge event
+                    # role=,  # Default: - a new role will be created
+                    # dead_letter_queue=,  # Default: - no dead-letter queue  # TODO: (OPTIONAL) Add an SQS queue to be used as DLQ ?
+                    max_event_age=Duration.hours(24),
+                    retry_attempts=185,
+                )
+            )
+
         lambda_func_update_role.add_to_policy(
             statement=factory.iam_policy_statement_lambda_update_function_code(lambda_func_arns=lambda_func_arns)
         )
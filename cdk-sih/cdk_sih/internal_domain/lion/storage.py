@@ -24,6 +24,7 @@ class CdkLionStorageStack(Stack):
         events_stack: CdkLionEventsStack,
         factory: CdkConstructsFactory,
         project_name: str,
+        event_bus_regions_obj_prefixes: dict[str, list[str]] = None,
         **kwargs,
     ) -> None:
         setattr(self, factory.ENV_, factory.check_env_exists(kwargs))
@@ -97,6 +98,13 @@ class CdkLionStorageStack(Stack):
         s3_param_data_bucket_name_s3_bucket: str = factory.join_sep_score(
             [self.s3_param_data_bucket_name, factory.S3_, factory.BUCKET_]
         )
+        # If `event_bus_regions_obj_prefixes` is set, a rule per regional Event bus, only sending the S3 object creation
+        #  events for the data sources (i.e. S3 object key prefixes) served in that region.
+        obj_prefixes: list[str] = (
+            sorted({j for i in event_bus_regions_obj_prefixes.values() for j in i})
+            if event_bus_regions_obj_prefixes
+            else None
+        )
         s3_param_data_bucket_rule: events.Rule = events.Rule(
             scope=self,
             id=factory.get_construct_id(self, [s3_param_data_bucket_name_s3_bucket], "Rule"),
@@ -105,29 +113,51 @@ class CdkLionStorageStack(Stack):
             # schedule=,  # Default: - None.
             # targets=[],  # Default: - No targets.
             # cross_stack_scope=,  # Default: - none (the main scope will be used, even for cross-stack Events)
-            description="Send S3 object creation events to regional Event buses, in order to "
-            "trigger all Extractor Lambda function(s) in that region.",
-            event_pattern=factory.events_event_pattern_s3_object_created(self.s3_param_data_bucket.bucket_arn),
+            description=(
+                "Log S3 object creation events, for all data sources."
+                if event_bus_regions_obj_prefixes
+                else "Send S3 object creation events to regional Event buses, in order to "
+                "trigger all Extractor Lambda function(s) in that region."
+            ),
+            event_pattern=factory.events_event_pattern_s3_object_created(
+                self.s3_param_data_bucket.bucket_arn, prefixes=obj_prefixes
+            ),
             rule_name=factory.get_construct_name(self, [s3_param_data_bucket_name_s3_bucket], underscore=True),
         )
 
         custom_events_props: list[str] = [factory.CUSTOM_, factory.EVENTS_]
-        cdk_custom_outputs: dict = factory.file_json_load_cdk_custom_outputs()
         for event_bus_region in event_bus_regions:
-            s3_param_data_bucket_rule.add_target(
+            event_bus_rule: events.Rule = s3_param_data_bucket_rule
+            if event_bus_regions_obj_prefixes:
+                event_bus_rule_name_props: list[str] = [s3_param_data_bucket_name_s3_bucket, event_bus_region]
+                event_bus_rule = events.Rule(
+                    scope=self,
+                    id=factory.get_construct_id(self, event_bus_rule_name_props, "Rule"),
+                    enabled=True,
+                    description=f"Send S3 object creation events to the {event_bus_region} Event bus, in order to "
+                    "trigger all Extractor Lambda function(s) in that region.",
+                    event_pattern=factory.events_event_pattern_s3_object_created(
+                        self.s3_param_data_bucket.bucket_arn,
+                        prefixes=event_bus_regions_obj_prefixes.get(event_bus_region),
+                    ),
+                    rule_name=factory.get_construct_name(self, event_bus_rule_name_props, underscore=True),
+                )
+            event_bus_rule.add_target(
                 target=targets.EventBus(
                     event_bus=events.EventBus.from_event_bus_arn(
                         scope=self,
                         id=factory.get_construct_id(self, custom_events_props + [event_bus_region], "IEventBus"),
-                        event_bus_arn=cdk_custom_outputs[factory.get_attr_env_region(self)][events_stack.stack_name][
+                        event_bus_arn=factory.get_cdk_custom_output(
+                            factory.get_attr_env_region(self),
+                            events_stack.stack_name,
                             factory.join_sep_empty(
                                 [factory.CDK_STACK_PREFIX]
                                 + factory.get_attr_project_name_comp_props(self)
                                 + [deploy_env]
                                 + custom_events_props
                                 + [factory.EVENT_, factory.BUS_, factory.ARN_, factory.CFN_OUTPUT_TYPE]
-                            )
-                        ],
+                            ),
+                        ),
                     ),
                     # dead_letter_queue=,  # Default: - no dead-letter queue  # TODO: (OPTIONAL) Add an SQS queue to be used as DLQ ?
                     # role=,  # Default: a new role is created.
@@ -251,9 +251,7 @@ class CdkOpenvpnVpnServerStack(Stack):
         )
         autoscaling_auto_scaling_group_.node.add_dependency(admin_password_secret)
 
-        self.public_ipv4_parameter_name: str = factory.get_path(
-            [self.stack_name, factory.join_sep_score([factory.PUBLIC_, factory.IPV4_])], lead=True
-        )
+        self.public_ipv4_parameter_name: str = factory.get_ec2_instance_public_ipv4_parameter_name(self.stack_name)
 
         for k, v in {base_stack: factory.BASE_, user_stack: factory.USER_}.items():
             factory.cfn_output_dependant_stack_name(self, k, v)
@@ -54,6 +54,7 @@ class CdkPypiServerStack(Stack):
         cf_origin_custom_header_secret: secretsmanager.Secret = factory.secrets_manager_secret_cf_origin_custom_header(
             self, cf_origin_custom_header, desc_insert=base_stack.server_description
         )
+        # Cache package files (at the edge) and index pages, e.g. for `pip install` by CodeBuild projects
         factory.cloudfront_distribution(
             self,
             alb,
@@ -63,6 +64,7 @@ class CdkPypiServerStack(Stack):
             origin_custom_headers=[(cf_origin_custom_header, cf_origin_custom_header_secret)],
             cf_stack_outputs_inc_comp=False,
             desc_insert=base_stack.server_description,
+            cache_behaviors=factory.CLOUDFRONT_CACHE_BEHAVIORS_PYPI,
         )
 
         factory.set_attrs_url(self, cf_origin_path)
@@ -70,9 +70,7 @@ class CdkIpsecVpnServerStack(Stack):
             dependant_constructs=[psk_stack.psk_secret],
         )
 
-        self.public_ipv4_parameter_name: str = factory.get_path(
-            [self.stack_name, factory.join_sep_score([factory.PUBLIC_, factory.IPV4_])], lead=True
-        )
+        self.public_ipv4_parameter_name: str = factory.get_ec2_instance_public_ipv4_parameter_name(self.stack_name)
 
         for k, v in {base_stack: factory.BASE_, psk_stack: factory.PSK_}.items():
             factory.cfn_output_dependant_stack_name(self, k, v)
@@ -147,9 +147,7 @@ class CdkProxyServerStack(Stack):
             machine_image=factory.ec2_machine_image_ubuntu_22_04(),
         )
 
-        self.public_ipv4_parameter_name: str = factory.get_path(
-            [self.stack_name, factory.join_sep_score([factory.PUBLIC_, factory.IPV4_])], lead=True
-        )
+        self.public_ipv4_parameter_name: str = factory.get_ec2_instance_public_ipv4_parameter_name(self.stack_name)
 
         factory.cfn_output_ec2_instance_eip_allocation_id(self, elastic_ip)
         factory.cfn_output_ec2_instance_public_ipv4_parameter_name(self, self.public_ipv4_parameter_name)
@@ -1,7 +1,15 @@
 import re
 from collections import OrderedDict
 
-from aws_cdk import Stack, Tags, aws_ec2 as ec2, aws_ssm as ssm
+from aws_cdk import (
+    Stack,
+    Tags,
+    aws_cloudfront as cloudfront,
+    aws_ec2 as ec2,
+    aws_ecs as ecs,
+    aws_s3 as s3,
+    aws_ssm as ssm,
+)
 from cdk_sih.constructs.factory import CdkConstructsFactory
 
 
@@ -65,6 +73,18 @@ class CdkVpcSihStack(Stack):
                     name, meta, self.vpc_cidrs[name], vpc_setup.get(max_azs_key), vpc_setup.get(vpn_connections_key)
                 )
 
+        # ---------- ECS clusters (shared) ----------
+
+        self.ecs_clusters_shared: dict[str, ecs.Cluster] = factory.ecs_clusters(self, self.vpcs[self.vpc_01_sih_])
+
+        # ---------- CloudFront log bucket (shared) ----------
+
+        self.cloudfront_log_bucket: s3.Bucket = factory.s3_bucket_cloudfront_logs(self)
+
+        # ---------- CloudFront cache policies (shared) ----------
+
+        self.cloudfront_cache_policies: dict[str, cloudfront.CachePolicy] = factory.cloudfront_cache_policies(self)
+
     def ec2_subnet_configuration(self, vpc_name: str, subnet_type: str) -> ec2.SubnetConfiguration:
         return ec2.SubnetConfiguration(
             cidr_mask=24,
@@ -171,6 +191,15 @@ class CdkVpcSihStack(Stack):
                 ),
             )
 
+    def set_attrs_cloudfront_cache_policies(self, self_obj) -> None:
+        setattr(self_obj, self.factory.CLOUDFRONT_CACHE_POLICIES_, self.cloudfront_cache_policies)
+
+    def set_attrs_cloudfront_log_bucket(self, self_obj) -> None:
+        setattr(self_obj, self.factory.CLOUDFRONT_LOG_BUCKET_, self.cloudfront_log_bucket)
+
+    def set_attrs_ecs_clusters(self, self_obj) -> None:
+        setattr(self_obj, self.factory.ECS_CLUSTERS_, self.ecs_clusters_shared)
+
     def set_attrs_vpc(self, self_obj, vpc_name: str = None, default: bool = False) -> None:
         if default:
             vpc_name = self.factory.DEFAULT_
@@ -184,3 +213,6 @@ class CdkVpcSihStack(Stack):
             setattr(self_obj, self.factory.VPC_, self.vpcs[vpc_name])
             setattr(self_obj, self.factory.VPC_CIDR_, self.vpc_cidrs[vpc_name])
         setattr(self_obj, self.factory.VPC_NAME_, vpc_name)
+        self.set_attrs_cloudfront_cache_policies(self_obj)
+        self.set_attrs_cloudfront_log_bucket(self_obj)
+        self.set_attrs_ecs_clusters(self_obj)
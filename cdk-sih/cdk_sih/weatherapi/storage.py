@@ -87,6 +87,7 @@ class CdkWeatherapiStorageStack(Stack):
                     [function_download_name, weatherapi_, factory.PY_, factory.LAYER_],
                     factory.get_path([weatherapi_, factory.get_file_name_zip([factory.PY_, factory.LAYER_])]),
                     "Lambda layer that contains: weatherapi py modules.",
+                    function_name=function_download_name,
                 ),
             ],
             memory_size=1024,
@@ -1,11 +1,13 @@
 #!/usr/bin/env python3.9
 from datetime import datetime
+from typing import Optional, Union
 
 from pytz import timezone
 
 
 class Schedules:
     _SEP_COLON_: str = ":"
+    _SEP_COMMA_: str = ","
     _SEP_SCORE_: str = "-"
     _SEP_UNDER_: str = "_"
 
@@ -22,6 +24,18 @@ class Schedules:
     _WEEK_DAY_SUNDAY_: str = "SUN"
     _WEEK_DAY_THURSDAY_: str = "THU"
     _WEEK_DAY_TUESDAY_: str = "TUE"
+    _WEEK_DAY_WEDNESDAY_: str = "WED"
+
+    # The days of the week, in cron day-of-week order (i.e. 1-7)
+    _WEEK_DAYS_CRON_: list[str] = [
+        _WEEK_DAY_SUNDAY_,
+        _WEEK_DAY_MONDAY_,
+        _WEEK_DAY_TUESDAY_,
+        _WEEK_DAY_WEDNESDAY_,
+        _WEEK_DAY_THURSDAY_,
+        _WEEK_DAY_FRIDAY_,
+        _WEEK_DAY_SATURDAY_,
+    ]
 
     _DAY_AFTER_: str = _WEEK_DAY_TUESDAY_
     _DAY_BEFORE_: str = _WEEK_DAY_SUNDAY_
@@ -202,6 +216,60 @@ class Schedules:
         else:
             window_props[hour_key] = window_props[hour_key] + self.hours_offset
 
+    def get_crons(
+        self, hours_week_days: list[tuple[Union[int, str], Optional[str]]]
+    ) -> list[tuple[str, Optional[str], int]]:
+        """
+        Compress a set of hours (each on some days of the week), into a compact list of cron hour and day-of-week
+        expressions, e.g. hours 10, 11, 22 and 23 (every day) into a single cron hour expression '10,11,22,23'.
+
+        Either the hours with the same days, or the days with the same hours, are grouped into a cron expression,
+        whichever gives fewer cron expressions. A given day-of-week expression (e.g. 'SAT-SUN') is kept as is.
+
+        :param hours_week_days: A list of tuples, each tuple containing:
+            hour: The UTC hour.
+            week_days: The cron day-of-week expression (e.g. 'MON-FRI'), or None for every day.
+        :return: A list of tuples, each tuple containing:
+            hour: The cron hour expression.
+            week_days: The cron day-of-week expression, or None for every day.
+            index: The index of the first of the given hours, in the cron expression.
+        """
+        expressions: dict[frozenset[int], Optional[str]] = {}
+        hour_days: dict[int, set[int]] = {}
+        for hour, week_days in hours_week_days:
+            days: frozenset[int] = self.get_week_days(week_days)
+            expressions.setdefault(days, week_days)
+            hour_days.setdefault(int(hour), set()).update(days)
+
+        days_hours: dict[frozenset[int], list[int]] = {}
+        for hour, days in sorted(hour_days.items()):
+            days_hours.setdefault(frozenset(days), []).append(hour)
+        hours_days: dict[tuple[int, ...], list[int]] = {}
+        for day in range(len(self._WEEK_DAYS_CRON_)):
+            if hours := tuple(k for k, v in sorted(hour_days.items()) if day in v):
+                hours_days.setdefault(hours, []).append(day)
+        crons: list[tuple[list[int], frozenset[int]]] = (
+            [(v, k) for k, v in days_hours.items()]
+            if len(days_hours) <= len(hours_days)
+            else [(list(k), frozenset(v)) for k, v in hours_days.items()]
+        )
+
+        return sorted(
+            [
+                (
+                    self._SEP_COMMA_.join(str(i) for i in hours),
+                    expressions[days] if days in expressions else self.get_week_days_expression(days),
+                    next(
+                        i
+                        for i, (hour, week_days) in enumerate(hours_week_days)
+                        if int(hour) in hours and days & self.get_week_days(week_days)
+                    ),
+                )
+                for hours, days in crons
+            ],
+            key=lambda i: i[2],
+        )
+
     def get_daily_backup_timestamp(self, window: dict[str, dict[str, int]]) -> str:
         return self._SEP_SCORE_.join(
             [
@@ -223,6 +291,49 @@ class Schedules:
             window_hours = [str(i) for i in range(window[self._START_], window[self._END_] + 1)]
         return window_hours
 
+    def get_week_days(self, week_days: Optional[str]) -> frozenset[int]:
+        """
+        Get the days (0 for Sunday, to 6 for Saturday) of a cron day-of-week expression,
+        e.g. 'MON-FRI', 'SAT-SUN' (wrapping around the week) or 'MON,WED'.
+
+        :param week_days: The cron day-of-week expression, or None (or '*') for every day.
+        :return: The days of the week.
+        """
+        num_days: int = len(self._WEEK_DAYS_CRON_)
+        if week_days is None or week_days == "*":
+            return frozenset(range(num_days))
+        days: set[int] = set()
+        for i in week_days.split(self._SEP_COMMA_):
+            start, _, end = i.partition(self._SEP_SCORE_)
+            start_day: int = self._WEEK_DAYS_CRON_.index(start)
+            end_day: int = self._WEEK_DAYS_CRON_.index(end) if end else start_day
+            days.update((start_day + j) % num_days for j in range((end_day - start_day) % num_days + 1))
+        return frozenset(days)
+
+    def get_week_days_expression(self, days: frozenset[int]) -> Optional[str]:
+        """
+        Get the cron day-of-week expression of some days (0 for Sunday, to 6 for Saturday), e.g. 'MON-FRI,SUN'.
+
+        :param days: The days of the week.
+        :return: The cron day-of-week expression, or None for every day.
+        """
+        if len(days) == len(self._WEEK_DAYS_CRON_):
+            return None
+        ranges: list[list[int]] = []
+        for day in sorted(days):
+            if ranges and ranges[-1][-1] == day - 1:
+                ranges[-1].append(day)
+            else:
+                ranges.append([day])
+        return self._SEP_COMMA_.join(
+            (
+                self._SEP_SCORE_.join([self._WEEK_DAYS_CRON_[i[0]], self._WEEK_DAYS_CRON_[i[-1]]])
+                if len(i) > 2
+                else self._SEP_COMMA_.join(self._WEEK_DAYS_CRON_[j] for j in i)
+            )
+            for i in ranges
+        )
+
     def get_weekly_maintenance_timestamp(self, window: dict[str, dict[str, int]]) -> str:
         return self._SEP_SCORE_.join(
             [